@@ -0,0 +1,35 @@
+"""Re-project stored embeddings to per-table storage dimensions
+
+Revision ID: 005_embedding_dimension
+Revises: 004_extend_messages
+Create Date: 2026-10-18 00:00:00
+
+Reads MEMORY_EMBEDDING_DIMENSION / CHAT_EMBEDDING_DIMENSION (defaulting to
+EMBEDDING_DIMENSION). Tables already at the configured width are left alone.
+To change the width again later, run scripts/reproject_embeddings.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.database.migrations.reproject import reproject_embedding_column
+from src.database.schema import CHAT_EMBEDDING_DIMENSION, EMBEDDING_DIMENSION, MEMORY_EMBEDDING_DIMENSION
+
+# revision identifiers, used by Alembic.
+revision: str = '005_embedding_dimension'
+down_revision: Union[str, None] = '004_extend_messages'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    reproject_embedding_column(conn, 'memory_chunks', MEMORY_EMBEDDING_DIMENSION)
+    reproject_embedding_column(conn, 'chat_messages', CHAT_EMBEDDING_DIMENSION)
+
+
+def downgrade() -> None:
+    # Back to the provider width; truncated dimensions come back as zeros
+    conn = op.get_bind()
+    reproject_embedding_column(conn, 'memory_chunks', EMBEDDING_DIMENSION)
+    reproject_embedding_column(conn, 'chat_messages', EMBEDDING_DIMENSION)
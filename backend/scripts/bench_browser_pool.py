@@ -0,0 +1,119 @@
+"""Playwright render throughput and memory: browser per page versus the shared BrowserPool.
+
+Serves --pages local HTML fixtures (offline corpus pages with images,
+scripts and links) and renders them --concurrency at a time, once by
+launching a Chromium per page the way WebScraper used to, and once
+through BrowserPool (one browser, pooled contexts, images/fonts/media
+blocked). Reports pages/min and the peak RSS of this process plus its
+browser child processes (Linux /proc). Requires Playwright and its
+Chromium (pip install -e ".[playwright]" && playwright install chromium).
+
+Usage:
+    python scripts/bench_browser_pool.py --pages 60 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.search.browser_pool import LAUNCH_ARGS, BrowserPool  # noqa: E402
+from src.search.offline import OfflineSearchBackend  # noqa: E402
+
+
+def tree_rss_mb(root: int) -> float:
+    """RSS of root and all its descendants in MB (0 where /proc is unavailable)."""
+    children: dict[int, list[int]] = {}
+    rss: dict[int, int] = {}
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not entry.isdigit():
+            continue
+        try:
+            status = Path(f"/proc/{entry}/status").read_text()
+        except OSError:
+            continue
+        fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+        pid = int(entry)
+        children.setdefault(int(fields.get("PPid", "0").strip()), []).append(pid)
+        rss[pid] = int(fields.get("VmRSS", "0 kB").split()[0])
+    total, stack = 0, [root]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+async def sample_rss(stop: asyncio.Event, peak: list[float]) -> None:
+    while not stop.is_set():
+        peak[0] = max(peak[0], tree_rss_mb(os.getpid()))
+        await asyncio.sleep(0.2)
+
+
+async def render_per_launch(url: str) -> None:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        page = await (await browser.new_context()).new_page()
+        await page.goto(url, wait_until="domcontentloaded")
+        await page.content()
+        await browser.close()
+
+
+async def run(label: str, render, urls: list[str], concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    stop, peak = asyncio.Event(), [0.0]
+    sampler = asyncio.create_task(sample_rss(stop, peak))
+
+    async def one(url: str) -> None:
+        async with semaphore:
+            await render(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one(url) for url in urls])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await sampler
+    print(f"{label:<10} {concurrency:>11} {len(urls) / elapsed * 60:>10.0f} {peak[0]:>13.0f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=60, help="Pages rendered per run")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pages rendered at once")
+    args = parser.parse_args()
+
+    try:
+        import playwright  # noqa: F401
+    except ImportError:
+        sys.exit("Playwright is not installed")
+
+    backend = OfflineSearchBackend(corpus_size=args.pages, latency_sigma=0, page_latency_ms=0)
+    await backend.start()
+    urls = [backend.page_url(doc) for doc in backend.documents]
+    pool = BrowserPool(max_pages=args.concurrency)
+
+    async def render_pooled(url: str) -> None:
+        async with pool.page() as page:
+            await page.goto(url, wait_until="domcontentloaded")
+            await page.content()
+
+    print(f"{'mode':<10} {'concurrency':>11} {'pages/min':>10} {'peak_rss_mb':>13}")
+    try:
+        await run("launch", render_per_launch, urls, args.concurrency)
+        await run("pool", render_pooled, urls, args.concurrency)
+        print(f"pool stats: {pool.stats}")
+    finally:
+        await pool.close()
+        await backend.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
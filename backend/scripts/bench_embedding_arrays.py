@@ -0,0 +1,111 @@
+"""Benchmark allocations of the list-based vs float32-array embedding path.
+
+Replays what FileSyncService does for one large file (embed chunks in
+batches, normalize to the database dimension, build ChunkCreate objects) and
+then loads the vectors into a FAISSAdapter. The list path reproduces the
+previous code (provider returns list[list[float]], padding by list
+concatenation, np.array in FAISS); the array path uses embed_batch_array
+and fit_dimension.
+
+Usage:
+    python scripts/bench_embedding_arrays.py --chunks 2000 --provider-dim 1024 --db-dim 1536
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.embeddings.base import EmbeddingProvider  # noqa: E402
+from src.embeddings.vectors import fit_dimension  # noqa: E402
+from src.memory.models.chunk import ChunkCreate  # noqa: E402
+from src.memory.vector_store_adapter import FAISSAdapter  # noqa: E402
+
+
+class ArrayProvider(EmbeddingProvider):
+    """Stands in for a model that produces float32 arrays (e.g. sentence-transformers)."""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.rng = np.random.default_rng(0)
+
+    async def embed_text(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return (await self.embed_batch_array(texts)).tolist()
+
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        return self.rng.random((len(texts), self.dimension), dtype=np.float32)
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+
+def make_chunk(i: int, embedding) -> ChunkCreate:
+    return ChunkCreate(file_id=1, chunk_index=i, content=f"chunk {i}", content_hash=str(i), embedding=embedding)
+
+
+async def list_path(provider: EmbeddingProvider, texts: list[str], db_dim: int, batch_size: int) -> FAISSAdapter:
+    all_embeddings = []
+    for i in range(0, len(texts), batch_size):
+        for emb in await provider.embed_batch(texts[i : i + batch_size]):
+            emb_list = list(emb) if not isinstance(emb, list) else emb
+            if len(emb_list) < db_dim:
+                emb_list = emb_list + [0.0] * (db_dim - len(emb_list))
+            elif len(emb_list) > db_dim:
+                emb_list = emb_list[:db_dim]
+            all_embeddings.append(emb_list)
+    chunks = [make_chunk(i, emb) for i, emb in enumerate(all_embeddings)]
+    store = FAISSAdapter(dimension=db_dim)
+    await store.add_embeddings(1, [{"id": i, "content": ""} for i in range(len(chunks))], [c.embedding for c in chunks])
+    return store
+
+
+async def array_path(provider: EmbeddingProvider, texts: list[str], db_dim: int, batch_size: int) -> FAISSAdapter:
+    all_embeddings: list[np.ndarray] = []
+    for i in range(0, len(texts), batch_size):
+        all_embeddings.extend(fit_dimension(await provider.embed_batch_array(texts[i : i + batch_size]), db_dim))
+    chunks = [make_chunk(i, emb) for i, emb in enumerate(all_embeddings)]
+    store = FAISSAdapter(dimension=db_dim)
+    vectors = np.stack([c.embedding for c in chunks])
+    await store.add_embeddings(1, [{"id": i, "content": ""} for i in range(len(chunks))], vectors)
+    return store
+
+
+async def measure(name: str, path, provider: EmbeddingProvider, texts: list[str], db_dim: int, batch_size: int) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = await path(provider, texts, db_dim, batch_size)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert store.index.ntotal == len(texts)
+    print(f"{name:6}: {elapsed * 1000:8.1f}ms  peak={peak / 1e6:8.1f}MB  per-vector={peak / len(texts) / 1024:6.1f}KB")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--provider-dim", type=int, default=1024)
+    parser.add_argument("--db-dim", type=int, default=1536)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    texts = [f"chunk {i}" for i in range(args.chunks)]
+    provider = ArrayProvider(args.provider_dim)
+    print(f"{args.chunks} chunks, provider dim {args.provider_dim} -> db dim {args.db_dim}\n")
+    await measure("lists", list_path, provider, texts, args.db_dim, args.batch_size)
+    await measure("arrays", array_path, provider, texts, args.db_dim, args.batch_size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""Benchmark micro-batching of concurrent embed_text calls.
+
+Simulates many concurrent callers (search queries, chat message indexing,
+reranker query embeddings) each calling embed_text for one string, against a
+provider with fixed per-request latency and a cap on concurrent requests.
+Compares calling the provider directly with CoalescingEmbeddingProvider.
+
+Usage:
+    python scripts/bench_embedding_coalescer.py --callers 200 --calls 20 --window-ms 5
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.embeddings.base import EmbeddingProvider  # noqa: E402
+from src.embeddings.coalescer import CoalescingEmbeddingProvider  # noqa: E402
+
+
+class SimulatedProvider(EmbeddingProvider):
+    """Provider with per-request latency, per-text cost and limited request concurrency."""
+
+    def __init__(self, latency_s: float, per_text_s: float, concurrency: int, dimension: int = 256):
+        self.latency_s = latency_s
+        self.per_text_s = per_text_s
+        self.dimension = dimension
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.calls = 0
+
+    async def embed_text(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        async with self.semaphore:
+            self.calls += 1
+            await asyncio.sleep(self.latency_s + self.per_text_s * len(texts))
+            return [[float(len(text))] * self.dimension for text in texts]
+
+    def get_dimension(self) -> int:
+        return self.dimension
+
+
+async def run_load(provider: EmbeddingProvider, callers: int, calls: int, think_ms: float) -> list[float]:
+    latencies: list[float] = []
+
+    async def caller(caller_id: int) -> None:
+        for i in range(calls):
+            await asyncio.sleep(random.expovariate(1000.0 / think_ms) if think_ms > 0 else 0)
+            start = time.perf_counter()
+            await provider.embed_text(f"query {caller_id}-{i}")
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[caller(c) for c in range(callers)])
+    return latencies
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--callers", type=int, default=200, help="Concurrent callers")
+    parser.add_argument("--calls", type=int, default=20, help="embed_text calls per caller")
+    parser.add_argument("--think-ms", type=float, default=20.0, help="Mean pause between a caller's calls")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="Provider latency per request")
+    parser.add_argument("--per-text-ms", type=float, default=0.1, help="Provider cost per text")
+    parser.add_argument("--provider-concurrency", type=int, default=8, help="Concurrent provider requests")
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"{args.callers} callers x {args.calls} embed_text calls\n")
+    for name in ("direct", "coalesced"):
+        random.seed(0)
+        simulated = SimulatedProvider(args.latency_ms / 1000, args.per_text_ms / 1000, args.provider_concurrency)
+        provider: EmbeddingProvider = simulated
+        if name == "coalesced":
+            provider = CoalescingEmbeddingProvider(simulated, args.window_ms, args.max_batch_size)
+
+        start = time.perf_counter()
+        latencies = await run_load(provider, args.callers, args.calls, args.think_ms)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:9}: p50={percentile(latencies, 50) * 1000:7.1f}ms  p99={percentile(latencies, 99) * 1000:7.1f}ms  "
+            f"provider_calls={simulated.calls:6d}  wall={elapsed:6.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,102 @@
+"""Compare recall, latency and memory of reduced embedding storage dimensions.
+
+Vectors are stored at each dimension via fit_dimension (truncate + re-normalize,
+as the write path does) and searched by cosine similarity with a flat FAISS
+index. Recall@k is measured against exact search at the full dimension on a
+held-out query set.
+
+By default a synthetic corpus is generated whose variance decays across
+dimensions, like Matryoshka-trained models (text-embedding-3-*) where the
+leading dimensions carry most of the signal. Real embeddings can be used
+instead with --corpus-npy/--queries-npy (float32 arrays, e.g. produced with
+OpenAIEmbeddingProvider.embed_batch_array and np.save).
+
+Usage:
+    python scripts/bench_embedding_dimensions.py --docs 50000 --queries 1000
+    python scripts/bench_embedding_dimensions.py --corpus-npy docs.npy --queries-npy queries.npy
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.embeddings.vectors import fit_dimension, l2_normalize  # noqa: E402
+
+try:
+    import faiss
+
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+def synthetic_embeddings(docs: int, queries: int, dimension: int, clusters: int, seed: int):
+    """Clustered corpus and held-out queries with a decaying per-dimension spectrum."""
+    rng = np.random.default_rng(seed)
+    scale = (1.0 + np.arange(dimension) / 64.0) ** -1.0
+    centers = rng.standard_normal((clusters, dimension), dtype=np.float32) * scale
+
+    def sample(count: int) -> np.ndarray:
+        noise = rng.standard_normal((count, dimension), dtype=np.float32) * scale
+        return l2_normalize((centers[rng.integers(0, clusters, count)] + 0.6 * noise).astype(np.float32))
+
+    return sample(docs), sample(queries)
+
+
+def search(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    if FAISS_AVAILABLE:
+        index = faiss.IndexFlatIP(corpus.shape[1])
+        index.add(corpus)
+        return index.search(queries, k)[1]
+    scores = queries @ corpus.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--clusters", type=int, default=2_000)
+    parser.add_argument("--full-dim", type=int, default=1536)
+    parser.add_argument("--dims", type=int, nargs="+", default=[1536, 512, 256])
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--corpus-npy", type=Path)
+    parser.add_argument("--queries-npy", type=Path)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.corpus_npy and args.queries_npy:
+        corpus = l2_normalize(np.load(args.corpus_npy).astype(np.float32))
+        queries = l2_normalize(np.load(args.queries_npy).astype(np.float32))
+        source = f"{args.corpus_npy.name} / {args.queries_npy.name}"
+    else:
+        corpus, queries = synthetic_embeddings(args.docs, args.queries, args.full_dim, args.clusters, args.seed)
+        source = "synthetic Matryoshka-like spectrum"
+
+    print(f"{len(corpus)} docs, {len(queries)} held-out queries, dim {corpus.shape[1]} ({source})")
+    print(f"search: {'faiss IndexFlatIP' if FAISS_AVAILABLE else 'numpy'}, recall@{args.k} vs exact full-dim search\n")
+    truth = search(corpus, queries, args.k)
+
+    print(f"{'dim':>6} {'recall':>8} {'ms/query':>9} {'index MB':>9} {'bytes/vec':>10}")
+    for dim in args.dims:
+        stored = np.ascontiguousarray(fit_dimension(corpus, dim))
+        projected_queries = np.ascontiguousarray(fit_dimension(queries, dim))
+        start = time.perf_counter()
+        found = search(stored, projected_queries, args.k)
+        elapsed = time.perf_counter() - start
+        recall = np.mean([len(set(f) & set(t)) / args.k for f, t in zip(found, truth, strict=True)])
+        print(
+            f"{dim:>6} {recall:>8.3f} {elapsed / len(queries) * 1000:>9.3f} "
+            f"{stored.nbytes / 1e6:>9.1f} {stored.nbytes // len(stored):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
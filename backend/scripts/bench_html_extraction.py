@@ -0,0 +1,128 @@
+"""Benchmark HTML extraction engines: ms per page and event loop lag.
+
+Builds a fixture corpus of offline stand-in pages (see
+src/search/offline.py) in two sizes: typical articles and long pages
+(--long-paragraphs paragraphs each). For each size it reports:
+
+- ms/page of the BeautifulSoup engine (WebScraper._parse_html) and of
+  the lxml engine (extract_page), single-threaded
+- event loop lag while --concurrency extractions run at once: a ticker
+  task sleeps 5 ms in a loop and records how late it wakes up. The
+  BeautifulSoup engine runs on the loop (as before); the lxml engine
+  runs through HTMLExtractor with --workers processes.
+
+Usage:
+    python scripts/bench_html_extraction.py --pages 200 --workers 2 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.search.extraction import HTMLExtractor, extract_page  # noqa: E402
+from src.search.offline import OfflineSearchBackend, generate_corpus  # noqa: E402
+from src.search.scraper import WebScraper  # noqa: E402
+
+TICK = 0.005
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def build_pages(count: int, paragraphs: tuple[int, int]) -> list[tuple[str, str]]:
+    backend = OfflineSearchBackend(documents=generate_corpus(size=count, seed=7, paragraphs=paragraphs))
+    return [(backend.page_html(doc), backend.page_url(doc)) for doc in backend.documents]
+
+
+def time_per_page(extract, pages: list[tuple[str, str]]) -> float:
+    started = time.perf_counter()
+    for html, url in pages:
+        extract(html, url)
+    return (time.perf_counter() - started) * 1000 / len(pages)
+
+
+async def measure_lag(extract_async, pages: list[tuple[str, str]], concurrency: int) -> dict[str, float]:
+    lags: list[float] = []
+    running = True
+
+    async def ticker() -> None:
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append((time.perf_counter() - started - TICK) * 1000)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(html: str, url: str) -> None:
+        async with semaphore:
+            # Pages arrive from the network, so extractions interleave with other tasks
+            await asyncio.sleep(0)
+            await extract_async(html, url)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK * 2)
+    started = time.perf_counter()
+    await asyncio.gather(*[run(html, url) for html, url in pages])
+    elapsed = time.perf_counter() - started
+    running = False
+    await tick_task
+    return {
+        "pages_per_s": len(pages) / elapsed,
+        "lag_p50_ms": percentile(lags, 0.5),
+        "lag_p99_ms": percentile(lags, 0.99),
+        "lag_max_ms": max(lags, default=0.0),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200, help="Pages per size")
+    parser.add_argument("--long-paragraphs", type=int, default=400, help="Paragraphs of each long page")
+    parser.add_argument("--workers", type=int, default=2, help="Extraction worker processes")
+    parser.add_argument("--concurrency", type=int, default=8, help="Extractions in flight during the lag test")
+    args = parser.parse_args()
+
+    scraper = WebScraper()
+    corpora = {
+        "article": build_pages(args.pages, (4, 12)),
+        "long": build_pages(max(1, args.pages // 10), (args.long_paragraphs, args.long_paragraphs)),
+    }
+
+    async def bs4_on_loop(html: str, url: str) -> None:
+        scraper._parse_html(html, url)
+
+    for name, pages in corpora.items():
+        size_kb = sum(len(html) for html, _ in pages) / len(pages) / 1024
+        print(f"\n{name} pages: {len(pages)} x {size_kb:.0f} KB")
+        bs4_ms = time_per_page(scraper._parse_html, pages)
+        lxml_ms = time_per_page(extract_page, pages)
+        print(f"  ms/page       bs4 {bs4_ms:8.2f}   lxml {lxml_ms:8.2f}   speedup {bs4_ms / lxml_ms:5.1f}x")
+
+        # Everything off-loop for the long pages; the default inline limit for articles
+        extractor = HTMLExtractor(workers=args.workers, inline_max_chars=32768 if name == "article" else 0)
+        try:
+            await extractor.extract(*pages[0])  # start the worker processes outside the measurement
+            results = {
+                "bs4 on loop": await measure_lag(bs4_on_loop, pages, args.concurrency),
+                f"lxml ({args.workers} workers)": await measure_lag(extractor.extract, pages, args.concurrency),
+            }
+        finally:
+            extractor.close()
+        for label, result in results.items():
+            print(
+                f"  {label:<18} {result['pages_per_s']:8.1f} pages/s   loop lag p50 {result['lag_p50_ms']:6.2f} ms"
+                f"   p99 {result['lag_p99_ms']:7.2f} ms   max {result['lag_max_ms']:7.2f} ms"
+            )
+    await scraper.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""Per-request latency of a fresh aiohttp session versus the shared HTTP client pool.
+
+Starts a local aiohttp server and fetches a small page --requests times
+(--concurrency at a time), once opening a new ClientSession per request
+the way the scraper and SearXNG provider used to, and once through
+HTTPClientRegistry sessions that keep connections alive. Against a local
+server the difference is TCP setup and session construction; against
+remote hosts DNS and TLS handshakes widen it further.
+
+Usage:
+    python scripts/bench_http_pool.py --requests 500 --concurrency 1 8
+"""
+
+import argparse
+import asyncio
+import functools
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+import aiohttp  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from src.utils.http import HTTPClientRegistry  # noqa: E402
+
+PAGE = "<html><title>Bench</title><body>" + "<p>pooled connections</p>" * 50 + "</body></html>"
+
+
+async def start_server() -> tuple[web.AppRunner, str]:
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(text=PAGE, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/page"
+
+
+async def fetch_fresh(url: str) -> None:
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with session.get(url) as response:
+            await response.text()
+
+
+async def fetch_pooled(session: aiohttp.ClientSession, url: str) -> None:
+    async with session.get(url) as response:
+        await response.text()
+
+
+async def run(label: str, fetch, requests: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await fetch()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(requests)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(
+        f"{label:<8} {concurrency:>11} {statistics.mean(latencies):>9.2f} "
+        f"{latencies[len(latencies) // 2]:>8.2f} {latencies[int(len(latencies) * 0.95)]:>8.2f} "
+        f"{requests / elapsed:>9.0f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8], help="In-flight requests to compare")
+    args = parser.parse_args()
+
+    runner, url = await start_server()
+    print(f"{'client':<8} {'concurrency':>11} {'mean_ms':>9} {'p50_ms':>8} {'p95_ms':>8} {'req/s':>9}")
+    try:
+        for concurrency in args.concurrency:
+            await run("fresh", lambda: fetch_fresh(url), args.requests, concurrency)
+
+            http_clients = HTTPClientRegistry()
+            session = http_clients.session("bench")
+            await run("pooled", functools.partial(fetch_pooled, session, url), args.requests, concurrency)
+            await http_clients.close()
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
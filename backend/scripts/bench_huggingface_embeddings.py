@@ -0,0 +1,84 @@
+"""Benchmark CPU throughput of local HuggingFace embeddings under concurrent load.
+
+Compares the old provider behaviour (every request sends model.encode to the
+default loop executor, so concurrent requests encode small batches in
+parallel threads) with HuggingFaceEmbeddingProvider (one inference thread,
+queued requests merged into length-sorted batches). Requires
+sentence-transformers.
+
+Usage:
+    python scripts/bench_huggingface_embeddings.py --requests 400 --texts-per-request 4
+    python scripts/bench_huggingface_embeddings.py --torch-threads 4
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.embeddings.huggingface_provider import HuggingFaceEmbeddingProvider  # noqa: E402
+
+WORDS = "the quick brown fox jumps over a lazy dog while research agents gather sources and notes".split()
+
+
+def make_texts(count: int, rng: random.Random) -> list[str]:
+    return [" ".join(rng.choices(WORDS, k=rng.randint(5, 200))) for _ in range(count)]
+
+
+async def run_legacy(provider: HuggingFaceEmbeddingProvider, requests: list[list[str]]) -> float:
+    """Previous behaviour: default executor, one encode per request."""
+    loop = asyncio.get_event_loop()
+
+    async def encode(texts: list[str]):
+        return await loop.run_in_executor(None, lambda: provider.model.encode(texts, show_progress_bar=False))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[encode(texts) for texts in requests])
+    return time.perf_counter() - start
+
+
+async def run_queued(provider: HuggingFaceEmbeddingProvider, requests: list[list[str]]) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*[provider.embed_batch_array(texts) for texts in requests])
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="sentence-transformers/all-MiniLM-L6-v2")
+    parser.add_argument("--requests", type=int, default=400, help="Concurrent embedding requests")
+    parser.add_argument("--texts-per-request", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--max-batch-texts", type=int, default=512)
+    parser.add_argument("--torch-threads", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    requests = [make_texts(args.texts_per_request, rng) for _ in range(args.requests)]
+    total = args.requests * args.texts_per_request
+
+    provider = HuggingFaceEmbeddingProvider(
+        model=args.model,
+        batch_size=args.batch_size,
+        max_batch_texts=args.max_batch_texts,
+        torch_threads=args.torch_threads,
+    )
+    await provider.warm_up()
+    print(f"{args.requests} concurrent requests x {args.texts_per_request} texts, model {args.model}\n")
+
+    elapsed = await run_legacy(provider, requests)
+    print(f"default executor : {elapsed:7.2f}s  {total / elapsed:8.1f} texts/s")
+
+    elapsed = await run_queued(provider, requests)
+    print(f"dedicated queue  : {elapsed:7.2f}s  {total / elapsed:8.1f} texts/s")
+    await provider.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Offline load test of the LLM scheduler with a simulating mock model.
+
+Runs --sessions concurrent research-shaped workloads (a supervisor call,
+then --agents agent calls that each trigger summarizations, then a title)
+next to a stream of interactive chat answers. Every call goes through one
+LLMScheduler and a MockChatModel with lognormal latency and injected 429s
+(retried after a short backoff), so scheduler changes can be compared
+without provider keys: interactive queue times should stay low while the
+research load saturates the provider.
+
+Usage:
+    python scripts/bench_llm_scheduler_load.py --sessions 8 --concurrency 4 8 16 --rate-limit 0.05
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+import openai  # noqa: E402
+
+from src.llm.factory import ScheduledMockChatModel  # noqa: E402
+from src.llm.scheduler import LLMPriority, LLMScheduler, llm_priority  # noqa: E402
+
+SITE_LATENCY = {"interactive": 0.3, "supervisor": 0.6, "agent": 0.8, "summarization": 0.4, "title": 0.1}
+
+
+async def call(llm: ScheduledMockChatModel, priority: LLMPriority, failures: list[int]) -> None:
+    with llm_priority(priority):
+        for attempt in range(5):
+            try:
+                await llm.ainvoke("Summarize the following source: mock text for the load test")
+                return
+            except openai.RateLimitError:
+                failures[0] += 1
+                await asyncio.sleep(0.05 * 2**attempt)
+
+
+async def research_session(llm: ScheduledMockChatModel, agents: int, failures: list[int]) -> None:
+    await call(llm, LLMPriority.SUPERVISOR, failures)
+
+    async def agent() -> None:
+        await call(llm, LLMPriority.AGENT, failures)
+        await asyncio.gather(*[call(llm, LLMPriority.SUMMARIZATION, failures) for _ in range(3)])
+
+    await asyncio.gather(*[agent() for _ in range(agents)])
+    await call(llm, LLMPriority.TITLE, failures)
+
+
+async def run(args: argparse.Namespace, concurrency: int) -> None:
+    scheduler = LLMScheduler(default_concurrency=concurrency)
+    llm = ScheduledMockChatModel(
+        token_latency=args.token_ms / 1000.0,
+        latency_distribution="lognormal",
+        site_latency=SITE_LATENCY,
+        rate_limit_rate=args.rate_limit,
+        seed=args.seed,
+    ).attach_scheduler(scheduler, "mock")
+    failures = [0]
+
+    async def chats() -> None:
+        for _ in range(args.chats):
+            await asyncio.sleep(0.2)
+            await call(llm, LLMPriority.INTERACTIVE, failures)
+
+    start = time.perf_counter()
+    await asyncio.gather(chats(), *[research_session(llm, args.agents, failures) for _ in range(args.sessions)])
+    elapsed = time.perf_counter() - start
+
+    stats = scheduler.get_stats()["mock"]
+    for priority in LLMPriority:
+        entry = stats.get(priority.name.lower())
+        if entry:
+            print(
+                f"{concurrency:>11} {priority.name.lower():<14} {entry['requests']:>8} "
+                f"{entry['avg_wait_ms']:>10.1f} {entry['p95_wait_ms']:>10.1f}"
+            )
+    print(f"{concurrency:>11} {'total':<14} wall={elapsed:.2f}s 429s={failures[0]}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent research sessions")
+    parser.add_argument("--agents", type=int, default=3, help="Agents per session")
+    parser.add_argument("--chats", type=int, default=10, help="Interactive answers during the run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16], help="Scheduler limits to compare")
+    parser.add_argument("--token-ms", type=float, default=2.0, help="Mock latency per token")
+    parser.add_argument("--rate-limit", type=float, default=0.05, help="Share of calls answered with a 429")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'concurrency':>11} {'priority':<14} {'requests':>8} {'avg_wait':>10} {'p95_wait':>10}")
+    for concurrency in args.concurrency:
+        await run(args, concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Benchmark time-to-first-token of the answer path.
+
+Uses MockChatModel with a first-token delay and per-token latency. "blocking"
+is the old path (ainvoke, then the answer is replayed in chunks), so the
+first report_chunk arrives only after the whole generation. "streaming" uses
+stream_text, which forwards tokens to emit_report_chunk as they arrive.
+
+Usage:
+    python scripts/bench_llm_streaming.py --first-token-ms 300 --token-ms 15 --runs 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+
+from src.llm.mock import MockChatModel  # noqa: E402
+from src.llm.streaming import stream_text  # noqa: E402
+
+PROMPT = [HumanMessage(content="Write the final report.\nResearch topic: solid-state batteries")]
+
+
+class TimingStream:
+    """Records when report chunks arrive."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.first_chunk_at: float | None = None
+        self.chunks = 0
+        self.report_streamed = False
+
+    def emit_report_chunk(self, chunk: str) -> None:
+        if self.first_chunk_at is None:
+            self.first_chunk_at = time.perf_counter()
+        self.chunks += 1
+
+
+async def run_blocking(llm: MockChatModel) -> tuple[float, float, int]:
+    stream = TimingStream()
+    result = await llm.ainvoke(PROMPT)
+    answer = result.content
+    for i in range(0, len(answer), 10000):
+        stream.emit_report_chunk(answer[i : i + 10000])
+    end = time.perf_counter()
+    return stream.first_chunk_at - stream.start, end - stream.start, stream.chunks
+
+
+async def run_streaming(llm: MockChatModel) -> tuple[float, float, int]:
+    stream = TimingStream()
+    await stream_text(llm, PROMPT, stream)
+    end = time.perf_counter()
+    return stream.first_chunk_at - stream.start, end - stream.start, stream.chunks
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--first-token-ms", type=float, default=300.0, help="Mock delay before the first token")
+    parser.add_argument("--token-ms", type=float, default=15.0, help="Mock latency per token")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    llm = MockChatModel(first_token_latency=args.first_token_ms / 1000.0, token_latency=args.token_ms / 1000.0)
+    print(f"{'path':<10} {'ttft_ms':>9} {'total_ms':>9} {'chunks':>7}")
+    for name, runner in [("blocking", run_blocking), ("streaming", run_streaming)]:
+        results = [await runner(llm) for _ in range(args.runs)]
+        ttft = statistics.median(r[0] for r in results) * 1000
+        total = statistics.median(r[1] for r in results) * 1000
+        print(f"{name:<10} {ttft:>9.1f} {total:>9.1f} {results[0][2]:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
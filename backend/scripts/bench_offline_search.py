@@ -0,0 +1,107 @@
+"""Offline end-to-end load test of search and scraping against the offline search stand-in.
+
+Starts OfflineSearchBackend in-process and runs --agents concurrent
+simulated researchers. Each one searches a topical query through the
+real SearXNGSearchProvider and scrapes the top --scrape results with
+WebScraper, --rounds times, all over one shared HTTPClientRegistry.
+Reports search/scrape latency percentiles, throughput and error counts
+under the configured latency, error and duplicate rates, with no network
+access needed.
+
+Usage:
+    python scripts/bench_offline_search.py --agents 16 --rounds 5 --latency-ms 200 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.search.offline import TOPICS, OfflineSearchBackend  # noqa: E402
+from src.search.scraper import WebScraper  # noqa: E402
+from src.search.searxng_provider import SearXNGSearchProvider  # noqa: E402
+from src.utils.host_limits import HostLimiter  # noqa: E402
+from src.utils.http import HTTPClientRegistry  # noqa: E402
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=16, help="Concurrent simulated researchers")
+    parser.add_argument("--rounds", type=int, default=5, help="Search+scrape rounds per agent")
+    parser.add_argument("--scrape", type=int, default=3, help="Results scraped per search")
+    parser.add_argument("--documents", type=int, default=2000, help="Generated corpus size")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="Median search latency")
+    parser.add_argument("--page-latency-ms", type=float, default=80.0, help="Median page latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0, help="Fraction of results repeated as URL variants")
+    args = parser.parse_args()
+
+    backend = OfflineSearchBackend(
+        corpus_size=args.documents,
+        latency_ms=args.latency_ms,
+        page_latency_ms=args.page_latency_ms,
+        error_rate=args.error_rate,
+        duplicate_rate=args.duplicate_rate,
+    )
+    base_url = await backend.start()
+    # Every search goes to the one stand-in instance, so per-host limits would only measure themselves
+    http_clients = HTTPClientRegistry(limit_per_host=0, hosts=HostLimiter(rate=0, max_concurrency=0, failure_threshold=0))
+    provider = SearXNGSearchProvider(instance_url=base_url, http_clients=http_clients)
+    scraper = WebScraper(http_clients=http_clients)
+    search_ms: list[float] = []
+    scrape_ms: list[float] = []
+    counts = {"empty_searches": 0, "scrape_errors": 0}
+    rng = random.Random(0)
+    topics = list(TOPICS.values())
+
+    async def agent() -> None:
+        for _ in range(args.rounds):
+            query = " ".join(rng.sample(rng.choice(topics), 3))
+            start = time.perf_counter()
+            response = await provider.search(query, max_results=10)
+            search_ms.append((time.perf_counter() - start) * 1000)
+            if not response.results:
+                counts["empty_searches"] += 1
+                continue
+
+            async def scrape(url: str) -> None:
+                start = time.perf_counter()
+                try:
+                    await scraper.scrape(url)
+                    scrape_ms.append((time.perf_counter() - start) * 1000)
+                except Exception:
+                    counts["scrape_errors"] += 1
+
+            await asyncio.gather(*[scrape(result.url) for result in response.results[: args.scrape]])
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*[agent() for _ in range(args.agents)])
+        elapsed = time.perf_counter() - start
+    finally:
+        await http_clients.close()
+        await backend.stop()
+
+    print(f"documents={len(backend.documents)} agents={args.agents} rounds={args.rounds} elapsed={elapsed:.2f}s")
+    print(f"{'op':<8} {'count':>7} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'ops/s':>8}")
+    for label, values in (("search", search_ms), ("scrape", scrape_ms)):
+        print(
+            f"{label:<8} {len(values):>7} {percentile(values, 0.5):>8.1f} {percentile(values, 0.95):>8.1f} "
+            f"{percentile(values, 0.99):>8.1f} {len(values) / elapsed:>8.1f}"
+        )
+    print(f"server stats: {backend.stats}  client: {counts}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
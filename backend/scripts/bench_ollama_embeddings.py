@@ -0,0 +1,119 @@
+"""Benchmark Ollama embedding throughput against a local stub server.
+
+Compares the old client (new aiohttp session and one /api/embeddings request
+per text, sequential) with OllamaEmbeddingProvider (pooled session, batched
+/api/embed, concurrent batches).
+
+Usage:
+    python scripts/bench_ollama_embeddings.py --texts 2000 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.embeddings.ollama_provider import OllamaEmbeddingProvider  # noqa: E402
+
+DIMENSION = 768
+
+
+def create_stub_app(latency_s: float, per_text_s: float, failure_rate: float) -> web.Application:
+    """Stub speaking the Ollama embedding API with simulated model latency."""
+    stats = {"requests": 0}
+
+    def fake_embedding(text: str) -> list[float]:
+        rng = random.Random(text)
+        return [rng.random() for _ in range(DIMENSION)]
+
+    async def embed(request: web.Request) -> web.Response:
+        stats["requests"] += 1
+        payload = await request.json()
+        inputs = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+        if random.random() < failure_rate:
+            return web.json_response({"error": "overloaded"}, status=503)
+        await asyncio.sleep(latency_s + per_text_s * len(inputs))
+        return web.json_response({"model": payload["model"], "embeddings": [fake_embedding(t) for t in inputs]})
+
+    async def embeddings(request: web.Request) -> web.Response:
+        stats["requests"] += 1
+        payload = await request.json()
+        await asyncio.sleep(latency_s + per_text_s)
+        return web.json_response({"embedding": fake_embedding(payload["prompt"])})
+
+    app = web.Application()
+    app["stats"] = stats
+    app.router.add_post("/api/embed", embed)
+    app.router.add_post("/api/embeddings", embeddings)
+    return app
+
+
+async def legacy_embed_batch(base_url: str, model: str, texts: list[str]) -> list[list[float]]:
+    """Previous behaviour: one session and one request per text, sequentially."""
+    result = []
+    for text in texts:
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{base_url}/api/embeddings", json={"model": model, "prompt": text}) as response:
+                response.raise_for_status()
+                result.append((await response.json())["embedding"])
+    return result
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Fixed latency per request")
+    parser.add_argument("--per-text-ms", type=float, default=0.2, help="Model time per text")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of /api/embed requests answered 503")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    app = create_stub_app(args.latency_ms / 1000, args.per_text_ms / 1000, args.failure_rate)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}"
+    texts = [f"chunk {i}: " + "lorem ipsum " * random.randint(5, 50) for i in range(args.texts)]
+
+    try:
+        print(f"Embedding {len(texts)} texts against stub at {base_url}\n")
+        if not args.skip_legacy:
+            app["stats"]["requests"] = 0
+            start = time.perf_counter()
+            await legacy_embed_batch(base_url, "stub", texts)
+            elapsed = time.perf_counter() - start
+            print(f"legacy  : {elapsed:8.2f}s  {len(texts) / elapsed:9.1f} texts/s  requests={app['stats']['requests']}")
+
+        provider = OllamaEmbeddingProvider(
+            base_url=base_url,
+            model="stub",
+            batch_size=args.batch_size,
+            max_concurrency=args.concurrency,
+            retry_backoff=0.05,
+        )
+        app["stats"]["requests"] = 0
+        start = time.perf_counter()
+        embeddings = await provider.embed_batch(texts)
+        elapsed = time.perf_counter() - start
+        await provider.close()
+        assert len(embeddings) == len(texts)
+        print(f"batched : {elapsed:8.2f}s  {len(texts) / elapsed:9.1f} texts/s  requests={app['stats']['requests']}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+"""Benchmark OpenAI embedding throughput against a rate-limited local stub.
+
+Compares the old client (fixed 100-text requests sent sequentially with a
+0.1s pause) with OpenAIEmbeddingProvider (token-packed requests sent
+concurrently under an adaptive limiter that honours 429/Retry-After).
+
+The stub speaks the OpenAI /v1/embeddings API and enforces per-second request
+and token budgets, answering 429 with retry-after-ms once either is exceeded.
+
+Usage:
+    python scripts/bench_openai_embeddings.py --texts 20000 --rps 5 --tps 400000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import web
+from openai import AsyncOpenAI
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.embeddings.openai_provider import OpenAIEmbeddingProvider  # noqa: E402
+
+DIMENSION = 256
+
+
+def create_stub_app(latency_s: float, per_text_s: float, rps: float, tps: float) -> web.Application:
+    """Stub OpenAI embeddings endpoint with latency and sliding-window rate limits."""
+    stats = {"requests": 0, "rate_limited": 0}
+    window: list[tuple[float, int]] = []
+
+    def fake_embedding(text: str) -> list[float]:
+        rng = random.Random(text)
+        return [rng.random() for _ in range(DIMENSION)]
+
+    async def embeddings(request: web.Request) -> web.Response:
+        payload = await request.json()
+        inputs = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+        tokens = sum(len(t) // 4 for t in inputs)
+
+        now = time.monotonic()
+        while window and now - window[0][0] > 1.0:
+            window.pop(0)
+        if window and (len(window) >= rps or sum(n for _, n in window) + tokens > tps):
+            stats["rate_limited"] += 1
+            retry_after_ms = int((1.0 - (now - window[0][0])) * 1000) + 1
+            return web.json_response(
+                {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                status=429,
+                headers={"retry-after-ms": str(retry_after_ms)},
+            )
+        window.append((now, tokens))
+        stats["requests"] += 1
+
+        await asyncio.sleep(latency_s + per_text_s * len(inputs))
+        # Shuffle to make sure clients order by index rather than position
+        data = [{"object": "embedding", "index": i, "embedding": fake_embedding(t)} for i, t in enumerate(inputs)]
+        random.shuffle(data)
+        return web.json_response(
+            {
+                "object": "list",
+                "data": data,
+                "model": payload["model"],
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            }
+        )
+
+    app = web.Application()
+    app["stats"] = stats
+    app.router.add_post("/v1/embeddings", embeddings)
+    return app
+
+
+async def legacy_embed_batch(client: AsyncOpenAI, texts: list[str]) -> list[list[float]]:
+    """Previous behaviour: 100 texts per request, sequential, 0.1s pause between requests."""
+    batch_size = 100
+    all_embeddings = []
+    for i in range(0, len(texts), batch_size):
+        response = await client.embeddings.create(input=texts[i : i + batch_size], model="text-embedding-3-small")
+        all_embeddings.extend([data.embedding for data in response.data])
+        if i + batch_size < len(texts):
+            await asyncio.sleep(0.1)
+    return all_embeddings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=20000)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Fixed latency per request")
+    parser.add_argument("--per-text-ms", type=float, default=0.05, help="Model time per text")
+    parser.add_argument("--rps", type=float, default=5.0, help="Requests per second allowed by the stub")
+    parser.add_argument("--tps", type=float, default=400_000, help="Tokens per second allowed by the stub")
+    parser.add_argument("--max-batch-tokens", type=int, default=250_000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    app = create_stub_app(args.latency_ms / 1000, args.per_text_ms / 1000, args.rps, args.tps)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}/v1"
+    texts = [f"chunk {i}: " + "lorem ipsum " * random.randint(5, 80) for i in range(args.texts)]
+
+    def report(name: str, elapsed: float) -> None:
+        stats = app["stats"]
+        print(
+            f"{name:8}: {elapsed:8.2f}s  {len(texts) / elapsed:9.1f} texts/s  "
+            f"requests={stats['requests']}  429s={stats['rate_limited']}"
+        )
+        stats["requests"] = stats["rate_limited"] = 0
+
+    try:
+        print(f"Embedding {len(texts)} texts against stub at {base_url} (limit {args.rps:g} req/s, {args.tps:g} tokens/s)\n")
+        if not args.skip_legacy:
+            client = AsyncOpenAI(api_key="stub", base_url=base_url)
+            start = time.perf_counter()
+            await legacy_embed_batch(client, texts)
+            report("legacy", time.perf_counter() - start)
+            await client.close()
+
+        provider = OpenAIEmbeddingProvider(
+            api_key="stub",
+            dimension=DIMENSION,
+            base_url=base_url,
+            max_batch_tokens=args.max_batch_tokens,
+            max_concurrency=args.concurrency,
+        )
+        start = time.perf_counter()
+        embeddings = await provider.embed_batch(texts)
+        elapsed = time.perf_counter() - start
+        assert len(embeddings) == len(texts)
+        # Order check: stub embeddings are seeded by the input text
+        assert embeddings[-1][0] == random.Random(texts[-1]).random()
+        report("packed", elapsed)
+        print(f"\nadaptive limit settled at {provider.rate_limiter.limit}/{provider.rate_limiter.max_concurrency}")
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""Offline benchmark of time-to-first-search for chat search modes.
+
+Compares the two pre-search paths of ChatSearchService._run_multi_query_search:
+classify_query followed by the research agent's first planning call, and the
+fused plan_search call whose queries are searched right away and seeded into
+the agent. A MockChatModel with per-call-site latency stands in for the
+provider and a mock search provider records when the first search starts.
+
+Usage:
+    python scripts/bench_search_planning.py --runs 5 --latency-ms 800
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from langchain_core.messages import ToolMessage  # noqa: E402
+
+from src.llm.mock import MockChatModel  # noqa: E402
+from src.search.mock_provider import MockSearchProvider  # noqa: E402
+from src.workflow.search.actions import ActionRegistry  # noqa: E402
+from src.workflow.search.classifier import classify_query, plan_search  # noqa: E402
+from src.workflow.search.researcher import research_agent  # noqa: E402
+
+
+class AgentMockChatModel(MockChatModel):
+    """Searches on its first turn and calls 'done' once it has seen results."""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        if kwargs.get("tools"):
+            searched = any(isinstance(message, ToolMessage) for message in messages)
+            kwargs["tool_choice"] = "done" if searched else "web_search"
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+class TimedSearchProvider(MockSearchProvider):
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.first_search: float | None = None
+
+    async def search(self, query: str, max_results: int = 10):
+        if self.first_search is None:
+            self.first_search = time.perf_counter()
+        await asyncio.sleep(self.latency)
+        return await super().search(query, max_results=max_results)
+
+
+async def run_once(fused: bool, llm: MockChatModel, search_latency: float, query: str) -> tuple[float, float]:
+    provider = TimedSearchProvider(search_latency)
+    start = time.perf_counter()
+    initial_queries: list[str] = []
+    initial_search = None
+    if fused:
+        classification = await plan_search(query, [], llm)
+        initial_queries = classification.search_queries
+        initial_search = asyncio.create_task(
+            ActionRegistry.execute(
+                "web_search",
+                {"queries": initial_queries},
+                {"search_provider": provider, "mode": "speed", "original_query": query},
+            )
+        )
+    else:
+        classification = await classify_query(query, [], llm)
+    await research_agent(
+        query=query,
+        classification=classification,
+        mode="speed",
+        llm=llm,
+        search_provider=provider,
+        scraper=None,
+        stream=None,
+        initial_queries=initial_queries,
+        initial_search=initial_search,
+    )
+    return provider.first_search - start, time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per path")
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="Mock first-token latency per LLM call")
+    parser.add_argument("--token-ms", type=float, default=2.0, help="Mock latency per generated token")
+    parser.add_argument("--search-ms", type=float, default=400.0, help="Mock latency per search query")
+    parser.add_argument("--query", default="How efficient are modern heat pumps in cold climates?")
+    args = parser.parse_args()
+
+    print(f"{'path':<22} {'first_search_ms':>16} {'p50_total_ms':>13}")
+    for fused in (False, True):
+        first, total = [], []
+        for run in range(args.runs):
+            llm = AgentMockChatModel(
+                first_token_latency=args.latency_ms / 1000.0, token_latency=args.token_ms / 1000.0, seed=run
+            )
+            ttfs, elapsed = await run_once(fused, llm, args.search_ms / 1000.0, args.query)
+            first.append(ttfs * 1000)
+            total.append(elapsed * 1000)
+        label = "plan_search+prefetch" if fused else "classify+agent"
+        print(f"{label:<22} {statistics.median(first):>16.0f} {statistics.median(total):>13.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+"""Run the offline search stand-in (SearXNG JSON API + result pages) for local development and load tests.
+
+Point the backend at it with:
+    SEARCH_PROVIDER=searxng SEARXNG_INSTANCE_URL=http://127.0.0.1:8890
+
+Result pages are served at http://<domain>.localhost:<port>/<slug>, which
+resolves to loopback, so --host must be a loopback or wildcard address.
+
+Usage:
+    python scripts/offline_search_server.py --port 8890 --documents 5000 --latency-ms 300 --error-rate 0.02
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.search.offline import OfflineSearchBackend  # noqa: E402
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    parser.add_argument("--port", type=int, default=8890, help="Port to bind")
+    parser.add_argument("--documents", type=int, default=2000, help="Generated corpus size")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus and latency seed")
+    parser.add_argument("--latency-ms", type=float, default=150.0, help="Median search latency")
+    parser.add_argument("--page-latency-ms", type=float, default=80.0, help="Median page latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0, help="Fraction of results repeated as URL variants")
+    args = parser.parse_args()
+
+    backend = OfflineSearchBackend(
+        corpus_size=args.documents,
+        seed=args.seed,
+        latency_ms=args.latency_ms,
+        page_latency_ms=args.page_latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        duplicate_rate=args.duplicate_rate,
+    )
+    base_url = await backend.start(args.host, args.port)
+    print(f"Offline search backend serving {len(backend.documents)} documents at {base_url}")
+    print(f"  SEARCH_PROVIDER=searxng SEARXNG_INSTANCE_URL={base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await backend.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
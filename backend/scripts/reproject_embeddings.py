@@ -0,0 +1,47 @@
+"""Re-project stored embeddings after changing a table's storage dimension.
+
+Rewrites the embedding column of memory_chunks and/or chat_messages at the
+given width (truncate + re-normalize, or zero-pad) and rebuilds the vector
+index. Set MEMORY_EMBEDDING_DIMENSION / CHAT_EMBEDDING_DIMENSION to the same
+value before restarting the API.
+
+Usage:
+    python scripts/reproject_embeddings.py --table memory_chunks --dimension 256
+    python scripts/reproject_embeddings.py --table all --dimension 512
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+# Add backend to path
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from src.config.settings import get_settings  # noqa: E402
+from src.database.migrations.reproject import EMBEDDING_TABLES, reproject_embedding_column  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--table", choices=[*EMBEDDING_TABLES, "all"], required=True)
+    parser.add_argument("--dimension", type=int, required=True)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if not settings.use_postgres:
+        sys.exit("Embedding columns only exist in PostgreSQL (pgvector)")
+
+    tables = list(EMBEDDING_TABLES) if args.table == "all" else [args.table]
+    engine = create_engine(settings.sync_database_url)
+    with engine.begin() as conn:
+        for table in tables:
+            count = reproject_embedding_column(conn, table, args.dimension, args.batch_size)
+            print(f"{table}: {count} vectors re-projected to {args.dimension} dims")
+
+
+if __name__ == "__main__":
+    main()
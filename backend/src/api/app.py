@@ -15,10 +15,18 @@ from src.config.logging_config import configure_logging
 from src.chat.service import ChatSearchService
 from src.chat.search import ChatMessageSearchEngine
 from src.database.connection import create_database_engine, create_db_pool, create_session_factory
+from src.embeddings.coalescer import CoalescingEmbeddingProvider
 from src.embeddings.factory import create_embedding_provider
 from src.memory.hybrid_search import HybridSearchEngine
 from src.memory.manager import MemoryManager
+from src.memory.session_archive import SessionArchive, run_session_archival_loop
+from src.llm.accounting import close_usage_tracker
+from src.llm.cache import close_response_cache
 from src.llm.factory import create_chat_model
+from src.llm.scheduler import close_llm_scheduler
+from src.search.cache import close_search_cache
+from src.search.page_cache import close_page_cache
+from src.utils.http import close_http_clients, get_http_clients
 
 # Import routers
 from src.api.routes import (
@@ -88,14 +96,26 @@ async def lifespan(app: FastAPI):
     app.state.session_factory = session_factory
     app.state.db_pool = db_pool
 
+    # Shared outbound HTTP connection pool
+    http_clients = get_http_clients(settings)
+    app.state.http_clients = http_clients
+
     # Initialize embedding provider
     logger.info("Initializing embedding provider...", provider=settings.embedding_provider)
-    embedding_provider = create_embedding_provider(settings)
+    embedding_provider = create_embedding_provider(settings, http_clients)
     embedding_dimension = embedding_provider.get_dimension()
     logger.info("Embedding dimension detected", dimension=embedding_dimension, provider=settings.embedding_provider)
     app.state.embedding_provider = embedding_provider
     app.state.embedding_dimension = embedding_dimension
 
+    # Load weights and initialize kernels before the first request (local models)
+    warm_up = getattr(embedding_provider, "warm_up", None)
+    if warm_up and settings.huggingface_warmup:
+        try:
+            await warm_up()
+        except Exception as e:
+            logger.warning("Embedding warm-up failed", error=str(e))
+
     # Initialize hybrid search engine
     logger.info("Initializing hybrid search engine...")
     search_engine = HybridSearchEngine(
@@ -166,6 +186,7 @@ async def lifespan(app: FastAPI):
         settings=settings,
         search_engine=search_engine,
         embedding_provider=embedding_provider,
+        http_clients=http_clients,
     )
     app.state.chat_service = chat_service
     app.state.settings = settings
@@ -175,6 +196,23 @@ async def lifespan(app: FastAPI):
     # Initialize active streams storage for reconnection
     app.state.active_streams: dict[str, Any] = {}
 
+    # Archive finished agent session directories in the background
+    app.state.session_archive_task = None
+    if settings.session_archive_enabled:
+        from src.workflow.research.session.manager import SessionManager
+
+        logger.info("Starting agent session archival job", interval_minutes=settings.session_archive_interval_minutes)
+        app.state.session_archive_task = asyncio.create_task(
+            run_session_archival_loop(
+                SessionManager(session_factory),
+                SessionArchive(settings.memory_dir),
+                interval_seconds=settings.session_archive_interval_minutes * 60,
+                expire_after_hours=settings.session_expiry_hours,
+                archive_after_hours=settings.session_archive_after_hours,
+                active_session_ids=lambda: list(app.state.active_tasks.keys()),
+            )
+        )
+
     logger.info(
         "All-Included Deep Research API started successfully",
         available_modes=["chat", "search", "deep_search", "deep_research"],
@@ -185,6 +223,30 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down All-Included Deep Research API...")
 
+    # Stop background jobs
+    archive_task = getattr(app.state, "session_archive_task", None)
+    if archive_task:
+        archive_task.cancel()
+        try:
+            await archive_task
+        except asyncio.CancelledError:
+            pass
+
+    # Close pooled HTTP sessions held by providers
+    embedding_provider = getattr(app.state, "embedding_provider", None)
+    if isinstance(embedding_provider, CoalescingEmbeddingProvider):
+        logger.info("Embedding coalescing stats", **embedding_provider.get_stats())
+    embedding_close = getattr(embedding_provider, "close", None)
+    if embedding_close:
+        await embedding_close()
+    await app.state.chat_service.close()
+    await close_http_clients()
+    close_search_cache()
+    close_page_cache()
+    close_response_cache()
+    close_llm_scheduler()
+    close_usage_tracker()
+
     # Cleanup database connections
     if hasattr(app.state, "engine"):
         await app.state.engine.dispose()
@@ -11,6 +11,12 @@ from fastapi.responses import StreamingResponse
 
 from src.api.models.chat import ChatCompletionRequest
 from src.streaming.sse import ResearchStreamingGenerator
+from src.llm.accounting import get_session_usage
+from src.search.cache import get_session_search_stats
+from src.search.page_cache import get_session_page_stats
+from src.search.singleflight import get_single_flight_stats
+from src.llm.cache import cache_scope
+from src.llm.scheduler import LLMPriority, llm_priority
 from src.utils.pdf_generator import markdown_to_pdf
 from src.memory.agent_session import create_agent_session_services, cleanup_agent_session_dir
 from fastapi.responses import Response
@@ -224,7 +230,7 @@ async def stream_chat(request: ChatCompletionRequest, app_request: Request):
             if mode == "deep_research":
                 memory_root = Path(app_request.app.state.memory_manager.memory_dir)
                 agent_memory_service, agent_file_service, session_agent_dir = create_agent_session_services(
-                    memory_root, session_id
+                    memory_root, session_id, embedding_provider=app_request.app.state.embedding_provider
                 )
                 await agent_memory_service.read_main_file()
                 # Store in both stream.app_state (for backward compatibility) and pass directly
@@ -244,9 +250,10 @@ async def stream_chat(request: ChatCompletionRequest, app_request: Request):
                 # This preserves markdown structure and ensures smooth streaming
                 chunk_size = 10000
                 chunks = [result.answer[i:i+chunk_size] for i in range(0, len(result.answer), chunk_size)]
-                for chunk in chunks:
-                    stream_generator.emit_report_chunk(chunk)
-                    await asyncio.sleep(0.02)
+                if not stream_generator.report_streamed:  # Already sent token by token
+                    for chunk in chunks:
+                        stream_generator.emit_report_chunk(chunk)
+                        await asyncio.sleep(0.02)
                 stream_generator.emit_final_report(result.answer)
                 stream_generator.emit_done()
                 return
@@ -271,9 +278,10 @@ async def stream_chat(request: ChatCompletionRequest, app_request: Request):
                         # This preserves markdown structure and ensures smooth streaming
                         chunk_size = 10000
                         chunks = [result.answer[i:i+chunk_size] for i in range(0, len(result.answer), chunk_size)]
-                        for chunk in chunks:
-                            stream_generator.emit_report_chunk(chunk)
-                            await asyncio.sleep(0.02)
+                        if not stream_generator.report_streamed:  # Already sent token by token
+                            for chunk in chunks:
+                                stream_generator.emit_report_chunk(chunk)
+                                await asyncio.sleep(0.02)
                         # CRITICAL: emit_final_report will automatically save to DB
                         # This ensures answer is persisted even if client disconnects
                         stream_generator.emit_final_report(result.answer)
@@ -448,9 +456,10 @@ async def stream_chat(request: ChatCompletionRequest, app_request: Request):
                     # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
                     chunk_size = 10000
                     chunks = [final_report[i:i+chunk_size] for i in range(0, len(final_report), chunk_size)]
-                    for chunk in chunks:
-                        stream_generator.emit_report_chunk(chunk)
-                        await asyncio.sleep(0.02)
+                    if not stream_generator.report_streamed:  # Already sent token by token
+                        for chunk in chunks:
+                            stream_generator.emit_report_chunk(chunk)
+                            await asyncio.sleep(0.02)
                     stream_generator.emit_final_report(final_report)
                     logger.info("Final report emitted successfully")
                     
@@ -502,9 +511,10 @@ async def stream_chat(request: ChatCompletionRequest, app_request: Request):
                             # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
                             chunk_size = 10000
                             chunks = [fallback_report[i:i+chunk_size] for i in range(0, len(fallback_report), chunk_size)]
-                            for chunk in chunks:
-                                stream_generator.emit_report_chunk(chunk)
-                                await asyncio.sleep(0.02)
+                            if not stream_generator.report_streamed:  # Already sent token by token
+                                for chunk in chunks:
+                                    stream_generator.emit_report_chunk(chunk)
+                                    await asyncio.sleep(0.02)
                             stream_generator.emit_final_report(fallback_report)
                             _store_session_report(app_request.app.state, session_id, fallback_report, query, mode)
                             logger.info("Fallback report emitted successfully")
@@ -569,9 +579,10 @@ async def stream_chat(request: ChatCompletionRequest, app_request: Request):
                     # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
                     chunk_size = 10000
                     chunks = [fallback_report[i:i+chunk_size] for i in range(0, len(fallback_report), chunk_size)]
-                    for chunk in chunks:
-                        stream_generator.emit_report_chunk(chunk)
-                        await asyncio.sleep(0.02)
+                    if not stream_generator.report_streamed:  # Already sent token by token
+                        for chunk in chunks:
+                            stream_generator.emit_report_chunk(chunk)
+                            await asyncio.sleep(0.02)
                     stream_generator.emit_final_report(fallback_report)
                     _store_session_report(app_request.app.state, session_id, fallback_report, query, mode)
                 else:
@@ -777,6 +788,44 @@ async def reconnect_stream(session_id: str, app_request: Request):
     )
 
 
+@router.get("/stream/{session_id}/usage")
+async def get_session_usage_summary(session_id: str, app_request: Request):
+    """
+    Return LLM token use and latency of a session by graph node, agent, call site and model.
+
+    Running and recent sessions are served from memory; completed deep_research
+    sessions fall back to the summary saved in the session metadata. Search
+    cache hit rates are included when the session searched through the cache,
+    upstream searches/scrapes saved by single-flight deduplication as
+    "single_flight", and scraped page cache hit ratio and bytes saved as
+    "page_cache".
+    """
+    usage = get_session_usage(session_id)
+    search_cache = get_session_search_stats(session_id)
+    single_flight = get_single_flight_stats(session_id)
+    page_cache = get_session_page_stats(session_id)
+    session_factory = getattr(app_request.app.state, "session_factory", None)
+    if usage is None and session_factory is not None:
+        from src.workflow.research.session.manager import SessionManager
+
+        research_session = await SessionManager(session_factory).get_session(session_id)
+        if research_session is not None:
+            usage = (research_session.session_metadata or {}).get("usage")
+            search_cache = search_cache or (research_session.session_metadata or {}).get("search_cache")
+            single_flight = single_flight or (research_session.session_metadata or {}).get("single_flight")
+            page_cache = page_cache or (research_session.session_metadata or {}).get("page_cache")
+
+    if usage is None:
+        raise HTTPException(status_code=404, detail=f"No usage recorded for session {session_id}")
+    return {
+        "session_id": session_id,
+        "usage": usage,
+        "search_cache": search_cache,
+        "single_flight": single_flight,
+        "page_cache": page_cache,
+    }
+
+
 @router.get("/stream/{session_id}/pdf")
 async def generate_pdf(session_id: str, app_request: Request):
     """Generate PDF from final report for a completed research session."""
@@ -817,7 +866,11 @@ Requirements:
 
 Title:"""
 
-                title_response = await title_llm.ainvoke([{"role": "user", "content": title_prompt}])
+                with (
+                    cache_scope("pdf_title", allow_nondeterministic=True),
+                    llm_priority(LLMPriority.TITLE),
+                ):
+                    title_response = await title_llm.ainvoke([{"role": "user", "content": title_prompt}])
                 generated_title = title_response.content.strip().strip('"').strip("'")
 
                 if generated_title and len(generated_title) <= 80:
@@ -10,6 +10,8 @@ from pydantic import BaseModel
 from sqlalchemy import select, func, delete
 
 from src.database.schema import ChatModel, ChatMessageModel
+from src.embeddings.vectors import fit_dimension
+from src.llm.scheduler import LLMPriority, llm_priority
 from src.utils.text import summarize_text
 
 router = APIRouter(prefix="/api/chats", tags=["chats"])
@@ -309,10 +311,11 @@ async def generate_chat_title(chat_id: str, app_request: Request):
             from src.models.schemas import ChatTitle
             
             structured_llm = llm.with_structured_output(ChatTitle, method="function_calling")
-            title_response = await structured_llm.ainvoke([
-                SystemMessage(content="Generate a concise, descriptive title (max 60 characters) for this conversation."),
-                HumanMessage(content=conversation)
-            ])
+            with llm_priority(LLMPriority.TITLE):
+                title_response = await structured_llm.ainvoke([
+                    SystemMessage(content="Generate a concise, descriptive title (max 60 characters) for this conversation."),
+                    HumanMessage(content=conversation)
+                ])
 
             if isinstance(title_response, ChatTitle):
                 generated_title = title_response.title.strip().strip('"').strip("'")[:60]
@@ -449,12 +452,8 @@ async def add_message(
                 try:
                     embedding_provider = app_request.app.state.embedding_provider
                     embedding_vector = await embedding_provider.embed_text(content)
-                    from src.database.schema import EMBEDDING_DIMENSION
-                    db_dimension = EMBEDDING_DIMENSION
-                    if len(embedding_vector) < db_dimension:
-                        embedding_vector = list(embedding_vector) + [0.0] * (db_dimension - len(embedding_vector))
-                    elif len(embedding_vector) > db_dimension:
-                        embedding_vector = embedding_vector[:db_dimension]
+                    from src.database.schema import CHAT_EMBEDDING_DIMENSION
+                    embedding_vector = fit_dimension(embedding_vector, CHAT_EMBEDDING_DIMENSION)
                     existing_message.embedding = embedding_vector
                     embedding = embedding_vector  # Set for logging
                 except Exception as e:
@@ -471,14 +470,9 @@ async def add_message(
                     embedding_vector = await embedding_provider.embed_text(content)
 
                     # Normalize embedding to database schema dimension (not provider dimension!)
-                    # Database schema uses EMBEDDING_DIMENSION from settings/environment
-                    from src.database.schema import EMBEDDING_DIMENSION
-                    db_dimension = EMBEDDING_DIMENSION
-                    
-                    if len(embedding_vector) < db_dimension:
-                        embedding_vector = list(embedding_vector) + [0.0] * (db_dimension - len(embedding_vector))
-                    elif len(embedding_vector) > db_dimension:
-                        embedding_vector = embedding_vector[:db_dimension]
+                    # chat_messages stores CHAT_EMBEDDING_DIMENSION (defaults to EMBEDDING_DIMENSION)
+                    from src.database.schema import CHAT_EMBEDDING_DIMENSION
+                    embedding_vector = fit_dimension(embedding_vector, CHAT_EMBEDDING_DIMENSION)
 
                     embedding = embedding_vector
                 except Exception as e:
@@ -565,12 +559,8 @@ async def create_chat_with_message(
                 embedding_provider = app_request.app.state.embedding_provider
                 if embedding_provider:
                     embedding_vector = await embedding_provider.embed_text(message)
-                    from src.database.schema import EMBEDDING_DIMENSION
-
-                    if len(embedding_vector) < EMBEDDING_DIMENSION:
-                        embedding_vector = list(embedding_vector) + [0.0] * (EMBEDDING_DIMENSION - len(embedding_vector))
-                    elif len(embedding_vector) > EMBEDDING_DIMENSION:
-                        embedding_vector = embedding_vector[:EMBEDDING_DIMENSION]
+                    from src.database.schema import CHAT_EMBEDDING_DIMENSION
+                    embedding_vector = fit_dimension(embedding_vector, CHAT_EMBEDDING_DIMENSION)
 
                     msg.embedding = embedding_vector
             except Exception as e:
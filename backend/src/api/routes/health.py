@@ -1,6 +1,6 @@
 """Health check endpoint."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from src.api.models.health import HealthResponse
 
@@ -12,3 +12,17 @@ async def health_check() -> HealthResponse:
     """Check API health status."""
     return HealthResponse(status="healthy", version="1.0.0")
 
+
+@router.get("/health/hosts")
+async def host_health(app_request: Request, degraded_only: bool = False) -> dict:
+    """
+    Return per-host circuit state, failures, rejections and rate-limit waits of outbound requests.
+
+    Hosts are search engines and scraped sites; degraded_only limits the
+    list to hosts with an open or half-open circuit, recent failures or throttling.
+    """
+    http_clients = getattr(app_request.app.state, "http_clients", None)
+    if http_clients is None:
+        return {"hosts": {}}
+    hosts = http_clients.hosts.get_degraded_hosts() if degraded_only else http_clients.hosts.get_stats()
+    return {"hosts": hosts}
@@ -264,7 +264,7 @@ async def handle_chat_send(sid: str, data: Dict[str, Any]) -> Dict[str, Any]:
 
                     memory_root = Path(app_state.memory_manager.memory_dir)
                     agent_memory_service, agent_file_service, session_agent_dir = create_agent_session_services(
-                        memory_root, session_id
+                        memory_root, session_id, embedding_provider=getattr(app_state, "embedding_provider", None)
                     )
                     await agent_memory_service.read_main_file()
                     stream_generator.app_state["agent_memory_service"] = agent_memory_service
@@ -425,9 +425,10 @@ async def handle_chat_send(sid: str, data: Dict[str, Any]) -> Dict[str, Any]:
                                    session_status=session_status_from_db)
                         stream_generator.emit_status("Finalizing report...", step="report")
                         # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
-                        for chunk in _chunk_text(draft_report_content, size=10000):
-                            stream_generator.emit_report_chunk(chunk)
-                            await asyncio.sleep(0.02)
+                        if not stream_generator.report_streamed:  # Already sent token by token
+                            for chunk in _chunk_text(draft_report_content, size=10000):
+                                stream_generator.emit_report_chunk(chunk)
+                                await asyncio.sleep(0.02)
                         stream_generator.emit_final_report(draft_report_content)
                         _store_session_report(app_state, session_id, draft_report_content, message, mode)
                     elif final_report:
@@ -436,9 +437,10 @@ async def handle_chat_send(sid: str, data: Dict[str, Any]) -> Dict[str, Any]:
                                    final_report_length=len(final_report))
                         stream_generator.emit_status("Finalizing report...", step="report")
                         # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
-                        for chunk in _chunk_text(final_report, size=10000):
-                            stream_generator.emit_report_chunk(chunk)
-                            await asyncio.sleep(0.02)
+                        if not stream_generator.report_streamed:  # Already sent token by token
+                            for chunk in _chunk_text(final_report, size=10000):
+                                stream_generator.emit_report_chunk(chunk)
+                                await asyncio.sleep(0.02)
                         stream_generator.emit_final_report(final_report)
                         _store_session_report(app_state, session_id, final_report, message, mode)
                     elif session_status_from_db == "completed":
@@ -457,9 +459,10 @@ async def handle_chat_send(sid: str, data: Dict[str, Any]) -> Dict[str, Any]:
                                                note="Draft report is the structured research result with chapters")
                                     stream_generator.emit_status("Finalizing report...", step="report")
                                     # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
-                                    for chunk in _chunk_text(draft_report, size=10000):
-                                        stream_generator.emit_report_chunk(chunk)
-                                        await asyncio.sleep(0.02)
+                                    if not stream_generator.report_streamed:  # Already sent token by token
+                                        for chunk in _chunk_text(draft_report, size=10000):
+                                            stream_generator.emit_report_chunk(chunk)
+                                            await asyncio.sleep(0.02)
                                     stream_generator.emit_final_report(draft_report)
                                     _store_session_report(app_state, session_id, draft_report, message, mode)
                                 else:
@@ -511,9 +514,10 @@ async def handle_chat_send(sid: str, data: Dict[str, Any]) -> Dict[str, Any]:
                             if fallback_report:
                                 stream_generator.emit_status("Finalizing report...", step="report")
                                 # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
-                                for chunk in _chunk_text(fallback_report, size=10000):
-                                    stream_generator.emit_report_chunk(chunk)
-                                    await asyncio.sleep(0.02)
+                                if not stream_generator.report_streamed:  # Already sent token by token
+                                    for chunk in _chunk_text(fallback_report, size=10000):
+                                        stream_generator.emit_report_chunk(chunk)
+                                        await asyncio.sleep(0.02)
                                 stream_generator.emit_final_report(fallback_report)
                                 _store_session_report(app_state, session_id, fallback_report, message, mode)
                             else:
@@ -613,9 +617,10 @@ async def _emit_answer(stream_generator: SocketIOStreamingGenerator, answer: str
     # CRITICAL: Send answer in chunks (same as deep research - 10000 chars per chunk)
     # This preserves markdown structure and ensures smooth streaming
     # CRITICAL: _chunk_text preserves all formatting including \n
-    for chunk in _chunk_text(answer, size=10000):
-        await stream_generator.emit_report_chunk(chunk)
-        await asyncio.sleep(0.02)
+    if not stream_generator.report_streamed:  # Already sent token by token
+        for chunk in _chunk_text(answer, size=10000):
+            await stream_generator.emit_report_chunk(chunk)
+            await asyncio.sleep(0.02)
     # CRITICAL: emit_final_report preserves all formatting including \n
     await stream_generator.emit_final_report(answer)
 
@@ -1,12 +1,14 @@
 """Chat message hybrid search engine with RRF (Reciprocal Rank Fusion)."""
 
 import asyncpg
+import numpy as np
 import structlog
 from dataclasses import dataclass
 from typing import Any
 from collections.abc import Sequence
 
 from src.embeddings.base import EmbeddingProvider
+from src.embeddings.vectors import fit_dimension
 
 logger = structlog.get_logger(__name__)
 
@@ -57,9 +59,10 @@ def _normalize_query(query: object) -> str:
     return str(query)
 
 
-def _format_vector_param(embedding: Sequence[float]) -> str:
+def _format_vector_param(embedding: Sequence[float] | np.ndarray) -> str:
     """Format embedding for pgvector input when asyncpg expects text."""
-    return "[" + ", ".join(str(value) for value in embedding) + "]"
+    values = embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+    return "[" + ", ".join(str(value) for value in values) + "]"
 
 
 class ChatMessageSearchEngine:
@@ -121,12 +124,8 @@ class ChatMessageSearchEngine:
         query_embedding = await self.embedding_provider.embed_text(query)
 
         # Normalize embedding to database schema dimension (not provider dimension!)
-        from src.database.schema import EMBEDDING_DIMENSION
-        db_dimension = EMBEDDING_DIMENSION
-        if len(query_embedding) < db_dimension:
-            query_embedding = list(query_embedding) + [0.0] * (db_dimension - len(query_embedding))
-        elif len(query_embedding) > db_dimension:
-            query_embedding = query_embedding[:db_dimension]
+        from src.database.schema import CHAT_EMBEDDING_DIMENSION
+        query_embedding = fit_dimension(query_embedding, CHAT_EMBEDDING_DIMENSION)
 
         embedding_param = _format_vector_param(query_embedding)
 
@@ -233,12 +232,8 @@ class ChatMessageSearchEngine:
         query_embedding = await self.embedding_provider.embed_text(query)
 
         # Normalize embedding to database schema dimension (not provider dimension!)
-        from src.database.schema import EMBEDDING_DIMENSION
-        db_dimension = EMBEDDING_DIMENSION
-        if len(query_embedding) < db_dimension:
-            query_embedding = list(query_embedding) + [0.0] * (db_dimension - len(query_embedding))
-        elif len(query_embedding) > db_dimension:
-            query_embedding = query_embedding[:db_dimension]
+        from src.database.schema import CHAT_EMBEDDING_DIMENSION
+        query_embedding = fit_dimension(query_embedding, CHAT_EMBEDDING_DIMENSION)
 
         embedding_param = _format_vector_param(query_embedding)
 
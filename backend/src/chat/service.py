@@ -17,13 +17,18 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from src.config.settings import Settings
 from src.embeddings.base import EmbeddingProvider
 from src.llm.factory import create_chat_model
+from src.llm.scheduler import LLMPriority, with_llm_priority
+from src.llm.streaming import stream_text
 from src.memory.hybrid_search import HybridSearchEngine
+from src.search.browser_pool import BrowserPool
 from src.search.factory import create_search_provider
 from src.search.models import ScrapedContent, SearchResult
+from src.search.page_cache import get_page_cache
 from src.search.reranker import SemanticReranker
 from src.search.scraper import WebScraper
 from src.utils.chat_history import format_chat_history
 from src.utils.date import get_current_date
+from src.utils.http import HTTPClientRegistry
 from src.utils.text import summarize_text
 from src.models.schemas import QueryRewrite, SearchQueries, FollowupQueries, SummarizedContent, SynthesizedAnswer
 
@@ -97,17 +102,33 @@ class ChatSearchService:
         settings: Settings,
         search_engine: HybridSearchEngine,
         embedding_provider: EmbeddingProvider,
+        http_clients: HTTPClientRegistry | None = None,
     ) -> None:
         self.settings = settings
         self.search_engine = search_engine
         self.embedding_provider = embedding_provider
-        self.search_provider = create_search_provider(settings)
+        self.search_provider = create_search_provider(settings, http_clients)
+        # Shared with the scraper but owned here: closed in close()
+        self.browser_pool = BrowserPool(
+            max_pages=settings.scraper_browser_max_pages,
+            page_timeout=settings.scraper_timeout,
+            block_resources=tuple(
+                kind.strip() for kind in settings.scraper_browser_block_resources.split(",") if kind.strip()
+            ),
+            context_max_uses=settings.scraper_browser_context_max_uses,
+        )
         self.scraper = WebScraper(
             timeout=settings.scraper_timeout,
             use_playwright=settings.scraper_use_playwright,
             scroll_enabled=settings.scraper_scroll_enabled,
             scroll_pause=settings.scraper_scroll_pause,
             max_scrolls=settings.scraper_max_scrolls,
+            http_clients=http_clients,
+            browser_pool=self.browser_pool,
+            page_cache=get_page_cache(settings),
+            extraction_engine=settings.scraper_extraction_engine,
+            extraction_workers=settings.scraper_extraction_workers,
+            extract_media=settings.scraper_extract_media,
         )
         self.reranker = SemanticReranker(embedding_provider)
         self.blocked_domains = _parse_blocklist(settings.search_blocked_domains)
@@ -126,6 +147,13 @@ class ChatSearchService:
             temperature=0.2,
         )
 
+    async def close(self) -> None:
+        """Close the search provider, the scraper and the browser pool (Playwright and Chromium)."""
+        await self.search_provider.close()
+        await self.scraper.close()
+        await self.browser_pool.close()
+
+    @with_llm_priority(LLMPriority.INTERACTIVE)
     async def answer_simple(
         self,
         query: str,
@@ -210,13 +238,12 @@ class ChatSearchService:
         )
         
         from langchain_core.messages import SystemMessage, HumanMessage
-        chat_result = await self.chat_llm.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
-        ])
-        
-        # CRITICAL: Get answer directly from LLM response (like DeepSearchNode)
-        answer = chat_result.content if hasattr(chat_result, 'content') else str(chat_result)
+        # Stream tokens to the client as they are generated
+        answer = await stream_text(
+            self.chat_llm,
+            [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)],
+            stream,
+        )
         
         # CRITICAL: Log EXACTLY what LLM returned - BEFORE any processing
         if answer:
@@ -246,6 +273,7 @@ class ChatSearchService:
             memory_context=[],
         )
 
+    @with_llm_priority(LLMPriority.INTERACTIVE)
     async def answer_web(
         self,
         query: str,
@@ -261,6 +289,7 @@ class ChatSearchService:
             messages=messages,
         )
 
+    @with_llm_priority(LLMPriority.INTERACTIVE)
     async def answer_deep(
         self,
         query: str,
@@ -300,37 +329,65 @@ class ChatSearchService:
             chat_history = format_chat_history(messages, self.settings.chat_history_limit)
             memory_context: list[dict[str, Any]] = []
 
-            # Classify query
-            from src.workflow.search.classifier import classify_query
-            if stream:
-                self._emit_status(stream, "Classifying query...", step="classification")
-            
-            classification = await classify_query(
-                query, 
-                [{"role": m.get("role", "user"), "content": m.get("content", "")} for m in (messages or [])],
-                self.chat_llm
-            )
+            history_dicts = [{"role": m.get("role", "user"), "content": m.get("content", "")} for m in (messages or [])]
 
             # Map tuning mode to research agent mode
             research_mode = "speed" if tuning.mode == "web" else "balanced" if tuning.mode == "deep" else "quality"
-            
+
+            # Classify query (and, when fused, plan the first searches in the same LLM call)
+            from src.workflow.search.actions import ActionRegistry
+            from src.workflow.search.classifier import classify_query, plan_search
+            if stream:
+                self._emit_status(stream, "Classifying query...", step="classification")
+
+            initial_queries: list[str] = []
+            initial_search: asyncio.Task | None = None
+            if self.settings.search_fused_planning:
+                classification = await plan_search(query, history_dicts, self.chat_llm)
+                initial_queries = classification.search_queries
+                if initial_queries:
+                    # Start the planned searches now; the agent awaits them as its first step
+                    initial_search = asyncio.create_task(
+                        ActionRegistry.execute(
+                            "web_search",
+                            {"queries": initial_queries},
+                            {
+                                "search_provider": self.search_provider,
+                                "scraper": self.scraper,
+                                "stream": stream,
+                                "llm": self.chat_llm,
+                                "mode": research_mode,
+                                "agent_id": "researcher",
+                                "original_query": query,
+                            },
+                        )
+                    )
+            else:
+                classification = await classify_query(query, history_dicts, self.chat_llm)
+
             # Use research agent (LLM-driven, like Perplexica)
             # LLM sees results and decides what to search next
             from src.workflow.search.researcher import research_agent
-            
+
             if stream:
                 self._emit_status(stream, f"Starting {research_mode} research...", step="research")
-            
-            research_results = await research_agent(
-                query=query,
-                classification=classification,
-                mode=research_mode,
-                llm=self.chat_llm,  # Use same LLM for research
-                search_provider=self.search_provider,
-                scraper=self.scraper,
-                stream=stream,
-                chat_history=[{"role": m.get("role", "user"), "content": m.get("content", "")} for m in (messages or [])],
-            )
+
+            try:
+                research_results = await research_agent(
+                    query=query,
+                    classification=classification,
+                    mode=research_mode,
+                    llm=self.chat_llm,  # Use same LLM for research
+                    search_provider=self.search_provider,
+                    scraper=self.scraper,
+                    stream=stream,
+                    chat_history=history_dicts,
+                    initial_queries=initial_queries,
+                    initial_search=initial_search,
+                )
+            finally:
+                if initial_search is not None and not initial_search.done():
+                    initial_search.cancel()
 
             # Extract sources from research results
             # research_agent returns sources as list of dicts from web_search action
@@ -414,6 +471,7 @@ class ChatSearchService:
                 memory_context=memory_context,
                 mode=writer_mode,
                 chat_history=chat_history,
+                stream=stream,
             )
 
             if not answer or not answer.strip():
@@ -788,6 +846,7 @@ class ChatSearchService:
         scraped = [item for item in results_list if item and not isinstance(item, Exception)]
         return scraped
 
+    @with_llm_priority(LLMPriority.SUMMARIZATION)
     async def _summarize_scraped(
         self,
         query: str,
@@ -855,6 +914,7 @@ class ChatSearchService:
         memory_context: list[dict[str, Any]],
         mode: str,
         chat_history: str | None = None,
+        stream: Any | None = None,
     ) -> str:
         sources_block = self._format_sources(sources, scraped)
         memory_block = self._format_memory(memory_context)
@@ -1092,13 +1152,13 @@ class ChatSearchService:
         )
         
         from langchain_core.messages import SystemMessage, HumanMessage
-        synthesis_result = await self.chat_llm.ainvoke([
-            SystemMessage(content=simple_system_prompt),
-            HumanMessage(content=simple_user_prompt)
-        ])
-        
-        # CRITICAL: Get answer directly from LLM response (like DeepSearchNode)
-        answer = synthesis_result.content if hasattr(synthesis_result, 'content') else str(synthesis_result)
+        # Stream tokens to the client as they are generated; the Sources section
+        # is checked and completed afterwards and sent with the final report
+        answer = await stream_text(
+            self.chat_llm,
+            [SystemMessage(content=simple_system_prompt), HumanMessage(content=simple_user_prompt)],
+            stream,
+        )
         
         # CRITICAL: Log EXACTLY what LLM returned - BEFORE any processing
         if answer:
@@ -76,16 +76,32 @@ class Settings(BaseSettings):
     chunk_size: int = Field(default=800, description="Chunk size for text splitting")
     chunk_overlap: int = Field(default=200, description="Chunk overlap")
 
+    # Agent session archival (finished sessions are packed into agent_sessions_archive/)
+    session_archive_enabled: bool = Field(default=True, description="Periodically archive finished agent session directories")
+    session_archive_interval_minutes: int = Field(default=60, description="Minutes between session archival passes")
+    session_archive_after_hours: int = Field(default=24, description="Hours after completion before a session is archived")
+    session_expiry_hours: int = Field(default=24, description="Hours after which incomplete sessions are marked expired")
+
     # Deep Research Multi-Agent Settings
     deep_research_num_agents: int = Field(default=3, description="Number of researcher agents for Deep Research mode")
     deep_research_enable_clarifying_questions: bool = Field(default=True, description="Enable clarifying questions in Deep Research mode")
     deep_research_run_deep_search_first: bool = Field(default=True, description="Run deep search before spawning agents in Deep Research mode")
 
     # Embedding Settings
-    embedding_provider: Literal["openai", "ollama", "cohere", "huggingface", "mock"] = Field(
+    embedding_provider: Literal["openai", "ollama", "cohere", "huggingface", "hashing", "mock"] = Field(
         default="openai", description="Embedding provider"
     )
     embedding_dimension: int = Field(default=1536, description="Embedding vector dimension")
+    memory_embedding_dimension: Optional[int] = Field(
+        default=None, description="Stored vector width for memory_chunks (default: embedding_dimension)"
+    )
+    chat_embedding_dimension: Optional[int] = Field(
+        default=None, description="Stored vector width for chat_messages (default: embedding_dimension)"
+    )
+    embedding_coalesce_window_ms: float = Field(
+        default=5.0, description="Window for micro-batching concurrent embed_text calls (0 disables)"
+    )
+    embedding_coalesce_max_batch_size: int = Field(default=64, description="Max texts per coalesced embedding batch")
 
     # OpenAI Embeddings
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
@@ -93,6 +109,10 @@ class Settings(BaseSettings):
         default=None, description="OpenAI API base URL (for OpenRouter, 302.AI, or any OpenAI-compatible API)"
     )
     openai_embedding_model: str = Field(default="text-embedding-3-small", description="OpenAI embedding model")
+    openai_embedding_max_batch_tokens: int = Field(default=250000, description="Token budget per OpenAI embedding request")
+    openai_embedding_max_batch_size: int = Field(default=2048, description="Max inputs per OpenAI embedding request")
+    openai_embedding_concurrency: int = Field(default=4, description="Concurrent OpenAI embedding requests")
+    openai_embedding_max_retries: int = Field(default=5, description="Retries per OpenAI embedding request")
     
     # OpenAI-compatible API headers (for OpenRouter, etc.)
     openai_api_http_referer: Optional[str] = Field(
@@ -105,6 +125,10 @@ class Settings(BaseSettings):
     # Ollama Embeddings
     ollama_base_url: str = Field(default="http://localhost:11434", description="Ollama base URL")
     ollama_embedding_model: str = Field(default="nomic-embed-text", description="Ollama embedding model")
+    ollama_embedding_batch_size: int = Field(default=64, description="Texts per Ollama /api/embed request")
+    ollama_embedding_concurrency: int = Field(default=4, description="Concurrent Ollama embedding requests")
+    ollama_embedding_max_retries: int = Field(default=3, description="Retries per Ollama embedding request")
+    ollama_embedding_timeout: float = Field(default=60.0, description="Ollama embedding request timeout in seconds")
 
     # Cohere Embeddings
     cohere_api_key: Optional[str] = Field(default=None, description="Cohere API key")
@@ -117,9 +141,44 @@ class Settings(BaseSettings):
         default="sentence-transformers/all-MiniLM-L6-v2", description="HuggingFace model"
     )
     huggingface_use_local: bool = Field(default=True, description="Use local HuggingFace model")
+    huggingface_batch_size: int = Field(default=64, description="Texts per HuggingFace forward pass")
+    huggingface_max_batch_texts: int = Field(
+        default=512, description="Max queued texts merged into one HuggingFace encode call"
+    )
+    huggingface_torch_threads: Optional[int] = Field(default=None, description="torch intra-op threads (default: torch)")
+    huggingface_torch_interop_threads: Optional[int] = Field(
+        default=None, description="torch inter-op threads (default: torch)"
+    )
+    huggingface_warmup: bool = Field(default=True, description="Run a warm-up encode at startup")
+
+    # Outbound HTTP connection pool (search, scraping, Ollama embeddings)
+    http_pool_limit: int = Field(default=100, description="Max open outbound HTTP connections")
+    http_pool_limit_per_host: int = Field(default=10, description="Max open outbound HTTP connections per host")
+    http_dns_cache_ttl: int = Field(default=300, description="Seconds outbound DNS lookups are cached")
+    http_keepalive_timeout: float = Field(default=30.0, description="Seconds idle outbound connections are kept open")
+
+    # Per-host limits for search engines and scraped sites
+    host_rate_limit: float = Field(default=10.0, description="Requests per second per outbound host (0 disables)")
+    host_rate_burst: int = Field(default=20, description="Requests per outbound host allowed at once before rate limiting")
+    host_max_concurrency: int = Field(default=10, description="Concurrent requests per outbound host (0 disables)")
+    host_failure_threshold: int = Field(
+        default=5, description="Consecutive failures or timeouts that open a host's circuit (0 disables)"
+    )
+    host_circuit_reset_seconds: float = Field(
+        default=30.0, description="Seconds a host's circuit stays open before a probe request"
+    )
 
     # Search Settings
     search_provider: Literal["tavily", "searxng", "mock"] = Field(default="tavily", description="Search provider")
+    search_hedge_provider: Literal["", "tavily", "searxng"] = Field(
+        default="", description="Second provider raced against slow or poor search_provider responses (empty disables)"
+    )
+    search_hedge_quantile: float = Field(default=0.9, description="Primary latency quantile used as the hedge delay")
+    search_hedge_initial_delay: float = Field(
+        default=1.0, description="Hedge delay in seconds until enough primary latencies are known"
+    )
+    search_hedge_min_delay: float = Field(default=0.2, description="Lower bound of the hedge delay in seconds")
+    search_hedge_max_delay: float = Field(default=5.0, description="Upper bound of the hedge delay in seconds")
     
     # Web Scraper Settings
     scraper_timeout: int = Field(default=30, description="Web scraper timeout in seconds")
@@ -127,10 +186,50 @@ class Settings(BaseSettings):
     scraper_scroll_enabled: bool = Field(default=False, description="Enable automatic scrolling to load dynamic content")
     scraper_scroll_pause: float = Field(default=1.0, description="Pause between scrolls in seconds")
     scraper_max_scrolls: int = Field(default=5, description="Maximum number of scroll operations")
+    scraper_browser_max_pages: int = Field(default=4, description="Pages the shared Playwright browser renders at once")
+    scraper_browser_block_resources: str = Field(
+        default="image,font,media", description="Resource types not loaded when rendering with Playwright (comma-separated)"
+    )
+    scraper_browser_context_max_uses: int = Field(
+        default=50, description="Renders after which a Playwright browser context is replaced"
+    )
+    scraper_extraction_engine: Literal["lxml", "bs4"] = Field(
+        default="lxml", description="HTML extraction engine: lxml (single parse, main content scoring) or bs4"
+    )
+    scraper_extraction_workers: int = Field(
+        default=2, description="Worker processes extracting large pages off the event loop (0 extracts inline)"
+    )
+    scraper_extract_media: bool = Field(default=False, description="Collect image and outbound link URLs of pages")
+
+    # Scraped page cache
+    page_cache_enabled: bool = Field(default=True, description="Cache extracted pages and revalidate them conditionally")
+    page_cache_path: str = Field(
+        default="./data/page_cache.db", description="SQLite file for cached pages (empty keeps memory only)"
+    )
+    page_cache_max_bytes: int = Field(default=500_000_000, description="Max total size of cached pages in bytes")
+    page_cache_default_ttl_seconds: float = Field(
+        default=3600.0, description="Freshness of pages whose responses set no max-age or Expires"
+    )
+    page_cache_max_ttl_seconds: float = Field(default=86400.0, description="Upper bound of cached page freshness")
+
+    # Search result cache
+    search_cache_enabled: bool = Field(default=True, description="Cache search responses for repeated queries")
+    search_cache_path: str = Field(
+        default="./data/search_cache.db", description="SQLite file for cached search responses (empty keeps memory only)"
+    )
+    search_cache_ttl_seconds: float = Field(default=3600.0, description="How long cached search responses are fresh")
+    search_cache_stale_seconds: float = Field(
+        default=21600.0, description="How long stale search responses are served while refreshed in the background"
+    )
+    search_cache_max_entries: int = Field(default=20000, description="Max cached search responses on disk")
+    search_cache_memory_max_entries: int = Field(default=2000, description="Max cached search responses in memory")
 
     # Tavily
     tavily_api_key: Optional[str] = Field(default=None, description="Tavily API key")
     tavily_max_results: int = Field(default=8, description="Tavily max results")
+    tavily_max_concurrency: int = Field(default=8, description="Concurrent requests to the Tavily API")
+    tavily_timeout: float = Field(default=30.0, description="Total timeout per Tavily request in seconds")
+    tavily_connect_timeout: float = Field(default=5.0, description="Connect timeout per Tavily request in seconds")
 
     # SearXNG
     searxng_instance_url: Optional[str] = Field(default="http://localhost:8080", description="SearXNG instance URL")
@@ -143,6 +242,18 @@ class Settings(BaseSettings):
 
     # LLM Settings
     llm_mode: Literal["live", "mock"] = Field(default="live", description="LLM mode: live or mock")
+    mock_llm_latency_ms: float = Field(default=0.0, description="Mock LLM mean delay before the first token")
+    mock_llm_latency_distribution: Literal["fixed", "lognormal"] = Field(
+        default="fixed", description="Mock LLM first-token delay distribution"
+    )
+    mock_llm_latency_sigma: float = Field(default=0.5, description="Mock LLM lognormal latency spread")
+    mock_llm_token_ms: float = Field(default=0.0, description="Mock LLM delay per generated token")
+    mock_llm_site_latency_ms: str = Field(
+        default="", description="Mock LLM per call-site or priority delays, e.g. classify_query=200,agent=1500"
+    )
+    mock_llm_failure_rate: float = Field(default=0.0, description="Fraction of mock LLM calls failing with a 500")
+    mock_llm_rate_limit_rate: float = Field(default=0.0, description="Fraction of mock LLM calls failing with a 429")
+    mock_llm_seed: Optional[int] = Field(default=None, description="Seed for reproducible mock LLM behaviour")
     chat_model: str = Field(default="z-ai:glm-4.7", description="Chat model for search answers")
     chat_model_max_tokens: int = Field(default=32768, description="Chat model max tokens for writer synthesis")
 
@@ -160,6 +271,33 @@ class Settings(BaseSettings):
     final_report_model: str = Field(default="z-ai:glm-4.7", description="Final report model")
     final_report_model_max_tokens: int = Field(default=131072, description="Final report model max tokens (increased for comprehensive reports)")
 
+    # LLM scheduler (shared by all chat models)
+    llm_scheduler_enabled: bool = Field(default=True, description="Queue LLM calls by provider limits and priority")
+    llm_max_concurrency: int = Field(default=8, description="Concurrent LLM calls per provider")
+    llm_tokens_per_minute: int = Field(default=0, description="Token budget per provider per minute (0 = unlimited)")
+    llm_provider_concurrency: str = Field(
+        default="", description="Per-provider concurrency overrides, e.g. openai=16,anthropic=4"
+    )
+    llm_provider_tokens_per_minute: str = Field(
+        default="", description="Per-provider token budget overrides, e.g. openai=2000000,anthropic=400000"
+    )
+
+    # LLM response cache (exact match on model, temperature, messages and schema)
+    llm_cache_enabled: bool = Field(default=True, description="Cache LLM responses for identical requests")
+    llm_cache_path: str = Field(
+        default="./data/llm_cache.db", description="SQLite file for cached LLM responses (empty keeps memory only)"
+    )
+    llm_cache_ttl_seconds: float = Field(default=86400.0, description="Cached LLM response lifetime (0 never expires)")
+    llm_cache_max_entries: int = Field(default=10000, description="Max cached LLM responses on disk")
+    llm_cache_memory_max_entries: int = Field(default=1000, description="Max cached LLM responses in memory")
+    llm_cache_allow_nondeterministic: bool = Field(
+        default=False, description="Also cache models with temperature > 0 (otherwise only per call-site opt-in)"
+    )
+
+    # LLM usage accounting (tokens and latency per session, node, agent and call site)
+    llm_usage_tracking_enabled: bool = Field(default=True, description="Record token use and latency of LLM calls")
+    llm_usage_max_sessions: int = Field(default=200, description="Research sessions whose usage is kept in memory")
+
     # Anthropic (for Claude models)
     anthropic_api_key: Optional[str] = Field(default=None, description="Anthropic API key")
 
@@ -178,6 +316,8 @@ class Settings(BaseSettings):
     deep_research_agent_max_steps: int = Field(default=10, description="Max steps per agent task in deep research")  # Increased for deeper research
     deep_research_supervisor_max_iterations: int = Field(default=7, description="Max ReAct iterations per ONE supervisor call (not total) - keep low to force frequent agent-supervisor cycles")  # Low value = supervisor works quickly and returns to agents
     deep_research_default_max_iterations: int = Field(default=20, description="Default max iterations for deep research cycles")  # Increased from 15 for more comprehensive research
+    deep_research_note_context_top_k: int = Field(default=8, description="Max relevant notes included in a researcher agent prompt")
+    deep_research_note_context_token_budget: int = Field(default=1500, description="Token budget for notes included in a researcher agent prompt")
 
     # Advanced Settings
     memory_context_limit: int = Field(default=6, description="Max memory snippets for chat prompts")
@@ -202,6 +342,10 @@ class Settings(BaseSettings):
     deep_search_quality_iterations: int = Field(
         default=25, description="Search refinement iterations for quality deep search"
     )
+    search_fused_planning: bool = Field(
+        default=True,
+        description="Classify and plan the first search queries in one LLM call, starting those searches right away",
+    )
 
     max_retries: int = Field(default=3, description="Max retries for API calls")
     max_structured_output_retries: int = Field(default=3, description="Max retries for structured output")
@@ -0,0 +1,100 @@
+"""Re-project stored pgvector embeddings to a new storage dimension."""
+
+import json
+
+import numpy as np
+import structlog
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from src.embeddings.vectors import fit_dimension
+
+logger = structlog.get_logger(__name__)
+
+# Tables with an embedding column and the ivfflat index built on it
+EMBEDDING_TABLES = {
+    "memory_chunks": "idx_memory_chunks_embedding",
+    "chat_messages": "idx_chat_messages_embedding",
+}
+
+
+def get_vector_dimension(conn: Connection, table: str, column: str = "embedding") -> int | None:
+    """Return the declared width of a vector column, or None if it is missing or unconstrained."""
+    row = conn.execute(
+        text(
+            "SELECT atttypmod FROM pg_attribute "
+            "WHERE attrelid = CAST(:table AS regclass) AND attname = :column AND NOT attisdropped"
+        ),
+        {"table": table, "column": column},
+    ).first()
+    if row is None or row[0] is None or row[0] <= 0:
+        return None
+    return int(row[0])
+
+
+def reproject_embedding_column(conn: Connection, table: str, dimension: int, batch_size: int = 500) -> int:
+    """
+    Rewrite a table's embedding column at a new width.
+
+    Longer vectors are truncated and re-normalized (Matryoshka), shorter ones
+    zero-padded, using the same fit_dimension as the write path. The vector
+    index is dropped and rebuilt around the rewrite.
+
+    Args:
+        conn: Sync connection inside a transaction
+        table: Table name (key of EMBEDDING_TABLES)
+        dimension: Target storage dimension
+        batch_size: Rows read and rewritten per round trip
+
+    Returns:
+        Number of vectors re-projected (0 if the column already has this width)
+    """
+    index_name = EMBEDDING_TABLES[table]
+    current = get_vector_dimension(conn, table)
+    if current is None or current == dimension:
+        return 0
+    if dimension > current:
+        logger.warning(
+            "Widening embedding column zero-pads vectors; re-embed for full quality",
+            table=table,
+            from_dimension=current,
+            to_dimension=dimension,
+        )
+
+    conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN embedding_reprojected vector({dimension})"))
+
+    total = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            text(
+                f"SELECT id, embedding::text FROM {table} "
+                "WHERE embedding IS NOT NULL AND id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": batch_size},
+        ).all()
+        if not rows:
+            break
+        # pgvector text output ("[1,2,3]") is valid JSON
+        vectors = fit_dimension(np.array([json.loads(row[1]) for row in rows], dtype=np.float32), dimension)
+        conn.execute(
+            text(f"UPDATE {table} SET embedding_reprojected = CAST(:vector AS vector) WHERE id = :id"),
+            [
+                {"id": row[0], "vector": "[" + ",".join(map(repr, vector.tolist())) + "]"}
+                for row, vector in zip(rows, vectors, strict=True)
+            ],
+        )
+        total += len(rows)
+        last_id = rows[-1][0]
+
+    conn.execute(text(f"ALTER TABLE {table} DROP COLUMN embedding"))
+    conn.execute(text(f"ALTER TABLE {table} RENAME COLUMN embedding_reprojected TO embedding"))
+    conn.execute(
+        text(
+            f"CREATE INDEX {index_name} ON {table} "
+            "USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+        )
+    )
+    logger.info("Re-projected embeddings", table=table, from_dimension=current, to_dimension=dimension, rows=total)
+    return total
@@ -41,6 +41,36 @@ def _get_embedding_dimension() -> int:
 EMBEDDING_DIMENSION = _get_embedding_dimension()
 
 
+def _get_storage_dimension(env_var: str, setting: str) -> int:
+    """Get the stored vector width for one table.
+
+    Tables may store fewer dimensions than the provider produces (Matryoshka
+    truncation of text-embedding-3-*); vectors are truncated and
+    re-normalized to this width before they are written or queried.
+    Falls back to EMBEDDING_DIMENSION.
+    """
+    env_dim = os.getenv(env_var)
+    if env_dim:
+        try:
+            return int(env_dim)
+        except ValueError:
+            pass
+
+    try:
+        from src.config.settings import get_settings
+        value = getattr(get_settings(), setting)
+        if value:
+            return value
+    except Exception:
+        pass
+    return EMBEDDING_DIMENSION
+
+
+# Per-table storage dimensions
+MEMORY_EMBEDDING_DIMENSION = _get_storage_dimension("MEMORY_EMBEDDING_DIMENSION", "memory_embedding_dimension")
+CHAT_EMBEDDING_DIMENSION = _get_storage_dimension("CHAT_EMBEDDING_DIMENSION", "chat_embedding_dimension")
+
+
 class MemoryFileModel(Base):
     """Memory file model with metadata."""
 
@@ -92,7 +122,7 @@ class MemoryChunkModel(Base):
     chunk_index = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
     content_hash = Column(String(64), nullable=False)
-    embedding = Column(Vector(EMBEDDING_DIMENSION))  # Dimension from settings/environment
+    embedding = Column(Vector(MEMORY_EMBEDDING_DIMENSION))  # Storage dimension from settings/environment
     header_path = Column(ARRAY(Text), default=list)
     section_level = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -219,7 +249,7 @@ class ChatMessageModel(Base):
     message_id = Column(String(64), nullable=False, index=True)
     role = Column(String(16), nullable=False)  # user, assistant, system
     content = Column(Text, nullable=False)
-    embedding = Column(Vector(EMBEDDING_DIMENSION))  # Dimension from settings/environment
+    embedding = Column(Vector(CHAT_EMBEDDING_DIMENSION))  # Storage dimension from settings/environment
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     message_metadata = Column("metadata", JSONB, default=dict)
 
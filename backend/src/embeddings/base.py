@@ -2,6 +2,10 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from src.embeddings.vectors import as_float32_array
+
 
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
@@ -32,6 +36,21 @@ class EmbeddingProvider(ABC):
         """
         pass
 
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate embeddings for batch of texts as one contiguous float32 array.
+
+        Providers that receive embeddings as arrays or raw buffers override this
+        to skip the intermediate Python lists.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        return as_float32_array(await self.embed_batch(texts), self.get_dimension())
+
     @abstractmethod
     def get_dimension(self) -> int:
         """
@@ -0,0 +1,120 @@
+"""Micro-batching wrapper that coalesces concurrent embed_text calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import numpy as np
+import structlog
+
+from src.embeddings.base import EmbeddingProvider
+
+logger = structlog.get_logger(__name__)
+
+
+class CoalescingEmbeddingProvider(EmbeddingProvider):
+    """Wrap an EmbeddingProvider so concurrent single-text calls share one batch request.
+
+    embed_text calls arriving within window_ms of the first pending call (or
+    until max_batch_size texts are pending) are sent as one embed_batch call
+    to the wrapped provider and the results are fanned back out. Identical
+    texts in the same window are embedded once. embed_batch calls pass
+    straight through.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, window_ms: float = 5.0, max_batch_size: int = 64):
+        """
+        Initialize coalescer.
+
+        Args:
+            provider: Embedding provider to wrap
+            window_ms: How long the first pending call waits for others to join
+            max_batch_size: Flush immediately once this many texts are pending
+        """
+        self.provider = provider
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.requests = 0
+        self.provider_calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific attributes (model, rate_limiter, ...) stay reachable
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def embed_text(self, text: str) -> list[float]:
+        """Generate embedding for single text, batched with concurrent callers."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for batch of texts."""
+        self.requests += 1
+        self.provider_calls += 1
+        return await self.provider.embed_batch(texts)
+
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for batch of texts as a float32 array."""
+        self.requests += 1
+        self.provider_calls += 1
+        return await self.provider.embed_batch_array(texts)
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension."""
+        return self.provider.get_dimension()
+
+    async def close(self) -> None:
+        """Close the wrapped provider if it holds resources."""
+        close = getattr(self.provider, "close", None)
+        if close:
+            await close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return coalescing counters."""
+        return {
+            "requests": self.requests,
+            "provider_calls": self.provider_calls,
+            "saved_calls": max(0, self.requests - self.provider_calls),
+        }
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        self.provider_calls += 1
+        try:
+            embeddings = await self.provider.embed_batch(unique_texts)
+            by_text = dict(zip(unique_texts, embeddings, strict=True))
+        except Exception as e:
+            logger.error("Coalesced embedding batch failed", error=str(e), batch_size=len(unique_texts))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
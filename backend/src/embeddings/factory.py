@@ -4,19 +4,58 @@ import structlog
 
 from src.config.settings import Settings
 from src.embeddings.base import EmbeddingProvider
+from src.embeddings.coalescer import CoalescingEmbeddingProvider
+from src.embeddings.hashing_provider import HashingEmbeddingProvider
 from src.embeddings.mock_provider import MockEmbeddingProvider
 from src.embeddings.openai_provider import OpenAIEmbeddingProvider
 from src.embeddings.ollama_provider import OllamaEmbeddingProvider
+from src.utils.http import HTTPClientRegistry
 
 logger = structlog.get_logger(__name__)
 
 
-def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
+def create_embedding_provider(
+    settings: Settings, http_clients: HTTPClientRegistry | None = None
+) -> EmbeddingProvider:
     """
     Create embedding provider based on settings.
 
+    Unless EMBEDDING_COALESCE_WINDOW_MS is 0, the provider is wrapped so that
+    concurrent embed_text calls are micro-batched into one embed_batch call.
+
+    Args:
+        settings: Application settings
+        http_clients: Shared HTTP client registry for HTTP-based providers
+
+    Returns:
+        Embedding provider instance
+
+    Raises:
+        ValueError: If provider is not supported or required API key is missing
+    """
+    provider = _create_base_provider(settings, http_clients)
+    if settings.embedding_coalesce_window_ms <= 0:
+        return provider
+
+    logger.info(
+        "Coalescing concurrent embedding requests",
+        window_ms=settings.embedding_coalesce_window_ms,
+        max_batch_size=settings.embedding_coalesce_max_batch_size,
+    )
+    return CoalescingEmbeddingProvider(
+        provider,
+        window_ms=settings.embedding_coalesce_window_ms,
+        max_batch_size=settings.embedding_coalesce_max_batch_size,
+    )
+
+
+def _create_base_provider(settings: Settings, http_clients: HTTPClientRegistry | None) -> EmbeddingProvider:
+    """
+    Create the underlying embedding provider based on settings.
+
     Args:
         settings: Application settings
+        http_clients: Shared HTTP client registry for HTTP-based providers
 
     Returns:
         Embedding provider instance
@@ -29,8 +68,8 @@ def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
     if provider == "openai":
         if not settings.openai_api_key:
             if settings.llm_mode == "mock":
-                logger.warning("OpenAI API key missing in mock mode, using mock embeddings")
-                return MockEmbeddingProvider(dimension=settings.embedding_dimension)
+                logger.warning("OpenAI API key missing in mock mode, using hashing embeddings")
+                return HashingEmbeddingProvider(dimension=settings.embedding_dimension)
             raise ValueError("OpenAI API key is required for OpenAI embedding provider")
 
         logger.info(
@@ -42,6 +81,11 @@ def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
             api_key=settings.openai_api_key,
             model=settings.openai_embedding_model,
             dimension=settings.embedding_dimension,
+            base_url=settings.openai_base_url,
+            max_batch_tokens=settings.openai_embedding_max_batch_tokens,
+            max_batch_size=settings.openai_embedding_max_batch_size,
+            max_concurrency=settings.openai_embedding_concurrency,
+            max_retries=settings.openai_embedding_max_retries,
         )
 
     elif provider == "ollama":
@@ -53,6 +97,11 @@ def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
         return OllamaEmbeddingProvider(
             base_url=settings.ollama_base_url,
             model=settings.ollama_embedding_model,
+            batch_size=settings.ollama_embedding_batch_size,
+            max_concurrency=settings.ollama_embedding_concurrency,
+            max_retries=settings.ollama_embedding_max_retries,
+            timeout=settings.ollama_embedding_timeout,
+            http_clients=http_clients,
         )
 
     elif provider == "mock":
@@ -62,6 +111,13 @@ def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
         )
         return MockEmbeddingProvider(dimension=settings.embedding_dimension)
 
+    elif provider == "hashing":
+        logger.info(
+            "Creating hashing embedding provider",
+            dimension=settings.embedding_dimension,
+        )
+        return HashingEmbeddingProvider(dimension=settings.embedding_dimension)
+
     elif provider == "cohere":
         try:
             from src.embeddings.cohere_provider import CohereEmbeddingProvider
@@ -94,6 +150,10 @@ def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
                 model=settings.huggingface_model,
                 api_key=settings.huggingface_api_key,
                 use_local=settings.huggingface_use_local,
+                batch_size=settings.huggingface_batch_size,
+                max_batch_texts=settings.huggingface_max_batch_texts,
+                torch_threads=settings.huggingface_torch_threads,
+                torch_interop_threads=settings.huggingface_torch_interop_threads,
             )
         except ImportError:
             raise ValueError(
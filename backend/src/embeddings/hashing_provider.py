@@ -0,0 +1,112 @@
+"""Deterministic feature-hashing embedding provider for offline runs and load tests."""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+from src.embeddings.base import EmbeddingProvider
+from src.embeddings.vectors import l2_normalize
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@lru_cache(maxsize=1 << 18)
+def _bucket(feature: str, dimension: int) -> tuple[int, float]:
+    # Index and sign from independent bits of one digest (a sign tied to the index would
+    # make colliding features add up instead of cancelling, biasing unrelated texts' similarity)
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=9).digest()
+    index = int.from_bytes(digest[:8], "little") % dimension
+    sign = 1.0 if digest[8] & 1 else -1.0
+    return index, sign
+
+
+@lru_cache(maxsize=1 << 16)
+def _char_ngrams(word: str, min_n: int, max_n: int) -> tuple[str, ...]:
+    padded = f"<{word}>"
+    return tuple("c:" + padded[i : i + n] for n in range(min_n, max_n + 1) for i in range(len(padded) - n + 1))
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Embed texts by hashing character and word n-grams into a fixed-size vector.
+
+    No model and no network: every feature (word n-grams and character
+    n-grams of each word) is hashed to a signed bucket, counts are damped
+    with 1 + log(tf) and the vector is L2-normalized. Texts that share
+    words or word fragments get high cosine similarity, so ranking,
+    filtering and vector-index code paths behave realistically in mock mode,
+    benchmarks and CI. Output is identical across processes and runs.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 1536,
+        char_ngram_range: tuple[int, int] = (3, 5),
+        word_ngram_range: tuple[int, int] = (1, 2),
+        word_weight: float = 2.0,
+    ) -> None:
+        """
+        Initialize hashing embedding provider.
+
+        Args:
+            dimension: Output vector dimension
+            char_ngram_range: Min and max character n-gram length (within words)
+            word_ngram_range: Min and max word n-gram length
+            word_weight: Weight of word n-grams relative to character n-grams
+        """
+        self.dimension = dimension
+        self.char_ngram_range = char_ngram_range
+        self.word_ngram_range = word_ngram_range
+        self.word_weight = word_weight
+
+    async def embed_text(self, text: str) -> list[float]:
+        """Generate embedding for single text."""
+        return self._embed(text).tolist()
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for batch of texts."""
+        return (await self.embed_batch_array(texts)).tolist()
+
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for batch of texts as a float32 array."""
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.vstack([self._embed(text) for text in texts])
+
+    def get_dimension(self) -> int:
+        """Get embedding dimension."""
+        return self.dimension
+
+    def _features(self, text: str) -> Counter:
+        words = _TOKEN_RE.findall(text.lower())
+        features: Counter = Counter()
+
+        min_n, max_n = self.word_ngram_range
+        for n in range(min_n, max_n + 1):
+            for i in range(len(words) - n + 1):
+                features["w:" + " ".join(words[i : i + n])] += 1
+
+        min_n, max_n = self.char_ngram_range
+        for word, count in Counter(words).items():
+            for ngram in _char_ngrams(word, min_n, max_n):
+                features[ngram] += count
+        return features
+
+    def _embed(self, text: str) -> np.ndarray:
+        features = self._features(text)
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        if not features:
+            return vector
+
+        indices = np.empty(len(features), dtype=np.int64)
+        values = np.empty(len(features), dtype=np.float32)
+        for i, (feature, count) in enumerate(features.items()):
+            index, sign = _bucket(feature, self.dimension)
+            weight = self.word_weight if feature.startswith("w:") else 1.0
+            indices[i] = index
+            values[i] = sign * weight * (1.0 + math.log(count))
+        np.add.at(vector, indices, values)
+        return l2_normalize(vector)
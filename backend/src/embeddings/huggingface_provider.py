@@ -1,11 +1,15 @@
 """HuggingFace embedding provider (optional dependency)."""
 
 import asyncio
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
+import numpy as np
 import structlog
 
 from src.embeddings.base import EmbeddingProvider
+from src.embeddings.vectors import as_float32_array
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -13,17 +17,33 @@ try:
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
 
 class HuggingFaceEmbeddingProvider(EmbeddingProvider):
-    """HuggingFace embedding provider using sentence-transformers."""
+    """HuggingFace embedding provider using sentence-transformers.
+
+    All inference runs on one dedicated worker thread. Requests are queued;
+    the dispatcher takes everything pending (up to max_batch_texts), sorts
+    the texts by length so padding is minimal and encodes them in one call,
+    instead of many small encode() calls competing for the same CPU cores.
+    """
 
     def __init__(
         self,
         model: str = "sentence-transformers/all-MiniLM-L6-v2",
         api_key: Optional[str] = None,
         use_local: bool = True,
+        batch_size: int = 64,
+        max_batch_texts: int = 512,
+        torch_threads: Optional[int] = None,
+        torch_interop_threads: Optional[int] = None,
     ):
         """
         Initialize HuggingFace embedding provider.
@@ -32,6 +52,10 @@ class HuggingFaceEmbeddingProvider(EmbeddingProvider):
             model: Model name or path
             api_key: HuggingFace API key (optional, for private models)
             use_local: Use local model (True) or API (False)
+            batch_size: Texts per forward pass
+            max_batch_texts: Max texts merged from queued requests into one encode call
+            torch_threads: torch intra-op threads (None keeps the torch default)
+            torch_interop_threads: torch inter-op threads (None keeps the torch default)
         """
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError(
@@ -42,22 +66,36 @@ class HuggingFaceEmbeddingProvider(EmbeddingProvider):
         self.model_name = model
         self.api_key = api_key
         self.use_local = use_local
+        self.batch_size = max(1, batch_size)
+        self.max_batch_texts = max(1, max_batch_texts)
 
-        if use_local:
-            # Load model locally
-            self.model = SentenceTransformer(model)
-            self.dimension = self.model.get_sentence_embedding_dimension()
-        else:
+        if not use_local:
             # API-based would need different implementation
             raise NotImplementedError("API-based HuggingFace embeddings not yet implemented")
 
+        _configure_torch_threads(torch_threads, torch_interop_threads)
+        # Load model locally
+        self.model = SentenceTransformer(model)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+        # Intra-op thread count can be per calling thread, so set it on the worker too
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="hf-embed",
+            initializer=_configure_torch_threads,
+            initargs=(torch_threads, None),
+        )
+        self._queue: asyncio.Queue[tuple[list[str], asyncio.Future]] | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self.texts_encoded = 0
+        self.encode_calls = 0
+        self.encode_seconds = 0.0
+
     async def embed_text(self, text: str) -> list[float]:
         """Generate embedding for single text."""
         try:
-            # Run in thread pool since sentence-transformers is synchronous
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(None, lambda: self.model.encode(text))
-            return embedding.tolist()
+            embeddings = await self.embed_batch_array([text])
+            return embeddings[0].tolist()
         except Exception as e:
             logger.error("Failed to generate HuggingFace embedding", error=str(e), model=self.model_name)
             raise
@@ -66,19 +104,116 @@ class HuggingFaceEmbeddingProvider(EmbeddingProvider):
         """Generate embeddings for batch of texts."""
         if not texts:
             return []
+        return (await self.embed_batch_array(texts)).tolist()
 
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for batch of texts as a float32 array (no list conversion)."""
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_dispatcher()
+        await self._queue.put((list(texts), future))
         try:
-            # Run in thread pool
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                None,
-                lambda: self.model.encode(texts, show_progress_bar=False)
-            )
-            return embeddings.tolist()
+            return await future
         except Exception as e:
             logger.error("Failed to generate HuggingFace batch embeddings", error=str(e), batch_size=len(texts))
             raise
 
+    async def warm_up(self) -> None:
+        """Run one encode so weights, kernels and thread pools are initialized before traffic."""
+        start = time.perf_counter()
+        await self.embed_batch_array(["warm-up"] * min(self.batch_size, 8))
+        logger.info(
+            "HuggingFace embedding model warmed up",
+            model=self.model_name,
+            seconds=round(time.perf_counter() - start, 3),
+        )
+
     def get_dimension(self) -> int:
         """Get embedding dimension."""
         return self.dimension
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return inference counters and CPU throughput."""
+        return {
+            "texts_encoded": self.texts_encoded,
+            "encode_calls": self.encode_calls,
+            "encode_seconds": round(self.encode_seconds, 3),
+            "texts_per_second": round(self.texts_encoded / self.encode_seconds, 1) if self.encode_seconds else 0.0,
+        }
+
+    async def close(self) -> None:
+        """Stop the dispatcher and the inference thread."""
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("HuggingFace embedding stats", model=self.model_name, **self.get_stats())
+
+    def _ensure_dispatcher(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+
+    async def _dispatch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = [await self._queue.get()]
+            pending_texts = len(requests[0][0])
+            # Merge whatever queued up while the previous batch was encoding
+            while not self._queue.empty() and pending_texts < self.max_batch_texts:
+                request = self._queue.get_nowait()
+                requests.append(request)
+                pending_texts += len(request[0])
+
+            texts = [text for request_texts, _ in requests for text in request_texts]
+            try:
+                embeddings = await loop.run_in_executor(self._executor, self._encode_sorted, texts)
+            except Exception as e:
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_texts, future in requests:
+                if not future.done():
+                    future.set_result(embeddings[offset : offset + len(request_texts)])
+                offset += len(request_texts)
+
+    def _encode_sorted(self, texts: list[str]) -> np.ndarray:
+        """Encode on the inference thread, longest texts first, restoring input order."""
+        start = time.perf_counter()
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        encoded = self.model.encode(
+            [texts[i] for i in order],
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+        )
+        embeddings = np.empty_like(as_float32_array(encoded))
+        embeddings[order] = encoded
+
+        self.encode_seconds += time.perf_counter() - start
+        self.encode_calls += 1
+        self.texts_encoded += len(texts)
+        return embeddings
+
+
+def _configure_torch_threads(threads: Optional[int], interop_threads: Optional[int]) -> None:
+    if not TORCH_AVAILABLE:
+        return
+    if threads:
+        torch.set_num_threads(threads)
+    if interop_threads:
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError:
+            # Only allowed once per process, before any inter-op parallel work
+            logger.warning("torch inter-op threads already fixed", requested=interop_threads)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from src.embeddings.base import EmbeddingProvider
 
 
@@ -17,5 +19,8 @@ class MockEmbeddingProvider(EmbeddingProvider):
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         return [[0.0] * self.dimension for _ in texts]
 
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        return np.zeros((len(texts), self.dimension), dtype=np.float32)
+
     def get_dimension(self) -> int:
         return self.dimension
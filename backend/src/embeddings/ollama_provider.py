@@ -1,67 +1,162 @@
 """Ollama embedding provider for local embeddings."""
 
+import asyncio
+import json
+
 import aiohttp
 import structlog
 
 from src.embeddings.base import EmbeddingProvider
+from src.utils.http import HTTPClientRegistry
 
 logger = structlog.get_logger(__name__)
 
+_RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
 
 class OllamaEmbeddingProvider(EmbeddingProvider):
-    """Ollama embedding provider for local models."""
+    """Ollama embedding provider for local models.
+
+    Uses the batch /api/embed endpoint over one long-lived pooled
+    aiohttp session from the shared HTTP client registry. Batches are sent concurrently (bounded by
+    max_concurrency) and retried with exponential backoff. Servers without
+    /api/embed (Ollama < 0.3) fall back to the legacy per-text endpoint.
+    """
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "nomic-embed-text"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "nomic-embed-text",
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        timeout: float = 60.0,
+        http_clients: HTTPClientRegistry | None = None,
+    ):
         """
         Initialize Ollama embedding provider.
 
         Args:
             base_url: Ollama server URL
             model: Model name
+            batch_size: Texts per /api/embed request
+            max_concurrency: Concurrent requests to the server
+            max_retries: Retries per request on connection errors and 408/429/5xx
+            retry_backoff: Base delay in seconds for exponential backoff
+            timeout: Total timeout per request in seconds
+            http_clients: Shared HTTP client registry (a private one is created if omitted)
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._dimension: int | None = None
+        self._owns_http_clients = http_clients is None
+        self.http_clients = http_clients or HTTPClientRegistry(limit=self.max_concurrency)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._batch_endpoint = True
 
     async def embed_text(self, text: str) -> list[float]:
         """Generate embedding for single text."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/api/embeddings",
-                    json={"model": self.model, "prompt": text},
-                    timeout=aiohttp.ClientTimeout(total=60),
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    embedding = data["embedding"]
-
-                    # Cache dimension on first call
-                    if self._dimension is None:
-                        self._dimension = len(embedding)
-
-                    return embedding
-        except Exception as e:
-            logger.error("Failed to generate Ollama embedding", error=str(e), model=self.model)
-            raise
+        embeddings = await self.embed_batch([text])
+        return embeddings[0]
 
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for batch of texts."""
         if not texts:
             return []
 
-        # Ollama doesn't have native batch API, so we process sequentially
-        # Could parallelize with asyncio.gather but might overwhelm local server
-        embeddings = []
-        for text in texts:
-            embedding = await self.embed_text(text)
-            embeddings.append(embedding)
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        try:
+            results = await asyncio.gather(*[self._embed_request(batch) for batch in batches])
+        except Exception as e:
+            logger.error("Failed to generate Ollama embeddings", error=str(e), model=self.model, batch_size=len(texts))
+            raise
 
+        embeddings = [embedding for batch_embeddings in results for embedding in batch_embeddings]
+        # Cache dimension on first call
+        if self._dimension is None and embeddings:
+            self._dimension = len(embeddings[0])
         return embeddings
 
+    async def close(self) -> None:
+        """Close the pooled HTTP session (unless the registry is shared)."""
+        if self._owns_http_clients:
+            await self.http_clients.close()
+
     def get_dimension(self) -> int:
         """Get embedding dimension."""
         if self._dimension is None:
             # nomic-embed-text is 768 dimensions by default
             return 768
         return self._dimension
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.http_clients.session("ollama", timeout=self.timeout)
+
+    async def _embed_request(self, batch: list[str]) -> list[list[float]]:
+        session = self._get_session()
+        async with self._semaphore:
+            if self._batch_endpoint:
+                data = await self._post_with_retry(session, "/api/embed", {"model": self.model, "input": batch})
+                if data is not None:
+                    return data["embeddings"]
+                # Older Ollama servers only expose /api/embeddings
+                logger.warning("Ollama /api/embed not available, falling back to /api/embeddings", model=self.model)
+                self._batch_endpoint = False
+
+            embeddings = []
+            for text in batch:
+                data = await self._post_with_retry(session, "/api/embeddings", {"model": self.model, "prompt": text})
+                if data is None:
+                    raise RuntimeError(f"Ollama embeddings endpoint not found at {self.base_url}")
+                embeddings.append(data["embedding"])
+            return embeddings
+
+    async def _post_with_retry(self, session: aiohttp.ClientSession, path: str, payload: dict) -> dict | None:
+        """POST with retries; returns None on 404 for a missing endpoint so callers can fall back."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.post(f"{self.base_url}{path}", json=payload) as response:
+                    if response.status == 404:
+                        # Ollama also answers 404 for unknown models; that is not a reason to fall back
+                        error = _model_error(await response.text())
+                        if error:
+                            raise RuntimeError(f"Ollama model {self.model!r} not available: {error}")
+                        return None
+                    if response.status in _RETRYABLE_STATUSES and attempt < self.max_retries:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info, response.history, status=response.status
+                        )
+                    response.raise_for_status()
+                    return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                status = getattr(e, "status", None)
+                retryable = status is None or status in _RETRYABLE_STATUSES
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * (2**attempt)
+                logger.warning(
+                    "Ollama request failed, retrying",
+                    path=path,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+        return None
+
+
+def _model_error(body: str) -> str | None:
+    """Return the error message of an Ollama JSON error body about the model, if it is one."""
+    try:
+        error = json.loads(body).get("error")
+    except (ValueError, AttributeError):
+        return None
+    return error if isinstance(error, str) and "model" in error.lower() else None
@@ -1,20 +1,44 @@
 """OpenAI embedding provider."""
 
 import asyncio
+import base64
 from typing import Any
 
+import numpy as np
+import openai
 import structlog
 from openai import AsyncOpenAI
 
 from src.embeddings.base import EmbeddingProvider
+from src.embeddings.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+from src.embeddings.vectors import as_float32_array
+from src.utils.text import estimate_tokens, truncate_to_tokens
 
 logger = structlog.get_logger(__name__)
 
+# OpenAI limits: 8191 tokens per input, 300k tokens and 2048 inputs per request
+MAX_INPUT_TOKENS = 8191
+
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
-    """OpenAI embedding provider using text-embedding-3-small."""
+    """OpenAI embedding provider using text-embedding-3-small.
+
+    embed_batch packs texts into requests by token count, sends up to
+    max_concurrency requests at once under an adaptive limiter that backs off
+    on 429/Retry-After, and returns embeddings in input order.
+    """
 
-    def __init__(self, api_key: str, model: str = "text-embedding-3-small", dimension: int = 1536):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "text-embedding-3-small",
+        dimension: int = 1536,
+        base_url: str | None = None,
+        max_batch_tokens: int = 250_000,
+        max_batch_size: int = 2048,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+    ):
         """
         Initialize OpenAI embedding provider.
 
@@ -22,20 +46,26 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             api_key: OpenAI API key
             model: Model name
             dimension: Embedding dimension
+            base_url: Optional OpenAI-compatible API base URL
+            max_batch_tokens: Token budget per request
+            max_batch_size: Maximum inputs per request
+            max_concurrency: Maximum concurrent requests
+            max_retries: Retries per request on 429, timeouts and 5xx
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Retries are handled here so 429s also feed the adaptive limiter
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
         self.model = model
         self.dimension = dimension
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.rate_limiter = AdaptiveRateLimiter(max_concurrency=max_concurrency)
 
     async def embed_text(self, text: str) -> list[float]:
         """Generate embedding for single text."""
         try:
-            response = await self.client.embeddings.create(
-                input=text,
-                model=self.model,
-                dimensions=self.dimension if "3" in self.model else None,  # Only for v3 models
-            )
-            return response.data[0].embedding
+            embeddings = await self._embed_request([truncate_to_tokens(text, MAX_INPUT_TOKENS)])
+            return embeddings[0]
         except Exception as e:
             logger.error("Failed to generate embedding", error=str(e), model=self.model)
             raise
@@ -46,28 +76,89 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             return []
 
         try:
-            # OpenAI allows up to 2048 texts per request
-            batch_size = 100
-            all_embeddings = []
-
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i : i + batch_size]
-                response = await self.client.embeddings.create(
-                    input=batch,
-                    model=self.model,
-                    dimensions=self.dimension if "3" in self.model else None,
-                )
-                all_embeddings.extend([data.embedding for data in response.data])
-
-                # Small delay to avoid rate limits
-                if i + batch_size < len(texts):
-                    await asyncio.sleep(0.1)
-
+            batches = self._pack_batches(texts)
+            results = await asyncio.gather(*[self._embed_request(batch) for batch in batches])
+            all_embeddings = [embedding for batch_embeddings in results for embedding in batch_embeddings]
+            logger.debug("Embedded batch", texts=len(texts), requests=len(batches))
             return all_embeddings
         except Exception as e:
             logger.error("Failed to generate batch embeddings", error=str(e), batch_size=len(texts))
             raise
 
+    async def embed_batch_array(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings as one float32 array, decoded straight from base64 buffers."""
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        try:
+            batches = self._pack_batches(texts)
+            results = await asyncio.gather(*[self._embed_request(batch, as_array=True) for batch in batches])
+            # Rows are views on the decoded buffers; one copy into the output array
+            return np.vstack([row for rows in results for row in rows])
+        except Exception as e:
+            logger.error("Failed to generate batch embeddings", error=str(e), batch_size=len(texts))
+            raise
+
     def get_dimension(self) -> int:
         """Get embedding dimension."""
         return self.dimension
+
+    def _pack_batches(self, texts: list[str]) -> list[list[str]]:
+        """Split texts into order-preserving requests bounded by token and input counts."""
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for text in texts:
+            tokens = estimate_tokens(text)
+            if tokens > MAX_INPUT_TOKENS:
+                text = truncate_to_tokens(text, MAX_INPUT_TOKENS)
+                tokens = MAX_INPUT_TOKENS
+            if current and (current_tokens + tokens > self.max_batch_tokens or len(current) >= self.max_batch_size):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _embed_request(self, batch: list[str], as_array: bool = False) -> Any:
+        kwargs: dict[str, Any] = {"input": batch, "model": self.model}
+        if "3" in self.model:  # Only v3 models accept dimensions
+            kwargs["dimensions"] = self.dimension
+        if as_array:
+            # Raw little-endian float32 buffers instead of JSON float lists
+            kwargs["encoding_format"] = "base64"
+
+        attempt = 0
+        while True:
+            backoff = min(30.0, 0.5 * (2**attempt))
+            try:
+                async with self.rate_limiter.slot(retry=attempt > 0):
+                    try:
+                        response = await self.client.embeddings.create(**kwargs)
+                    except openai.RateLimitError as e:
+                        # Pause the limiter before the slot is handed to a waiting request
+                        self.rate_limiter.on_rate_limited(parse_retry_after(e.response.headers, backoff))
+                        raise
+                self.rate_limiter.on_success()
+                data = sorted(response.data, key=lambda item: item.index)
+                if as_array:
+                    return [_decode_embedding(item.embedding) for item in data]
+                return [item.embedding for item in data]
+            except openai.RateLimitError:
+                if attempt >= self.max_retries:
+                    raise
+            except (openai.APIConnectionError, openai.InternalServerError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.warning("Embedding request failed, retrying", attempt=attempt + 1, delay=backoff, error=str(e))
+                await asyncio.sleep(backoff)
+            attempt += 1
+
+
+def _decode_embedding(embedding: str | list[float]) -> np.ndarray:
+    # Some OpenAI-compatible servers ignore encoding_format and still send lists
+    if isinstance(embedding, str):
+        return np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+    return as_float32_array(embedding)
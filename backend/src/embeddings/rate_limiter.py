@@ -0,0 +1,135 @@
+"""Adaptive concurrency limiter for embedding API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """AIMD concurrency limiter driven by 429 / Retry-After responses.
+
+    The number of requests allowed in flight starts at max_concurrency. A
+    rate-limit response halves it and pauses new requests until Retry-After
+    has elapsed; every `limit` consecutive successes raise it by one again.
+    """
+
+    def __init__(self, max_concurrency: int = 4, min_concurrency: int = 1):
+        """
+        Initialize limiter.
+
+        Args:
+            max_concurrency: Upper bound for concurrent requests
+            min_concurrency: Lower bound the limit is never reduced below
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.limit = self.max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._blocked_until = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self.rate_limited_count = 0
+
+    @asynccontextmanager
+    async def slot(self, retry: bool = False) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the block."""
+        await self.acquire(retry)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, retry: bool = False) -> None:
+        """Wait for a free slot and for any Retry-After pause to end.
+
+        Retries queue ahead of first attempts so a request that was rate
+        limited is not starved by newer ones.
+        """
+        if not self._waiters and self._in_flight < self.limit and self._blocked_until <= time.monotonic():
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        if retry:
+            self._waiters.appendleft(waiter)
+        else:
+            self._waiters.append(waiter)
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just before cancellation; hand it on
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Return a slot."""
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Grant free slots to waiters in arrival order, or schedule a wake-up after a pause."""
+        wait = self._blocked_until - time.monotonic()
+        if wait > 0:
+            if self._waiters and self._wake_handle is None:
+                self._wake_handle = asyncio.get_running_loop().call_later(wait, self._on_pause_elapsed)
+            return
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _on_pause_elapsed(self) -> None:
+        self._wake_handle = None
+        self._wake()
+
+    def on_success(self) -> None:
+        """Additive increase after a streak of successful requests."""
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        """Multiplicative decrease and pause after a 429."""
+        self.rate_limited_count += 1
+        self._successes = 0
+        self.limit = max(self.min_concurrency, self.limit // 2)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + max(0.0, retry_after))
+        logger.warning("Embedding requests rate limited", retry_after=retry_after, concurrency_limit=self.limit)
+
+
+def parse_retry_after(headers: object, default: float) -> float:
+    """Read the server-advised delay from Retry-After style headers."""
+    if headers is None:
+        return default
+    get = getattr(headers, "get", None)
+    if get is None:
+        return default
+    retry_after_ms = get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    retry_after = get("retry-after")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return default
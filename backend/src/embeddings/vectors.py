@@ -0,0 +1,66 @@
+"""NumPy helpers for embedding vectors."""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+
+def as_float32_array(embeddings: np.ndarray | Sequence, dimension: int | None = None) -> np.ndarray:
+    """
+    Convert embeddings to a C-contiguous float32 array without copying when possible.
+
+    Args:
+        embeddings: One vector or a batch of vectors (ndarray or nested lists)
+        dimension: Vector width to use for an empty batch
+
+    Returns:
+        float32 array, 1-D for one vector or 2-D (n, dim) for a batch
+    """
+    array = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if array.size == 0 and array.ndim == 1 and dimension is not None:
+        # An empty batch, not an empty vector
+        return np.empty((0, dimension), dtype=np.float32)
+    return array
+
+
+def fit_dimension(embeddings: np.ndarray | Sequence, dimension: int) -> np.ndarray:
+    """
+    Project embeddings to the storage dimension.
+
+    Works on a single vector or a (n, dim) batch. Vectors that already have
+    the right width are returned as-is (no copy for float32 input). Longer
+    vectors keep their leading dimensions and are re-normalized to unit
+    length, which is how Matryoshka-trained models (text-embedding-3-*) are
+    meant to be shortened. Shorter vectors are zero-padded, which keeps
+    their norm.
+
+    Args:
+        embeddings: One vector or a batch of vectors
+        dimension: Target dimension (e.g. a table's storage dimension)
+
+    Returns:
+        float32 array whose last axis has length dimension
+    """
+    array = as_float32_array(embeddings, dimension)
+    width = array.shape[-1]
+    if width == dimension:
+        return array
+    if width > dimension:
+        return l2_normalize(array[..., :dimension])
+    padded = np.zeros(array.shape[:-1] + (dimension,), dtype=np.float32)
+    padded[..., :width] = array
+    return padded
+
+
+def l2_normalize(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Scale vectors along the last axis to unit length; zero vectors stay zero.
+
+    Args:
+        embeddings: One vector or a batch of vectors
+
+    Returns:
+        New float32 array of the same shape
+    """
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return np.divide(embeddings, norms, out=np.zeros_like(embeddings, dtype=np.float32), where=norms > 0)
@@ -0,0 +1,286 @@
+"""Token and latency accounting for chat-model calls, per session, graph node, agent and call site."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Iterator, Optional
+from uuid import UUID
+
+import structlog
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.llm.cache import current_call_site
+from src.llm.scheduler import current_priority
+from src.utils.session_stats import SessionStats
+from src.utils.text import estimate_tokens
+
+logger = structlog.get_logger(__name__)
+
+_session_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("usage_session_id", default=None)
+_node: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("usage_node", default=None)
+_agent_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("usage_agent_id", default=None)
+
+
+@contextlib.contextmanager
+def usage_scope(
+    session_id: Optional[str] = None, node: Optional[str] = None, agent_id: Optional[str] = None
+) -> Iterator[None]:
+    """
+    Attribute LLM calls made inside the block to a session, graph node and/or agent.
+
+    Arguments left as None keep the enclosing scope's value. When a node or
+    agent is given, the block's wall time is added to that node's or agent's
+    totals.
+
+    Args:
+        session_id: Research session ID
+        node: Graph node name
+        agent_id: Researcher agent ID
+    """
+    tokens = [
+        (var, var.set(value))
+        for var, value in ((_session_id, session_id), (_node, node), (_agent_id, agent_id))
+        if value is not None
+    ]
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if _tracker is not None and (node or agent_id):
+            _tracker.record_wall_time(_session_id.get(), node, agent_id, time.perf_counter() - start)
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_session_id() -> Optional[str]:
+    """Return the session ID set by the innermost usage_scope, if any."""
+    return _session_id.get()
+
+
+def _new_bucket() -> dict[str, Any]:
+    return {
+        "calls": 0,
+        "cached_calls": 0,
+        "errors": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "estimated_calls": 0,
+        "llm_ms": 0.0,
+    }
+
+
+class _SessionUsage:
+    def __init__(self) -> None:
+        self.totals = _new_bucket()
+        self.nodes: dict[str, dict[str, Any]] = defaultdict(_new_bucket)
+        self.agents: dict[str, dict[str, Any]] = defaultdict(_new_bucket)
+        self.sites: dict[str, dict[str, Any]] = defaultdict(_new_bucket)
+        self.models: dict[str, dict[str, Any]] = defaultdict(_new_bucket)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "totals": _rounded(self.totals),
+            "nodes": {name: _rounded(bucket) for name, bucket in self.nodes.items()},
+            "agents": {name: _rounded(bucket) for name, bucket in sorted(self.agents.items())},
+            "sites": {name: _rounded(bucket) for name, bucket in sorted(self.sites.items())},
+            "models": {name: _rounded(bucket) for name, bucket in sorted(self.models.items())},
+        }
+
+
+class UsageTracker:
+    """Aggregates prompt/completion tokens and latency of every chat-model call.
+
+    Calls are attributed through usage_scope (session, node, agent) and the
+    current cache_scope label, falling back to the scheduler priority, as
+    the call site. Cached responses are counted but add no tokens. Node and
+    agent buckets also get wall_ms, the time spent inside them; llm_ms sums
+    call latencies and can exceed wall_ms when calls run concurrently.
+    Only the most recent max_sessions sessions are kept in memory.
+    """
+
+    def __init__(self, max_sessions: int = 200):
+        """
+        Initialize tracker.
+
+        Args:
+            max_sessions: Sessions kept in memory (least recently updated dropped first)
+        """
+        self._usage: SessionStats[_SessionUsage] = SessionStats(_SessionUsage, max_sessions)
+        self._lock = threading.Lock()
+        self.callback_handler = UsageCallbackHandler(self)
+
+    def record_call(
+        self,
+        context: dict[str, Optional[str]],
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency: float,
+        cached: bool = False,
+        estimated: bool = False,
+        error: bool = False,
+    ) -> None:
+        """Add one finished (or failed) call to its session, node, agent, site and model buckets."""
+        with self._lock:
+            for usage in self._usage.targets(context["session_id"]):
+                buckets = [usage.totals, usage.sites[context["site"]], usage.models[model]]
+                if context["node"]:
+                    buckets.append(usage.nodes[context["node"]])
+                if context["agent_id"]:
+                    buckets.append(usage.agents[context["agent_id"]])
+                for bucket in buckets:
+                    bucket["calls"] += 1
+                    bucket["cached_calls"] += int(cached)
+                    bucket["errors"] += int(error)
+                    bucket["estimated_calls"] += int(estimated)
+                    bucket["prompt_tokens"] += prompt_tokens
+                    bucket["completion_tokens"] += completion_tokens
+                    bucket["total_tokens"] += prompt_tokens + completion_tokens
+                    bucket["llm_ms"] += latency * 1000
+
+    def record_wall_time(
+        self, session_id: Optional[str], node: Optional[str], agent_id: Optional[str], elapsed: float
+    ) -> None:
+        """Add time spent inside a node or agent scope."""
+        if not session_id:
+            return
+        with self._lock:
+            usage = self._usage.session(session_id)
+            for bucket in ([usage.nodes[node]] if node else []) + ([usage.agents[agent_id]] if agent_id else []):
+                bucket["wall_ms"] = bucket.get("wall_ms", 0.0) + elapsed * 1000
+            if node:
+                usage.totals["wall_ms"] = usage.totals.get("wall_ms", 0.0) + elapsed * 1000
+
+    def get_session(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Return the usage summary of a session, or None if nothing was recorded for it."""
+        with self._lock:
+            usage = self._usage.get(session_id)
+            return usage.to_dict() if usage is not None else None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return process-wide totals by call site and model."""
+        with self._lock:
+            summary = self._usage.total.to_dict()
+        return {"totals": summary["totals"], "sites": summary["sites"], "models": summary["models"]}
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """Callback handler that reports every chat-model call to a UsageTracker.
+
+    Runs inline so the attribution context of the calling task is read when
+    the call starts. Token counts come from the response usage metadata,
+    or are estimated from text length when the provider reports none.
+    """
+
+    run_inline = True
+
+    def __init__(self, tracker: UsageTracker):
+        self.tracker = tracker
+        self._runs: dict[UUID, tuple[float, dict[str, Optional[str]], str, int]] = {}
+
+    def on_chat_model_start(
+        self, serialized: dict[str, Any], messages: list[list[Any]], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        site = current_call_site()
+        context = {
+            "session_id": _session_id.get(),
+            "node": _node.get(),
+            "agent_id": _agent_id.get(),
+            "site": site if site != "unscoped" else current_priority().name.lower(),
+        }
+        params = kwargs.get("invocation_params") or {}
+        model = (
+            (kwargs.get("metadata") or {}).get("ls_model_name")
+            or params.get("model")
+            or params.get("model_name")
+            or "unknown"
+        )
+        prompt_estimate = sum(
+            estimate_tokens(str(getattr(message, "content", message))) for batch in messages for message in batch
+        )
+        self._runs[run_id] = (time.perf_counter(), context, str(model), prompt_estimate)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        start, context, model, prompt_estimate = run
+        generations = [generation for batch in response.generations for generation in batch]
+        cached = bool(generations) and all(
+            (generation.generation_info or {}).get("cache_hit") for generation in generations
+        )
+        if cached:
+            self.tracker.record_call(context, model, 0, 0, time.perf_counter() - start, cached=True)
+            return
+
+        usage = _reported_usage(response, generations)
+        estimated = usage is None
+        if usage is None:
+            usage = (prompt_estimate, sum(estimate_tokens(generation.text) for generation in generations))
+        self.tracker.record_call(context, model, usage[0], usage[1], time.perf_counter() - start, estimated=estimated)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        start, context, model, _ = run
+        self.tracker.record_call(context, model, 0, 0, time.perf_counter() - start, error=True)
+
+
+def _reported_usage(response: LLMResult, generations: list[Any]) -> Optional[tuple[int, int]]:
+    prompt = completion = 0
+    found = False
+    for generation in generations:
+        usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+        if usage:
+            prompt += usage.get("input_tokens", 0)
+            completion += usage.get("output_tokens", 0)
+            found = True
+    if found:
+        return prompt, completion
+    token_usage = (response.llm_output or {}).get("token_usage") or (response.llm_output or {}).get("usage")
+    if token_usage:
+        return (
+            token_usage.get("prompt_tokens", token_usage.get("input_tokens", 0)),
+            token_usage.get("completion_tokens", token_usage.get("output_tokens", 0)),
+        )
+    return None
+
+
+def _rounded(bucket: dict[str, Any]) -> dict[str, Any]:
+    return {key: round(value, 1) if isinstance(value, float) else value for key, value in bucket.items()}
+
+
+_tracker: UsageTracker | None = None
+
+
+def get_usage_tracker(settings: Any) -> Optional[UsageTracker]:
+    """Return the process-wide usage tracker, or None when accounting is disabled."""
+    global _tracker
+    if not settings.llm_usage_tracking_enabled:
+        return None
+    if _tracker is None:
+        _tracker = UsageTracker(max_sessions=settings.llm_usage_max_sessions)
+    return _tracker
+
+
+def get_session_usage(session_id: Optional[str]) -> Optional[dict[str, Any]]:
+    """Return the usage summary of a session from the process-wide tracker, if any."""
+    if _tracker is None or not session_id:
+        return None
+    return _tracker.get_session(session_id)
+
+
+def close_usage_tracker() -> None:
+    """Log process-wide usage totals and drop the tracker."""
+    global _tracker
+    if _tracker is None:
+        return
+    logger.info("LLM usage stats", **_tracker.get_stats())
+    _tracker = None
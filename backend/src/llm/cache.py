@@ -0,0 +1,283 @@
+"""Exact-match LLM response cache (memory + SQLite) with per-call-site metrics."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence
+
+import structlog
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+logger = structlog.get_logger(__name__)
+
+_call_site: contextvars.ContextVar[str] = contextvars.ContextVar("llm_cache_site", default="unscoped")
+_allow_nondeterministic: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "llm_cache_allow_nondeterministic", default=False
+)
+
+# Prune the disk table once this many writes have happened since the last prune
+_PRUNE_EVERY = 100
+
+
+@contextlib.contextmanager
+def cache_scope(site: str, allow_nondeterministic: bool = False) -> Iterator[None]:
+    """
+    Label LLM calls made inside the block for cache metrics.
+
+    Args:
+        site: Call-site name reported in hit-rate metrics
+        allow_nondeterministic: Also cache responses of models with temperature > 0
+    """
+    site_token = _call_site.set(site)
+    allow_token = _allow_nondeterministic.set(allow_nondeterministic)
+    try:
+        yield
+    finally:
+        _allow_nondeterministic.reset(allow_token)
+        _call_site.reset(site_token)
+
+
+def current_call_site() -> str:
+    """Return the call-site label set by the innermost cache_scope ("unscoped" outside one)."""
+    return _call_site.get()
+
+
+class LLMResponseCache:
+    """Exact-match response store: in-memory LRU in front of a SQLite table.
+
+    Entries are keyed by a hash of LangChain's llm_string (model class,
+    model name, temperature, max_tokens and bound kwargs such as the tool
+    schema used by with_structured_output) and the serialized messages.
+    Entries expire after ttl_seconds; the disk table keeps at most
+    max_entries rows (oldest evicted first).
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: float = 86400.0,
+        max_entries: int = 10000,
+        memory_max_entries: int = 1000,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite file path (None keeps entries in memory only)
+            ttl_seconds: Entry lifetime (0 disables expiry)
+            max_entries: Max rows kept on disk
+            memory_max_entries: Max entries kept in the in-memory LRU
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.memory_max_entries = max(1, memory_max_entries)
+        self._memory: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "bypassed": 0})
+        self._conn: sqlite3.Connection | None = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, created_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_created_at ON llm_cache (created_at)")
+
+    def get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Return the stored generations for key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._expired(entry[0], now):
+                    del self._memory[key]
+                else:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+
+            if self._conn is None:
+                return None
+            row = self._conn.execute("SELECT created_at, value FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self._expired(row[0], now):
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            value = json.loads(row[1])
+            self._remember(key, row[0], value)
+            return value
+
+    def put(self, key: str, value: list[dict[str, Any]]) -> None:
+        """Store generations for key in memory and on disk."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, created_at, value) VALUES (?, ?, ?)",
+                (key, now, json.dumps(value)),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_EVERY:
+                self._prune(now)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_cache")
+
+    def record(self, site: str, outcome: str) -> None:
+        """Count a hit, miss or bypass for a call site."""
+        self._stats[site][outcome] += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-call-site hits, misses, bypasses and hit rate."""
+        stats = {}
+        for site, counts in sorted(self._stats.items()):
+            lookups = counts["hits"] + counts["misses"]
+            stats[site] = {**counts, "hit_rate": round(counts["hits"] / lookups, 3) if lookups else 0.0}
+        return stats
+
+    def close(self) -> None:
+        """Prune expired rows and close the SQLite connection."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._prune(time.time())
+            self._conn.close()
+            self._conn = None
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, created_at: float, value: list[dict[str, Any]]) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+
+    def _prune(self, now: float) -> None:
+        self._writes_since_prune = 0
+        if self.ttl_seconds > 0:
+            self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+        self._conn.execute(
+            "DELETE FROM llm_cache WHERE key NOT IN "
+            "(SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+
+class ModelCache(BaseCache):
+    """LangChain cache hook for one chat model, backed by a shared LLMResponseCache.
+
+    Models with temperature > 0 bypass the cache unless nondeterministic
+    caching is allowed for the model or for the current cache_scope.
+    """
+
+    def __init__(self, store: LLMResponseCache, deterministic: bool, allow_nondeterministic: bool = False):
+        """
+        Initialize model cache.
+
+        Args:
+            store: Shared response store
+            deterministic: Whether the model samples with temperature 0
+            allow_nondeterministic: Cache this model even when it is not deterministic
+        """
+        self.store = store
+        self.deterministic = deterministic
+        self.allow_nondeterministic = allow_nondeterministic
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Look up cached generations for a prompt."""
+        site = _call_site.get()
+        if not self._enabled():
+            self.store.record(site, "bypassed")
+            return None
+        value = self.store.get(_cache_key(prompt, llm_string))
+        self.store.record(site, "hits" if value is not None else "misses")
+        if value is None:
+            return None
+        messages = messages_from_dict([item["message"] for item in value])
+        return [
+            ChatGeneration(message=message, generation_info={**(item.get("generation_info") or {}), "cache_hit": True})
+            for message, item in zip(messages, value, strict=True)
+        ]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Store generations for a prompt."""
+        if not self._enabled() or not all(isinstance(gen, ChatGeneration) for gen in return_val):
+            return
+        value = [
+            {"message": message_to_dict(gen.message), "generation_info": gen.generation_info} for gen in return_val
+        ]
+        self.store.put(_cache_key(prompt, llm_string), value)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop all entries of the shared store."""
+        self.store.clear()
+
+    # Lookups hit memory or one indexed SQLite row; skip the default executor hop
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Look up cached generations for a prompt."""
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Store generations for a prompt."""
+        self.update(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs: Any) -> None:
+        """Drop all entries of the shared store."""
+        self.clear()
+
+    def _enabled(self) -> bool:
+        return self.deterministic or self.allow_nondeterministic or _allow_nondeterministic.get()
+
+
+def _cache_key(prompt: str, llm_string: str) -> str:
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+
+_store: LLMResponseCache | None = None
+
+
+def get_response_cache(settings: Any) -> Optional[LLMResponseCache]:
+    """Return the process-wide response store, or None when caching is disabled."""
+    global _store
+    if not settings.llm_cache_enabled:
+        return None
+    if _store is None:
+        _store = LLMResponseCache(
+            path=settings.llm_cache_path or None,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_entries=settings.llm_cache_max_entries,
+            memory_max_entries=settings.llm_cache_memory_max_entries,
+        )
+        logger.info("LLM response cache enabled", path=settings.llm_cache_path, ttl=settings.llm_cache_ttl_seconds)
+    return _store
+
+
+def close_response_cache() -> None:
+    """Log metrics and close the process-wide response store."""
+    global _store
+    if _store is None:
+        return
+    logger.info("LLM response cache stats", sites=_store.get_stats())
+    _store.close()
+    _store = None
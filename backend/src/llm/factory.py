@@ -11,22 +11,50 @@ from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
 from src.config.settings import Settings
+from src.llm.accounting import get_usage_tracker
+from src.llm.cache import ModelCache, get_response_cache
 from src.llm.mock import MockChatModel
+from src.llm.scheduler import ScheduledStreamingChatModel, get_llm_scheduler
 
 logger = structlog.get_logger(__name__)
 
 
+class ScheduledChatOpenAI(ScheduledStreamingChatModel, ChatOpenAI):
+    """ChatOpenAI whose calls go through the process-wide LLM scheduler."""
+
+
+class ScheduledChatAnthropic(ScheduledStreamingChatModel, ChatAnthropic):
+    """ChatAnthropic whose calls go through the process-wide LLM scheduler."""
+
+
+class ScheduledMockChatModel(ScheduledStreamingChatModel, MockChatModel):
+    """MockChatModel whose calls go through the process-wide LLM scheduler."""
+
+
 def create_chat_model(
     model_str: str,
     settings: Settings,
     max_tokens: int,
     temperature: float = 0.7,
     structured_output: Optional[Type[BaseModel]] = None,
+    cache_nondeterministic: bool = False,
 ) -> BaseChatModel:
-    """Create a chat model from provider:model string."""
+    """Create a chat model from provider:model string.
+
+    Async calls go through the process-wide LLM scheduler (per-provider
+    concurrency, token budget and priority). When the LLM response cache is
+    enabled, the model gets an exact-match cache hook. Models with temperature > 0 only use it if
+    cache_nondeterministic is set (or inside a cache_scope that allows it). Token use and latency
+    are reported to the usage tracker when accounting is enabled.
+    """
+    cache = _create_model_cache(settings, temperature, cache_nondeterministic)
+    scheduler = get_llm_scheduler(settings)
+    tracker = get_usage_tracker(settings)
+    callbacks = [tracker.callback_handler] if tracker is not None else None
+
     if settings.llm_mode == "mock" or model_str.startswith("mock"):
         logger.info("using_mock_llm")
-        return MockChatModel()
+        return _create_mock_model(settings, cache, callbacks).attach_scheduler(scheduler, "mock")
 
     if ":" in model_str:
         provider, model_name = model_str.split(":", 1)
@@ -48,6 +76,10 @@ def create_chat_model(
             "temperature": temperature,
             "max_retries": max_retries,  # CRITICAL: Enable retry on client level
         }
+        if cache is not None:
+            llm_kwargs["cache"] = cache
+        if callbacks:
+            llm_kwargs["callbacks"] = callbacks
 
         # Support for any OpenAI-compatible API (OpenRouter, 302.AI, etc.)
         if settings.openai_base_url:
@@ -84,7 +116,7 @@ def create_chat_model(
             temperature=temperature,
             base_url=settings.openai_base_url or "default (api.openai.com)",
         )
-        llm = ChatOpenAI(**llm_kwargs)
+        llm = ScheduledChatOpenAI(**llm_kwargs).attach_scheduler(scheduler, provider)
         
         # CRITICAL: Verify max_tokens was set correctly
         if hasattr(llm, "max_tokens"):
@@ -132,12 +164,14 @@ def create_chat_model(
             raise ValueError("Anthropic API key not configured")
 
         logger.debug("creating_anthropic_model", model=model_name)
-        llm = ChatAnthropic(
+        llm = ScheduledChatAnthropic(
             model=model_name,
             api_key=settings.anthropic_api_key,
             max_tokens=max_tokens,
             temperature=temperature,
-        )
+            cache=cache,
+            callbacks=callbacks,
+        ).attach_scheduler(scheduler, "anthropic")
         
         # Apply structured output if requested
         if structured_output:
@@ -152,3 +186,36 @@ def create_chat_model(
         return llm
 
     raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+def _create_model_cache(settings: Settings, temperature: float, cache_nondeterministic: bool) -> Optional[ModelCache]:
+    store = get_response_cache(settings)
+    if store is None:
+        return None
+    return ModelCache(
+        store,
+        deterministic=temperature <= 0,
+        allow_nondeterministic=cache_nondeterministic or settings.llm_cache_allow_nondeterministic,
+    )
+
+
+def _create_mock_model(
+    settings: Settings, cache: Optional[ModelCache], callbacks: Optional[list]
+) -> ScheduledMockChatModel:
+    site_latency = {}
+    for item in settings.mock_llm_site_latency_ms.split(","):
+        if "=" in item:
+            site, value = item.split("=", 1)
+            site_latency[site.strip()] = float(value) / 1000.0
+    return ScheduledMockChatModel(
+        cache=cache,
+        callbacks=callbacks,
+        first_token_latency=settings.mock_llm_latency_ms / 1000.0,
+        token_latency=settings.mock_llm_token_ms / 1000.0,
+        latency_distribution=settings.mock_llm_latency_distribution,
+        latency_sigma=settings.mock_llm_latency_sigma,
+        site_latency=site_latency,
+        failure_rate=settings.mock_llm_failure_rate,
+        rate_limit_rate=settings.mock_llm_rate_limit_rate,
+        seed=settings.mock_llm_seed,
+    )
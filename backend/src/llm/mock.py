@@ -1,24 +1,75 @@
-"""Mock chat model for offline testing."""
+"""Mock chat model for offline testing and load simulation."""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import random
 import re
-from typing import Any, List, Optional
+import uuid
+from typing import Any, AsyncIterator, List, Literal, Optional, Sequence
 
+import httpx
+import openai
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import AIMessage, BaseMessage
-from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+from src.llm.cache import current_call_site
+from src.llm.scheduler import current_priority
+
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+_FORMAT_EXAMPLES = {
+    "date-time": "2025-01-01T00:00:00Z",
+    "date": "2025-01-01",
+    "time": "00:00:00",
+    "uuid": "00000000-0000-4000-8000-000000000000",
+}
+_MOCK_REQUEST = httpx.Request("POST", "https://mock.invalid/v1/chat/completions")
 
 
 class MockChatModel(BaseChatModel):
-    """Minimal chat model that returns deterministic responses."""
+    """Chat model that returns deterministic responses with simulated provider behaviour.
+
+    first_token_latency and token_latency (seconds) simulate generation
+    time: ainvoke waits for the whole response, astream yields word-sized
+    tokens as they are "generated". The first-token delay can be drawn from
+    a lognormal distribution and overridden per call site (cache_scope label
+    or priority name, e.g. {"classify_query": 0.2, "agent": 1.5}).
+    Async calls fail with a 429 (immediately) or a 500 (after the delay) at
+    the configured rates. Bound tools get schema-valid tool calls, so
+    with_structured_output and agent tool loops work offline. seed makes
+    latencies, failures and generated arguments reproducible.
+    """
 
     model_name: str = "mock"
+    first_token_latency: float = 0.0
+    token_latency: float = 0.0
+    latency_distribution: Literal["fixed", "lognormal"] = "fixed"
+    latency_sigma: float = 0.5
+    site_latency: dict[str, float] = {}
+    failure_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    tool_call_rate: float = 0.5
+    max_tool_rounds: int = 2
+    seed: Optional[int] = None
+
+    _rng: Optional[random.Random] = PrivateAttr(default=None)
 
     @property
     def _llm_type(self) -> str:
         return "mock-chat"
 
+    def bind_tools(self, tools: Sequence[Any], tool_choice: Any = None, **kwargs: Any) -> Runnable:
+        """Bind tools in OpenAI format; tool_choice may be a tool name, "any"/"required", "auto" or "none"."""
+        formatted = [convert_to_openai_tool(tool) for tool in tools]
+        if tool_choice is not None:
+            kwargs["tool_choice"] = tool_choice
+        return self.bind(tools=formatted, **kwargs)
+
     def _generate(
         self,
         messages: List[BaseMessage],
@@ -26,9 +77,7 @@ class MockChatModel(BaseChatModel):
         run_manager: Any = None,
         **kwargs: Any,
     ) -> ChatResult:
-        content = self._compose_response(messages)
-        message = AIMessage(content=content)
-        return ChatResult(generations=[ChatGeneration(message=message)])
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages, kwargs))])
 
     async def _agenerate(
         self,
@@ -37,14 +86,171 @@ class MockChatModel(BaseChatModel):
         run_manager: Any = None,
         **kwargs: Any,
     ) -> ChatResult:
-        return self._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._maybe_rate_limit()
+        result = self._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        delay = self._first_token_delay()
+        if self.token_latency:
+            delay += self.token_latency * len(_TOKEN_RE.findall(_response_text(result.generations[0].message)))
+        if delay:
+            await asyncio.sleep(delay)
+        self._maybe_fail()
+        return result
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        self._maybe_rate_limit()
+        message = self._respond(messages, kwargs)
+        delay = self._first_token_delay()
+        if delay:
+            await asyncio.sleep(delay)
+        self._maybe_fail()
+
+        pieces: list[tuple[str, Optional[dict[str, Any]]]] = [
+            (token, None) for token in _TOKEN_RE.findall(message.content)
+        ]
+        for index, call in enumerate(message.tool_calls):
+            for i, token in enumerate(_TOKEN_RE.findall(json.dumps(call["args"]))):
+                name, call_id = (call["name"], call["id"]) if i == 0 else (None, None)
+                pieces.append(("", {"name": name, "args": token, "id": call_id, "index": index}))
+
+        for token, tool_chunk in pieces:
+            if self.token_latency:
+                await asyncio.sleep(self.token_latency)
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(content=token, tool_call_chunks=[tool_chunk] if tool_chunk else [])
+            )
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=message.usage_metadata))
+
+    def _respond(self, messages: List[BaseMessage], kwargs: dict[str, Any]) -> AIMessage:
+        tool = self._select_tool(messages, kwargs.get("tools") or [], kwargs.get("tool_choice"))
+        if tool is None:
+            content = self._compose_response(messages)
+            tool_calls = []
+        else:
+            function = tool["function"]
+            topic = self._extract_topic("\n".join(str(getattr(m, "content", "")) for m in messages))
+            args = self._fake_from_schema(function.get("parameters") or {}, function["name"], topic)
+            content = ""
+            call_id = f"call_{uuid.uuid4().hex[:12]}"
+            tool_calls = [{"name": function["name"], "args": args, "id": call_id, "type": "tool_call"}]
+
+        input_tokens = sum(len(_TOKEN_RE.findall(str(getattr(m, "content", m)))) for m in messages)
+        output_tokens = len(_TOKEN_RE.findall(content)) + sum(
+            len(_TOKEN_RE.findall(json.dumps(call["args"]))) for call in tool_calls
+        )
+        usage = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return AIMessage(content=content, tool_calls=tool_calls, usage_metadata=usage)
+
+    def _select_tool(
+        self, messages: List[BaseMessage], tools: list[dict[str, Any]], tool_choice: Any
+    ) -> Optional[dict[str, Any]]:
+        if not tools or tool_choice in ("none", False):
+            return None
+        by_name = {tool["function"]["name"]: tool for tool in tools}
+        if isinstance(tool_choice, dict):
+            name = tool_choice.get("function", {}).get("name") or tool_choice.get("name")
+            return by_name.get(name, tools[0])
+        if isinstance(tool_choice, str) and tool_choice in by_name:
+            return by_name[tool_choice]
+        if tool_choice in ("any", "required", True):
+            return tools[0]
+
+        # "auto": call a tool for a few rounds, then answer in text
+        rounds = sum(isinstance(message, ToolMessage) for message in messages)
+        if rounds >= self.max_tool_rounds or self._random().random() >= self.tool_call_rate:
+            return None
+        return self._random().choice(tools)
+
+    def _fake_from_schema(self, schema: dict[str, Any], name: str, topic: str, defs: Optional[dict] = None) -> Any:
+        """Generate a value that validates against a JSON schema."""
+        defs = {**(defs or {}), **schema.get("$defs", {}), **schema.get("definitions", {})}
+        if "$ref" in schema:
+            schema = defs.get(schema["$ref"].rsplit("/", 1)[-1], {})
+        if "const" in schema:
+            return schema["const"]
+        if schema.get("enum"):
+            return self._random().choice(schema["enum"])
+        for key in ("anyOf", "oneOf", "allOf"):
+            if key in schema:
+                options = [option for option in schema[key] if option.get("type") != "null"] or schema[key]
+                return self._fake_from_schema(options[0], name, topic, defs)
+
+        kind = schema.get("type")
+        if isinstance(kind, list):
+            kind = next((k for k in kind if k != "null"), "null")
+        if kind == "object" or (kind is None and "properties" in schema):
+            return {
+                field: self._fake_from_schema(subschema, field, topic, defs)
+                for field, subschema in schema.get("properties", {}).items()
+            }
+        if kind == "array":
+            count = max(schema.get("minItems", 0), 2)
+            if "maxItems" in schema:
+                count = min(count, schema["maxItems"])
+            return [self._fake_from_schema(schema.get("items", {}), name, topic, defs) for _ in range(count)]
+        if kind == "integer":
+            low = int(schema.get("minimum", 1))
+            return self._random().randint(low, max(low, int(schema.get("maximum", low + 4))))
+        if kind == "number":
+            low = float(schema.get("minimum", 0.0))
+            return round(self._random().uniform(low, max(low, float(schema.get("maximum", low + 1.0)))), 3)
+        if kind == "boolean":
+            return self._random().random() < 0.5
+        if kind == "null":
+            return None
+
+        fmt = schema.get("format")
+        if fmt in _FORMAT_EXAMPLES:
+            return _FORMAT_EXAMPLES[fmt]
+        if fmt == "uri" or name.endswith("url"):
+            text = f"https://example.com/mock/{self._random().randint(1, 9999)}"
+        else:
+            text = f"Mock {name.replace('_', ' ')} for {topic}."
+        text = text.ljust(schema.get("minLength", 0), ".")
+        return text[: schema["maxLength"]] if "maxLength" in schema else text
+
+    def _first_token_delay(self) -> float:
+        base = self.site_latency.get(current_call_site())
+        if base is None:
+            base = self.site_latency.get(current_priority().name.lower(), self.first_token_latency)
+        if base <= 0 or self.latency_distribution == "fixed":
+            return max(base, 0.0)
+        # Median-below-mean lognormal whose mean equals base (long right tail like real providers)
+        sigma = self.latency_sigma
+        return base * self._random().lognormvariate(-sigma * sigma / 2, sigma)
+
+    def _maybe_rate_limit(self) -> None:
+        if self.rate_limit_rate and self._random().random() < self.rate_limit_rate:
+            response = httpx.Response(429, headers={"retry-after": "1"}, request=_MOCK_REQUEST)
+            raise openai.RateLimitError("Mock rate limit exceeded", response=response, body=None)
+
+    def _maybe_fail(self) -> None:
+        if self.failure_rate and self._random().random() < self.failure_rate:
+            response = httpx.Response(500, request=_MOCK_REQUEST)
+            raise openai.InternalServerError("Mock provider error", response=response, body=None)
+
+    def _random(self) -> random.Random:
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
 
     def _compose_response(self, messages: List[BaseMessage]) -> str:
         if not messages:
             return "Mock response."
 
-        last = messages[-1].content if hasattr(messages[-1], "content") else ""
-        last_text = str(last)
+        last_text = _last_text(messages)
         lower = last_text.lower()
 
         if "rewrite the user query" in lower:
@@ -125,3 +331,13 @@ class MockChatModel(BaseChatModel):
         lines = [line for line in text.splitlines() if line.strip()]
         snippet = " ".join(lines[-6:])[:280]
         return f"Summary: {snippet}"
+
+
+def _last_text(messages: List[BaseMessage]) -> str:
+    if not messages:
+        return ""
+    return str(getattr(messages[-1], "content", ""))
+
+
+def _response_text(message: AIMessage) -> str:
+    return message.content + "".join(json.dumps(call["args"]) for call in message.tool_calls)
@@ -0,0 +1,323 @@
+"""Process-wide LLM scheduler: per-provider concurrency, token budgets and priorities."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import heapq
+import itertools
+import time
+from collections import defaultdict, deque
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+import structlog
+from langchain_core.language_models import BaseChatModel
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+from src.utils.text import estimate_tokens
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMPriority(IntEnum):
+    """Priority classes, most urgent first."""
+
+    INTERACTIVE = 0
+    SUPERVISOR = 1
+    AGENT = 2
+    SUMMARIZATION = 3
+    TITLE = 4
+
+
+_priority: contextvars.ContextVar[LLMPriority] = contextvars.ContextVar("llm_priority", default=LLMPriority.AGENT)
+# Set while a call holds a slot, so a model's _agenerate that streams internally does not queue twice
+_holding_slot: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_holding_slot", default=False)
+
+
+@contextlib.contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run LLM calls made inside the block at the given priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> LLMPriority:
+    """Return the priority LLM calls made here would run at."""
+    return _priority.get()
+
+
+def with_llm_priority(priority: LLMPriority) -> Callable:
+    """Decorate a coroutine function so its LLM calls run at the given priority."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with llm_priority(priority):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _Grant:
+    def __init__(self, estimated_tokens: int):
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens = 0
+
+
+class _ProviderQueue:
+    """Priority queue for one provider, bounded by concurrency and a tokens-per-minute bucket."""
+
+    def __init__(self, name: str, max_concurrency: int, tokens_per_minute: int):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.active = 0
+        self._tokens = float(self.tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._waiters: list[tuple[int, int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self.wait_samples: dict[LLMPriority, deque[float]] = defaultdict(lambda: deque(maxlen=1000))
+        self.requests: dict[LLMPriority, int] = defaultdict(int)
+
+    async def acquire(self, priority: LLMPriority, tokens: int) -> None:
+        start = time.monotonic()
+        self.requests[priority] += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), tokens, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before cancellation; hand the slot back
+                self.release(tokens, tokens)
+            else:
+                future.cancel()
+                self._dispatch()
+            raise
+        self.wait_samples[priority].append(time.monotonic() - start)
+
+    def release(self, estimated_tokens: int, used_tokens: int) -> None:
+        self.active -= 1
+        if self.tokens_per_minute and used_tokens > estimated_tokens:
+            # Charge the part of the response the estimate did not cover
+            self._tokens -= used_tokens - estimated_tokens
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.tokens_per_minute / 60.0
+        self._tokens = min(float(self.tokens_per_minute), self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+
+    def _dispatch(self) -> None:
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+
+        while self._waiters and self.active < self.max_concurrency:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.tokens_per_minute:
+                self._refill()
+                # A request larger than the whole budget only waits for a full bucket
+                needed = min(tokens, self.tokens_per_minute)
+                if self._tokens < needed:
+                    delay = (needed - self._tokens) / (self.tokens_per_minute / 60.0)
+                    self._wake_handle = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                    return
+                self._tokens -= tokens
+            heapq.heappop(self._waiters)
+            self.active += 1
+            future.set_result(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"active": self.active, "queued": sum(not w[3].done() for w in self._waiters)}
+        for priority in sorted(self.requests):
+            samples = sorted(self.wait_samples[priority])
+            stats[priority.name.lower()] = {
+                "requests": self.requests[priority],
+                "avg_wait_ms": round(1000 * sum(samples) / len(samples), 1) if samples else 0.0,
+                "p95_wait_ms": round(1000 * samples[int(0.95 * (len(samples) - 1))], 1) if samples else 0.0,
+                "max_wait_ms": round(1000 * samples[-1], 1) if samples else 0.0,
+            }
+        return stats
+
+
+class LLMScheduler:
+    """Shared gate for all chat-model calls in the process.
+
+    Each provider gets its own queue with a concurrency limit and an
+    optional tokens-per-minute budget. Waiting calls are served strictly by
+    priority class (then FIFO), so interactive answers are not stuck behind
+    a deep-research run's agents and summarizers. Token use is reserved
+    from the prompt estimate and reconciled with reported usage afterwards.
+    """
+
+    def __init__(
+        self,
+        default_concurrency: int = 8,
+        default_tokens_per_minute: int = 0,
+        concurrency_limits: Optional[dict[str, int]] = None,
+        tokens_per_minute_limits: Optional[dict[str, int]] = None,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            default_concurrency: Concurrent calls per provider without an explicit limit
+            default_tokens_per_minute: Token budget per provider without an explicit limit (0 = unlimited)
+            concurrency_limits: Per-provider concurrency overrides
+            tokens_per_minute_limits: Per-provider token budget overrides
+        """
+        self.default_concurrency = default_concurrency
+        self.default_tokens_per_minute = default_tokens_per_minute
+        self.concurrency_limits = concurrency_limits or {}
+        self.tokens_per_minute_limits = tokens_per_minute_limits or {}
+        self._queues: dict[str, _ProviderQueue] = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, provider: str, tokens: int, mark_context: bool = True) -> AsyncIterator[_Grant]:
+        """
+        Hold a provider slot for one LLM call at the current priority.
+
+        Args:
+            provider: Provider key (openai, anthropic, ...)
+            tokens: Estimated prompt tokens
+            mark_context: Let nested calls in this context reuse the slot (False for
+                streams, whose consumer code runs between chunks)
+
+        Yields:
+            Grant whose used_tokens the caller sets from the response usage
+        """
+        if _holding_slot.get():
+            yield _Grant(tokens)
+            return
+
+        queue = self._queue(provider)
+        await queue.acquire(_priority.get(), tokens)
+        grant = _Grant(tokens)
+        holding = _holding_slot.set(True) if mark_context else None
+        try:
+            yield grant
+        finally:
+            if holding is not None:
+                _holding_slot.reset(holding)
+            queue.release(tokens, grant.used_tokens)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return per-provider, per-priority request counts and queue times."""
+        return {name: queue.get_stats() for name, queue in sorted(self._queues.items())}
+
+    def _queue(self, provider: str) -> _ProviderQueue:
+        queue = self._queues.get(provider)
+        if queue is None:
+            queue = _ProviderQueue(
+                provider,
+                self.concurrency_limits.get(provider, self.default_concurrency),
+                self.tokens_per_minute_limits.get(provider, self.default_tokens_per_minute),
+            )
+            self._queues[provider] = queue
+        return queue
+
+
+class ScheduledChatModel(BaseChatModel):
+    """Chat-model mixin that runs async generation through an LLMScheduler.
+
+    Combine with a concrete model class; with no scheduler attached the
+    model behaves exactly like its base class.
+    """
+
+    _scheduler: Optional[LLMScheduler] = PrivateAttr(default=None)
+    _scheduler_provider: str = PrivateAttr(default="default")
+
+    def attach_scheduler(self, scheduler: Optional[LLMScheduler], provider: str) -> "ScheduledChatModel":
+        """Route this model's calls through scheduler under the given provider key."""
+        self._scheduler = scheduler
+        self._scheduler_provider = provider
+        return self
+
+    async def _agenerate(
+        self, messages: list, stop: Optional[list[str]] = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        if self._scheduler is None:
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        async with self._scheduler.slot(self._scheduler_provider, _estimate_prompt_tokens(messages)) as grant:
+            result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            grant.used_tokens = sum(_usage_tokens(generation) for generation in result.generations)
+            return result
+
+
+class ScheduledStreamingChatModel(ScheduledChatModel):
+    """ScheduledChatModel for models with native streaming; holds the slot until the stream ends."""
+
+    async def _astream(
+        self, messages: list, stop: Optional[list[str]] = None, run_manager: Any = None, **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        if self._scheduler is None:
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+            return
+        tokens = _estimate_prompt_tokens(messages)
+        async with self._scheduler.slot(self._scheduler_provider, tokens, mark_context=False) as grant:
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                grant.used_tokens += _usage_tokens(chunk)
+                yield chunk
+
+
+def _estimate_prompt_tokens(messages: list) -> int:
+    return sum(estimate_tokens(str(getattr(message, "content", message))) for message in messages)
+
+
+def _usage_tokens(generation: Any) -> int:
+    usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+    return int(usage.get("total_tokens", 0)) if usage else 0
+
+
+def _parse_limits(raw: str) -> dict[str, int]:
+    """Parse "openai=8,anthropic=4" into a dict."""
+    limits = {}
+    for item in (raw or "").split(","):
+        if "=" in item:
+            name, value = item.split("=", 1)
+            limits[name.strip().lower()] = int(value)
+    return limits
+
+
+_scheduler: LLMScheduler | None = None
+
+
+def get_llm_scheduler(settings: Any) -> Optional[LLMScheduler]:
+    """Return the process-wide scheduler, or None when scheduling is disabled."""
+    global _scheduler
+    if not settings.llm_scheduler_enabled:
+        return None
+    if _scheduler is None:
+        _scheduler = LLMScheduler(
+            default_concurrency=settings.llm_max_concurrency,
+            default_tokens_per_minute=settings.llm_tokens_per_minute,
+            concurrency_limits=_parse_limits(settings.llm_provider_concurrency),
+            tokens_per_minute_limits=_parse_limits(settings.llm_provider_tokens_per_minute),
+        )
+    return _scheduler
+
+
+def close_llm_scheduler() -> None:
+    """Log queue-time metrics and drop the process-wide scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        return
+    logger.info("LLM scheduler stats", providers=_scheduler.get_stats())
+    _scheduler = None
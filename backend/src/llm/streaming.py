@@ -0,0 +1,158 @@
+"""Stream LLM output into report_chunk events as it is generated."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Callable, Type
+
+import structlog
+from langchain_core.messages import HumanMessage
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel
+
+logger = structlog.get_logger(__name__)
+
+
+class _ChunkEmitter:
+    """Forward text to stream.emit_report_chunk, coalescing tokens into ~flush_interval batches.
+
+    The first piece is sent immediately so time-to-first-token is not
+    delayed; afterwards tokens are grouped so a long answer does not turn
+    into thousands of events (and push everything else out of the replay
+    history).
+    """
+
+    def __init__(self, stream: Any, flush_interval: float):
+        self.stream = stream
+        self.flush_interval = flush_interval
+        self.start = time.perf_counter()
+        self.first_token_at: float | None = None
+        self._buffer: list[str] = []
+        self._last_flush = 0.0
+
+    def add(self, text: str) -> None:
+        if not text:
+            return
+        now = time.perf_counter()
+        if self.first_token_at is None:
+            self.first_token_at = now
+        self._buffer.append(text)
+        if now - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self.stream is not None:
+            self.stream.report_streamed = True
+            self.stream.emit_report_chunk("".join(self._buffer))
+        self._buffer = []
+        self._last_flush = time.perf_counter()
+
+    def log(self, event: str, **kwargs: Any) -> None:
+        end = time.perf_counter()
+        ttft = (self.first_token_at or end) - self.start
+        logger.info(event, ttft_ms=round(ttft * 1000, 1), total_ms=round((end - self.start) * 1000, 1), **kwargs)
+
+
+async def stream_text(llm: Any, messages: list, stream: Any = None, flush_interval: float = 0.05) -> str:
+    """
+    Generate a text answer with llm.astream, forwarding tokens to the client as they arrive.
+
+    Args:
+        llm: Chat model
+        messages: Prompt messages
+        stream: Streaming generator with emit_report_chunk (None only collects the text)
+        flush_interval: Minimum seconds between report_chunk events after the first
+
+    Returns:
+        The complete generated text
+    """
+    emitter = _ChunkEmitter(stream, flush_interval)
+    parts: list[str] = []
+    async for chunk in llm.astream(messages):
+        text = _chunk_text(chunk)
+        parts.append(text)
+        emitter.add(text)
+    emitter.flush()
+    answer = "".join(parts)
+    emitter.log("LLM answer streamed", chars=len(answer))
+    return answer
+
+
+async def stream_structured(
+    llm: Any,
+    schema: Type[BaseModel],
+    messages: list,
+    render: Callable[[dict[str, Any]], str],
+    stream: Any = None,
+    flush_interval: float = 0.05,
+) -> BaseModel:
+    """
+    Generate a structured output while streaming its rendered markdown.
+
+    The schema is bound as a forced tool call; partial tool-call arguments
+    are rendered with render after every chunk and the newly added suffix is
+    forwarded to the client. render must only grow at the end as fields fill
+    in (no separators after a field that may still be streaming). Models
+    without tool binding fall back to a blocking call asked for JSON
+    matching the schema (nothing is streamed then).
+
+    Args:
+        llm: Chat model
+        schema: Pydantic output schema
+        messages: Prompt messages
+        render: Turns (partial) schema arguments into markdown
+        stream: Streaming generator with emit_report_chunk
+        flush_interval: Minimum seconds between report_chunk events after the first
+
+    Returns:
+        Validated schema instance
+    """
+    try:
+        bound = llm.bind_tools([schema], tool_choice=schema.__name__)
+    except NotImplementedError:
+        return await _invoke_json(llm, schema, messages)
+
+    emitter = _ChunkEmitter(stream, flush_interval)
+    message = None
+    emitted = ""
+    async for chunk in bound.astream(messages):
+        message = chunk if message is None else message + chunk
+        if not message.tool_calls:
+            continue
+        rendered = render(message.tool_calls[0]["args"])
+        if len(rendered) > len(emitted) and rendered.startswith(emitted):
+            emitter.add(rendered[len(emitted):])
+            emitted = rendered
+    emitter.flush()
+
+    if message is None or not message.tool_calls:
+        raise ValueError(f"Model returned no {schema.__name__} tool call")
+    result = schema.model_validate(message.tool_calls[0]["args"])
+    emitter.log("LLM structured output streamed", schema=schema.__name__, chars=len(emitted))
+    return result
+
+
+async def _invoke_json(llm: Any, schema: Type[BaseModel], messages: list) -> BaseModel:
+    instruction = HumanMessage(
+        content=(
+            "Respond only with a JSON object that matches this JSON schema:\n"
+            f"{json.dumps(schema.model_json_schema())}"
+        )
+    )
+    response = await llm.ainvoke([*messages, instruction])
+    text = _chunk_text(response)
+    try:
+        return schema.model_validate(parse_json_markdown(text))
+    except (json.JSONDecodeError, ValueError) as e:
+        raise ValueError(f"Model returned no valid {schema.__name__} JSON: {e}") from e
+
+
+def _chunk_text(chunk: Any) -> str:
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+    # Content blocks (e.g. Anthropic): keep text parts only
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
@@ -9,6 +9,7 @@ from uuid import uuid4
 import structlog
 
 from src.memory.file_manager import FileManager
+from src.memory.note_index import SessionNoteIndex
 from src.models.agent_models import AgentNote
 from src.utils.text import summarize_text
 
@@ -18,16 +19,19 @@ logger = structlog.get_logger(__name__)
 class AgentMemoryService:
     """Service for agents to interact with persistent memory files."""
 
-    def __init__(self, file_manager: FileManager):
+    def __init__(self, file_manager: FileManager, note_index: SessionNoteIndex | None = None):
         """
         Initialize agent memory service.
 
         Args:
             file_manager: File manager instance
+            note_index: Optional per-session note index for relevant-note retrieval
         """
         self.file_manager = file_manager
         self.main_file = "main.md"
         self.items_dir = "items"
+        self.note_index = note_index
+        self._note_index_loaded = False
 
     async def save_agent_note(
         self,
@@ -61,6 +65,15 @@ class AgentMemoryService:
         # Save note file to items/
         await self.file_manager.write_file(file_path, content)
 
+        # Keep the session note index up to date (items are shared by all agents)
+        if self.note_index is not None:
+            try:
+                await self.note_index.add(
+                    f"{note.title}: {note.summary}", source="item", agent_id=agent_id, doc_id=file_path
+                )
+            except Exception as e:
+                logger.warning("Failed to index agent note", agent_id=agent_id, error=str(e))
+
         # Add note to agent's personal file Notes section
         if agent_file_service:
             try:
@@ -161,6 +174,56 @@ class AgentMemoryService:
             logger.warning("Failed to list items", error=str(e))
             return []
 
+    async def get_relevant_notes(
+        self,
+        query: str,
+        agent_id: str,
+        personal_notes: list[str] | None = None,
+        top_k: int = 8,
+        token_budget: int = 1500,
+    ) -> list[str] | None:
+        """
+        Select notes relevant to the current task from the session note index.
+
+        Indexes existing items on first use (e.g. a resumed session) and the
+        agent's personal notes incrementally before searching.
+
+        Args:
+            query: Current task description
+            agent_id: Agent the prompt is built for
+            personal_notes: Notes from the agent's personal file
+            top_k: Maximum notes to return
+            token_budget: Maximum tokens for the returned notes
+
+        Returns:
+            Selected note texts, or None if no index is configured
+        """
+        if self.note_index is None:
+            return None
+
+        if not self._note_index_loaded:
+            self._note_index_loaded = True
+            for item in await self.list_items():
+                await self.note_index.add(
+                    f"{item['title']}: {item['summary']}", source="item", doc_id=item["file_path"]
+                )
+
+        if personal_notes:
+            await self.note_index.add_many(personal_notes, source="agent_note", agent_id=agent_id)
+
+        return await self.note_index.select_for_prompt(
+            query, agent_id=agent_id, top_k=top_k, token_budget=token_budget
+        )
+
+    async def index_shared_note(self, text: str) -> None:
+        """Add a shared note (e.g. a main.md key insight) to the session note index."""
+        if self.note_index is None:
+            return
+        try:
+            await self.note_index.add(text, source="shared")
+        except Exception as e:
+            logger.warning("Failed to index shared note", error=str(e))
+
     def _sanitize_filename(self, title: str) -> str:
         """Sanitize title for use in filename."""
         # Remove special characters, keep only alphanumeric, spaces, hyphens, underscores
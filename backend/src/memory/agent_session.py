@@ -9,16 +9,26 @@ from datetime import datetime, timezone
 
 import structlog
 
+from src.embeddings.base import EmbeddingProvider
 from src.memory.agent_file_service import AgentFileService
 from src.memory.agent_memory_service import AgentMemoryService
 from src.memory.file_manager import FileManager
+from src.memory.note_index import SessionNoteIndex
+from src.memory.session_archive import SessionArchive
 
 logger = structlog.get_logger(__name__)
 
 
-def create_agent_session_services(memory_root: Path, session_id: str) -> tuple[AgentMemoryService, AgentFileService, Path]:
+def create_agent_session_services(
+    memory_root: Path,
+    session_id: str,
+    embedding_provider: EmbeddingProvider | None = None,
+) -> tuple[AgentMemoryService, AgentFileService, Path]:
     """
     Create agent session services for deep research.
+
+    The memory service gets a per-session note index (BM25, plus embeddings when
+    embedding_provider is given) used to pick relevant notes for agent prompts.
     
     Creates session directory structure:
     - agent_sessions/{session_id}/
@@ -27,6 +37,9 @@ def create_agent_session_services(memory_root: Path, session_id: str) -> tuple[A
       - main.md (session main file - created by AgentMemoryService.read_main_file())
       - files_index.json (session index - created here)
     """
+    # Sessions packed by the archival job are restored transparently on access
+    SessionArchive(memory_root).ensure_restored(session_id)
+
     session_dir = memory_root / "agent_sessions" / session_id
     session_dir.mkdir(parents=True, exist_ok=True)
     (session_dir / "agents").mkdir(exist_ok=True)
@@ -50,7 +63,8 @@ def create_agent_session_services(memory_root: Path, session_id: str) -> tuple[A
         logger.info("Session files_index.json created", session_id=session_id, path=str(json_index))
 
     file_manager = FileManager(str(session_dir))
-    return AgentMemoryService(file_manager), AgentFileService(file_manager), session_dir
+    note_index = SessionNoteIndex(embedding_provider=embedding_provider)
+    return AgentMemoryService(file_manager, note_index=note_index), AgentFileService(file_manager), session_dir
 
 
 def cleanup_agent_session_dir(memory_root: Path, session_dir: Path) -> None:
@@ -125,8 +125,8 @@ class MemoryManager:
         async with self.session_factory() as session:
             # Use database schema dimension if not provided
             if embedding_dimension is None:
-                from src.database.schema import EMBEDDING_DIMENSION
-                embedding_dimension = EMBEDDING_DIMENSION
+                from src.database.schema import MEMORY_EMBEDDING_DIMENSION
+                embedding_dimension = MEMORY_EMBEDDING_DIMENSION
             
             sync_service = FileSyncService(
                 session=session,
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -19,7 +20,11 @@ class ChunkBase(BaseModel):
 class ChunkCreate(ChunkBase):
     """Create chunk model."""
 
-    embedding: list[float] | None = None
+    # float32 arrays are passed through to pgvector without a list round-trip
+    embedding: np.ndarray | list[float] | None = None
+
+    class Config:
+        arbitrary_types_allowed = True
 
 
 class Chunk(ChunkBase):
@@ -0,0 +1,302 @@
+"""Per-session semantic index over agent notes, items and shared notes.
+
+Agents used to get the last N notes of their personal file in every prompt,
+regardless of the task at hand. This index keeps all notes of a deep research
+session searchable (embeddings + BM25, fused with RRF) and is updated
+incrementally as notes are written, so the prompt only carries the notes that
+are relevant to the current todo within a token budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import structlog
+
+from src.embeddings.base import EmbeddingProvider
+from src.utils.text import estimate_tokens
+
+logger = structlog.get_logger(__name__)
+
+_token_re = re.compile(r"\w+", re.UNICODE)
+
+
+def _tokenize(text: str) -> list[str]:
+    return [token for token in _token_re.findall(text.lower()) if len(token) > 1]
+
+
+@dataclass
+class IndexedNote:
+    """Single entry of the note index."""
+
+    doc_id: str
+    text: str
+    source: str  # agent_note, item or shared
+    agent_id: str | None
+    tokens: int
+    term_counts: Counter = field(default_factory=Counter)
+    length: int = 0
+    embedding: np.ndarray | None = None
+    order: int = 0
+
+
+class SessionNoteIndex:
+    """Hybrid (vector + BM25) index of notes for one research session."""
+
+    def __init__(
+        self,
+        embedding_provider: EmbeddingProvider | None = None,
+        rrf_k: int = 60,
+        bm25_k1: float = 1.5,
+        bm25_b: float = 0.75,
+    ):
+        """
+        Initialize note index.
+
+        Args:
+            embedding_provider: Provider for note/query embeddings (BM25 only if None)
+            rrf_k: RRF K parameter used to fuse vector and BM25 rankings
+            bm25_k1: BM25 term frequency saturation
+            bm25_b: BM25 length normalization
+        """
+        self.embedding_provider = embedding_provider
+        self.rrf_k = rrf_k
+        self.bm25_k1 = bm25_k1
+        self.bm25_b = bm25_b
+        self._notes: dict[str, IndexedNote] = {}
+        self._doc_freq: Counter = Counter()
+        self._total_length = 0
+        self._lock = asyncio.Lock()
+        self._stats = {
+            "selections": 0,
+            "baseline_tokens": 0,
+            "selected_tokens": 0,
+            "embedding_failures": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    @staticmethod
+    def make_doc_id(text: str, source: str, agent_id: str | None = None) -> str:
+        """Stable id so re-adding the same note is a no-op."""
+        digest = hashlib.sha1(f"{source}|{agent_id or ''}|{text}".encode("utf-8")).hexdigest()
+        return digest[:16]
+
+    async def add(
+        self,
+        text: str,
+        source: str,
+        agent_id: str | None = None,
+        doc_id: str | None = None,
+    ) -> bool:
+        """
+        Add a note to the index (incremental, idempotent).
+
+        Args:
+            text: Note text
+            source: Note origin (agent_note, item, shared)
+            agent_id: Owning agent, None for shared notes
+            doc_id: Optional explicit id, derived from content otherwise
+
+        Returns:
+            True if the note was added, False if it was empty or already indexed
+        """
+        text = (text or "").strip()
+        if not text:
+            return False
+        doc_id = doc_id or self.make_doc_id(text, source, agent_id)
+        if doc_id in self._notes:
+            return False
+
+        embedding = await self._embed(text)
+
+        async with self._lock:
+            if doc_id in self._notes:
+                return False
+            terms = _tokenize(text)
+            note = IndexedNote(
+                doc_id=doc_id,
+                text=text,
+                source=source,
+                agent_id=agent_id,
+                tokens=estimate_tokens(text),
+                term_counts=Counter(terms),
+                length=len(terms),
+                embedding=embedding,
+                order=len(self._notes),
+            )
+            self._notes[doc_id] = note
+            self._doc_freq.update(note.term_counts.keys())
+            self._total_length += note.length
+
+        logger.debug("Note indexed", doc_id=doc_id, source=source, agent_id=agent_id, total=len(self._notes))
+        return True
+
+    async def add_many(self, texts: list[str], source: str, agent_id: str | None = None) -> int:
+        """Add several notes, returning how many were new."""
+        added = 0
+        for text in texts:
+            if await self.add(text, source=source, agent_id=agent_id):
+                added += 1
+        return added
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 8,
+        agent_id: str | None = None,
+    ) -> list[tuple[IndexedNote, float]]:
+        """
+        Hybrid search over the index.
+
+        Notes visible to an agent are its own notes plus items and shared notes
+        (items are written by every agent and are shared across the session).
+
+        Args:
+            query: Search query (usually the current task description)
+            top_k: Maximum results
+            agent_id: Restrict personal notes to this agent
+
+        Returns:
+            List of (note, RRF score) sorted by relevance
+        """
+        candidates = [
+            note
+            for note in self._notes.values()
+            if note.source != "agent_note" or agent_id is None or note.agent_id == agent_id
+        ]
+        if not candidates or top_k <= 0:
+            return []
+
+        rankings = [self._bm25_ranking(query, candidates)]
+        vector_ranking = await self._vector_ranking(query, candidates)
+        if vector_ranking:
+            rankings.append(vector_ranking)
+
+        scores: dict[str, float] = {}
+        for ranking in rankings:
+            for rank, doc_id in enumerate(ranking, start=1):
+                scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (self.rrf_k + rank)
+
+        if not scores:
+            # No term overlap and no usable embeddings: fall back to the most recent notes
+            recent = sorted(candidates, key=lambda note: note.order, reverse=True)
+            return [(note, 0.0) for note in recent[:top_k]]
+
+        # Recency breaks ties between equally ranked notes
+        ordered = sorted(scores.items(), key=lambda item: (item[1], self._notes[item[0]].order), reverse=True)
+        return [(self._notes[doc_id], score) for doc_id, score in ordered[:top_k]]
+
+    async def select_for_prompt(
+        self,
+        query: str,
+        agent_id: str | None = None,
+        top_k: int = 8,
+        token_budget: int = 1500,
+        max_note_chars: int = 1000,
+    ) -> list[str]:
+        """
+        Pick the most relevant notes for a prompt within a token budget.
+
+        Args:
+            query: Current task description
+            agent_id: Agent the prompt is built for
+            top_k: Maximum notes to include
+            token_budget: Maximum total tokens for included notes
+            max_note_chars: Per-note truncation (same limit as the old prompt)
+
+        Returns:
+            Note texts in relevance order
+        """
+        selected: list[str] = []
+        seen: set[str] = set()
+        used_tokens = 0
+        for note, _score in await self.search(query, top_k=top_k, agent_id=agent_id):
+            # Personal notes repeat the item they came from with a "| Sources: N" suffix
+            dedup_key = note.text.split(" | Sources:")[0]
+            if dedup_key in seen:
+                continue
+            seen.add(dedup_key)
+            text = note.text[:max_note_chars] + "..." if len(note.text) > max_note_chars else note.text
+            tokens = note.tokens if text is note.text else estimate_tokens(text)
+            if used_tokens + tokens > token_budget:
+                continue
+            selected.append(text)
+            used_tokens += tokens
+        return selected
+
+    def record_selection(self, baseline_tokens: int, selected_tokens: int) -> None:
+        """Track prompt tokens of the old "last N notes" context vs the selected one."""
+        self._stats["selections"] += 1
+        self._stats["baseline_tokens"] += baseline_tokens
+        self._stats["selected_tokens"] += selected_tokens
+
+    def get_stats(self) -> dict[str, Any]:
+        """Index size and prompt-token savings accumulated for this session."""
+        baseline = self._stats["baseline_tokens"]
+        saved = baseline - self._stats["selected_tokens"]
+        return {
+            **self._stats,
+            "indexed_notes": len(self._notes),
+            "saved_tokens": saved,
+            "saved_ratio": round(saved / baseline, 3) if baseline else 0.0,
+        }
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        if not self.embedding_provider:
+            return None
+        try:
+            vector = np.asarray(await self.embedding_provider.embed_text(text), dtype=np.float32)
+        except Exception as e:
+            self._stats["embedding_failures"] += 1
+            logger.warning("Note embedding failed, BM25 only for this note", error=str(e))
+            return None
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            # Zero vectors (mock provider) carry no ranking signal
+            return None
+        return vector / norm
+
+    def _bm25_ranking(self, query: str, candidates: list[IndexedNote]) -> list[str]:
+        query_terms = set(_tokenize(query))
+        if not query_terms:
+            return []
+        total_docs = len(self._notes)
+        avg_length = (self._total_length / total_docs) if total_docs else 0.0
+        scored = []
+        for note in candidates:
+            score = 0.0
+            for term in query_terms:
+                tf = note.term_counts.get(term, 0)
+                if not tf:
+                    continue
+                df = self._doc_freq.get(term, 0)
+                idf = math.log(1.0 + (total_docs - df + 0.5) / (df + 0.5))
+                norm = 1.0 - self.bm25_b + self.bm25_b * (note.length / avg_length if avg_length else 1.0)
+                score += idf * tf * (self.bm25_k1 + 1.0) / (tf + self.bm25_k1 * norm)
+            if score > 0:
+                scored.append((score, note.order, note.doc_id))
+        scored.sort(reverse=True)
+        return [doc_id for _, _, doc_id in scored]
+
+    async def _vector_ranking(self, query: str, candidates: list[IndexedNote]) -> list[str]:
+        embedded = [note for note in candidates if note.embedding is not None]
+        if not embedded or not query.strip():
+            return []
+        query_vector = await self._embed(query)
+        if query_vector is None:
+            return []
+        if any(note.embedding.shape != query_vector.shape for note in embedded):
+            logger.warning("Note index has mixed embedding dimensions, skipping vector ranking")
+            return []
+        similarities = np.stack([note.embedding for note in embedded]) @ query_vector
+        order = np.argsort(-similarities)
+        return [embedded[i].doc_id for i in order]
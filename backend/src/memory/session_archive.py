@@ -0,0 +1,232 @@
+"""Archival and lazy restore of finished agent session directories.
+
+Every deep research run leaves agent_sessions/{session_id}/ behind (main.md,
+draft_report.md, agents/, items/). Finished sessions are packed into one
+compressed zip per session under agent_sessions_archive/, listed in a JSON
+index, and their loose files are removed so scans of agent_sessions/ stay
+small. Accessing an archived session restores it transparently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+ARCHIVE_DIR_NAME = "agent_sessions_archive"
+ARCHIVE_INDEX_NAME = "index.json"
+
+
+class SessionArchive:
+    """Pack, index and restore agent session directories."""
+
+    def __init__(self, memory_root: Path | str):
+        """
+        Initialize session archive.
+
+        Args:
+            memory_root: Memory root containing agent_sessions/
+        """
+        self.memory_root = Path(memory_root)
+        self.sessions_dir = self.memory_root / "agent_sessions"
+        self.archive_dir = self.memory_root / ARCHIVE_DIR_NAME
+        self.index_path = self.archive_dir / ARCHIVE_INDEX_NAME
+
+    def archive_path(self, session_id: str) -> Path:
+        """Path of the compressed archive for a session."""
+        return self.archive_dir / f"{session_id}.zip"
+
+    def is_archived(self, session_id: str) -> bool:
+        """Check whether a session is stored in the archive."""
+        return self.archive_path(session_id).exists()
+
+    def read_index(self) -> dict[str, Any]:
+        """Read the archive index (session_id -> archive metadata)."""
+        if not self.index_path.exists():
+            return {"version": "1.0", "sessions": {}}
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning("Session archive index unreadable, rebuilding", error=str(e))
+            return self._rebuild_index()
+
+    def archive_session(self, session_id: str, status: str | None = None) -> dict[str, Any] | None:
+        """
+        Pack a session directory into a compressed archive and remove the loose files.
+
+        Args:
+            session_id: Session identifier
+            status: Session status recorded in the index (completed, expired, ...)
+
+        Returns:
+            Index entry for the archived session, or None if there was nothing to archive
+        """
+        session_dir = self._session_dir(session_id)
+        if session_dir is None or not session_dir.is_dir():
+            return None
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        target = self.archive_path(session_id)
+        tmp_target = target.with_suffix(".zip.tmp")
+
+        files = sorted(path for path in session_dir.rglob("*") if path.is_file())
+        original_bytes = 0
+        with zipfile.ZipFile(tmp_target, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+            for path in files:
+                archive.write(path, arcname=str(path.relative_to(session_dir)))
+                original_bytes += path.stat().st_size
+        # Only drop the loose files once the archive is complete on disk
+        os.replace(tmp_target, target)
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+        entry = {
+            "archive": target.name,
+            "status": status,
+            "archived_at": datetime.now(timezone.utc).isoformat(),
+            "files": len(files),
+            "original_bytes": original_bytes,
+            "archived_bytes": target.stat().st_size,
+        }
+        index = self.read_index()
+        index["sessions"][session_id] = entry
+        self._write_index(index)
+
+        logger.info("Agent session archived", session_id=session_id, **entry)
+        return entry
+
+    def restore_session(self, session_id: str) -> bool:
+        """
+        Restore an archived session to agent_sessions/{session_id}/.
+
+        Returns:
+            True if the session was restored, False if it was not archived
+        """
+        source = self.archive_path(session_id)
+        session_dir = self._session_dir(session_id)
+        if session_dir is None or not source.exists():
+            return False
+
+        session_dir.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.infolist():
+                destination = (session_dir / member.filename).resolve()
+                # Never extract outside the session directory
+                if session_dir.resolve() not in destination.parents:
+                    logger.warning("Skipping unsafe archive member", session_id=session_id, member=member.filename)
+                    continue
+                archive.extract(member, session_dir)
+        source.unlink()
+
+        index = self.read_index()
+        index["sessions"].pop(session_id, None)
+        self._write_index(index)
+
+        logger.info("Agent session restored from archive", session_id=session_id)
+        return True
+
+    def ensure_restored(self, session_id: str) -> bool:
+        """Restore the session if it is archived; no-op otherwise."""
+        if not self.is_archived(session_id):
+            return False
+        return self.restore_session(session_id)
+
+    def _session_dir(self, session_id: str) -> Path | None:
+        session_dir = self.sessions_dir / session_id
+        if session_dir.resolve().parent != self.sessions_dir.resolve():
+            logger.warning("Refusing session id outside agent_sessions", session_id=session_id)
+            return None
+        return session_dir
+
+    def _write_index(self, index: dict[str, Any]) -> None:
+        index["last_updated"] = datetime.now(timezone.utc).isoformat()
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(index, indent=2, ensure_ascii=True), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+    def _rebuild_index(self) -> dict[str, Any]:
+        sessions = {}
+        for path in sorted(self.archive_dir.glob("*.zip")):
+            with zipfile.ZipFile(path) as archive:
+                infos = archive.infolist()
+            sessions[path.stem] = {
+                "archive": path.name,
+                "status": None,
+                "archived_at": datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).isoformat(),
+                "files": len(infos),
+                "original_bytes": sum(info.file_size for info in infos),
+                "archived_bytes": path.stat().st_size,
+            }
+        return {"version": "1.0", "sessions": sessions}
+
+
+async def archive_finished_sessions(
+    session_manager: Any,
+    archive: SessionArchive,
+    expire_after_hours: int = 24,
+    archive_after_hours: int = 24,
+    active_session_ids: Iterable[str] = (),
+) -> int:
+    """
+    Expire stale sessions and archive finished ones.
+
+    Args:
+        session_manager: SessionManager used to expire and list sessions
+        archive: Session archive
+        expire_after_hours: Age after which incomplete sessions are marked expired
+        archive_after_hours: Time since completion after which sessions are archived
+        active_session_ids: Sessions with a running task in this process (never archived)
+
+    Returns:
+        Number of sessions archived
+    """
+    await session_manager.cleanup_expired_sessions(hours=expire_after_hours)
+    candidates = await session_manager.list_archivable_sessions(older_than_hours=archive_after_hours)
+
+    skip = set(active_session_ids)
+    archived = 0
+    for session_id, status in candidates:
+        if session_id in skip or not (archive.sessions_dir / session_id).is_dir():
+            continue
+        try:
+            if await asyncio.to_thread(archive.archive_session, session_id, status):
+                archived += 1
+        except Exception as e:
+            logger.warning("Failed to archive agent session", session_id=session_id, error=str(e))
+
+    if archived:
+        logger.info("Session archival pass completed", archived=archived, candidates=len(candidates))
+    return archived
+
+
+async def run_session_archival_loop(
+    session_manager: Any,
+    archive: SessionArchive,
+    interval_seconds: float,
+    expire_after_hours: int = 24,
+    archive_after_hours: int = 24,
+    active_session_ids: Callable[[], Iterable[str]] = lambda: (),
+) -> None:
+    """Periodically run archive_finished_sessions until cancelled."""
+    while True:
+        try:
+            await archive_finished_sessions(
+                session_manager,
+                archive,
+                expire_after_hours=expire_after_hours,
+                archive_after_hours=archive_after_hours,
+                active_session_ids=active_session_ids(),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Session archival pass failed", error=str(e))
+        await asyncio.sleep(interval_seconds)
@@ -1,9 +1,11 @@
 """File synchronization service for memory system."""
 
+import numpy as np
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.embeddings.base import EmbeddingProvider
+from src.embeddings.vectors import fit_dimension
 from src.memory.chunking import MarkdownChunker
 from src.memory.file_manager import FileManager
 from src.memory.models.chunk import ChunkCreate
@@ -43,8 +45,8 @@ class FileSyncService:
         self.batch_size = batch_size
         # Use database schema dimension if not provided
         if embedding_dimension is None:
-            from src.database.schema import EMBEDDING_DIMENSION
-            embedding_dimension = EMBEDDING_DIMENSION
+            from src.database.schema import MEMORY_EMBEDDING_DIMENSION
+            embedding_dimension = MEMORY_EMBEDDING_DIMENSION
         self.embedding_dimension = embedding_dimension
 
     async def sync_file(self, file_path: str, force: bool = False) -> int:
@@ -116,29 +118,15 @@ class FileSyncService:
             logger.warning("No chunks generated", file_path=file_path)
             return file_id
 
-        # Generate embeddings in batches
+        # Generate embeddings in batches as float32 arrays; each chunk keeps a row view
         chunk_texts = [chunk["content"] for chunk in chunks]
-        all_embeddings = []
+        all_embeddings: list[np.ndarray] = []
 
         for i in range(0, len(chunk_texts), self.batch_size):
             batch = chunk_texts[i : i + self.batch_size]
-            embeddings = await self.embedding_provider.embed_batch(batch)
-            
+            embeddings = await self.embedding_provider.embed_batch_array(batch)
             # Normalize embedding dimensions to match database schema
-            # Use configured dimension from embedding provider
-            db_dimension = self.embedding_dimension
-            normalized_embeddings = []
-            for emb in embeddings:
-                emb_list = list(emb) if not isinstance(emb, list) else emb
-                if len(emb_list) < db_dimension:
-                    # Pad with zeros if smaller
-                    emb_list = emb_list + [0.0] * (db_dimension - len(emb_list))
-                elif len(emb_list) > db_dimension:
-                    # Truncate if larger
-                    emb_list = emb_list[:db_dimension]
-                normalized_embeddings.append(emb_list)
-            
-            all_embeddings.extend(normalized_embeddings)
+            all_embeddings.extend(fit_dimension(embeddings, self.embedding_dimension))
 
         # Create chunk objects
         chunk_creates = [
@@ -13,6 +13,8 @@ from typing import Any
 import numpy as np
 import structlog
 
+from src.embeddings.vectors import fit_dimension
+
 logger = structlog.get_logger(__name__)
 
 
@@ -96,14 +98,14 @@ class FAISSAdapter(VectorStoreAdapter):
         self,
         file_id: int,
         chunks: list[dict[str, Any]],
-        embeddings: list[list[float]],
+        embeddings: list[list[float]] | np.ndarray,
     ) -> None:
         """Add embeddings to FAISS index."""
         if len(chunks) != len(embeddings):
             raise ValueError("Chunks and embeddings must have same length")
 
-        # Convert to numpy array
-        vectors = np.array(embeddings, dtype=np.float32)
+        # No copy when embeddings already is a contiguous float32 array of the index dimension
+        vectors = np.ascontiguousarray(fit_dimension(embeddings, self.dimension))
 
         # Add to index
         start_id = self.next_id
@@ -128,14 +130,14 @@ class FAISSAdapter(VectorStoreAdapter):
         )
 
     async def search(
-        self, query_embedding: list[float], top_k: int = 10, filter_dict: dict | None = None
+        self, query_embedding: list[float] | np.ndarray, top_k: int = 10, filter_dict: dict | None = None
     ) -> list[dict[str, Any]]:
         """Search FAISS index."""
         if self.index.ntotal == 0:
             return []
 
-        # Convert query to numpy
-        query_vector = np.array([query_embedding], dtype=np.float32)
+        # (1, dim) view of the query
+        query_vector = np.ascontiguousarray(fit_dimension(query_embedding, self.dimension).reshape(1, -1))
 
         # Search
         distances, indices = self.index.search(query_vector, min(top_k, self.index.ntotal))
@@ -35,6 +35,9 @@ class SearchProvider(ABC):
         """
         pass
 
+    async def close(self) -> None:  # noqa: B027 - optional hook, providers without connections keep the no-op
+        """Release pooled connections held by the provider."""
+
     async def search_and_scrape(
         self, query: str, max_results: int = 10, scrape_top_n: int = 3
     ) -> tuple[SearchResponse, list[ScrapedContent]]:
@@ -0,0 +1,173 @@
+"""Long-lived headless Chromium with a bounded pool of browser contexts for JavaScript rendering."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Chromium flags for containers (no sandbox, no GPU, small /dev/shm)
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+]
+
+
+class BrowserPool:
+    """One Chromium process shared by all renders, with at most max_pages pages open at once.
+
+    The browser is launched on first use and kept running. Each render
+    borrows an idle browser context (or creates one, up to max_pages) and
+    opens a fresh page in it; contexts are recycled after
+    context_max_uses renders to bound memory growth, and discarded if a
+    render fails. Requests for blocked resource types (images, fonts and
+    media by default) are aborted, since only the DOM is needed. If the
+    browser crashes or disconnects, it is relaunched on the next render.
+    """
+
+    def __init__(
+        self,
+        max_pages: int = 4,
+        user_agent: Optional[str] = None,
+        page_timeout: float = 30.0,
+        block_resources: tuple[str, ...] = ("image", "font", "media"),
+        context_max_uses: int = 50,
+        launcher: Optional[Callable[[Any], Awaitable[tuple[Any, Any]]]] = None,
+    ):
+        """
+        Initialize browser pool.
+
+        Args:
+            max_pages: Pages rendered concurrently (each in its own context)
+            user_agent: User agent of the browser contexts
+            page_timeout: Default timeout for page operations in seconds
+            block_resources: Playwright resource types whose requests are aborted
+            context_max_uses: Renders after which a context is closed and replaced
+            launcher: Async callable taking the running Playwright instance (None at first) and
+                returning (playwright, browser); defaults to launching headless Chromium
+        """
+        self.max_pages = max(1, max_pages)
+        self.user_agent = user_agent
+        self.page_timeout = page_timeout
+        self.block_resources = frozenset(block_resources)
+        self.context_max_uses = max(1, context_max_uses)
+        self._launcher = launcher or self._launch_chromium
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._idle: list[tuple[Any, int]] = []
+        self._semaphore: asyncio.Semaphore | None = None
+        self._lock: asyncio.Lock | None = None
+        self.stats = {"renders": 0, "launches": 0, "contexts": 0, "blocked_requests": 0, "failures": 0}
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """
+        Borrow a fresh page for one render.
+
+        Yields:
+            Playwright Page (closed again on exit)
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pages)
+        async with self._semaphore:
+            context, uses = await self._acquire_context()
+            page = None
+            healthy = False
+            try:
+                page = await context.new_page()
+                page.set_default_timeout(self.page_timeout * 1000)
+                page.set_default_navigation_timeout(self.page_timeout * 1000)
+                self.stats["renders"] += 1
+                yield page
+                healthy = True
+            finally:
+                if not healthy:
+                    self.stats["failures"] += 1
+                await self._release(context, uses + 1, page, healthy)
+
+    async def close(self) -> None:
+        """Close all contexts, the browser and Playwright."""
+        idle, self._idle = self._idle, []
+        for context, _ in idle:
+            await self._close_quietly(context)
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = None
+        if browser is not None:
+            await self._close_quietly(browser)
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.debug("Playwright stop failed", error=str(e))
+        if self.stats["renders"]:
+            logger.info("Browser pool stats", **self.stats)
+
+    async def _acquire_context(self) -> tuple[Any, int]:
+        browser = await self._ensure_browser()
+        if self._idle:
+            return self._idle.pop()
+        context = await browser.new_context(user_agent=self.user_agent, viewport={"width": 1920, "height": 1080})
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        self.stats["contexts"] += 1
+        return context, 0
+
+    async def _release(self, context: Any, uses: int, page: Any, healthy: bool) -> None:
+        if page is not None:
+            await self._close_quietly(page)
+        if healthy and uses < self.context_max_uses and self._is_connected():
+            self._idle.append((context, uses))
+        else:
+            await self._close_quietly(context)
+
+    async def _ensure_browser(self) -> Any:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._browser is not None and self._is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("Browser disconnected; relaunching", launches=self.stats["launches"])
+                for context, _ in self._idle:
+                    await self._close_quietly(context)
+                self._idle.clear()
+                await self._close_quietly(self._browser)
+            self._playwright, self._browser = await self._launcher(self._playwright)
+            self.stats["launches"] += 1
+            logger.info("Browser launched", max_pages=self.max_pages, blocked=sorted(self.block_resources))
+            return self._browser
+
+    def _is_connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _route(self, route: Any) -> None:
+        if route.request.resource_type in self.block_resources:
+            self.stats["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @staticmethod
+    async def _launch_chromium(playwright: Any) -> tuple[Any, Any]:
+        if playwright is None:
+            from playwright.async_api import async_playwright
+
+            playwright = await async_playwright().start()
+        browser = await playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        return playwright, browser
+
+    @staticmethod
+    async def _close_quietly(closable: Any) -> None:
+        try:
+            await closable.close()
+        except Exception as e:
+            # Already closed, or the browser is gone
+            logger.debug("Browser object close failed", error=str(e))
@@ -0,0 +1,294 @@
+"""Search result cache (memory + SQLite) with stale-while-revalidate and per-session metrics."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+from src.llm.accounting import current_session_id
+from src.search.base import SearchProvider
+from src.search.models import ScrapedContent, SearchResponse
+from src.utils.session_stats import SessionStats
+
+logger = structlog.get_logger(__name__)
+
+# Prune the disk table once this many writes have happened since the last prune
+_PRUNE_EVERY = 100
+
+_whitespace = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache keys (Unicode form, case, whitespace, edge punctuation)."""
+    query = unicodedata.normalize("NFKC", query).casefold()
+    return _whitespace.sub(" ", query).strip(" \t\n.,;:!?\"'")
+
+
+class SearchResultCache:
+    """Search response store: in-memory LRU in front of a SQLite table.
+
+    An entry is fresh for ttl_seconds and may then be served stale for
+    another stale_seconds while it is refreshed in the background; after
+    that it is treated as missing. The disk table keeps at most max_entries
+    rows (oldest evicted first). Hits, stale hits and misses are counted
+    per research session (see usage_scope) and process-wide.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: float = 3600.0,
+        stale_seconds: float = 21600.0,
+        max_entries: int = 20000,
+        memory_max_entries: int = 2000,
+        max_sessions: int = 200,
+    ):
+        """
+        Initialize search cache.
+
+        Args:
+            path: SQLite file path (None keeps entries in memory only)
+            ttl_seconds: How long an entry is served without revalidation
+            stale_seconds: How long after ttl_seconds a stale entry is still served
+            max_entries: Max rows kept on disk
+            memory_max_entries: Max entries kept in the in-memory LRU
+            max_sessions: Sessions whose metrics are kept (least recently updated dropped first)
+        """
+        self.path = path
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.stale_seconds = max(0.0, stale_seconds)
+        self.max_entries = max(1, max_entries)
+        self.memory_max_entries = max(1, memory_max_entries)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats: SessionStats[dict[str, int]] = SessionStats(lambda: defaultdict(int), max_sessions)
+        self._conn: sqlite3.Connection | None = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache "
+                "(key TEXT PRIMARY KEY, created_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS search_cache_created_at ON search_cache (created_at)")
+
+    def get(self, key: str) -> Optional[tuple[SearchResponse, bool]]:
+        """Return (response, stale) for key, or None if missing or past the stale window."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute("SELECT created_at, value FROM search_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._remember(key, *entry)
+            if entry is None:
+                return None
+            age = now - entry[0]
+            if age > self.ttl_seconds + self.stale_seconds:
+                self._memory.pop(key, None)
+                if self._conn is not None:
+                    self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                return None
+            self._memory.move_to_end(key)
+            value = entry[1]
+        return SearchResponse.model_validate_json(value), age > self.ttl_seconds
+
+    def put(self, key: str, response: SearchResponse) -> None:
+        """Store a response for key in memory and on disk."""
+        now = time.time()
+        value = response.model_dump_json()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, created_at, value) VALUES (?, ?, ?)", (key, now, value)
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_EVERY:
+                self._prune(now)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM search_cache")
+
+    def record(self, outcome: str, session_id: Optional[str] = None) -> None:
+        """Count a hit, stale hit or miss, process-wide and for the session."""
+        with self._lock:
+            for counts in self._stats.targets(session_id):
+                counts[outcome] += 1
+
+    def get_stats(self, session_id: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """Return hits, stale hits, misses and hit rate for a session (or process-wide when None)."""
+        with self._lock:
+            counts = self._stats.get(session_id)
+            if counts is None:
+                return None
+            counts = dict(counts)
+        summary = {outcome: counts.get(outcome, 0) for outcome in ("hits", "stale_hits", "misses")}
+        lookups = sum(summary.values())
+        served = summary["hits"] + summary["stale_hits"]
+        return {
+            **summary,
+            "revalidations": counts.get("revalidations", 0),
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Prune expired rows and close the SQLite connection."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._prune(time.time())
+            self._conn.close()
+            self._conn = None
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+
+    def _prune(self, now: float) -> None:
+        self._writes_since_prune = 0
+        self._conn.execute(
+            "DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl_seconds - self.stale_seconds,)
+        )
+        self._conn.execute(
+            "DELETE FROM search_cache WHERE key NOT IN "
+            "(SELECT key FROM search_cache ORDER BY created_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+
+class CachingSearchProvider(SearchProvider):
+    """Wrap a SearchProvider so repeated searches are answered from a SearchResultCache.
+
+    Searches are keyed by provider name, language, max_results and the
+    normalized query. Fresh entries are returned directly; stale ones are
+    returned immediately and refreshed with one background search per key.
+    Empty responses are not cached, since providers report failures that
+    way. scrape() and other attributes pass straight through.
+    """
+
+    def __init__(self, provider: SearchProvider, store: SearchResultCache, name: str, language: str = ""):
+        """
+        Initialize caching wrapper.
+
+        Args:
+            provider: Search provider to wrap
+            store: Shared search result store
+            name: Provider name used in cache keys
+            language: Search language used in cache keys
+        """
+        self.provider = provider
+        self.store = store
+        self.name = name
+        self.language = language
+        self._revalidating: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def search(self, query: str, max_results: int = 10) -> SearchResponse:
+        """Search, answering from the cache when possible."""
+        key = self._key(query, max_results)
+        session_id = current_session_id()
+        cached = self.store.get(key)
+        if cached is not None:
+            response, stale = cached
+            self.store.record("stale_hits" if stale else "hits", session_id)
+            if stale and key not in self._revalidating:
+                self._revalidating.add(key)
+                task = asyncio.create_task(self._revalidate(key, query, max_results, session_id))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return response.model_copy(update={"query": query})
+
+        self.store.record("misses", session_id)
+        response = await self.provider.search(query, max_results=max_results)
+        if response.results:
+            self.store.put(key, response)
+        return response
+
+    async def scrape(self, url: str) -> ScrapedContent:
+        """Scrape through the wrapped provider."""
+        return await self.provider.scrape(url)
+
+    async def close(self) -> None:
+        """Cancel pending revalidations and close the wrapped provider."""
+        for task in list(self._tasks):
+            task.cancel()
+        await self.provider.close()
+
+    async def _revalidate(self, key: str, query: str, max_results: int, session_id: Optional[str]) -> None:
+        try:
+            response = await self.provider.search(query, max_results=max_results)
+            if response.results:
+                self.store.put(key, response)
+            self.store.record("revalidations", session_id)
+        except Exception as e:
+            logger.warning("Search cache revalidation failed", query=query[:100], error=str(e))
+        finally:
+            self._revalidating.discard(key)
+
+    def _key(self, query: str, max_results: int) -> str:
+        raw = f"{self.name}\x00{self.language}\x00{max_results}\x00{normalize_query(query)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+_store: SearchResultCache | None = None
+
+
+def get_search_cache(settings: Any) -> Optional[SearchResultCache]:
+    """Return the process-wide search result store, or None when caching is disabled."""
+    global _store
+    if not settings.search_cache_enabled:
+        return None
+    if _store is None:
+        _store = SearchResultCache(
+            path=settings.search_cache_path or None,
+            ttl_seconds=settings.search_cache_ttl_seconds,
+            stale_seconds=settings.search_cache_stale_seconds,
+            max_entries=settings.search_cache_max_entries,
+            memory_max_entries=settings.search_cache_memory_max_entries,
+        )
+        logger.info("Search result cache enabled", path=settings.search_cache_path, ttl=settings.search_cache_ttl_seconds)
+    return _store
+
+
+def get_session_search_stats(session_id: Optional[str]) -> Optional[dict[str, Any]]:
+    """Return search cache metrics of a session from the process-wide store, if any."""
+    if _store is None or not session_id:
+        return None
+    return _store.get_stats(session_id)
+
+
+def close_search_cache() -> None:
+    """Log metrics and close the process-wide search result store."""
+    global _store
+    if _store is None:
+        return
+    logger.info("Search result cache stats", **_store.get_stats())
+    _store.close()
+    _store = None
@@ -0,0 +1,309 @@
+"""Fast HTML extraction: one lxml parse, readability-style main content, optional process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlparse
+
+import lxml.html
+import structlog
+from lxml import etree
+
+logger = structlog.get_logger(__name__)
+
+_BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "nav", "header", "footer", "aside", "form", "iframe", "svg", "template", "button",
+)
+_POSITIVE = re.compile(r"article|body|content|entry|hentry|main|page|post|text|blog|story", re.I)
+_NEGATIVE = re.compile(
+    r"comment|meta|footer|footnote|sidebar|sponsor|advert|\bads?\b|share|social|related|promo|nav|menu|widget|"
+    r"cookie|banner|subscribe|popup",
+    re.I,
+)
+_TAG_SCORES = {"div": 5, "article": 10, "main": 5, "section": 3, "pre": 3, "td": 3, "blockquote": 3,
+               "form": -3, "ol": -3, "ul": -3, "li": -3, "th": -5, "h1": -5, "h2": -5, "h3": -5}
+_BLOCK_TAGS = {"p", "div", "section", "article", "main", "figure", "figcaption", "dl", "dt", "dd", "center"}
+_whitespace = re.compile(r"\s+")
+_blank_lines = re.compile(r"\n\s*\n\s*\n+")
+_paragraph_breaks = re.compile(r"\n\s*\n")
+
+# Below this length, main content scoring is not trusted and the whole cleaned body is used
+_MIN_MAIN_CHARS = 250
+
+
+@dataclass
+class ExtractedPage:
+    """Title, text, markdown and (optionally) media of a page."""
+
+    title: str
+    content: str
+    markdown: str | None = None
+    images: list[str] = field(default_factory=list)
+    links: list[str] = field(default_factory=list)
+
+
+def extract_page(html: str, url: str, extract_markdown: bool = True, include_media: bool = False) -> ExtractedPage:
+    """
+    Extract a page from HTML with a single lxml parse.
+
+    Boilerplate elements (scripts, navigation, headers, footers, asides,
+    forms, ...) are dropped, then the main content container is chosen by
+    readability-style scoring: paragraphs add points to their parent and
+    half to their grandparent by length and comma count, adjusted by tag
+    and by class/id hints, and discounted by link density. Pure function,
+    safe to run in a worker process.
+
+    Args:
+        html: Page HTML
+        url: Page URL (base for image and link URLs)
+        extract_markdown: Render the main content as markdown
+        include_media: Collect image and outbound link URLs
+
+    Returns:
+        ExtractedPage
+    """
+    doc = _parse(html)
+    if doc is None:
+        return ExtractedPage(title="No title", content="", markdown="" if extract_markdown else None)
+
+    title = _title(doc)
+    for element in list(doc.iter(*_BOILERPLATE_TAGS, etree.Comment)):
+        if element.getparent() is not None:
+            element.drop_tree()
+
+    images = _images(doc, url) if include_media else []
+    links = _links(doc, url) if include_media else []
+    main = _main_content(doc)
+    content = _text(main)
+    if len(content) < _MIN_MAIN_CHARS:
+        body = doc.find("body")
+        main = body if body is not None else doc
+        content = _text(main)
+
+    markdown = None
+    if extract_markdown:
+        try:
+            markdown = _clean_markdown(_render(main, include_media))
+        except RecursionError:
+            # Pathologically nested markup
+            markdown = content
+    return ExtractedPage(title=title, content=content, markdown=markdown, images=images, links=links)
+
+
+class HTMLExtractor:
+    """Runs extract_page for pages off the event loop.
+
+    Pages up to inline_max_chars are extracted inline (lxml handles them
+    in about a millisecond); larger ones go to a pool of worker processes,
+    so neither parsing nor the GIL stalls the event loop. With workers=0
+    everything runs inline. If the pool breaks, extraction falls back to a
+    thread for that page and the pool is recreated on the next one.
+    """
+
+    def __init__(self, workers: int = 2, inline_max_chars: int = 32768):
+        """
+        Initialize extractor.
+
+        Args:
+            workers: Worker processes (0 extracts inline)
+            inline_max_chars: Pages up to this many characters are extracted without the pool
+        """
+        self.workers = max(0, workers)
+        self.inline_max_chars = inline_max_chars
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def extract(
+        self, html: str, url: str, extract_markdown: bool = True, include_media: bool = False
+    ) -> ExtractedPage:
+        """Extract a page, in a worker process if it is large."""
+        if self.workers == 0 or len(html) <= self.inline_max_chars:
+            return extract_page(html, url, extract_markdown, include_media)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), extract_page, html, url, extract_markdown, include_media
+            )
+        except BrokenProcessPool:
+            logger.warning("Extraction process pool broke; extracting in a thread", url=url)
+            self._executor = None
+            return await asyncio.to_thread(extract_page, html, url, extract_markdown, include_media)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop, SQLite and torch threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+
+def _parse(html: str) -> lxml.html.HtmlElement | None:
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # Unicode strings with an XML encoding declaration
+        return lxml.html.document_fromstring(html.encode("utf-8", "replace"))
+    except etree.ParserError:
+        return None
+
+
+def _title(doc: lxml.html.HtmlElement) -> str:
+    title = doc.findtext(".//title")
+    if title and title.strip():
+        return title.strip()
+    og_title = doc.xpath("//meta[@property='og:title']/@content")
+    if og_title and og_title[0].strip():
+        return og_title[0].strip()
+    h1 = doc.find(".//h1")
+    if h1 is not None:
+        return _whitespace.sub(" ", h1.text_content()).strip()
+    return "No title"
+
+
+def _class_weight(element: lxml.html.HtmlElement) -> int:
+    weight = 0
+    for hint in (element.get("class"), element.get("id")):
+        if hint:
+            if _NEGATIVE.search(hint):
+                weight -= 25
+            if _POSITIVE.search(hint):
+                weight += 25
+    return weight
+
+
+def _link_density(element: lxml.html.HtmlElement) -> float:
+    text_length = len(element.text_content())
+    if not text_length:
+        return 1.0
+    return sum(len(a.text_content()) for a in element.iter("a")) / text_length
+
+
+def _main_content(doc: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
+    scores: dict[lxml.html.HtmlElement, float] = {}
+    for paragraph in doc.iter("p", "pre", "td"):
+        text = paragraph.text_content().strip()
+        if len(text) < 25:
+            continue
+        points = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        for ancestor, share in ((parent, 1.0), (parent.getparent() if parent is not None else None, 0.5)):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = _TAG_SCORES.get(ancestor.tag, 0) + _class_weight(ancestor)
+            scores[ancestor] += points * share
+
+    if scores:
+        return max(scores, key=lambda element: scores[element] * (1 - _link_density(element)))
+    for tag in ("article", "main", "body"):
+        element = doc.find(f".//{tag}")
+        if element is not None:
+            return element
+    return doc
+
+
+def _text(element: lxml.html.HtmlElement) -> str:
+    return _whitespace.sub(" ", " ".join(element.itertext())).strip()
+
+
+def _images(doc: lxml.html.HtmlElement, base_url: str) -> list[str]:
+    images = []
+    for img in doc.iter("img"):
+        src = img.get("src") or img.get("data-src")
+        if src:
+            images.append(urljoin(base_url, src))
+            if len(images) >= 20:
+                break
+    return images
+
+
+def _links(doc: lxml.html.HtmlElement, base_url: str) -> list[str]:
+    base_domain = urlparse(base_url).netloc
+    links: dict[str, None] = {}
+    for a in doc.iter("a"):
+        href = a.get("href")
+        if not href:
+            continue
+        absolute_url = urljoin(base_url, href)
+        parsed = urlparse(absolute_url)
+        if parsed.scheme in ("http", "https") and parsed.netloc != base_domain:
+            links[absolute_url] = None
+            if len(links) >= 50:
+                break
+    return list(links)
+
+
+def _inline(text: str | None) -> str:
+    return _whitespace.sub(" ", text) if text else ""
+
+
+def _render_children(element: lxml.html.HtmlElement, include_media: bool) -> str:
+    parts = [_inline(element.text)]
+    for child in element:
+        if isinstance(child.tag, str):
+            parts.append(_render(child, include_media))
+        parts.append(_inline(child.tail))
+    return "".join(parts)
+
+
+def _render(element: lxml.html.HtmlElement, include_media: bool) -> str:
+    """Render an element as markdown (ATX headings, "-" bullets)."""
+    tag = element.tag
+    if tag == "pre":
+        return "\n\n```\n" + element.text_content().strip("\n") + "\n```\n\n"
+    if tag == "br":
+        return "\n"
+    if tag == "hr":
+        return "\n\n---\n\n"
+    if tag == "img":
+        src, alt = element.get("src") or element.get("data-src"), element.get("alt", "")
+        return f"![{alt}]({src})" if include_media and src else ""
+    if tag in ("ul", "ol"):
+        items = []
+        for number, item in enumerate((child for child in element if child.tag == "li"), start=1):
+            marker = f"{number}." if tag == "ol" else "-"
+            body = _paragraph_breaks.sub("\n", _render_children(item, include_media).strip()).replace("\n", "\n  ")
+            items.append(f"{marker} {body}")
+        return "\n\n" + "\n".join(items) + "\n\n"
+    if tag == "table":
+        rows = []
+        for row in element.iter("tr"):
+            cells = [_inline(cell.text_content()).strip() for cell in row if cell.tag in ("td", "th")]
+            rows.append("| " + " | ".join(cells) + " |")
+            if len(rows) == 1:
+                rows.append("|" + " --- |" * len(cells))
+        return "\n\n" + "\n".join(rows) + "\n\n"
+
+    inner = _render_children(element, include_media)
+    if tag in ("h1", "h2", "h3", "h4", "h5", "h6"):
+        return f"\n\n{'#' * int(tag[1])} {inner.strip()}\n\n"
+    if tag == "p" or tag in _BLOCK_TAGS:
+        return f"\n\n{inner.strip()}\n\n"
+    if tag == "blockquote":
+        return "\n\n" + "\n".join(f"> {line}" for line in inner.strip().splitlines()) + "\n\n"
+    if tag == "a":
+        href, text = element.get("href"), inner.strip()
+        return f"[{text}]({href})" if href and text and not href.startswith("javascript:") else inner
+    if tag in ("strong", "b"):
+        return f"**{inner.strip()}**" if inner.strip() else ""
+    if tag in ("em", "i"):
+        return f"*{inner.strip()}*" if inner.strip() else ""
+    if tag == "code":
+        return f"`{inner}`"
+    return inner
+
+
+def _clean_markdown(markdown: str) -> str:
+    lines = [line.rstrip() for line in markdown.splitlines()]
+    return _blank_lines.sub("\n\n", "\n".join(lines)).strip()
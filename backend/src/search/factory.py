@@ -4,19 +4,29 @@ import structlog
 
 from src.config.settings import Settings
 from src.search.base import SearchProvider
+from src.search.cache import CachingSearchProvider, get_search_cache
+from src.search.hedged import HedgedSearchProvider
 from src.search.mock_provider import MockSearchProvider
 from src.search.searxng_provider import SearXNGSearchProvider
+from src.search.singleflight import SingleFlightSearchProvider
 from src.search.tavily_provider import TavilySearchProvider
+from src.utils.http import HTTPClientRegistry
 
 logger = structlog.get_logger(__name__)
 
 
-def create_search_provider(settings: Settings) -> SearchProvider:
+def create_search_provider(settings: Settings, http_clients: HTTPClientRegistry | None = None) -> SearchProvider:
     """
     Create search provider based on configuration.
 
+    With SEARCH_HEDGE_PROVIDER set, searches are hedged with that second
+    provider. Concurrent identical searches and scrapes share one upstream request.
+    Unless SEARCH_CACHE_ENABLED is false, live providers are also wrapped so
+    that repeated searches are answered from the shared search result cache.
+
     Args:
         settings: Application settings
+        http_clients: Shared HTTP client registry
 
     Returns:
         Configured SearchProvider instance
@@ -24,11 +34,52 @@ def create_search_provider(settings: Settings) -> SearchProvider:
     Raises:
         ValueError: If search provider configuration is invalid
     """
-    if settings.search_provider == "mock":
+    base = _create_base_provider(settings, http_clients)
+    name = settings.search_provider
+    hedge_name = settings.search_hedge_provider
+    if hedge_name and hedge_name != name and not isinstance(base, MockSearchProvider):
+        logger.info("Hedging searches", primary=name, secondary=hedge_name)
+        base = HedgedSearchProvider(
+            base,
+            _create_base_provider(settings, http_clients, name=hedge_name),
+            primary_name=name,
+            secondary_name=hedge_name,
+            quantile=settings.search_hedge_quantile,
+            initial_delay=settings.search_hedge_initial_delay,
+            min_delay=settings.search_hedge_min_delay,
+            max_delay=settings.search_hedge_max_delay,
+        )
+        name = f"{name}+{hedge_name}"
+
+    provider = SingleFlightSearchProvider(base)
+    store = get_search_cache(settings)
+    if store is None or isinstance(base, MockSearchProvider):
+        return provider
+
+    language = settings.searxng_language if "searxng" in name else ""
+    return CachingSearchProvider(provider, store, name=name, language=language)
+
+
+def _create_base_provider(
+    settings: Settings, http_clients: HTTPClientRegistry | None, name: str | None = None
+) -> SearchProvider:
+    """
+    Create the underlying search provider based on configuration.
+
+    Args:
+        settings: Application settings
+        http_clients: Shared HTTP client registry
+        name: Provider to create (defaults to settings.search_provider)
+
+    Returns:
+        Search provider instance
+    """
+    name = name or settings.search_provider
+    if name == "mock":
         logger.info("Creating MockSearchProvider")
         return MockSearchProvider()
 
-    if settings.search_provider == "tavily":
+    if name == "tavily":
         if not settings.tavily_api_key:
             if settings.llm_mode == "mock":
                 logger.info("Tavily key missing; falling back to MockSearchProvider in mock mode")
@@ -36,9 +87,15 @@ def create_search_provider(settings: Settings) -> SearchProvider:
             raise ValueError("Tavily API key is required when using Tavily search provider")
 
         logger.info("Creating TavilySearchProvider")
-        return TavilySearchProvider(api_key=settings.tavily_api_key)
+        return TavilySearchProvider(
+            api_key=settings.tavily_api_key,
+            max_concurrency=settings.tavily_max_concurrency,
+            timeout=settings.tavily_timeout,
+            connect_timeout=settings.tavily_connect_timeout,
+            http_clients=http_clients,
+        )
 
-    elif settings.search_provider == "searxng":
+    elif name == "searxng":
         if not settings.searxng_instance_url:
             raise ValueError(
                 "SearXNG instance URL is required when using SearXNG search provider"
@@ -51,11 +108,12 @@ def create_search_provider(settings: Settings) -> SearchProvider:
             categories=settings.searxng_categories,
             engines=settings.searxng_engines,
             safesearch=settings.searxng_safesearch,
+            http_clients=http_clients,
         )
 
     else:
         raise ValueError(
-            f"Unknown search provider: {settings.search_provider}. "
+            f"Unknown search provider: {name}. "
             f"Supported providers: tavily, searxng, mock"
         )
 
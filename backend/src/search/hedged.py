@@ -0,0 +1,212 @@
+"""Hedged search across two providers: first good response wins."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+from collections import deque
+from typing import Any, Optional
+
+import structlog
+
+from src.search.base import SearchProvider
+from src.search.models import ScrapedContent, SearchResponse
+from src.search.searxng_provider import result_diversity, should_fallback
+
+logger = structlog.get_logger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+_BUCKETS = (0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Latency histogram of one provider with quantiles over a window of recent samples.
+
+    Bucket counts cover the whole process lifetime (for metrics); quantiles
+    use the last window samples, so the hedge delay follows recent behaviour.
+    """
+
+    def __init__(self, window: int = 200):
+        """
+        Initialize histogram.
+
+        Args:
+            window: Number of recent samples used for quantiles
+        """
+        self.counts = [0] * (len(_BUCKETS) + 1)
+        self.errors = 0
+        self._recent: deque[float] = deque(maxlen=max(1, window))
+
+    def observe(self, seconds: float) -> None:
+        """Record one request latency."""
+        self.counts[bisect.bisect_left(_BUCKETS, seconds)] += 1
+        self._recent.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the q-quantile of recent latencies, or None without samples."""
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def samples(self) -> int:
+        """Number of recent samples."""
+        return len(self._recent)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return bucket counts, error count and recent p50/p90 (ms)."""
+        labels = [f"le_{int(bound * 1000)}ms" for bound in _BUCKETS] + ["gt_10000ms"]
+        p50, p90 = self.quantile(0.5), self.quantile(0.9)
+        return {
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+            "count": sum(self.counts),
+            "errors": self.errors,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p90_ms": round(p90 * 1000, 1) if p90 is not None else None,
+        }
+
+
+class HedgedSearchProvider(SearchProvider):
+    """Send searches to a primary provider and hedge slow ones with a secondary.
+
+    A search goes to the primary first. If it has not answered after the
+    hedge delay (the primary's recent latency quantile, clamped to
+    [min_delay, max_delay]; initial_delay until min_samples requests were
+    seen), or it answered with results failing the should_fallback quality
+    checks, the same search is sent to the secondary. The first response
+    that passes the checks is returned and the other request is cancelled;
+    if neither passes, the more diverse of the two is returned. Scrapes go
+    to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: SearchProvider,
+        secondary: SearchProvider,
+        primary_name: str = "primary",
+        secondary_name: str = "secondary",
+        quantile: float = 0.9,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.2,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+        window: int = 200,
+    ):
+        """
+        Initialize hedged provider.
+
+        Args:
+            primary: Provider every search is sent to
+            secondary: Provider used for hedge requests
+            primary_name: Primary name used in metrics
+            secondary_name: Secondary name used in metrics
+            quantile: Primary latency quantile used as the hedge delay
+            initial_delay: Hedge delay in seconds until min_samples latencies are known
+            min_delay: Lower bound of the hedge delay in seconds
+            max_delay: Upper bound of the hedge delay in seconds
+            min_samples: Primary latencies needed before the delay is derived from them
+            window: Recent latencies kept per provider
+        """
+        self.primary = primary
+        self.secondary = secondary
+        self.primary_name = primary_name
+        self.secondary_name = secondary_name
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max(min_delay, max_delay)
+        self.min_samples = max(1, min_samples)
+        self.histograms = {primary_name: LatencyHistogram(window), secondary_name: LatencyHistogram(window)}
+        self.stats = {"searches": 0, "hedged": 0, f"{primary_name}_wins": 0, f"{secondary_name}_wins": 0}
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific attributes (instance_url, http_clients, ...) come from the primary
+        if name == "primary":
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+    def hedge_delay(self) -> float:
+        """Return the current hedge delay in seconds."""
+        histogram = self.histograms[self.primary_name]
+        if histogram.samples < self.min_samples:
+            return self.initial_delay
+        return min(self.max_delay, max(self.min_delay, histogram.quantile(self.quantile)))
+
+    async def search(self, query: str, max_results: int = 10) -> SearchResponse:
+        """Search, racing the secondary against a slow or poor primary response."""
+        self.stats["searches"] += 1
+        primary = asyncio.create_task(self._timed(self.primary_name, self.primary, query, max_results))
+        tasks = {primary: self.primary_name}
+        candidates: list[SearchResponse] = []
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay())
+            if done:
+                response = primary.result()
+                if response is not None and not should_fallback(response.results, max_results):
+                    return self._win(self.primary_name, response)
+                if response is not None:
+                    candidates.append(response)
+                del tasks[primary]
+
+            self.stats["hedged"] += 1
+            secondary = asyncio.create_task(self._timed(self.secondary_name, self.secondary, query, max_results))
+            tasks[secondary] = self.secondary_name
+            logger.debug("Hedging search", query=query[:100], primary_done=bool(done))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    if response is None:
+                        continue
+                    if not should_fallback(response.results, max_results):
+                        return self._win(tasks[task], response)
+                    candidates.append(response)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if not candidates:
+            return SearchResponse(query=query, results=[], total_results=0)
+        return max(candidates, key=lambda response: result_diversity(response.results))
+
+    async def scrape(self, url: str) -> ScrapedContent:
+        """Scrape through the primary provider."""
+        return await self.primary.scrape(url)
+
+    async def close(self) -> None:
+        """Log hedging metrics and close both providers."""
+        logger.info("Hedged search stats", **self.get_stats())
+        await self.primary.close()
+        await self.secondary.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return search/hedge/win counts, the current hedge delay and per-provider latency histograms."""
+        return {
+            **self.stats,
+            "hedge_delay_ms": round(self.hedge_delay() * 1000, 1),
+            "latency": {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+        }
+
+    def _win(self, name: str, response: SearchResponse) -> SearchResponse:
+        self.stats[f"{name}_wins"] += 1
+        return response
+
+    async def _timed(
+        self, name: str, provider: SearchProvider, query: str, max_results: int
+    ) -> Optional[SearchResponse]:
+        # Latency of cancelled requests is not recorded; errors become None so the other request can win
+        histogram = self.histograms[name]
+        start = time.perf_counter()
+        try:
+            response = await provider.search(query, max_results=max_results)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            histogram.errors += 1
+            logger.warning("Hedged search request failed", provider=name, query=query[:100], error=str(e))
+            return None
+        histogram.observe(time.perf_counter() - start)
+        return response
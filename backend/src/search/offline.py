@@ -0,0 +1,391 @@
+"""Offline search stand-in: generated corpus, BM25 index and a SearXNG-compatible HTTP server.
+
+Serves the SearXNG JSON search API and the result pages themselves, so the
+real SearXNGSearchProvider and WebScraper can be exercised (and load
+tested) without network access:
+
+    backend = OfflineSearchBackend(corpus_size=2000, latency_ms=150, error_rate=0.02)
+    base_url = await backend.start()
+    provider = SearXNGSearchProvider(instance_url=base_url)
+
+or from the command line with scripts/offline_search_server.py and
+SEARCH_PROVIDER=searxng SEARXNG_INSTANCE_URL=<printed URL>. Each site of
+the corpus is its own host, http://<domain>.localhost:<port>/<slug>, so
+result diversity checks, domain blocklists and per-host limits see many
+sites as they would on the web. Pages are routed on the Host header;
+HTTPClientRegistry resolves .localhost names to loopback, as browsers do.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Optional
+
+import structlog
+from aiohttp import web
+
+logger = structlog.get_logger(__name__)
+
+TOPICS: dict[str, list[str]] = {
+    "energy": ["solar", "wind", "battery", "grid", "turbine", "photovoltaic", "storage", "hydrogen", "nuclear",
+               "reactor", "megawatt", "renewable", "inverter", "transmission", "utility"],
+    "climate": ["climate", "emissions", "carbon", "warming", "temperature", "glacier", "drought", "methane",
+                "adaptation", "mitigation", "ocean", "sea", "level", "heatwave", "forest"],
+    "health": ["vaccine", "clinical", "trial", "patients", "hospital", "diagnosis", "therapy", "cancer", "diabetes",
+               "nutrition", "sleep", "immune", "antibiotic", "epidemic", "cardiology"],
+    "ai": ["neural", "network", "transformer", "language", "model", "training", "inference", "gpu", "dataset",
+           "benchmark", "reinforcement", "learning", "embedding", "retrieval", "alignment"],
+    "finance": ["inflation", "interest", "rates", "bond", "equity", "market", "central", "bank", "recession",
+                "earnings", "dividend", "currency", "liquidity", "credit", "portfolio"],
+    "space": ["rocket", "orbit", "satellite", "mars", "lunar", "telescope", "galaxy", "exoplanet", "launch",
+              "astronaut", "spacecraft", "asteroid", "nebula", "mission", "gravity"],
+    "transport": ["electric", "vehicle", "charging", "railway", "aviation", "shipping", "freight", "autonomous",
+                  "traffic", "bicycle", "tram", "highway", "logistics", "fuel", "airline"],
+    "food": ["agriculture", "crop", "wheat", "rice", "fertilizer", "irrigation", "harvest", "livestock", "dairy",
+             "soil", "organic", "yield", "pesticide", "farm", "greenhouse"],
+    "software": ["python", "database", "latency", "throughput", "cache", "kernel", "compiler", "async", "thread",
+                 "memory", "server", "container", "kubernetes", "protocol", "api"],
+    "history": ["empire", "medieval", "dynasty", "revolution", "archive", "manuscript", "war", "treaty", "monarchy",
+                "colonial", "ancient", "archaeology", "republic", "century", "chronicle"],
+    "sports": ["football", "tennis", "olympic", "marathon", "league", "championship", "coach", "athlete",
+               "stadium", "tournament", "season", "transfer", "record", "cycling", "swimming"],
+    "education": ["school", "university", "curriculum", "students", "teachers", "literacy", "exam", "tuition",
+                  "scholarship", "classroom", "online", "course", "degree", "research", "campus"],
+}
+
+_FILLER = (
+    "the of and to in a is that for on with as by at from this are was be it an or which has have new "
+    "report study analysis data results shows according experts said year years recent countries global "
+    "local policy impact growth cost costs price prices increase decrease trend trends significant major "
+    "first second important however while also more most between during across over under about public "
+    "industry companies government program project development evidence review update guide explained"
+).split()
+
+_DOMAINS = [
+    "dailyherald.example", "sciencewire.example", "openjournal.example", "techbriefs.example", "worldnews.example",
+    "policywatch.example", "marketpulse.example", "healthline.example", "energyreport.example", "labnotes.example",
+    "citygazette.example", "datadesk.example", "fieldguide.example", "archive.example", "explainer.example",
+    "weeklyreview.example", "globalpost.example", "insight.example", "research.example", "observer.example",
+]
+
+_TITLE_TEMPLATES = [
+    "{a} and {b}: what the {c} data shows",
+    "How {a} is changing {b}",
+    "{a} {b} explained",
+    "The state of {a} in {year}",
+    "Why {a} matters for {b} and {c}",
+    "New study links {a} to {b}",
+    "{a}: a guide to {b} {c}",
+]
+
+# Sites are served as subdomains of this loopback name
+SITE_SUFFIX = ".localhost"
+
+_token = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens of text."""
+    return _token.findall(text.lower())
+
+
+@dataclass
+class OfflineDocument:
+    """A generated web page."""
+
+    id: int
+    domain: str
+    slug: str
+    title: str
+    paragraphs: list[str]
+    published_date: str
+    topic: str
+
+    @property
+    def text(self) -> str:
+        """Title and body text (what the index sees)."""
+        return " ".join([self.title, *self.paragraphs])
+
+
+def generate_corpus(size: int = 2000, seed: int = 0, paragraphs: tuple[int, int] = (4, 12)) -> list[OfflineDocument]:
+    """
+    Generate a deterministic corpus of topical pages.
+
+    Each page mixes words of a primary topic, a secondary topic and common
+    filler words (Zipf-like frequencies), so BM25 ranking behaves like it
+    does on real text: topical queries find many pages with graded scores.
+
+    Args:
+        size: Number of documents
+        seed: Random seed (same seed, same corpus)
+        paragraphs: Min and max paragraphs per page
+
+    Returns:
+        Generated documents
+    """
+    rng = random.Random(seed)
+    topics = sorted(TOPICS)
+    filler_weights = [1.0 / (rank + 1) for rank in range(len(_FILLER))]
+    documents = []
+    for doc_id in range(size):
+        topic = topics[doc_id % len(topics)]
+        secondary = rng.choice([t for t in topics if t != topic])
+        words, other = TOPICS[topic], TOPICS[secondary]
+        year = 2015 + rng.randrange(11)
+        title = rng.choice(_TITLE_TEMPLATES).format(
+            a=rng.choice(words).capitalize(), b=rng.choice(words), c=rng.choice(other), year=year
+        )
+
+        body = []
+        for _ in range(rng.randint(*paragraphs)):
+            sentences = []
+            for _ in range(rng.randint(2, 5)):
+                sentence = []
+                for _ in range(rng.randint(8, 20)):
+                    roll = rng.random()
+                    if roll < 0.3:
+                        sentence.append(rng.choice(words))
+                    elif roll < 0.4:
+                        sentence.append(rng.choice(other))
+                    else:
+                        sentence.append(rng.choices(_FILLER, weights=filler_weights)[0])
+                sentences.append(" ".join(sentence).capitalize() + ".")
+            body.append(" ".join(sentences))
+
+        slug = "-".join(tokenize(title)[:6]) + f"-{doc_id}"
+        published = date(year, 1, 1) + timedelta(days=rng.randrange(365))
+        documents.append(
+            OfflineDocument(
+                id=doc_id,
+                domain=_DOMAINS[rng.randrange(len(_DOMAINS))],
+                slug=slug,
+                title=title,
+                paragraphs=body,
+                published_date=published.isoformat(),
+                topic=topic,
+            )
+        )
+    return documents
+
+
+class BM25Index:
+    """Okapi BM25 over an in-memory inverted index."""
+
+    def __init__(self, texts: list[str], k1: float = 1.5, b: float = 0.75):
+        """
+        Build the index.
+
+        Args:
+            texts: Document texts (position = document index)
+            k1: Term frequency saturation
+            b: Length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.doc_lengths: list[int] = []
+        self.postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for idx, text in enumerate(texts):
+            counts = Counter(tokenize(text))
+            self.doc_lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                self.postings[term].append((idx, tf))
+        self.avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if self.doc_lengths else 0.0
+        n = len(self.doc_lengths)
+        self.idf = {term: math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5)) for term, docs in self.postings.items()}
+
+    def search(self, query: str, limit: int = 20) -> tuple[list[tuple[int, float]], int]:
+        """Return the top (document index, score) pairs and the number of matching documents."""
+        scores: dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for idx, tf in self.postings[term]:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[idx] / self.avg_length)
+                scores[idx] += idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit], len(scores)
+
+
+class OfflineSearchBackend:
+    """SearXNG-compatible search server and page host for the generated corpus.
+
+    GET /search?q=...&format=json answers in SearXNG's JSON format with BM25
+    ranked results; GET /<slug> on host <domain>.localhost serves the
+    result pages (with navigation, boilerplate, images and links, like
+    real pages); GET /stats returns request counters. Each request waits a log-normal
+    delay (median latency_ms, spread latency_sigma), fails with HTTP 503 at
+    error_rate, and each search result is repeated under a tracking-
+    parameter or fragment variant of its URL at duplicate_rate.
+    """
+
+    def __init__(
+        self,
+        documents: Optional[list[OfflineDocument]] = None,
+        corpus_size: int = 2000,
+        seed: int = 0,
+        latency_ms: float = 150.0,
+        page_latency_ms: float = 80.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        duplicate_rate: float = 0.0,
+        results_per_page: int = 20,
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            documents: Corpus to serve (generated from corpus_size and seed if omitted)
+            corpus_size: Number of generated documents
+            seed: Seed for the corpus and the latency/error/duplicate draws
+            latency_ms: Median search latency in milliseconds
+            page_latency_ms: Median page latency in milliseconds
+            latency_sigma: Log-normal spread of latencies (0 makes them constant)
+            error_rate: Fraction of requests answered with HTTP 503
+            duplicate_rate: Fraction of search results repeated under a URL variant
+            results_per_page: Results per search page
+        """
+        self.documents = documents if documents is not None else generate_corpus(corpus_size, seed=seed)
+        self.index = BM25Index([doc.text for doc in self.documents])
+        self.by_path = {(doc.domain, doc.slug): doc for doc in self.documents}
+        self.latency_ms = latency_ms
+        self.page_latency_ms = page_latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.duplicate_rate = duplicate_rate
+        self.results_per_page = max(1, results_per_page)
+        self.stats = {"searches": 0, "pages": 0, "errors": 0, "duplicates": 0, "not_found": 0}
+        self._rng = random.Random(seed + 1)
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/search", self._search)
+        app.router.add_get("/stats", self._stats)
+        app.router.add_get("/{slug}", self._page)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL (port 0 picks a free port)."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        logger.info("Offline search backend started", host=host, port=self.port, documents=len(self.documents))
+        return f"http://{host}:{self.port}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self.port = None
+
+    def page_url(self, doc: OfflineDocument) -> str:
+        """Return the URL a document is served at (its real-looking URL before start())."""
+        if self.port is None:
+            return f"https://{doc.domain}/{doc.slug}"
+        return f"http://{doc.domain}{SITE_SUFFIX}:{self.port}/{doc.slug}"
+
+    def page_html(self, doc: OfflineDocument) -> str:
+        """Render a document as a full HTML page."""
+        related = [self.documents[(doc.id + step) % len(self.documents)] for step in (1, 7, 31)]
+        links = "".join(
+            f'<li><a href="{self.page_url(other)}">{html.escape(other.title)}</a></li>' for other in related
+        )
+        body = "".join(f"<p>{html.escape(paragraph)}</p>" for paragraph in doc.paragraphs)
+        return (
+            f"<!DOCTYPE html><html><head><title>{html.escape(doc.title)} | {doc.domain}</title>"
+            f'<meta name="description" content="{html.escape(doc.paragraphs[0][:150])}">'
+            "<script>window.analytics = {track: function() {}};</script></head><body>"
+            f'<header><nav><a href="/">Home</a> <a href="/topics/{doc.topic}">{doc.topic}</a> '
+            '<a href="/subscribe">Subscribe</a></nav></header>'
+            f'<main><article><h1>{html.escape(doc.title)}</h1><p class="byline">Published {doc.published_date}</p>'
+            f'<img src="/static/{doc.id}.jpg" alt="{html.escape(doc.title)}">{body}</article>'
+            f"<aside><h2>Related</h2><ul>{links}</ul></aside></main>"
+            '<footer><p>We use cookies to improve your experience.</p><a href="/privacy">Privacy</a></footer>'
+            "</body></html>"
+        )
+
+    async def _delay(self, median_ms: float) -> bool:
+        """Sleep a latency draw; return False if this request should fail."""
+        delay = median_ms * math.exp(self.latency_sigma * self._rng.gauss(0, 1)) if self.latency_sigma else median_ms
+        failed = self._rng.random() < self.error_rate
+        await asyncio.sleep(max(0.0, delay) / 1000)
+        if failed:
+            self.stats["errors"] += 1
+        return not failed
+
+    async def _search(self, request: web.Request) -> web.Response:
+        self.stats["searches"] += 1
+        if request.query.get("format", "json") != "json":
+            return web.Response(status=403, text="Only format=json is supported")
+        if not await self._delay(self.latency_ms):
+            return web.Response(status=503, text="Service temporarily unavailable")
+
+        query = request.query.get("q", "")
+        page = max(1, int(request.query.get("pageno", "1") or 1))
+        ranked, total = self.index.search(query, limit=page * self.results_per_page)
+        query_terms = set(tokenize(query))
+        results: list[dict[str, Any]] = []
+        for position, (idx, score) in enumerate(ranked[(page - 1) * self.results_per_page:], start=1):
+            doc = self.documents[idx]
+            result = {
+                "url": self.page_url(doc),
+                "title": doc.title,
+                "content": self._snippet(doc, query_terms),
+                "engine": "offline",
+                "engines": ["offline"],
+                "positions": [position],
+                "score": round(score, 4),
+                "category": "general",
+                "publishedDate": doc.published_date,
+            }
+            results.append(result)
+            if self._rng.random() < self.duplicate_rate:
+                self.stats["duplicates"] += 1
+                variant = self._rng.choice(["?utm_source=offline", "#comments", "?ref=feed"])
+                results.append({**result, "url": result["url"] + variant, "engine": "offline-mirror"})
+
+        return web.json_response(
+            {
+                "query": query,
+                "number_of_results": total,
+                "results": results,
+                "answers": [],
+                "corrections": [],
+                "infoboxes": [],
+                "suggestions": [],
+                "unresponsive_engines": [],
+            }
+        )
+
+    async def _page(self, request: web.Request) -> web.Response:
+        self.stats["pages"] += 1
+        if not await self._delay(self.page_latency_ms):
+            return web.Response(status=503, text="Service temporarily unavailable")
+        domain = (request.url.host or "").removesuffix(SITE_SUFFIX)
+        doc = self.by_path.get((domain, request.match_info["slug"]))
+        if doc is None:
+            self.stats["not_found"] += 1
+            return web.Response(status=404, text="Not found")
+        return web.Response(text=self.page_html(doc), content_type="text/html")
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, "documents": len(self.documents)})
+
+    @staticmethod
+    def _snippet(doc: OfflineDocument, query_terms: set[str], length: int = 300) -> str:
+        sentences = [s for paragraph in doc.paragraphs for s in paragraph.split(". ")]
+        best = max(sentences, key=lambda s: len(query_terms & set(tokenize(s))), default="")
+        return best[:length]
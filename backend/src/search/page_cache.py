@@ -0,0 +1,275 @@
+"""Scraped page cache (SQLite) with HTTP freshness, conditional revalidation and per-session metrics."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import structlog
+
+from src.search.models import ScrapedContent
+from src.utils.session_stats import SessionStats
+
+logger = structlog.get_logger(__name__)
+
+_max_age = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CachedPage:
+    """A cached scrape result and the validators needed to revalidate it."""
+
+    content: ScrapedContent
+    expires_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_bytes: int
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the page may be served without asking the origin."""
+        return time.time() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def freshness_lifetime(headers: Mapping[str, str], default_ttl: float, max_ttl: float) -> Optional[float]:
+    """
+    Return how long a response may be served from cache, or None if it must not be stored.
+
+    Cache-Control no-store forbids storing; no-cache stores but requires
+    revalidation on every use (lifetime 0); max-age, then Expires, give the
+    lifetime; otherwise default_ttl applies. Lifetimes are capped at max_ttl.
+    """
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+    match = _max_age.search(cache_control)
+    if match:
+        return min(float(match.group(1)), max_ttl)
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return min(max(0.0, parsedate_to_datetime(expires).timestamp() - time.time()), max_ttl)
+        except (TypeError, ValueError):
+            return 0.0
+    return min(default_ttl, max_ttl)
+
+
+class PageCache:
+    """Extracted page content keyed by canonical URL, stored in SQLite with size-based eviction.
+
+    Entries keep the extracted text/markdown (not the raw HTML) together
+    with the response's ETag and Last-Modified, so an expired page can be
+    revalidated with a conditional GET and reused on 304 Not Modified.
+    Entries past their freshness lifetime without validators are dropped
+    on lookup. The total stored size is kept under max_bytes by evicting
+    the least recently used entries. Hits, revalidations, misses and bytes
+    not downloaded are counted per research session and process-wide.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = 500_000_000,
+        default_ttl: float = 3600.0,
+        max_ttl: float = 86400.0,
+        max_sessions: int = 200,
+    ):
+        """
+        Initialize page cache.
+
+        Args:
+            path: SQLite file path (None keeps entries in memory only)
+            max_bytes: Max total size of stored entries
+            default_ttl: Freshness lifetime of responses without Cache-Control max-age or Expires
+            max_ttl: Upper bound of any freshness lifetime
+            max_sessions: Sessions whose metrics are kept (least recently updated dropped first)
+        """
+        self.path = path
+        self.max_bytes = max(1, max_bytes)
+        self.default_ttl = max(0.0, default_ttl)
+        self.max_ttl = max(0.0, max_ttl)
+        self._lock = threading.Lock()
+        self._stats: SessionStats[dict[str, int]] = SessionStats(lambda: defaultdict(int), max_sessions)
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection | None = sqlite3.connect(
+            path or ":memory:", check_same_thread=False, isolation_level=None
+        )
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS page_cache (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, etag TEXT, last_modified TEXT, body_bytes INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, value TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS page_cache_accessed_at ON page_cache (accessed_at)")
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM page_cache").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        """Return the cached page for key (fresh or revalidatable), or None."""
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT expires_at, etag, last_modified, body_bytes, value FROM page_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, etag, last_modified, body_bytes, value = row
+            if expires_at <= time.time() and not (etag or last_modified):
+                self._delete(key)
+                return None
+            self._conn.execute("UPDATE page_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CachedPage(
+            content=ScrapedContent.model_validate_json(value),
+            expires_at=expires_at,
+            etag=etag,
+            last_modified=last_modified,
+            body_bytes=body_bytes,
+        )
+
+    def put(self, key: str, content: ScrapedContent, headers: Mapping[str, str], body_bytes: int) -> None:
+        """Store a freshly fetched page unless its response forbids caching."""
+        lifetime = freshness_lifetime(headers, self.default_ttl, self.max_ttl)
+        if lifetime is None:
+            return
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if lifetime <= 0 and not (etag or last_modified):
+            return
+        value = content.model_dump_json(exclude={"html"})
+        now = time.time()
+        with self._lock:
+            if self._conn is None or len(value) > self.max_bytes:
+                return
+            self._delete(key)
+            self._conn.execute(
+                "INSERT INTO page_cache (key, expires_at, accessed_at, etag, last_modified, body_bytes, size, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, now + lifetime, now, etag, last_modified, body_bytes, len(value), value),
+            )
+            self._size += len(value)
+            self._evict()
+
+    def refresh(self, key: str, headers: Mapping[str, str]) -> None:
+        """Extend a page's freshness after a 304 Not Modified (validators updated if sent)."""
+        lifetime = freshness_lifetime(headers, self.default_ttl, self.max_ttl) or 0.0
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "UPDATE page_cache SET expires_at = ?, accessed_at = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                (now + lifetime, now, headers.get("ETag"), headers.get("Last-Modified"), key),
+            )
+
+    def record(self, outcome: str, session_id: Optional[str] = None, bytes_saved: int = 0) -> None:
+        """Count a hit, revalidation or miss (and bytes not downloaded), process-wide and for the session."""
+        with self._lock:
+            for counts in self._stats.targets(session_id):
+                counts[outcome] += 1
+                counts["bytes_saved"] += bytes_saved
+
+    def get_stats(self, session_id: Optional[str] = None) -> Optional[dict[str, Any]]:
+        """Return hits, revalidations, misses, hit ratio and bytes saved for a session (or process-wide when None)."""
+        with self._lock:
+            counts = self._stats.get(session_id)
+            if counts is None:
+                return None
+            counts = dict(counts)
+        summary = {outcome: counts.get(outcome, 0) for outcome in ("hits", "revalidated", "misses")}
+        lookups = sum(summary.values())
+        return {
+            **summary,
+            "hit_ratio": round((summary["hits"] + summary["revalidated"]) / lookups, 3) if lookups else 0.0,
+            "bytes_saved": counts.get("bytes_saved", 0),
+        }
+
+    @property
+    def size(self) -> int:
+        """Total size of stored entries in bytes."""
+        return self._size
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.close()
+            self._conn = None
+
+    def _delete(self, key: str) -> None:
+        row = self._conn.execute("SELECT size FROM page_cache WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM page_cache WHERE key = ?", (key,))
+            self._size -= row[0]
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM page_cache ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                return
+            for key, size in rows:
+                if self._size <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM page_cache WHERE key = ?", (key,))
+                self._size -= size
+
+
+_cache: PageCache | None = None
+
+
+def get_page_cache(settings: Any) -> Optional[PageCache]:
+    """Return the process-wide page cache, or None when page caching is disabled."""
+    global _cache
+    if not settings.page_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = PageCache(
+            path=settings.page_cache_path or None,
+            max_bytes=settings.page_cache_max_bytes,
+            default_ttl=settings.page_cache_default_ttl_seconds,
+            max_ttl=settings.page_cache_max_ttl_seconds,
+        )
+        logger.info("Scraped page cache enabled", path=settings.page_cache_path, max_bytes=settings.page_cache_max_bytes)
+    return _cache
+
+
+def get_session_page_stats(session_id: Optional[str]) -> Optional[dict[str, Any]]:
+    """Return page cache metrics of a session from the process-wide cache, if any."""
+    if _cache is None or not session_id:
+        return None
+    return _cache.get_stats(session_id)
+
+
+def close_page_cache() -> None:
+    """Log metrics and close the process-wide page cache."""
+    global _cache
+    if _cache is None:
+        return
+    logger.info("Scraped page cache stats", size=_cache.size, **_cache.get_stats())
+    _cache.close()
+    _cache = None
+
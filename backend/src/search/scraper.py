@@ -2,7 +2,8 @@
 
 import asyncio
 import re
-from typing import Any, Optional
+from contextlib import nullcontext
+from typing import Any, Mapping, Optional
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
@@ -10,7 +11,13 @@ import structlog
 from bs4 import BeautifulSoup
 from markdownify import markdownify as md
 
+from src.search.browser_pool import BrowserPool
+from src.search.extraction import HTMLExtractor
+from src.llm.accounting import current_session_id
 from src.search.models import ScrapedContent
+from src.search.page_cache import CachedPage, PageCache
+from src.search.singleflight import SingleFlight, canonical_url
+from src.utils.http import HTTPClientRegistry
 
 logger = structlog.get_logger(__name__)
 
@@ -26,6 +33,12 @@ class WebScraper:
         scroll_enabled: bool = False,
         scroll_pause: float = 1.0,
         max_scrolls: int = 5,
+        http_clients: HTTPClientRegistry | None = None,
+        browser_pool: BrowserPool | None = None,
+        page_cache: PageCache | None = None,
+        extraction_engine: str = "lxml",
+        extraction_workers: int = 0,
+        extract_media: bool = False,
     ):
         """
         Initialize web scraper.
@@ -37,6 +50,12 @@ class WebScraper:
             scroll_enabled: Enable automatic scrolling to load dynamic content
             scroll_pause: Pause between scrolls in seconds
             max_scrolls: Maximum number of scroll operations
+            http_clients: Shared HTTP client registry (a private one is created if omitted)
+            browser_pool: Browser pool for Playwright renders (a private one is created if omitted)
+            page_cache: Cache of extracted pages for HTTP scrapes (None disables caching)
+            extraction_engine: "lxml" (single parse, readability-style main content) or "bs4" (BeautifulSoup)
+            extraction_workers: Worker processes for extracting large pages with lxml (0 extracts inline)
+            extract_media: Collect image and outbound link URLs of pages
         """
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.user_agent = user_agent or (
@@ -47,6 +66,25 @@ class WebScraper:
         self.scroll_enabled = scroll_enabled
         self.scroll_pause = scroll_pause
         self.max_scrolls = max_scrolls
+        self._owns_http_clients = http_clients is None
+        self.http_clients = http_clients or HTTPClientRegistry()
+        self._owns_browser_pool = browser_pool is None
+        # The browser is only launched on the first Playwright render
+        self.browser_pool = browser_pool or BrowserPool(page_timeout=timeout)
+        self.browser_pool.user_agent = self.browser_pool.user_agent or self.user_agent
+        self.page_cache = page_cache
+        self.extractor = HTMLExtractor(workers=extraction_workers) if extraction_engine == "lxml" else None
+        self.extract_media = extract_media
+        self._scrapes = SingleFlight("scrape")
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session and browser (unless they are shared) and the extraction workers."""
+        if self.extractor is not None:
+            self.extractor.close()
+        if self._owns_browser_pool:
+            await self.browser_pool.close()
+        if self._owns_http_clients:
+            await self.http_clients.close()
 
     async def scrape(
         self, url: str, extract_markdown: bool = True, scroll: bool | None = None
@@ -54,6 +92,9 @@ class WebScraper:
         """
         Scrape and extract content from URL.
 
+        Concurrent scrapes of the same canonical URL with the same options
+        share one fetch.
+
         Args:
             url: URL to scrape
             extract_markdown: Convert content to markdown
@@ -63,10 +104,15 @@ class WebScraper:
             ScrapedContent with extracted data
         """
         should_scroll = scroll if scroll is not None else self.scroll_enabled
+        key = f"{int(extract_markdown)}{int(should_scroll)}\x00{canonical_url(url)}"
+        return await self._scrapes.do(key, lambda: self._scrape(url, extract_markdown, should_scroll))
 
+    async def _scrape(self, url: str, extract_markdown: bool, should_scroll: bool) -> ScrapedContent:
         # Use Playwright if enabled or if scrolling is requested
         if self.use_playwright or should_scroll:
-            return await self._scrape_with_playwright(url, extract_markdown, should_scroll)
+            # Per-host rate limit, concurrency cap and circuit breaker (fails fast for hosts that keep failing)
+            async with self.http_clients.hosts.request(url):
+                return await self._scrape_with_playwright(url, extract_markdown, should_scroll)
 
         # Fallback to standard HTTP scraping
         return await self._scrape_with_http(url, extract_markdown)
@@ -76,33 +122,13 @@ class WebScraper:
     ) -> ScrapedContent:
         """Scrape using Playwright for JavaScript rendering and scrolling."""
         try:
-            from playwright.async_api import async_playwright
+            import playwright  # noqa: F401
         except ImportError:
             logger.warning("Playwright not installed, falling back to HTTP scraping", url=url)
-            return await self._scrape_with_http(url, extract_markdown)
+            return await self._scrape_with_http(url, extract_markdown, limit_host=False)
 
         try:
-            async with async_playwright() as p:
-                # Use chromium headless shell for better performance in Docker
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--disable-software-rasterizer',
-                        '--disable-extensions',
-                    ]
-                )
-                context = await browser.new_context(
-                    user_agent=self.user_agent,
-                    viewport={"width": 1920, "height": 1080},
-                    # Increase timeouts for slow connections
-                    navigation_timeout=60000,
-                )
-                page = await context.new_page()
-
+            async with self.browser_pool.page() as page:
                 logger.info("Loading page with Playwright", url=url)
                 await page.goto(url, wait_until="domcontentloaded", timeout=int(self.timeout.total * 1000))
 
@@ -119,10 +145,8 @@ class WebScraper:
 
                 # Get final HTML content
                 html = await page.content()
-                await browser.close()
 
-                # Parse with BeautifulSoup
-                return self._parse_html(html, url, extract_markdown)
+            return await self._extract(html, url, extract_markdown)
 
         except Exception as e:
             error_msg = str(e) if e else "Unknown Playwright error"
@@ -135,7 +159,7 @@ class WebScraper:
             )
             # Fallback to HTTP scraping
             logger.info("Falling back to HTTP scraping", url=url)
-            return await self._scrape_with_http(url, extract_markdown)
+            return await self._scrape_with_http(url, extract_markdown, limit_host=False)
 
     async def _scroll_and_load(self, page) -> None:
         """Scroll page down to trigger dynamic content loading."""
@@ -178,34 +202,67 @@ class WebScraper:
 
         logger.info("Scroll sequence completed", total_scrolls=scroll_count)
 
-    async def _scrape_with_http(self, url: str, extract_markdown: bool = True) -> ScrapedContent:
-        """Scrape using standard HTTP request (existing implementation)."""
-        try:
-            async with aiohttp.ClientSession(timeout=self.timeout, headers=self.headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-
-                    # Check if it's a PDF file
-                    content_type = response.headers.get("Content-Type", "").lower()
-                    if "application/pdf" in content_type or url.lower().endswith(".pdf"):
-                        return await self._scrape_pdf(url, response)
-
-                    # Try to read as text
-                    try:
-                        html = await response.text()
-                    except UnicodeDecodeError as e:
-                        logger.warning("Failed to decode response as text", url=url, error=str(e))
-                        return ScrapedContent(
-                            url=url,
-                            title="Unable to decode content",
-                            content="",
-                            markdown=None,
-                            html=None,
-                            images=[],
-                            links=[],
-                        )
+    async def _scrape_with_http(
+        self, url: str, extract_markdown: bool = True, limit_host: bool = True
+    ) -> ScrapedContent:
+        """
+        Scrape using standard HTTP request.
 
-            return self._parse_html(html, url, extract_markdown)
+        With a page cache, fresh cached pages are returned without a request
+        and expired ones are revalidated with a conditional GET (reused on
+        304 Not Modified). Only requests take a per-host slot, so fresh pages
+        are served even while the host's circuit is open.
+        """
+        cache_key = f"{int(extract_markdown)}\x00{canonical_url(url)}"
+        cached = self.page_cache.get(cache_key) if self.page_cache is not None else None
+        if cached is not None and cached.fresh:
+            self.page_cache.record("hits", current_session_id(), cached.body_bytes)
+            return cached.content.model_copy(update={"url": url})
+
+        # Playwright fallbacks already hold the host's slot
+        async with self.http_clients.hosts.request(url) if limit_host else nullcontext():
+            return await self._fetch_with_http(url, extract_markdown, cache_key, cached)
+
+    async def _fetch_with_http(
+        self, url: str, extract_markdown: bool, cache_key: str, cached: CachedPage | None
+    ) -> ScrapedContent:
+        """GET the page (conditionally if an expired cached copy has validators) and extract it."""
+        try:
+            session = self.http_clients.session("scraper", timeout=self.timeout, headers=self.headers)
+            request_headers = cached.conditional_headers() if cached is not None else None
+            async with session.get(url, headers=request_headers) as response:
+                if response.status == 304 and cached is not None:
+                    self.page_cache.refresh(cache_key, response.headers)
+                    self.page_cache.record("revalidated", current_session_id(), cached.body_bytes)
+                    return cached.content.model_copy(update={"url": url})
+                response.raise_for_status()
+
+                # Check if it's a PDF file
+                content_type = response.headers.get("Content-Type", "").lower()
+                if "application/pdf" in content_type or url.lower().endswith(".pdf"):
+                    content = await self._scrape_pdf(url, response)
+                    self._store_page(cache_key, content, response.headers, len(await response.read()))
+                    return content
+
+                # Try to read as text
+                try:
+                    body_bytes = len(await response.read())
+                    html = await response.text()
+                except UnicodeDecodeError as e:
+                    logger.warning("Failed to decode response as text", url=url, error=str(e))
+                    return ScrapedContent(
+                        url=url,
+                        title="Unable to decode content",
+                        content="",
+                        markdown=None,
+                        html=None,
+                        images=[],
+                        links=[],
+                    )
+
+            content = await self._extract(html, url, extract_markdown)
+            self._store_page(cache_key, content, response.headers, body_bytes)
+            return content
 
         except aiohttp.ClientError as e:
             error_msg = str(e) if e else "Unknown connection error"
@@ -229,8 +286,38 @@ class WebScraper:
             )
             raise
 
+    def _store_page(self, cache_key: str, content: ScrapedContent, headers: Mapping[str, str], body_bytes: int) -> None:
+        if self.page_cache is None:
+            return
+        self.page_cache.record("misses", current_session_id())
+        if content.content:
+            self.page_cache.put(cache_key, content, headers, body_bytes)
+
+    async def _extract(self, html: str, url: str, extract_markdown: bool) -> ScrapedContent:
+        """Extract content with the configured engine (lxml pages large enough go to worker processes)."""
+        if self.extractor is None:
+            return self._parse_html(html, url, extract_markdown)
+
+        page = await self.extractor.extract(html, url, extract_markdown, self.extract_media)
+        logger.info(
+            "Web scraping completed",
+            url=url,
+            content_length=len(page.content),
+            images_count=len(page.images),
+            links_count=len(page.links),
+        )
+        return ScrapedContent(
+            url=url,
+            title=page.title,
+            content=page.content,
+            markdown=page.markdown,
+            html=html,
+            images=page.images,
+            links=page.links,
+        )
+
     def _parse_html(self, html: str, url: str, extract_markdown: bool = True) -> ScrapedContent:
-        """Parse HTML and extract content."""
+        """Parse HTML and extract content with BeautifulSoup."""
         soup = BeautifulSoup(html, "html.parser")
 
         # Extract title
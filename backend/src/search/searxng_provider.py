@@ -7,10 +7,42 @@ from urllib.parse import urlparse
 
 from src.search.base import SearchProvider
 from src.search.models import ScrapedContent, SearchResponse, SearchResult
+from src.utils.http import HTTPClientRegistry
 
 logger = structlog.get_logger(__name__)
 
 
+def result_diversity(results: list[SearchResult]) -> tuple[int, int]:
+    """Return (unique domains, results with a domain) of a result list."""
+    domains = []
+    for item in results:
+        if not item.url:
+            continue
+        try:
+            domain = urlparse(item.url).netloc.lower()
+        except Exception:
+            continue
+        if domain:
+            domains.append(domain)
+    return len(set(domains)), len(domains)
+
+
+def should_fallback(results: list[SearchResult], max_results: int) -> bool:
+    """Return True if results are too few or too concentrated on few domains to be used as-is."""
+    if not results:
+        return True
+    unique_domains, total = result_diversity(results)
+    if total == 0:
+        return True
+    if total >= 3 and unique_domains <= 1:
+        return True
+    if total >= 6 and (unique_domains / total) < 0.34:
+        return True
+    if total < max(3, max_results // 2):
+        return True
+    return False
+
+
 class SearXNGSearchProvider(SearchProvider):
     """SearXNG metasearch engine provider."""
 
@@ -22,6 +54,7 @@ class SearXNGSearchProvider(SearchProvider):
         categories: str = "",
         engines: str = "",
         safesearch: int = 0,
+        http_clients: HTTPClientRegistry | None = None,
     ):
         """
         Initialize SearXNG provider.
@@ -29,6 +62,7 @@ class SearXNGSearchProvider(SearchProvider):
         Args:
             instance_url: SearXNG instance URL (e.g., http://localhost:8080)
             timeout: Request timeout in seconds
+            http_clients: Shared HTTP client registry (a private one is created if omitted)
         """
         self.instance_url = instance_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout)
@@ -36,6 +70,8 @@ class SearXNGSearchProvider(SearchProvider):
         self.categories = self._split_list(categories)
         self.engines = self._split_list(engines)
         self.safesearch = safesearch
+        self._owns_http_clients = http_clients is None
+        self.http_clients = http_clients or HTTPClientRegistry()
         logger.info("SearXNGSearchProvider initialized", instance_url=self.instance_url)
 
     def _improve_query(self, query: str) -> str:
@@ -240,7 +276,8 @@ class SearXNGSearchProvider(SearchProvider):
         )
 
         try:
-            async with session.get(url, params=params) as response:
+            async with self.http_clients.hosts.request(url) as slot, session.get(url, params=params) as response:
+                slot.record_status(response.status)
                 response_text = await response.text()
 
                 logger.debug(
@@ -424,31 +461,10 @@ class SearXNGSearchProvider(SearchProvider):
             return SearchResponse(query=query, results=[], total_results=0)
 
     def _result_diversity(self, results: list[SearchResult]) -> tuple[int, int]:
-        domains = []
-        for item in results:
-            if not item.url:
-                continue
-            try:
-                domain = urlparse(item.url).netloc.lower()
-            except Exception:
-                continue
-            if domain:
-                domains.append(domain)
-        return len(set(domains)), len(domains)
+        return result_diversity(results)
 
     def _should_fallback(self, results: list[SearchResult], max_results: int) -> bool:
-        if not results:
-            return True
-        unique_domains, total = self._result_diversity(results)
-        if total == 0:
-            return True
-        if total >= 3 and unique_domains <= 1:
-            return True
-        if total >= 6 and (unique_domains / total) < 0.34:
-            return True
-        if total < max(3, max_results // 2):
-            return True
-        return False
+        return should_fallback(results, max_results)
 
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text supporting all Unicode languages."""
@@ -502,16 +518,16 @@ class SearXNGSearchProvider(SearchProvider):
             SearchResponse with results
         """
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                # Simple search like Perplexica: one request, no fallback
-                # SearXNG will automatically choose working engines
-                return await self._search_once(
-                    session,
-                    query,
-                    max_results=max_results,
-                    engines_override=[],  # Empty = SearXNG auto-selects engines
-                    label="search",
-                )
+            session = self.http_clients.session("searxng", timeout=self.timeout)
+            # Simple search like Perplexica: one request, no fallback
+            # SearXNG will automatically choose working engines
+            return await self._search_once(
+                session,
+                query,
+                max_results=max_results,
+                engines_override=[],  # Empty = SearXNG auto-selects engines
+                label="search",
+            )
         except aiohttp.ClientError as e:
             logger.error("SearXNG search failed - connection error", error=str(e), query=query)
             return SearchResponse(query=query, results=[], total_results=0)
@@ -519,6 +535,11 @@ class SearXNGSearchProvider(SearchProvider):
             logger.error("SearXNG search failed", error=str(e), query=query)
             return SearchResponse(query=query, results=[], total_results=0)
 
+    async def close(self) -> None:
+        """Close the pooled HTTP session (unless the registry is shared)."""
+        if self._owns_http_clients:
+            await self.http_clients.close()
+
     async def scrape(self, url: str) -> ScrapedContent:
         """
         Scrape URL content.
@@ -533,64 +554,64 @@ class SearXNGSearchProvider(SearchProvider):
             ScrapedContent with extracted data
         """
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    html = await response.text()
-
-                # Basic HTML cleaning - will be improved by scraper.py
-                from html.parser import HTMLParser
-                from io import StringIO
-
-                class HTMLToText(HTMLParser):
-                    """Simple HTML to text converter."""
-
-                    def __init__(self):
-                        super().__init__()
-                        self.text = StringIO()
-                        self.skip_tags = {"script", "style", "noscript"}
+            session = self.http_clients.session("searxng", timeout=self.timeout)
+            async with self.http_clients.hosts.request(url), session.get(url) as response:
+                response.raise_for_status()
+                html = await response.text()
+
+            # Basic HTML cleaning - will be improved by scraper.py
+            from html.parser import HTMLParser
+            from io import StringIO
+
+            class HTMLToText(HTMLParser):
+                """Simple HTML to text converter."""
+
+                def __init__(self):
+                    super().__init__()
+                    self.text = StringIO()
+                    self.skip_tags = {"script", "style", "noscript"}
+                    self.in_skip_tag = False
+
+                def handle_starttag(self, tag, attrs):
+                    if tag in self.skip_tags:
+                        self.in_skip_tag = True
+
+                def handle_endtag(self, tag):
+                    if tag in self.skip_tags:
                         self.in_skip_tag = False
 
-                    def handle_starttag(self, tag, attrs):
-                        if tag in self.skip_tags:
-                            self.in_skip_tag = True
-
-                    def handle_endtag(self, tag):
-                        if tag in self.skip_tags:
-                            self.in_skip_tag = False
-
-                    def handle_data(self, data):
-                        if not self.in_skip_tag:
-                            self.text.write(data)
-                            self.text.write(" ")
-
-                    def get_text(self):
-                        return self.text.getvalue().strip()
-
-                parser = HTMLToText()
-                parser.feed(html)
-                content = parser.get_text()
-
-                # Extract title from HTML
-                title = ""
-                title_start = html.find("<title>")
-                title_end = html.find("</title>")
-                if title_start != -1 and title_end != -1:
-                    title = html[title_start + 7 : title_end].strip()
-
-                scraped = ScrapedContent(
-                    url=url,
-                    title=title,
-                    content=content,
-                    markdown=None,  # Will be added by scraper.py
-                    html=html,
-                    images=[],  # Will be extracted by scraper.py
-                    links=[],  # Will be extracted by scraper.py
-                )
+                def handle_data(self, data):
+                    if not self.in_skip_tag:
+                        self.text.write(data)
+                        self.text.write(" ")
+
+                def get_text(self):
+                    return self.text.getvalue().strip()
+
+            parser = HTMLToText()
+            parser.feed(html)
+            content = parser.get_text()
+
+            # Extract title from HTML
+            title = ""
+            title_start = html.find("<title>")
+            title_end = html.find("</title>")
+            if title_start != -1 and title_end != -1:
+                title = html[title_start + 7 : title_end].strip()
+
+            scraped = ScrapedContent(
+                url=url,
+                title=title,
+                content=content,
+                markdown=None,  # Will be added by scraper.py
+                html=html,
+                images=[],  # Will be extracted by scraper.py
+                links=[],  # Will be extracted by scraper.py
+            )
 
-                logger.info("SearXNG scrape completed", url=url, content_length=len(content))
+            logger.info("SearXNG scrape completed", url=url, content_length=len(content))
 
-                return scraped
+            return scraped
 
         except aiohttp.ClientError as e:
             logger.error("SearXNG scrape failed - connection error", error=str(e), url=url)
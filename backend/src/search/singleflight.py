@@ -0,0 +1,144 @@
+"""Single-flight deduplication of concurrent identical searches and scrapes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlsplit, urlunsplit
+
+import structlog
+
+from src.llm.accounting import current_session_id
+from src.search.base import SearchProvider
+from src.search.cache import normalize_query
+from src.search.models import ScrapedContent, SearchResponse
+from src.utils.session_stats import SessionStats
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_MAX_SESSIONS = 200
+
+
+def canonical_url(url: str) -> str:
+    """Canonicalize a URL for deduplication (scheme/host case, default port, fragment, empty path)."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    netloc = host if parts.port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{parts.port}"
+    if parts.username:
+        netloc = f"{parts.username}{':' + parts.password if parts.password else ''}@{netloc}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+class _FlightStats:
+    """Upstream calls and shared (saved) calls, process-wide and per research session."""
+
+    def __init__(self, max_sessions: int = _MAX_SESSIONS):
+        self._lock = threading.Lock()
+        self._usage: SessionStats[dict[str, dict[str, int]]] = SessionStats(
+            lambda: defaultdict(lambda: {"calls": 0, "shared": 0}), max_sessions
+        )
+
+    def record(self, name: str, outcome: str, session_id: Optional[str]) -> None:
+        with self._lock:
+            for usage in self._usage.targets(session_id):
+                usage[name][outcome] += 1
+
+    def get(self, session_id: Optional[str] = None) -> Optional[dict[str, dict[str, int]]]:
+        with self._lock:
+            usage = self._usage.get(session_id)
+            return {name: dict(counts) for name, counts in sorted(usage.items())} if usage is not None else None
+
+
+_stats = _FlightStats()
+
+
+class SingleFlight:
+    """Run one call per key at a time; concurrent callers with the same key share its result.
+
+    The first caller starts the call as a task and later callers await the
+    same task, so one upstream request serves all of them. Errors are
+    shared too. A caller being cancelled does not cancel the call for the
+    others. Calls are counted as "calls" for the caller that started them
+    and "shared" for the callers that joined (saved upstream calls).
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize single-flight group.
+
+        Args:
+            name: Operation name used in metrics (e.g. "search", "scrape")
+        """
+        self.name = name
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn for key, or join the call already in flight for key.
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            _stats.record(self.name, "calls", current_session_id())
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            _stats.record(self.name, "shared", current_session_id())
+            logger.debug("Joined in-flight call", operation=self.name, key=key[:100])
+        return await asyncio.shield(task)
+
+
+class SingleFlightSearchProvider(SearchProvider):
+    """Wrap a SearchProvider so concurrent identical searches and scrapes share one request.
+
+    Searches are keyed by normalized query and max_results, scrapes by
+    canonical URL. Sequential repeats still reach the wrapped provider (see
+    CachingSearchProvider for those).
+    """
+
+    def __init__(self, provider: SearchProvider):
+        """
+        Initialize single-flight wrapper.
+
+        Args:
+            provider: Search provider to wrap
+        """
+        self.provider = provider
+        self._searches = SingleFlight("search")
+        self._scrapes = SingleFlight("scrape")
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def search(self, query: str, max_results: int = 10) -> SearchResponse:
+        """Search, sharing the request with concurrent identical searches."""
+        key = f"{max_results}\x00{normalize_query(query)}"
+        return await self._searches.do(key, lambda: self.provider.search(query, max_results=max_results))
+
+    async def scrape(self, url: str) -> ScrapedContent:
+        """Scrape, sharing the request with concurrent scrapes of the same URL."""
+        return await self._scrapes.do(canonical_url(url), lambda: self.provider.scrape(url))
+
+    async def close(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.close()
+
+
+def get_single_flight_stats(session_id: Optional[str] = None) -> Optional[dict[str, dict[str, int]]]:
+    """Return upstream and shared call counts by operation for a session (or process-wide when None)."""
+    return _stats.get(session_id)
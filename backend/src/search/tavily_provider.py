@@ -1,31 +1,59 @@
 """Tavily search provider implementation."""
 
+import asyncio
+
+import aiohttp
 import structlog
-from tavily import TavilyClient
 
 from src.search.base import SearchProvider
 from src.search.models import ScrapedContent, SearchResponse, SearchResult
+from src.utils.http import HTTPClientRegistry
 
 logger = structlog.get_logger(__name__)
 
 
 class TavilySearchProvider(SearchProvider):
-    """Tavily API search provider."""
-
-    def __init__(self, api_key: str):
+    """Tavily API search provider.
+
+    Talks to the Tavily REST API over a long-lived aiohttp session from the
+    shared HTTP client registry, so searches never block the event loop and
+    reuse kept-alive connections. Concurrent requests are bounded by
+    max_concurrency.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.tavily.com",
+        max_concurrency: int = 8,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        http_clients: HTTPClientRegistry | None = None,
+    ):
         """
         Initialize Tavily provider.
 
         Args:
             api_key: Tavily API key
+            base_url: Tavily API URL
+            max_concurrency: Concurrent requests to the API
+            timeout: Total timeout per request in seconds
+            connect_timeout: Timeout for establishing a connection in seconds
+            http_clients: Shared HTTP client registry (a private one is created if omitted)
         """
-        self.client = TavilyClient(api_key=api_key)
-        logger.info("TavilySearchProvider initialized")
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self._owns_http_clients = http_clients is None
+        self.http_clients = http_clients or HTTPClientRegistry(limit=self.max_concurrency)
+        self._semaphore: asyncio.Semaphore | None = None
+        logger.info("TavilySearchProvider initialized", max_concurrency=self.max_concurrency)
 
     async def search(self, query: str, max_results: int = 10) -> SearchResponse:
         """
         Search using Tavily API.
-        
+
         Tavily already provides high-quality, relevant results with scores,
         so no reranking is needed. The API is optimized for LLM use cases.
 
@@ -40,15 +68,18 @@ class TavilySearchProvider(SearchProvider):
             # Tavily search with optimized parameters
             # According to Tavily docs: auto_parameters optimizes search automatically
             # search_depth="advanced" provides better quality results
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                search_depth="advanced",  # "basic", "advanced", "fast", or "ultra-fast"
-                topic="general",  # "general", "news", or "finance"
-                include_answer=False,  # We'll generate our own answers
-                include_raw_content=False,  # Don't need raw HTML in search results
-                auto_parameters=True,  # Automatically optimize search parameters for better results
-                include_favicon=False,  # Not needed for our use case
+            response = await self._post(
+                "/search",
+                {
+                    "query": query,
+                    "max_results": max_results,
+                    "search_depth": "advanced",  # "basic", "advanced", "fast", or "ultra-fast"
+                    "topic": "general",  # "general", "news", or "finance"
+                    "include_answer": False,  # We'll generate our own answers
+                    "include_raw_content": False,  # Don't need raw HTML in search results
+                    "auto_parameters": True,  # Automatically optimize search parameters for better results
+                    "include_favicon": False,  # Not needed for our use case
+                },
             )
 
             # Tavily already provides relevance scores (0.0-1.0)
@@ -92,8 +123,7 @@ class TavilySearchProvider(SearchProvider):
             ScrapedContent with extracted data
         """
         try:
-            # Tavily extract (synchronous API)
-            result = self.client.extract(urls=[url])
+            result = await self._post("/extract", {"urls": [url]})
 
             if not result or not result.get("results"):
                 raise ValueError(f"No content extracted from {url}")
@@ -117,3 +147,28 @@ class TavilySearchProvider(SearchProvider):
         except Exception as e:
             logger.error("Tavily scrape failed", error=str(e), url=url)
             raise
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session (unless the registry is shared)."""
+        if self._owns_http_clients:
+            await self.http_clients.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.http_clients.session(
+            "tavily",
+            timeout=self.timeout,
+            headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+        )
+
+    async def _post(self, path: str, payload: dict) -> dict:
+        session = self._get_session()
+        url = f"{self.base_url}{path}"
+        async with self._semaphore, self.http_clients.hosts.request(url) as slot:
+            async with session.post(url, json=payload) as response:
+                if response.status >= 400:
+                    slot.record_status(response.status)
+                    detail = await response.text()
+                    raise RuntimeError(f"Tavily {path} returned HTTP {response.status}: {detail[:200]}")
+                return await response.json()
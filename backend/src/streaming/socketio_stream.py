@@ -38,6 +38,8 @@ class SocketIOStreamingGenerator:
         self.session_id = session_id or sid
         self.app_state = app_state or {}
         self._event_count = 0
+        # Set once the answer was streamed token by token via emit_report_chunk
+        self.report_streamed = False
 
     def _schedule(self, coro: asyncio.Future) -> asyncio.Task | None:
         try:
@@ -362,12 +364,9 @@ class SocketIOStreamingGenerator:
                             embedding_provider = self.app_state.get("embedding_provider")
                             if embedding_provider:
                                 embedding_vector = await embedding_provider.embed_text(final_content)
-                                from src.database.schema import EMBEDDING_DIMENSION
-                                db_dimension = EMBEDDING_DIMENSION
-                                if len(embedding_vector) < db_dimension:
-                                    embedding_vector = list(embedding_vector) + [0.0] * (db_dimension - len(embedding_vector))
-                                elif len(embedding_vector) > db_dimension:
-                                    embedding_vector = embedding_vector[:db_dimension]
+                                from src.database.schema import CHAT_EMBEDDING_DIMENSION
+                                from src.embeddings.vectors import fit_dimension
+                                embedding_vector = fit_dimension(embedding_vector, CHAT_EMBEDDING_DIMENSION)
                                 embedding = embedding_vector
                                 logger.debug("Generated embedding for final message via SocketIO", message_id=message_id, embedding_dim=len(embedding_vector))
                             else:
@@ -408,6 +407,10 @@ class SocketIOStreamingGenerator:
                 else:
                     logger.error("Failed to save final message to DB via SocketIO after all retries", message_id=message_id)
 
+    def emit_usage(self, usage: Dict[str, Any]) -> asyncio.Task | None:
+        """Emit LLM token and latency totals of the session so far."""
+        return self._schedule(self._emit('stream:usage', usage))
+
     def emit_error(self, error: str, details: Optional[str] = None) -> asyncio.Task | None:
         """Emit error event."""
         data = {'error': error}
@@ -44,6 +44,7 @@ class StreamEventType(str, Enum):
     COMPRESSION = "compression"
     REPORT_CHUNK = "report_chunk"
     FINAL_REPORT = "final_report"
+    USAGE = "usage"
     ERROR = "error"
     DONE = "done"
 
@@ -68,6 +69,8 @@ class StreamingGenerator:
         # Store all sent events for reconnection (keep last 1000 events)
         self._event_history: list[str] = []
         self._max_history = 1000
+        # Set once the answer was streamed token by token via emit_report_chunk
+        self.report_streamed = False
 
     def add(self, data: str) -> None:
         """Add data to stream."""
@@ -371,6 +374,9 @@ class ResearchStreamingGenerator(StreamingGenerator):
         # This ensures all assistant messages are persisted for ALL modes (chat, search, deep_search, deep_research)
         # Mark that we saved final report to avoid duplicate saving in emit_done
         self._final_report_saved = True
+        # The report supersedes streamed chunks: with token streaming they are the raw LLM output
+        # (before citation/Sources cleanup), possibly of an abandoned attempt followed by a fallback
+        self._accumulated_content = ""
         logger.info("Saving final report to DB via emit_final_report", 
                    report_length=len(report),
                    newline_count=report.count("\n"),
@@ -403,11 +409,8 @@ class ResearchStreamingGenerator(StreamingGenerator):
                           app_state_keys=list(self.app_state.keys()) if self.app_state else [])
             return
         
-        # Use accumulated content if available, otherwise use provided content
         # CRITICAL: Don't strip or modify content - preserve all formatting including \n
-        final_content = getattr(self, "_accumulated_content", "") or content
-        if not final_content.strip():
-            return
+        final_content = content
         
         # CRITICAL: Log formatting preservation
         import re
@@ -457,12 +460,9 @@ class ResearchStreamingGenerator(StreamingGenerator):
                             embedding_provider = self.app_state.get("embedding_provider")
                             if embedding_provider:
                                 embedding_vector = await embedding_provider.embed_text(final_content)
-                                from src.database.schema import EMBEDDING_DIMENSION
-                                db_dimension = EMBEDDING_DIMENSION
-                                if len(embedding_vector) < db_dimension:
-                                    embedding_vector = list(embedding_vector) + [0.0] * (db_dimension - len(embedding_vector))
-                                elif len(embedding_vector) > db_dimension:
-                                    embedding_vector = embedding_vector[:db_dimension]
+                                from src.database.schema import CHAT_EMBEDDING_DIMENSION
+                                from src.embeddings.vectors import fit_dimension
+                                embedding_vector = fit_dimension(embedding_vector, CHAT_EMBEDDING_DIMENSION)
                                 embedding = embedding_vector
                                 logger.debug("Generated embedding for final message", message_id=message_id, embedding_dim=len(embedding_vector))
                             else:
@@ -503,6 +503,10 @@ class ResearchStreamingGenerator(StreamingGenerator):
                 else:
                     logger.error("Failed to save final message to DB after all retries", message_id=message_id)
 
+    def emit_usage(self, usage: dict) -> None:
+        """Emit LLM token and latency totals of the session so far."""
+        self.add(self._create_event(StreamEventType.USAGE, usage))
+
     def emit_error(self, error: str, details: str | None = None) -> None:
         """Emit error event."""
         logger.error("Research stream error", error=error, details=details)
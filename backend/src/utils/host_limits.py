@@ -0,0 +1,241 @@
+"""Per-host rate limiting, concurrency caps and circuit breaking for outbound HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from urllib.parse import urlsplit
+
+import aiohttp
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class HostCircuitOpenError(aiohttp.ClientConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+def is_host_failure(error: BaseException) -> bool:
+    """Return True if an error means the host is unhealthy (timeout, connection error, 429 or 5xx)."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ServerTimeoutError))
+
+
+class HostSlot:
+    """Permission to send one request to a host; lets the caller report a failed HTTP status."""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.failed = False
+
+    def record_status(self, status: int) -> None:
+        """Mark the request failed if the status means the host is throttling or erroring (429, 5xx)."""
+        if status == 429 or status >= 500:
+            self.failed = True
+
+
+class _HostState:
+    def __init__(self, rate: float, burst: int, max_concurrency: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probing = False
+        self.consecutive_failures = 0
+        self.in_flight = 0
+        self.stats = {"requests": 0, "failures": 0, "rejected": 0, "throttled": 0, "throttle_wait_ms": 0.0, "opened": 0}
+
+    def reserve_token(self) -> float:
+        """Take a token (possibly going into debt) and return how long to wait for it."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1.0
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class HostLimiter:
+    """Token bucket, concurrency cap and circuit breaker per host.
+
+    Every request to a host first passes the host's circuit breaker: after
+    failure_threshold consecutive failures (timeouts, connection errors,
+    429 or 5xx) the circuit opens and requests fail immediately with
+    HostCircuitOpenError for reset_timeout seconds. Then a single probe
+    request is let through (half-open); its success closes the circuit, its
+    failure opens it again. Admitted requests wait for a token from the
+    host's bucket (rate per second, up to burst at once) and for one of
+    max_concurrency slots. Shared by search providers and the scraper via
+    HTTPClientRegistry.hosts.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 20,
+        max_concurrency: int = 10,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_hosts: int = 1000,
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            rate: Requests per second per host (0 disables rate limiting)
+            burst: Requests per host allowed at once before rate limiting applies
+            max_concurrency: Concurrent requests per host (0 disables the cap)
+            failure_threshold: Consecutive failures that open a host's circuit (0 disables circuit breaking)
+            reset_timeout: Seconds a circuit stays open before a probe request is allowed
+            max_hosts: Hosts tracked (idle hosts used least recently are dropped first)
+        """
+        self.rate = max(0.0, rate)
+        self.burst = max(1, burst)
+        self.max_concurrency = max(0, max_concurrency)
+        self.failure_threshold = max(0, failure_threshold)
+        self.reset_timeout = max(0.0, reset_timeout)
+        self.max_hosts = max(1, max_hosts)
+        self._hosts: OrderedDict[str, _HostState] = OrderedDict()
+
+    @asynccontextmanager
+    async def request(self, url: str) -> AsyncIterator[HostSlot]:
+        """
+        Admit one request to the host of url.
+
+        Args:
+            url: Request URL
+
+        Yields:
+            HostSlot (call record_status for responses that do not raise)
+
+        Raises:
+            HostCircuitOpenError: If the host's circuit is open
+        """
+        host = (urlsplit(url).hostname or "").lower()
+        state = self._state(host)
+        self._admit(host, state)
+        slot = HostSlot(host)
+        state.in_flight += 1
+        cancelled = False
+        try:
+            wait = state.reserve_token()
+            if wait > 0:
+                state.stats["throttled"] += 1
+                state.stats["throttle_wait_ms"] += wait * 1000
+                await asyncio.sleep(wait)
+            if state.semaphore is None:
+                yield slot
+            else:
+                async with state.semaphore:
+                    yield slot
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as e:
+            if is_host_failure(e):
+                slot.failed = True
+            raise
+        finally:
+            state.in_flight -= 1
+            if not cancelled:
+                self._finish(host, state, slot)
+            elif state.state == HALF_OPEN:
+                # A cancelled probe proves nothing; let the next request probe instead
+                state.probing = False
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Return circuit state and request/failure/rejection/throttling counts per host."""
+        now = time.monotonic()
+        stats = {}
+        for host, state in self._hosts.items():
+            stats[host] = {
+                "state": self._current_state(state, now),
+                "consecutive_failures": state.consecutive_failures,
+                "in_flight": state.in_flight,
+                **state.stats,
+                "throttle_wait_ms": round(state.stats["throttle_wait_ms"], 1),
+            }
+        return stats
+
+    def get_degraded_hosts(self) -> dict[str, dict[str, Any]]:
+        """Return stats of hosts whose circuit is not closed or that recently failed or were throttled."""
+        return {
+            host: stats
+            for host, stats in self.get_stats().items()
+            if stats["state"] != CLOSED or stats["consecutive_failures"] or stats["throttled"]
+        }
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            self._evict()
+            state = self._hosts[host] = _HostState(self.rate, self.burst, self.max_concurrency)
+        self._hosts.move_to_end(host)
+        return state
+
+    def _evict(self) -> None:
+        for host in list(self._hosts):
+            if len(self._hosts) < self.max_hosts:
+                break
+            if self._hosts[host].in_flight == 0:
+                del self._hosts[host]
+
+    def _current_state(self, state: _HostState, now: float) -> str:
+        if state.state == OPEN and now - state.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return state.state
+
+    def _admit(self, host: str, state: _HostState) -> None:
+        current = self._current_state(state, time.monotonic())
+        if current == OPEN or (current == HALF_OPEN and state.probing):
+            state.stats["rejected"] += 1
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - state.opened_at))
+            raise HostCircuitOpenError(host, retry_in)
+        if current == HALF_OPEN:
+            state.state = HALF_OPEN
+            state.probing = True
+            logger.info("Probing host after open circuit", host=host)
+        state.stats["requests"] += 1
+
+    def _finish(self, host: str, state: _HostState, slot: HostSlot) -> None:
+        was_probe = state.probing and state.state == HALF_OPEN
+        if slot.failed:
+            state.stats["failures"] += 1
+            state.consecutive_failures += 1
+            if self.failure_threshold and (
+                was_probe or (state.state == CLOSED and state.consecutive_failures >= self.failure_threshold)
+            ):
+                state.state = OPEN
+                state.opened_at = time.monotonic()
+                state.stats["opened"] += 1
+                logger.warning(
+                    "Host circuit opened",
+                    host=host,
+                    consecutive_failures=state.consecutive_failures,
+                    reset_timeout=self.reset_timeout,
+                )
+        else:
+            if state.state != CLOSED:
+                logger.info("Host circuit closed", host=host)
+            state.state = CLOSED
+            state.consecutive_failures = 0
+        if was_probe:
+            state.probing = False
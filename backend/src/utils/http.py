@@ -0,0 +1,190 @@
+"""Shared, long-lived aiohttp sessions for outbound HTTP."""
+
+from __future__ import annotations
+
+import socket
+from typing import Any, Optional
+
+import aiohttp
+import structlog
+from aiohttp.abc import AbstractResolver, ResolveResult
+
+from src.utils.host_limits import HostLimiter
+
+logger = structlog.get_logger(__name__)
+
+
+class LocalhostResolver(AbstractResolver):
+    """Resolves localhost subdomains to the loopback address, everything else as usual.
+
+    Names under .localhost are reserved for loopback (RFC 6761) and browsers
+    resolve them that way, but getaddrinfo often does not. This lets local
+    stand-ins serve many sites, one subdomain each, from one port (see
+    src/search/offline.py).
+    """
+
+    def __init__(self, resolver: AbstractResolver | None = None):
+        """
+        Initialize resolver.
+
+        Args:
+            resolver: Resolver for other names (defaults to aiohttp's default resolver)
+        """
+        self._resolver = resolver
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> list[ResolveResult]:
+        """Resolve host, mapping localhost and its subdomains to 127.0.0.1."""
+        name = host.lower().rstrip(".")
+        if name == "localhost" or name.endswith(".localhost"):
+            return [
+                ResolveResult(
+                    hostname=host,
+                    host="127.0.0.1",
+                    port=port,
+                    family=socket.AF_INET,
+                    proto=0,
+                    flags=socket.AI_NUMERICHOST,
+                )
+            ]
+        if self._resolver is None:
+            self._resolver = aiohttp.DefaultResolver()
+        return await self._resolver.resolve(host, port, family)
+
+    async def close(self) -> None:
+        """Close the wrapped resolver."""
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+
+class HTTPClientRegistry:
+    """Named aiohttp sessions that share one pooled connector.
+
+    Every component (search providers, scraper, embedding client) gets its
+    own session with its own default timeout and headers, but all sessions
+    draw from the same TCPConnector, so connections are kept alive and
+    reused across requests, DNS lookups are cached, and the number of open
+    connections is capped overall and per host. Names under .localhost
+    resolve to loopback (LocalhostResolver). The connector and sessions
+    are created lazily on first use, inside the running event loop.
+    hosts holds the per-host rate limits and circuit breakers that callers
+    apply around requests (see HostLimiter).
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        hosts: HostLimiter | None = None,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            limit: Max open connections across all hosts
+            limit_per_host: Max open connections to a single host
+            dns_cache_ttl: Seconds DNS lookups are cached
+            keepalive_timeout: Seconds an idle connection is kept open
+            hosts: Per-host limiter (defaults to HostLimiter())
+        """
+        self.limit = max(1, limit)
+        self.limit_per_host = max(0, limit_per_host)
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.hosts = hosts or HostLimiter()
+        self._connector: aiohttp.TCPConnector | None = None
+        self._resolver: LocalhostResolver | None = None
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+
+    def session(
+        self,
+        name: str,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> aiohttp.ClientSession:
+        """
+        Return the session registered under name, creating it on first use.
+
+        Args:
+            name: Component name (one session per component)
+            timeout: Default timeout for requests made with the session
+            headers: Default headers for requests made with the session
+
+        Returns:
+            Session backed by the shared connector
+        """
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self._get_connector(),
+                connector_owner=False,
+                timeout=timeout or aiohttp.ClientTimeout(total=30),
+                headers=headers,
+            )
+            self._sessions[name] = session
+        return session
+
+    async def close(self) -> None:
+        """Close all sessions and the shared connector."""
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        if self._connector is None or self._connector.closed:
+            if self._resolver is None:
+                self._resolver = LocalhostResolver()
+            self._connector = aiohttp.TCPConnector(
+                resolver=self._resolver,
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+        return self._connector
+
+
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_clients(settings: Any) -> HTTPClientRegistry:
+    """Return the process-wide HTTP client registry."""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry(
+            limit=settings.http_pool_limit,
+            limit_per_host=settings.http_pool_limit_per_host,
+            dns_cache_ttl=settings.http_dns_cache_ttl,
+            keepalive_timeout=settings.http_keepalive_timeout,
+            hosts=HostLimiter(
+                rate=settings.host_rate_limit,
+                burst=settings.host_rate_burst,
+                max_concurrency=settings.host_max_concurrency,
+                failure_threshold=settings.host_failure_threshold,
+                reset_timeout=settings.host_circuit_reset_seconds,
+            ),
+        )
+    return _registry
+
+
+async def close_http_clients() -> None:
+    """Log degraded hosts and close the process-wide HTTP client registry."""
+    global _registry
+    if _registry is None:
+        return
+    degraded = _registry.hosts.get_degraded_hosts()
+    if degraded:
+        logger.info("Degraded outbound hosts", hosts=degraded)
+    await _registry.close()
+    _registry = None
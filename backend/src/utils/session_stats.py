@@ -0,0 +1,48 @@
+"""Process-wide and per-session statistics, keeping only the most recently updated sessions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SessionStats(Generic[T]):
+    """A process-wide stats object plus one per research session.
+
+    Stats objects come from factory (a counter dict, a usage summary, ...).
+    Only the max_sessions sessions updated most recently are kept. Not
+    thread-safe: callers update and read under their own lock.
+    """
+
+    def __init__(self, factory: Callable[[], T], max_sessions: int = 200):
+        """
+        Initialize stats.
+
+        Args:
+            factory: Creates an empty stats object
+            max_sessions: Sessions kept (least recently updated dropped first)
+        """
+        self.factory = factory
+        self.max_sessions = max(1, max_sessions)
+        self.total = factory()
+        self._sessions: OrderedDict[str, T] = OrderedDict()
+
+    def targets(self, session_id: Optional[str]) -> list[T]:
+        """Return the stats objects an update for session_id goes to: process-wide, then the session's."""
+        return [self.total, self.session(session_id)] if session_id else [self.total]
+
+    def session(self, session_id: str) -> T:
+        """Return the stats of a session, creating it and marking it most recently updated."""
+        stats = self._sessions.get(session_id)
+        if stats is None:
+            stats = self._sessions[session_id] = self.factory()
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        return stats
+
+    def get(self, session_id: Optional[str] = None) -> Optional[T]:
+        """Return the stats of a session (process-wide when None), or None if nothing was recorded for it."""
+        return self.total if session_id is None else self._sessions.get(session_id)
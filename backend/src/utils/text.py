@@ -8,9 +8,55 @@ from typing import Any
 import structlog
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from src.llm.cache import cache_scope
+
 logger = structlog.get_logger(__name__)
 
 _sentence_splitter = re.compile(r"(?<=[.!?])\s+")
+_token_encoding: Any = None
+_token_encoding_loaded = False
+
+
+def _get_token_encoding() -> Any:
+    global _token_encoding, _token_encoding_loaded
+    if not _token_encoding_loaded:
+        _token_encoding_loaded = True
+        try:
+            import tiktoken
+
+            _token_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.debug("tiktoken unavailable, using char-based token estimate", error=str(e))
+            _token_encoding = None
+    return _token_encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Count tokens in text.
+
+    Uses tiktoken's cl100k_base encoding when it is available and falls back
+    to the usual ~4 chars per token approximation otherwise (e.g. offline).
+    """
+    if not text:
+        return 0
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return max(1, len(text) // 4)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens (same counting as estimate_tokens)."""
+    if not text or max_tokens <= 0:
+        return ""
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+    return text[: max_tokens * 4]
 
 
 def summarize_text(text: str, max_chars: int) -> str:
@@ -92,6 +138,7 @@ async def summarize_text_llm(text: str, max_tokens: int, llm: Any) -> str:
 
     try:
         # Import here to avoid circular dependency
+        from src.llm.scheduler import LLMPriority, llm_priority
         from src.models.schemas import SummarizedContent
 
         prompt = (
@@ -101,10 +148,15 @@ async def summarize_text_llm(text: str, max_tokens: int, llm: Any) -> str:
 
         structured_llm = llm.with_structured_output(SummarizedContent, method="function_calling")
 
-        response = await structured_llm.ainvoke([
-            SystemMessage(content=prompt),
-            HumanMessage(content=trimmed)
-        ])
+        # The same page is often scraped and summarized by several agents
+        with (
+            cache_scope("summarize_text_llm", allow_nondeterministic=True),
+            llm_priority(LLMPriority.SUMMARIZATION),
+        ):
+            response = await structured_llm.ainvoke([
+                SystemMessage(content=prompt),
+                HumanMessage(content=trimmed)
+            ])
 
         if hasattr(response, 'summary'):
             logger.debug("LLM summarization successful", original_length=len(text), summary_length=len(response.summary))
@@ -3,12 +3,17 @@
 Defines the state machine for multi-agent research orchestration.
 """
 
-from typing import Any
+import functools
+from typing import Any, Callable
 
 import structlog
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
+from src.llm.accounting import get_session_usage, usage_scope
+from src.search.cache import get_session_search_stats
+from src.search.page_cache import get_session_page_stats
+from src.search.singleflight import get_single_flight_stats
 from src.workflow.research.state import ResearchState, create_initial_state
 from src.workflow.research.nodes import (
     run_deep_search_node,
@@ -20,6 +25,7 @@ from src.workflow.research.nodes import (
     supervisor_review_enhanced_node,
     compress_findings_node,
     generate_final_report_enhanced_node,
+    runtime_deps_context,
 )
 
 logger = structlog.get_logger(__name__)
@@ -152,6 +158,24 @@ def should_ask_clarification(state: ResearchState) -> str:
         return "proceed"
 
 
+def _tracked_node(name: str, node: Callable) -> Callable:
+    """Attribute a node's LLM usage and wall time to it and stream the session's running totals."""
+
+    @functools.wraps(node)
+    async def wrapper(state: ResearchState) -> dict:
+        session_id = state.get("session_id")
+        with usage_scope(session_id=session_id, node=name):
+            result = await node(state)
+
+        usage = get_session_usage(session_id)
+        stream = (runtime_deps_context.get() or {}).get("stream")
+        if usage and stream is not None and hasattr(stream, "emit_usage"):
+            stream.emit_usage(usage)
+        return result
+
+    return wrapper
+
+
 # Global checkpointer shared across all graph instances
 # This ensures checkpoints persist between graph invocations
 _global_checkpointer = None
@@ -181,15 +205,15 @@ def create_research_graph(checkpoint_path: str = "./research_checkpoints.db") ->
 
     # Add nodes
     # Note: search_memory_node removed - agent memory is created empty and populated during research
-    workflow.add_node("run_deep_search", run_deep_search_node)
-    workflow.add_node("clarify", clarify_with_user_node)
-    workflow.add_node("analyze_query", analyze_query_node)
-    workflow.add_node("plan_research", plan_research_enhanced_node)
-    workflow.add_node("spawn_agents", create_agent_characteristics_enhanced_node)
-    workflow.add_node("execute_agents", execute_agents_enhanced_node)
-    workflow.add_node("supervisor_react", supervisor_review_enhanced_node)
-    workflow.add_node("compress_findings", compress_findings_node)
-    workflow.add_node("generate_report", generate_final_report_enhanced_node)
+    workflow.add_node("run_deep_search", _tracked_node("run_deep_search", run_deep_search_node))
+    workflow.add_node("clarify", _tracked_node("clarify", clarify_with_user_node))
+    workflow.add_node("analyze_query", _tracked_node("analyze_query", analyze_query_node))
+    workflow.add_node("plan_research", _tracked_node("plan_research", plan_research_enhanced_node))
+    workflow.add_node("spawn_agents", _tracked_node("spawn_agents", create_agent_characteristics_enhanced_node))
+    workflow.add_node("execute_agents", _tracked_node("execute_agents", execute_agents_enhanced_node))
+    workflow.add_node("supervisor_react", _tracked_node("supervisor_react", supervisor_review_enhanced_node))
+    workflow.add_node("compress_findings", _tracked_node("compress_findings", compress_findings_node))
+    workflow.add_node("generate_report", _tracked_node("generate_report", generate_final_report_enhanced_node))
 
     # Define edges
     workflow.set_entry_point("run_deep_search")
@@ -469,6 +493,29 @@ async def run_research_graph(
 
         logger.info("Research graph completed successfully")
 
+        usage = get_session_usage(session_id)
+        if usage and session_manager and final_state.get("report_generated"):
+            search_cache = get_session_search_stats(session_id)
+            single_flight = get_single_flight_stats(session_id)
+            page_cache = get_session_page_stats(session_id)
+            try:
+                await session_manager.update_metadata(
+                    session_id,
+                    {
+                        "usage": usage,
+                        **({"search_cache": search_cache} if search_cache else {}),
+                        **({"single_flight": single_flight} if single_flight else {}),
+                        **({"page_cache": page_cache} if page_cache else {}),
+                    },
+                )
+            except Exception as e:
+                logger.warning("Failed to save session usage", session_id=session_id, error=str(e))
+            logger.info("Research session usage", session_id=session_id, **usage["totals"])
+
+        note_index = getattr(agent_memory_service, "note_index", None)
+        if note_index is not None:
+            logger.info("Agent note context token savings", session_id=session_id, **note_index.get_stats())
+
         return final_state
 
     except Exception as e:
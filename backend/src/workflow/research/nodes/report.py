@@ -4,6 +4,7 @@ import structlog
 from typing import Dict, Any
 from datetime import datetime
 
+from src.llm.streaming import stream_structured
 from src.workflow.research.state import ResearchState
 from src.workflow.research.nodes.base import ResearchNode
 from src.workflow.research.models import FinalReport
@@ -164,10 +165,17 @@ CRITICAL: Write the ENTIRE report in {user_language}.
 Minimum report length: 1500 characters.
 Include Executive Summary, Main Body (min 3 sections), and Conclusion."""
 
-            report = await llm.with_structured_output(FinalReport).ainvoke([
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ])
+            # Sections are streamed to the client as the tool-call arguments arrive
+            report = await stream_structured(
+                llm,
+                FinalReport,
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                render=lambda args: self._render_partial_report(args, original_query),
+                stream=stream,
+            )
 
             logger.info("Report generated successfully",
                        sections_count=len(report.sections) if hasattr(report, "sections") else 0,
@@ -467,6 +475,33 @@ Research completed with {len(findings)} findings from multiple agents covering v
 
         return final_report
 
+    def _render_partial_report(self, args: Dict[str, Any], query: str) -> str:
+        """Render partial FinalReport arguments as markdown for streaming.
+
+        Same layout as _format_report, but separators are only added in front
+        of a field once it appears, so the output grows strictly at the end
+        while the last field is still being generated.
+
+        Args:
+            args: Partially parsed FinalReport tool-call arguments
+            query: Original query
+
+        Returns:
+            Markdown rendered so far
+        """
+        parts = [f"# Research Report: {query}"]
+        if "executive_summary" in args:
+            parts.append(f"\n\n## Executive Summary\n\n{args['executive_summary']}")
+        for section in args.get("sections") or []:
+            if not isinstance(section, dict) or "title" not in section:
+                break
+            parts.append(f"\n\n## {section['title']}")
+            if "content" in section:
+                parts.append(f"\n\n{section['content']}")
+        if "conclusion" in args:
+            parts.append(f"\n\n## Conclusion\n\n{args['conclusion']}")
+        return "".join(parts)
+
     def _create_fallback_report(self, query: str, draft: str, findings: list) -> str:
         """Create fallback report when generation fails.
         
@@ -5,6 +5,7 @@ from typing import Dict, Any
 
 from src.workflow.research.state import ResearchState
 from src.workflow.research.nodes.base import ResearchNode
+from src.llm.scheduler import LLMPriority, with_llm_priority
 
 logger = structlog.get_logger(__name__)
 
@@ -34,6 +35,7 @@ class SupervisorReviewNode(ResearchNode):
 
 
 # Legacy function wrapper for backward compatibility
+@with_llm_priority(LLMPriority.SUPERVISOR)
 async def supervisor_review_enhanced_node(state: ResearchState) -> Dict:
     """Legacy wrapper for SupervisorReviewNode.
 
@@ -11,6 +11,8 @@ from typing import Any, Dict
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from src.llm.scheduler import LLMPriority, llm_priority
+
 # IMPORTANT: Import runtime_deps_context from nodes/__init__.py to ensure we use THE SAME context variable
 # Previously this file had its own context variable which was never set, causing llm=None errors!
 from src.workflow.research.nodes import runtime_deps_context
@@ -128,12 +130,9 @@ async def _save_message_to_db_async(
                         
                         if embedding_provider:
                             embedding_vector = await embedding_provider.embed_text(content)
-                            from src.database.schema import EMBEDDING_DIMENSION
-                            db_dimension = EMBEDDING_DIMENSION
-                            if len(embedding_vector) < db_dimension:
-                                embedding_vector = list(embedding_vector) + [0.0] * (db_dimension - len(embedding_vector))
-                            elif len(embedding_vector) > db_dimension:
-                                embedding_vector = embedding_vector[:db_dimension]
+                            from src.database.schema import CHAT_EMBEDDING_DIMENSION
+                            from src.embeddings.vectors import fit_dimension
+                            embedding_vector = fit_dimension(embedding_vector, CHAT_EMBEDDING_DIMENSION)
                             embedding = embedding_vector
                             logger.debug("Generated embedding for message", message_id=message_id, embedding_dim=len(embedding_vector))
                         else:
@@ -382,13 +381,14 @@ async def run_deep_search_node(state: ResearchState) -> Dict:
                    session_id=session_id,
                    note="Deep research is isolated from chat mode - no chat_history from other modes")
         
-        # Run deep search
-        result = await search_service._answer_deep_search(
-            query=deep_search_query,  # CRITICAL: Use current_research_query, not potentially outdated query
-            classification=None,  # Will be created internally
-            stream=stream,
-            chat_history=chat_history_for_deep_search,  # CRITICAL: Empty to prevent using chat history from other modes
-        )
+        # Run deep search (its research and writer agents inherit the caller's LLM priority)
+        with llm_priority(LLMPriority.AGENT):
+            result = await search_service._answer_deep_search(
+                query=deep_search_query,  # CRITICAL: Use current_research_query, not potentially outdated query
+                classification=None,  # Will be created internally
+                stream=stream,
+                chat_history=chat_history_for_deep_search,  # CRITICAL: Empty to prevent using chat history from other modes
+            )
 
         logger.info("Deep search completed", answer_length=len(result) if result else 0)
 
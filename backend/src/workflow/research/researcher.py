@@ -8,6 +8,9 @@ import structlog
 from src.workflow.search.actions import ActionRegistry
 from src.workflow.research.models import AgentPlan, AgentReflection
 from src.models.agent_models import AgentNote
+from src.utils.text import estimate_tokens
+from src.llm.accounting import usage_scope
+from src.llm.scheduler import LLMPriority, with_llm_priority
 
 logger = structlog.get_logger(__name__)
 
@@ -23,9 +26,10 @@ async def run_researcher_agent_enhanced(
     max_steps: int = None,  # If None, will use settings.deep_research_agent_max_steps (old default: 8)
 ) -> Dict:
     """Enhanced researcher agent - main implementation."""
-    return await _run_researcher_agent_impl(
-        agent_id, state, llm, search_provider, scraper, stream, supervisor_queue, max_steps
-    )
+    with usage_scope(agent_id=agent_id):
+        return await _run_researcher_agent_impl(
+            agent_id, state, llm, search_provider, scraper, stream, supervisor_queue, max_steps
+        )
 
 
 async def run_researcher_agent(
@@ -39,11 +43,75 @@ async def run_researcher_agent(
     max_steps: int = 8,
 ) -> Dict:
     """Backward compatibility wrapper for run_researcher_agent."""
-    return await _run_researcher_agent_impl(
-        agent_id, state, llm, search_provider, scraper, stream, None, max_steps
-    )
+    with usage_scope(agent_id=agent_id):
+        return await _run_researcher_agent_impl(
+            agent_id, state, llm, search_provider, scraper, stream, None, max_steps
+        )
 
 
+async def _build_notes_context(
+    agent_id: str,
+    all_notes: list[str],
+    current_task: Any,
+    agent_memory_service: Any,
+    settings: Any = None,
+) -> str:
+    """
+    Build the "previous notes" prompt section for the current task.
+
+    Uses the session note index to pick the notes most relevant to the task
+    within a token budget. Falls back to the last 10 notes of the agent file
+    when no index is available.
+    """
+    # CRITICAL: Only truncate notes if they're extremely long (over 1000 chars) - don't break normal usage
+    max_note_length = 1000  # Only truncate if extremely long
+    # Notes are already limited to 20 in read_agent_file, the old context took the last 10
+    recent_notes = all_notes[-10:] if len(all_notes) > 10 else all_notes
+    baseline_notes = [note[:max_note_length] + "..." if len(note) > max_note_length else note for note in recent_notes]
+
+    if settings is None:
+        from src.workflow.research.nodes import _get_runtime_deps
+        settings = _get_runtime_deps().get("settings")
+    top_k = getattr(settings, "deep_research_note_context_top_k", 8)
+    token_budget = getattr(settings, "deep_research_note_context_token_budget", 1500)
+
+    selected_notes = None
+    get_relevant_notes = getattr(agent_memory_service, "get_relevant_notes", None)
+    if get_relevant_notes is not None:
+        task_query = " ".join(
+            part for part in (
+                getattr(current_task, "title", ""),
+                getattr(current_task, "objective", ""),
+                getattr(current_task, "note", None) or "",
+            ) if part
+        )
+        try:
+            selected_notes = await get_relevant_notes(
+                task_query, agent_id, personal_notes=all_notes, top_k=top_k, token_budget=token_budget
+            )
+        except Exception as e:
+            logger.warning(f"Agent {agent_id} note index lookup failed, using recent notes", error=str(e))
+
+    if selected_notes is None:
+        selected_notes = baseline_notes
+    else:
+        baseline_tokens = sum(estimate_tokens(note) for note in baseline_notes)
+        selected_tokens = sum(estimate_tokens(note) for note in selected_notes)
+        agent_memory_service.note_index.record_selection(baseline_tokens, selected_tokens)
+        logger.info(
+            f"Agent {agent_id} note context selected",
+            notes_in_context=len(selected_notes),
+            indexed_notes=len(agent_memory_service.note_index),
+            baseline_tokens=baseline_tokens,
+            selected_tokens=selected_tokens,
+        )
+
+    if all_notes:
+        logger.debug(f"Agent {agent_id} notes", total=len(all_notes), in_context=len(selected_notes))
+    return "\n".join([f"- {note}" for note in selected_notes]) if selected_notes else "No previous notes."
+
+
+@with_llm_priority(LLMPriority.AGENT)
 async def _run_researcher_agent_impl(
     agent_id: str,
     state: Dict[str, Any],
@@ -123,20 +191,6 @@ async def _run_researcher_agent_impl(
     preferences = agent_file.get("preferences", "")
     todos = agent_file.get("todos", [])
     
-    # Get recent notes - LIMIT to prevent context bloat
-    # Only include last 10 most recent important notes in context
-    all_notes = agent_file.get("notes", [])
-    # Notes are already limited to 20 in read_agent_file, but we limit further for context
-    recent_notes = all_notes[-10:] if len(all_notes) > 10 else all_notes
-    # CRITICAL: Only truncate notes if they're extremely long (over 1000 chars) - don't break normal usage
-    max_note_length = 1000  # Only truncate if extremely long
-    truncated_notes = [note[:max_note_length] + "..." if len(note) > max_note_length else note for note in recent_notes]
-    notes_context = "\n".join([f"- {note}" for note in truncated_notes]) if truncated_notes else "No previous notes."
-    
-    # Log note count for debugging
-    if all_notes:
-        logger.debug(f"Agent {agent_id} notes", total=agent_file.get("all_notes_count", len(all_notes)), in_context=len(recent_notes))
-
     # Get agent characteristics from state
     agent_characteristics = state.get("agent_characteristics", {}).get(agent_id, {})
     role = agent_characteristics.get("role", f"Research Agent {agent_id}")
@@ -285,6 +339,14 @@ Create a BRIEF, actionable research plan for completing this task.
             fallback_if_stuck="Try alternative sources"
         )
 
+    notes_context = await _build_notes_context(
+        agent_id,
+        agent_file.get("notes", []),
+        current_task,
+        agent_memory_service,
+        state.get("settings"),
+    )
+
     # Research execution (ReAct loop)
     sources = []
     notes = []
@@ -2,10 +2,10 @@
 
 import structlog
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from uuid import uuid4
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.schema import ResearchSessionModel
@@ -242,6 +242,24 @@ class SessionManager:
 
             logger.info("Session completed", session_id=session_id)
 
+    async def update_metadata(self, session_id: str, values: dict) -> None:
+        """Merge values into the session's metadata.
+
+        Args:
+            session_id: Session identifier
+            values: Top-level keys to set (existing keys are replaced)
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                update(ResearchSessionModel)
+                .where(ResearchSessionModel.id == session_id)
+                .values(
+                    updated_at=datetime.now(),
+                    session_metadata=ResearchSessionModel.session_metadata.op("||")(values),
+                )
+            )
+            await session.commit()
+
     async def save_deep_search_result(self, session_id: str, result: str) -> None:
         """Save deep search result to session.
 
@@ -360,7 +378,7 @@ class SessionManager:
                     status="expired",
                     completed_at=datetime.now(),
                     updated_at=datetime.now(),
-                    metadata=ResearchSessionModel.metadata.op("||")(
+                    session_metadata=ResearchSessionModel.session_metadata.op("||")(
                         {"expired_at": datetime.now().isoformat(), "expiry_hours": hours}
                     ),
                 )
@@ -372,3 +390,29 @@ class SessionManager:
                 logger.info("Expired old sessions", count=count, hours=hours)
 
             return count
+
+    async def list_archivable_sessions(self, older_than_hours: int = 24) -> List[Tuple[str, str]]:
+        """List finished sessions whose agent files can be archived.
+
+        Finished statuses: completed, expired, superseded, cancelled
+
+        Args:
+            older_than_hours: Minimum time since the session finished
+
+        Returns:
+            List of (session_id, status) tuples
+        """
+        cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
+
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(ResearchSessionModel.id, ResearchSessionModel.status).where(
+                    ResearchSessionModel.status.in_(
+                        ["completed", "expired", "superseded", "cancelled"]
+                    ),
+                    func.coalesce(
+                        ResearchSessionModel.completed_at, ResearchSessionModel.updated_at
+                    ) < cutoff_time,
+                )
+            )
+            return [(row.id, row.status) for row in result.all()]
@@ -24,6 +24,7 @@ from src.workflow.research.models import (
     ResearchGap,
 )
 from src.models.agent_models import AgentTodoItem
+from src.llm.scheduler import LLMPriority, with_llm_priority
 
 logger = structlog.get_logger(__name__)
 
@@ -203,6 +204,8 @@ async def write_main_document_handler(args: Dict[str, Any], context: Dict[str, A
                 updated = f"# Agent Memory - Main Index\n\n## Overview\n\n{summary}\n\n---\n\n" + "\n\n---\n\n".join(sections[-3:])
         
         await agent_memory_service.file_manager.write_file("main.md", updated)
+        # main.md sections are shared with every agent - make them retrievable for agent prompts
+        await agent_memory_service.index_shared_note(f"{section_title}: {content}")
         
         logger.info("Main document updated", section=section_title, content_length=len(content), total_length=len(updated))
         
@@ -1540,6 +1543,7 @@ class SupervisorToolsRegistry:
 # ==================== Supervisor Agent Implementation ====================
 
 
+@with_llm_priority(LLMPriority.SUPERVISOR)
 async def run_supervisor_agent(
     state: Dict[str, Any],
     llm: Any,
@@ -11,6 +11,8 @@ import structlog
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
+from src.llm.cache import cache_scope
+
 logger = structlog.get_logger(__name__)
 
 
@@ -36,6 +38,15 @@ class QueryClassification(BaseModel):
     )
 
 
+class SearchPlan(QueryClassification):
+    """Classification plus the first batch of web search queries, from one LLM call."""
+
+    search_queries: list[str] = Field(
+        default_factory=list,
+        description="First web search queries: concise keywords in the query's language (empty for chat mode)",
+    )
+
+
 # ==================== Classifier Implementation ====================
 
 
@@ -55,6 +66,106 @@ async def classify_query(
     Returns:
         QueryClassification with routing decision
     """
+    system_prompt, user_prompt = _classification_prompts(query, chat_history)
+
+    try:
+        # Use structured output
+        structured_llm = llm.with_structured_output(
+            QueryClassification, method="function_calling"
+        )
+
+        # Re-asked questions with the same history get the same routing
+        with cache_scope("classify_query", allow_nondeterministic=True):
+            result = await structured_llm.ainvoke(
+                [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+            )
+
+        logger.info(
+            "Query classified",
+            query=query[:100],
+            type=result.query_type,
+            mode=result.suggested_mode,
+            requires_sources=result.requires_sources,
+            standalone=result.standalone_query[:100],
+        )
+
+        return result
+
+    except Exception as e:
+        logger.error("Classification failed, using fallback", error=str(e))
+
+        # Fallback to safe defaults
+        return QueryClassification(
+            reasoning="Classification failed, using safe defaults",
+            query_type="factual",
+            standalone_query=query,
+            suggested_mode="web",
+            requires_sources=True,
+            time_sensitive=False,
+        )
+
+
+async def plan_search(
+    query: str,
+    chat_history: list[dict[str, str]],
+    llm: any,
+    max_queries: int = 3,
+) -> SearchPlan:
+    """
+    Classify the query and propose the first search queries in a single LLM call.
+
+    Replaces classify_query followed by the research agent's first planning
+    step, so the first searches can start one LLM round-trip earlier.
+
+    Args:
+        query: User's current question
+        chat_history: Previous messages [{"role": "user|assistant", "content": "..."}]
+        llm: LLM instance with structured output support
+        max_queries: Max search queries to return
+
+    Returns:
+        SearchPlan with routing decision and search queries
+    """
+    system_prompt, user_prompt = _classification_prompts(query, chat_history)
+    system_prompt += f"""
+Also return search_queries: the first {max_queries} web search queries to run for this query.
+- Concise keywords (not full sentences), in the same language as the query
+- Preserve the core meaning and key terms; each query covers a different aspect
+- Return an empty list if suggested_mode is 'chat'
+"""
+
+    try:
+        structured_llm = llm.with_structured_output(SearchPlan, method="function_calling")
+        with cache_scope("plan_search", allow_nondeterministic=True):
+            result = await structured_llm.ainvoke(
+                [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+            )
+        result.search_queries = [q.strip() for q in result.search_queries if q and q.strip()][:max_queries]
+
+        logger.info(
+            "Search planned",
+            query=query[:100],
+            type=result.query_type,
+            mode=result.suggested_mode,
+            search_queries=result.search_queries,
+        )
+        return result
+
+    except Exception as e:
+        logger.error("Search planning failed, using fallback", error=str(e))
+        return SearchPlan(
+            reasoning="Planning failed, using safe defaults",
+            query_type="factual",
+            standalone_query=query,
+            suggested_mode="web",
+            requires_sources=True,
+            time_sensitive=False,
+            search_queries=[query],
+        )
+
+
+def _classification_prompts(query: str, chat_history: list[dict[str, str]]) -> tuple[str, str]:
+    """Build the system and user prompts shared by classify_query and plan_search."""
     current_date = datetime.now().strftime("%Y-%m-%d")
 
     system_prompt = f"""You are a query classifier that routes questions to the appropriate search mode.
@@ -113,39 +224,7 @@ Current query: {query}
 
 Classify this query and provide routing decision."""
 
-    try:
-        # Use structured output
-        structured_llm = llm.with_structured_output(
-            QueryClassification, method="function_calling"
-        )
-
-        result = await structured_llm.ainvoke(
-            [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
-        )
-
-        logger.info(
-            "Query classified",
-            query=query[:100],
-            type=result.query_type,
-            mode=result.suggested_mode,
-            requires_sources=result.requires_sources,
-            standalone=result.standalone_query[:100],
-        )
-
-        return result
-
-    except Exception as e:
-        logger.error("Classification failed, using fallback", error=str(e))
-
-        # Fallback to safe defaults
-        return QueryClassification(
-            reasoning="Classification failed, using safe defaults",
-            query_type="factual",
-            standalone_query=query,
-            suggested_mode="web",
-            requires_sources=True,
-            time_sensitive=False,
-        )
+    return system_prompt, user_prompt
 
 
 # ==================== Helper Functions ====================
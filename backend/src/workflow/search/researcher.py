@@ -5,7 +5,7 @@ Two-stage architecture: Researcher (gather info) → Writer (synthesize answer).
 
 import json
 import structlog
-from typing import Any
+from typing import Any, Awaitable
 from pydantic import BaseModel, Field
 
 from src.workflow.search.actions import ActionRegistry
@@ -266,10 +266,16 @@ async def research_agent(
     scraper: Any,
     stream: Any,
     chat_history: list[dict] = None,
+    initial_queries: list[str] | None = None,
+    initial_search: Awaitable[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """
     Run research agent with action loop.
 
+    When initial_queries come from a fused planning call (plan_search), they
+    stand in for the agent's first web_search step: the search results are
+    seeded into the agent history and count as the first iteration.
+
     Args:
         query: User query
         classification: Query classification result
@@ -279,6 +285,8 @@ async def research_agent(
         scraper: Web scraper instance
         stream: Streaming generator for progress updates
         chat_history: Chat history for context
+        initial_queries: Queries of an already planned first web_search
+        initial_search: Pending web_search result for initial_queries (started by the caller)
 
     Returns:
         Dict with:
@@ -362,6 +370,43 @@ async def research_agent(
         "content": f"{history_context}\n\n**Current user query:** {standalone_query}"
     })
 
+    # Seed the planned first search as if the agent had called web_search itself
+    start_iteration = 0
+    if initial_queries:
+        try:
+            if initial_search is None:
+                initial_search = ActionRegistry.execute(
+                    "web_search",
+                    {"queries": initial_queries},
+                    {
+                        "search_provider": search_provider,
+                        "scraper": scraper,
+                        "stream": stream,
+                        "llm": llm,
+                        "mode": mode,
+                        "agent_id": "researcher",
+                        "original_query": original_query,
+                    },
+                )
+            result = await initial_search
+            sources.extend(result.get("results", []))
+            agent_history.append({
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {"name": "web_search", "args": {"queries": initial_queries}, "id": "call_plan_0", "type": "tool_call"}
+                ],
+            })
+            agent_history.append({
+                "role": "tool",
+                "content": _format_tool_output("web_search", result),
+                "tool_call_id": "call_plan_0",
+            })
+            start_iteration = 1
+            logger.info("Seeded planned search", queries=initial_queries, results_count=len(result.get("results", [])))
+        except Exception as e:
+            logger.warning("Planned search failed, agent will search itself", error=str(e))
+
     logger.info(
         "Starting research",
         mode=mode,
@@ -370,7 +415,8 @@ async def research_agent(
     )
 
     # Research loop
-    for iteration in range(max_iterations):
+    iteration = start_iteration
+    for iteration in range(start_iteration, max_iterations):
         try:
             # Get researcher prompt for current iteration - pass original query to ensure key terms are preserved
             system_prompt = get_researcher_prompt(mode, iteration, max_iterations, original_query=query)
@@ -809,28 +855,8 @@ async def research_agent(
                     elif tool_name == "scrape_url" and "scraped" in result:
                         scraped_content.extend(result["scraped"])
 
-                    # Format result for LLM to see - make it readable
-                    # For web_search, show titles and snippets so LLM can see what was found
-                    # CRITICAL: Show ALL results (up to 15) so agent can see ai.meta.com, huggingface.co, etc.
-                    # Not just top 5, because authoritative sources might be ranked lower
-                    if tool_name == "web_search" and "results" in result:
-                        all_results = result.get("results", [])
-                        formatted_output = {
-                            "results_count": len(all_results),
-                            "results": [
-                                {
-                                    "title": r.get("title", ""),
-                                    "url": r.get("url", ""),
-                                    "snippet": r.get("snippet", "")[:200]  # Truncate for readability
-                                }
-                                for r in all_results[:15]  # Show top 15 results so agent sees authoritative sources
-                            ],
-                            "note": f"Total {len(all_results)} results found. When calling select_urls_to_scrape, pass ALL {len(all_results)} results, not just the first few!"
-                        }
-                        output_str = json.dumps(formatted_output, ensure_ascii=False, indent=2)
-                    else:
-                        output_str = json.dumps(result, ensure_ascii=False, indent=2)
-                    
+                    output_str = _format_tool_output(tool_name, result)
+
                     return {
                         "tool_call_id": tool_call_id,
                         "output": output_str
@@ -918,3 +944,26 @@ async def research_agent(
         "scraped_content": scraped_content,
         "reasoning_history": reasoning_history
     }
+
+
+def _format_tool_output(tool_name: str, result: Any) -> str:
+    """Render an action result as the ToolMessage content the agent sees."""
+    # For web_search, show titles and snippets so LLM can see what was found
+    # CRITICAL: Show ALL results (up to 15) so agent can see ai.meta.com, huggingface.co, etc.
+    # Not just top 5, because authoritative sources might be ranked lower
+    if tool_name == "web_search" and "results" in result:
+        all_results = result.get("results", [])
+        formatted_output = {
+            "results_count": len(all_results),
+            "results": [
+                {
+                    "title": r.get("title", ""),
+                    "url": r.get("url", ""),
+                    "snippet": r.get("snippet", "")[:200]  # Truncate for readability
+                }
+                for r in all_results[:15]  # Show top 15 results so agent sees authoritative sources
+            ],
+            "note": f"Total {len(all_results)} results found. When calling select_urls_to_scrape, pass ALL {len(all_results)} results, not just the first few!"
+        }
+        return json.dumps(formatted_output, ensure_ascii=False, indent=2)
+    return json.dumps(result, ensure_ascii=False, indent=2)
@@ -10,6 +10,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from src.llm.streaming import stream_text
 from src.workflow.search.classifier import get_current_date, format_chat_history
 
 logger = structlog.get_logger(__name__)
@@ -396,13 +397,13 @@ Remember: CITE EVERY FACT. Return ONLY your answer in markdown format. Do NOT re
             note="Using simple llm.ainvoke() like DeepSearchNode to preserve markdown formatting"
         )
 
-        result = await llm.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
-        ])
-
-        # CRITICAL: Get answer directly from LLM response (like DeepSearchNode)
-        final_answer = result.content if hasattr(result, 'content') else str(result)
+        # Tokens go to the client as they are generated; the cleaned-up answer
+        # below is sent afterwards as the final report
+        final_answer = await stream_text(
+            llm,
+            [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)],
+            stream,
+        )
         
         # CRITICAL: Log EXACTLY what LLM returned - BEFORE any processing
         if final_answer:
@@ -844,7 +845,6 @@ Remember: CITE EVERY FACT. Return ONLY your answer in markdown format. Do NOT re
             "Answer synthesized",
             length=len(final_answer),
             sources=len(unique_sources),
-            confidence=result.confidence,
             newline_count=final_newline_count,
             has_newlines=final_has_newlines,
             has_markdown_headings=bool(re.search(r'^#{2,}\s+', final_answer, re.MULTILINE)),
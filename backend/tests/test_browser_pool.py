@@ -0,0 +1,154 @@
+"""Tests for the shared Playwright browser pool (with a fake browser)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.chat.service import ChatSearchService
+from src.config.settings import Settings
+from src.embeddings.hashing_provider import HashingEmbeddingProvider
+from src.search.browser_pool import BrowserPool
+
+
+class _Page:
+    def __init__(self, state):
+        self.state = state
+
+    def set_default_timeout(self, ms):
+        self.timeout = ms
+
+    def set_default_navigation_timeout(self, ms):
+        self.navigation_timeout = ms
+
+    async def close(self):
+        self.state["open_pages"] -= 1
+
+
+class _Context:
+    def __init__(self, state):
+        self.state = state
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+    async def new_page(self):
+        self.state["open_pages"] += 1
+        self.state["peak_pages"] = max(self.state["peak_pages"], self.state["open_pages"])
+        return _Page(self.state)
+
+    async def close(self):
+        self.closed = True
+
+
+class _Browser:
+    def __init__(self, state):
+        self.state = state
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        return _Context(self.state)
+
+    async def close(self):
+        self.connected = False
+
+
+def _pool(state, **kwargs):
+    async def launcher(playwright):
+        state["launches"] += 1
+        state["browser"] = _Browser(state)
+        return playwright or "playwright", state["browser"]
+
+    return BrowserPool(launcher=launcher, **kwargs)
+
+
+def _state():
+    return {"launches": 0, "open_pages": 0, "peak_pages": 0}
+
+
+@pytest.mark.asyncio
+async def test_renders_share_one_browser_with_bounded_pages():
+    """Many renders launch the browser once, never exceed max_pages and recycle contexts."""
+    state = _state()
+    pool = _pool(state, max_pages=3, context_max_uses=4)
+
+    async def render():
+        async with pool.page():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[render() for _ in range(12)])
+
+    assert state["launches"] == 1
+    assert state["peak_pages"] == 3 and state["open_pages"] == 0
+    assert pool.stats["renders"] == 12
+    assert pool.stats["contexts"] == 3
+    await asyncio.gather(*[render() for _ in range(3)])
+    assert pool.stats["contexts"] == 6
+
+
+@pytest.mark.asyncio
+async def test_crashed_browser_is_relaunched_and_failed_contexts_dropped():
+    """A disconnected browser is relaunched on the next render; a failed render's context is not reused."""
+    state = _state()
+    pool = _pool(state, max_pages=2)
+
+    with pytest.raises(RuntimeError):
+        async with pool.page():
+            raise RuntimeError("Target closed")
+    async with pool.page():
+        pass
+    assert pool.stats["contexts"] == 2 and pool.stats["failures"] == 1
+
+    state["browser"].connected = False
+    async with pool.page():
+        pass
+
+    assert state["launches"] == 2
+    assert pool.stats["contexts"] == 3
+    await pool.close()
+    assert not state["browser"].connected
+
+
+@pytest.mark.asyncio
+async def test_blocked_resource_types_are_aborted():
+    """Image, font and media requests are aborted; documents and scripts continue."""
+    pool = _pool(_state())
+    actions = []
+
+    def route(resource_type):
+        async def abort():
+            actions.append(("abort", resource_type))
+
+        async def continue_():
+            actions.append(("continue", resource_type))
+
+        return SimpleNamespace(request=SimpleNamespace(resource_type=resource_type), abort=abort, continue_=continue_)
+
+    for resource_type in ("document", "image", "script", "font", "media"):
+        await pool._route(route(resource_type))
+
+    assert [kind for action, kind in actions if action == "abort"] == ["image", "font", "media"]
+    assert pool.stats["blocked_requests"] == 3
+
+
+@pytest.mark.asyncio
+async def test_chat_service_close_shuts_down_the_browser():
+    """The chat service owns the scraper's browser pool and closes the browser on shutdown."""
+    settings = Settings(
+        llm_mode="mock", search_provider="mock", search_cache_enabled=False, page_cache_enabled=False,
+        llm_cache_enabled=False,
+    )
+    service = ChatSearchService(settings, None, HashingEmbeddingProvider(dimension=8))
+    state = _state()
+    service.browser_pool._launcher = _pool(state)._launcher
+    assert service.scraper.browser_pool is service.browser_pool
+
+    async with service.browser_pool.page():
+        pass
+    await service.close()
+
+    assert state["launches"] == 1 and not state["browser"].connected
@@ -0,0 +1,48 @@
+"""Tests for micro-batching of concurrent embed_text calls."""
+
+import asyncio
+
+import pytest
+
+from src.embeddings.coalescer import CoalescingEmbeddingProvider
+from src.embeddings.mock_provider import MockEmbeddingProvider
+
+
+class _CountingProvider(MockEmbeddingProvider):
+    def __init__(self, fail: bool = False):
+        super().__init__(dimension=2)
+        self.batches = []
+        self.fail = fail
+
+    async def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("provider down")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_batch():
+    """Concurrent embed_text calls become one deduplicated embed_batch call."""
+    inner = _CountingProvider()
+    provider = CoalescingEmbeddingProvider(inner, window_ms=20, max_batch_size=64)
+
+    results = await asyncio.gather(*[provider.embed_text(text) for text in ["a", "bb", "a", "ccc"]])
+
+    assert results == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [3.0, 1.0]]
+    assert inner.batches == [["a", "bb", "ccc"]]
+    assert provider.get_stats() == {"requests": 4, "provider_calls": 1, "saved_calls": 3}
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_flushes_and_errors_propagate():
+    """A full batch flushes without waiting for the window and failures reach every caller."""
+    inner = _CountingProvider(fail=True)
+    provider = CoalescingEmbeddingProvider(inner, window_ms=10_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(provider.embed_text("x"), provider.embed_text("y"), return_exceptions=True), timeout=1
+    )
+
+    assert [str(result) for result in results] == ["provider down", "provider down"]
+    assert inner.batches == [["x", "y"]]
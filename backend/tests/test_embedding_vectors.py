@@ -0,0 +1,45 @@
+"""Tests for the float32 embedding array path."""
+
+import numpy as np
+import pytest
+
+from src.embeddings.base import EmbeddingProvider
+from src.embeddings.vectors import fit_dimension
+
+
+class _ListProvider(EmbeddingProvider):
+    def __init__(self, dimension):
+        self.dimension = dimension
+
+    async def embed_text(self, text):
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts):
+        return [[float(i)] * self.dimension for i, _ in enumerate(texts)]
+
+    def get_dimension(self):
+        return self.dimension
+
+
+def test_fit_dimension_pads_and_renormalizes_truncation():
+    """Batches are zero-padded or truncated to unit length; matching float32 input is not copied."""
+    batch = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+    assert fit_dimension(batch, 3) is batch
+    assert fit_dimension(batch, 5).tolist() == [[0, 1, 2, 0, 0], [3, 4, 5, 0, 0]]
+    np.testing.assert_allclose(fit_dimension(batch, 2), [[0.0, 1.0], [0.6, 0.8]])
+    np.testing.assert_allclose(fit_dimension([0.0, 0.0, 1.0], 2), [0.0, 0.0])
+    assert fit_dimension([1.0, 2.0], 3).dtype == np.float32
+    assert fit_dimension([], 4).shape == (0, 4)
+
+
+@pytest.mark.asyncio
+async def test_default_embed_batch_array_converts_lists():
+    """Providers without a native array path still return a (n, dim) float32 array."""
+    provider = _ListProvider(dimension=3)
+
+    array = await provider.embed_batch_array(["a", "b"])
+
+    assert array.dtype == np.float32 and array.flags.c_contiguous
+    assert array.tolist() == [[0.0] * 3, [1.0] * 3]
+    assert (await provider.embed_batch_array([])).shape == (0, 3)
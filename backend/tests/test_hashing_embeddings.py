@@ -0,0 +1,43 @@
+"""Tests for the feature-hashing offline embedding provider."""
+
+import numpy as np
+import pytest
+
+from src.embeddings.hashing_provider import HashingEmbeddingProvider
+
+
+@pytest.mark.asyncio
+async def test_hashing_embeddings_are_deterministic_normalized_and_similarity_aware():
+    """Similar texts score higher than unrelated ones; output is unit length and repeatable."""
+    provider = HashingEmbeddingProvider(dimension=256)
+    texts = [
+        "Vector databases store embeddings for similarity search",
+        "Embedding vectors are stored in a vector database for similarity searching",
+        "The recipe needs two eggs and a cup of flour",
+        "",
+    ]
+
+    vectors = await provider.embed_batch_array(texts)
+
+    assert vectors.shape == (4, 256) and vectors.dtype == np.float32
+    np.testing.assert_allclose(np.linalg.norm(vectors[:3], axis=1), 1.0, rtol=1e-5)
+    assert not vectors[3].any()
+    assert vectors[0] @ vectors[1] > 0.5
+    assert vectors[0] @ vectors[1] > 3 * abs(vectors[0] @ vectors[2])
+    assert await provider.embed_text(texts[0]) == vectors[0].tolist()
+    assert (await HashingEmbeddingProvider(dimension=256).embed_batch(texts[:1]))[0] == vectors[0].tolist()
+
+
+@pytest.mark.asyncio
+async def test_unrelated_texts_have_near_zero_mean_similarity():
+    """Hash collisions cancel on average, so unrelated texts are not biased towards positive similarity."""
+    rng = np.random.default_rng(0)
+    alphabet = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    texts = [
+        " ".join("".join(rng.choice(alphabet, size=rng.integers(3, 9))) for _ in range(30)) for _ in range(200)
+    ]
+
+    vectors = await HashingEmbeddingProvider(dimension=256).embed_batch_array(texts)
+
+    similarities = (vectors @ vectors.T)[np.triu_indices(len(texts), k=1)]
+    assert abs(similarities.mean()) < 0.02
@@ -0,0 +1,106 @@
+"""Tests for hedged multi-provider search."""
+
+import asyncio
+
+import pytest
+
+from src.search.hedged import HedgedSearchProvider, LatencyHistogram
+from src.search.mock_provider import MockSearchProvider
+from src.search.models import SearchResponse, SearchResult
+
+
+class _Provider(MockSearchProvider):
+    def __init__(self, delay: float, domains: int = 5, fail: bool = False):
+        self.delay = delay
+        self.domains = domains
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def search(self, query, max_results=10):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError("upstream down")
+        results = [
+            SearchResult(title=f"r{i}", url=f"https://site{i % self.domains}.org/{i}", snippet="s")
+            for i in range(max_results)
+        ]
+        return SearchResponse(query=query, results=results, total_results=len(results))
+
+
+def _hedged(primary, secondary, **kwargs):
+    return HedgedSearchProvider(primary, secondary, "searxng", "tavily", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """A good primary answer within the hedge delay never reaches the secondary."""
+    primary, secondary = _Provider(0.0), _Provider(0.0)
+    hedged = _hedged(primary, secondary, initial_delay=0.2)
+
+    response = await hedged.search("q", max_results=6)
+
+    assert len(response.results) == 6
+    assert secondary.calls == 0
+    assert hedged.stats["searxng_wins"] == 1 and hedged.stats["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_loses_to_hedge_and_is_cancelled():
+    """After the hedge delay the secondary is raced and the slower request is cancelled."""
+    primary, secondary = _Provider(1.0), _Provider(0.01)
+    hedged = _hedged(primary, secondary, initial_delay=0.02)
+
+    response = await hedged.search("q", max_results=6)
+    await asyncio.sleep(0)
+
+    assert len(response.results) == 6
+    assert primary.cancelled == 1
+    assert hedged.stats["tavily_wins"] == 1 and hedged.stats["hedged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_poor_or_failed_primary_hedges_immediately():
+    """Results failing the quality checks, or errors, trigger the hedge without waiting."""
+    for primary in (_Provider(0.0, domains=1), _Provider(0.0, fail=True)):
+        secondary = _Provider(0.0)
+        hedged = _hedged(primary, secondary, initial_delay=10.0)
+
+        response = await asyncio.wait_for(hedged.search("q", max_results=6), timeout=1.0)
+
+        assert len({r.url.split("/")[2] for r in response.results}) == 5
+        assert hedged.stats["tavily_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_tracks_primary_quantile():
+    """Once enough samples exist, the delay is the clamped primary p90."""
+    hedged = _hedged(_Provider(0.0), _Provider(0.0), min_samples=10, min_delay=0.1, max_delay=2.0)
+    assert hedged.hedge_delay() == 1.0
+
+    histogram = hedged.histograms["searxng"]
+    for ms in range(100, 1100, 100):
+        histogram.observe(ms / 1000)
+    assert hedged.hedge_delay() == 1.0
+    for _ in range(10):
+        histogram.observe(0.3)
+    assert hedged.hedge_delay() == pytest.approx(0.9)
+    assert hedged.get_stats()["latency"]["searxng"]["count"] == 20
+
+
+def test_latency_histogram_buckets():
+    """Latencies land in the bucket of their upper bound."""
+    histogram = LatencyHistogram(window=2)
+    for seconds in (0.05, 0.1, 0.3, 12.0):
+        histogram.observe(seconds)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"]["le_100ms"] == 2
+    assert snapshot["buckets"]["le_500ms"] == 1
+    assert snapshot["buckets"]["gt_10000ms"] == 1
+    assert histogram.samples == 2
@@ -0,0 +1,85 @@
+"""Tests for per-host rate limiting and circuit breaking."""
+
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+from src.utils.host_limits import HostCircuitOpenError, HostLimiter
+
+
+async def _fail(limiter, url, error=None):
+    with pytest.raises(type(error or asyncio.TimeoutError())):
+        async with limiter.request(url):
+            raise error or asyncio.TimeoutError()
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_failures_and_probes_half_open():
+    """Consecutive failures open a host's circuit; after the reset timeout one probe decides."""
+    limiter = HostLimiter(rate=0, failure_threshold=3, reset_timeout=0.05)
+    url = "https://slow.example.org/page"
+
+    for _ in range(3):
+        await _fail(limiter, url)
+    with pytest.raises(HostCircuitOpenError):
+        async with limiter.request(url):
+            pass
+    async with limiter.request("https://other.example.org/"):
+        pass
+    assert limiter.get_stats()["slow.example.org"]["state"] == "open"
+
+    await asyncio.sleep(0.06)
+    await _fail(limiter, url)
+    assert limiter.get_stats()["slow.example.org"]["state"] == "open"
+
+    await asyncio.sleep(0.06)
+    async with limiter.request(url) as slot:
+        with pytest.raises(HostCircuitOpenError):
+            async with limiter.request(url):
+                pass
+        slot.record_status(200)
+    stats = limiter.get_stats()["slow.example.org"]
+    assert stats["state"] == "closed" and stats["opened"] == 2 and stats["rejected"] == 2
+
+
+@pytest.mark.asyncio
+async def test_only_host_failures_count():
+    """429/5xx and timeouts count as failures; 404s and parse errors do not."""
+    limiter = HostLimiter(rate=0, failure_threshold=2)
+    url = "https://news.example.com/a"
+
+    await _fail(limiter, url, aiohttp.ClientResponseError(None, (), status=404))
+    await _fail(limiter, url, ValueError("bad html"))
+    async with limiter.request(url) as slot:
+        slot.record_status(503)
+    assert limiter.get_stats()["news.example.com"]["consecutive_failures"] == 1
+
+    await _fail(limiter, url, aiohttp.ClientResponseError(None, (), status=429))
+    assert limiter.get_stats()["news.example.com"]["state"] == "open"
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_and_concurrency_cap():
+    """Requests beyond the burst wait for tokens, and in-flight requests per host are capped."""
+    limiter = HostLimiter(rate=50, burst=2, max_concurrency=2, failure_threshold=0)
+    url = "https://searx.local/search"
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter.request(url):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request() for _ in range(6)])
+    elapsed = time.perf_counter() - start
+
+    stats = limiter.get_stats()["searx.local"]
+    assert peak == 2
+    assert stats["throttled"] == 4 and stats["requests"] == 6
+    assert elapsed >= 0.07
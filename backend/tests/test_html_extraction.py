@@ -0,0 +1,55 @@
+"""Tests for the lxml extraction engine and its process pool."""
+
+import pytest
+
+from src.search.extraction import HTMLExtractor, extract_page
+
+ARTICLE = (
+    "<p>Retrieval systems rank passages by relevance, then pass the best ones, in order, to the model.</p>" * 6
+)
+PAGE = f"""<html><head><title>Ranking</title><script>track()</script></head><body>
+<header><nav><a href="/">Home</a><a href="/about">About</a></nav></header>
+<div class="sidebar"><ul><li><a href="https://ads.example/a">Sponsored offer one</a></li></ul></div>
+<div id="content"><h2>How ranking works</h2>{ARTICLE}<p>See <a href="https://paper.example/bm25">the paper</a>, twice.</p>
+<ul><li>first</li><li>second</li></ul><pre>score = bm25(q, d)</pre><img src="/fig.png"></div>
+<div class="comments"><p>Great post, thanks, really helpful, loved it, more please!</p></div>
+<footer>We use cookies to improve your experience.</footer></body></html>"""
+
+
+def test_main_content_drops_boilerplate_and_renders_markdown():
+    """The article container is chosen over navigation, sidebars, comments and footers, and rendered as markdown."""
+    page = extract_page(PAGE, "https://blog.example/ranking")
+
+    assert page.title == "Ranking"
+    assert page.content.startswith("How ranking works Retrieval systems")
+    for boilerplate in ("Home", "Sponsored", "Great post", "cookies", "track()"):
+        assert boilerplate not in page.content
+    assert page.markdown.startswith("## How ranking works\n\nRetrieval systems")
+    assert "[the paper](https://paper.example/bm25)" in page.markdown
+    assert "- first\n- second" in page.markdown
+    assert "```\nscore = bm25(q, d)\n```" in page.markdown
+    assert page.images == [] and page.links == []
+
+
+def test_media_only_when_requested_and_odd_inputs():
+    """Images and external links are collected on request; empty and XML-declared documents do not fail."""
+    page = extract_page(PAGE, "https://blog.example/ranking", extract_markdown=False, include_media=True)
+    assert page.markdown is None
+    assert page.images == ["https://blog.example/fig.png"]
+    assert page.links == ["https://ads.example/a", "https://paper.example/bm25"]
+
+    assert extract_page("", "https://blog.example").content == ""
+    declared = '<?xml version="1.0" encoding="utf-8"?><html><head><title>X</title></head><body><p>ok</p></body></html>'
+    assert extract_page(declared, "https://blog.example").content == "ok"
+
+
+@pytest.mark.asyncio
+async def test_large_pages_are_extracted_in_worker_processes():
+    """Pages above the inline limit go through the process pool and give the same result as inline extraction."""
+    extractor = HTMLExtractor(workers=1, inline_max_chars=100)
+    try:
+        pooled = await extractor.extract(PAGE, "https://blog.example/ranking")
+        assert extractor._executor is not None
+    finally:
+        extractor.close()
+    assert pooled == extract_page(PAGE, "https://blog.example/ranking")
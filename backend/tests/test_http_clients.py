@@ -0,0 +1,63 @@
+"""Tests for the shared HTTP client registry."""
+
+import pytest
+from aiohttp import web
+
+from src.search.scraper import WebScraper
+from src.search.searxng_provider import SearXNGSearchProvider
+from src.utils.http import HTTPClientRegistry
+
+
+async def _start_stub(peers: list) -> tuple[web.AppRunner, str]:
+    async def page(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername")[1])
+        html = "<html><title>Stub</title><body><p>Hello pool</p></body></html>"
+        return web.Response(text=html, content_type="text/html")
+
+    async def search(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"results": [{"title": "t", "url": "https://example.com/a", "content": "c"}]})
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    app.router.add_get("/search", search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_components_reuse_pooled_connections():
+    """Scraper and search provider share one kept-alive connection to the same host."""
+    peers = []
+    runner, base_url = await _start_stub(peers)
+    http_clients = HTTPClientRegistry(limit_per_host=1)
+    scraper = WebScraper(http_clients=http_clients)
+    provider = SearXNGSearchProvider(instance_url=base_url, http_clients=http_clients)
+    try:
+        for _ in range(3):
+            scraped = await scraper.scrape(f"{base_url}/page")
+            response = await provider.search("pool")
+        await scraper.close()
+        await provider.close()
+        assert not http_clients.session("scraper").closed
+    finally:
+        await http_clients.close()
+        await runner.cleanup()
+
+    assert scraped.title == "Stub" and response.results
+    assert len(peers) == 6 and len(set(peers)) == 1
+
+
+@pytest.mark.asyncio
+async def test_private_registry_is_closed_with_component():
+    """A component without an injected registry owns and closes its own sessions."""
+    scraper = WebScraper()
+    session = scraper.http_clients.session("scraper")
+
+    await scraper.close()
+
+    assert session.closed
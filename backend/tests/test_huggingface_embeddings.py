@@ -0,0 +1,47 @@
+"""Tests for the queued single-worker HuggingFace embedding provider."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+import src.embeddings.huggingface_provider as hf
+
+
+class _FakeSentenceTransformer:
+    def __init__(self, name):
+        self.calls = []
+        self.threads = set()
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size, show_progress_bar, convert_to_numpy):
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_merged_sorted_and_returned_in_order(monkeypatch):
+    """Concurrent requests share one length-sorted encode call on the dedicated thread."""
+    monkeypatch.setattr(hf, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(hf, "SentenceTransformer", _FakeSentenceTransformer, raising=False)
+    provider = hf.HuggingFaceEmbeddingProvider(model="fake")
+
+    await provider.warm_up()
+    results = await asyncio.gather(
+        provider.embed_batch(["a", "ccc"]),
+        provider.embed_text("bb"),
+        provider.embed_batch_array(["dddd", "e"]),
+    )
+    await provider.close()
+
+    assert results[0] == [[1.0, 1.0], [3.0, 1.0]]
+    assert results[1] == [2.0, 1.0]
+    assert results[2].tolist() == [[4.0, 1.0], [1.0, 1.0]]
+    # One warm-up call plus one merged call, longest texts first
+    assert provider.model.calls[1] == ["dddd", "ccc", "bb", "a", "e"]
+    assert provider.model.threads == {"hf-embed_0"}
+    assert provider.get_stats()["texts_encoded"] == 8 + 5
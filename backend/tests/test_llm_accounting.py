@@ -0,0 +1,89 @@
+"""Tests for per-session LLM token and latency accounting."""
+
+import openai
+import pytest
+
+import src.llm.accounting as accounting
+from src.llm.accounting import UsageTracker, usage_scope
+from src.llm.cache import LLMResponseCache, ModelCache, cache_scope
+from src.llm.mock import MockChatModel
+from src.workflow.research.graph import _tracked_node
+from src.workflow.research.nodes import runtime_deps_context
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = UsageTracker()
+    monkeypatch.setattr(accounting, "_tracker", tracker)
+    return tracker
+
+
+class _Stream:
+    def __init__(self):
+        self.usage = []
+
+    def emit_usage(self, usage):
+        self.usage.append(usage)
+
+
+@pytest.mark.asyncio
+async def test_calls_are_aggregated_by_node_agent_and_site(tracker):
+    """Reported token usage is summed per session, node, agent and call site."""
+    llm = MockChatModel(callbacks=[tracker.callback_handler])
+
+    with usage_scope(session_id="s1", node="execute_agents"):
+        with usage_scope(agent_id="agent_1"):
+            await llm.ainvoke("Summarize the following source: one two three")
+            with cache_scope("summarize"):
+                await llm.ainvoke("Summarize the following source: four five")
+        await llm.ainvoke("plain question")
+    await llm.ainvoke("outside any session")
+
+    usage = tracker.get_session("s1")
+    assert usage["totals"]["calls"] == 3
+    assert usage["nodes"]["execute_agents"]["calls"] == 3
+    assert usage["agents"]["agent_1"]["calls"] == 2
+    assert set(usage["sites"]) == {"agent", "summarize"}
+    assert usage["totals"]["total_tokens"] == usage["totals"]["prompt_tokens"] + usage["totals"]["completion_tokens"]
+    assert usage["totals"]["prompt_tokens"] > 0 and usage["totals"]["estimated_calls"] == 0
+    assert usage["agents"]["agent_1"]["wall_ms"] >= 0
+    assert tracker.get_stats()["totals"]["calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_errors_add_no_tokens(tracker):
+    """Cached responses and failed calls are counted without tokens."""
+    store = LLMResponseCache()
+    llm = MockChatModel(cache=ModelCache(store, deterministic=True), callbacks=[tracker.callback_handler])
+    failing = MockChatModel(failure_rate=1.0, callbacks=[tracker.callback_handler])
+
+    with usage_scope(session_id="s2"):
+        await llm.ainvoke("hello")
+        first_tokens = tracker.get_session("s2")["totals"]["total_tokens"]
+        await llm.ainvoke("hello")
+        with pytest.raises(openai.InternalServerError):
+            await failing.ainvoke("hello")
+
+    totals = tracker.get_session("s2")["totals"]
+    assert totals["calls"] == 3
+    assert totals["cached_calls"] == 1
+    assert totals["errors"] == 1
+    assert totals["total_tokens"] == first_tokens
+
+
+@pytest.mark.asyncio
+async def test_tracked_node_streams_running_totals(tracker):
+    """Graph nodes record their wall time and emit the session usage after running."""
+    llm = MockChatModel(callbacks=[tracker.callback_handler])
+    stream = _Stream()
+    runtime_deps_context.set({"stream": stream})
+
+    async def node(state):
+        await llm.ainvoke("plan the research")
+        return {"done": True}
+
+    result = await _tracked_node("plan_research", node)({"session_id": "s3"})
+
+    assert result == {"done": True}
+    assert stream.usage[-1]["nodes"]["plan_research"]["calls"] == 1
+    assert stream.usage[-1]["nodes"]["plan_research"]["wall_ms"] >= stream.usage[-1]["nodes"]["plan_research"]["llm_ms"]
@@ -0,0 +1,70 @@
+"""Tests for the exact-match LLM response cache."""
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.llm.cache import LLMResponseCache, ModelCache, cache_scope
+from src.llm.mock import MockChatModel
+
+
+class _CountingModel(MockChatModel):
+    calls: int = 0
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_hit_cache_and_persist(tmp_path):
+    """A repeated request is served from memory, and from disk after a restart."""
+    path = str(tmp_path / "llm_cache.db")
+    store = LLMResponseCache(path=path)
+    model = _CountingModel(cache=ModelCache(store, deterministic=True))
+    messages = [HumanMessage(content="Summarize the following source: abc")]
+
+    first = await model.ainvoke(messages)
+    second = await model.ainvoke(messages)
+    await model.ainvoke(messages, stop=["\n"])
+
+    assert first.content == second.content
+    assert model.calls == 2
+    store.close()
+
+    restarted = _CountingModel(cache=ModelCache(LLMResponseCache(path=path), deterministic=True))
+    assert (await restarted.ainvoke(messages)).content == first.content
+    assert restarted.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_nondeterministic_models_need_opt_in():
+    """Temperature > 0 models bypass the cache unless the call site opts in."""
+    store = LLMResponseCache()
+    model = _CountingModel(cache=ModelCache(store, deterministic=False))
+    messages = [HumanMessage(content="hello")]
+
+    await model.ainvoke(messages)
+    await model.ainvoke(messages)
+    with cache_scope("title", allow_nondeterministic=True):
+        await model.ainvoke(messages)
+        await model.ainvoke(messages)
+
+    assert model.calls == 3
+    stats = store.get_stats()
+    assert stats["unscoped"]["bypassed"] == 2
+    assert stats["title"] == {"hits": 1, "misses": 1, "bypassed": 0, "hit_rate": 0.5}
+
+
+def test_ttl_and_size_limits(tmp_path, monkeypatch):
+    """Expired entries are dropped and the memory tier evicts least recently used keys."""
+    store = LLMResponseCache(path=str(tmp_path / "c.db"), ttl_seconds=10, memory_max_entries=2)
+    now = 1000.0
+    monkeypatch.setattr("src.llm.cache.time.time", lambda: now)
+
+    for key in ["a", "b", "c"]:
+        store.put(key, [{"message": key}])
+    assert list(store._memory) == ["b", "c"]
+    assert store.get("a") == [{"message": "a"}]  # Reloaded from disk
+
+    now = 1011.0
+    assert store.get("b") is None
@@ -0,0 +1,81 @@
+"""Tests for the process-wide LLM scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.llm.factory import ScheduledMockChatModel
+from src.llm.scheduler import LLMPriority, LLMScheduler, llm_priority
+
+
+@pytest.mark.asyncio
+async def test_waiting_calls_are_served_by_priority():
+    """With one slot busy, queued calls run in priority order, FIFO within a class."""
+    scheduler = LLMScheduler(default_concurrency=1)
+    order = []
+    release = asyncio.Event()
+
+    async def call(name, priority):
+        with llm_priority(priority):
+            async with scheduler.slot("openai", tokens=10):
+                order.append(name)
+                if name == "first":
+                    await release.wait()
+
+    first = asyncio.create_task(call("first", LLMPriority.AGENT))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(call(name, priority))
+        for name, priority in [
+            ("title", LLMPriority.TITLE),
+            ("agent", LLMPriority.AGENT),
+            ("chat", LLMPriority.INTERACTIVE),
+            ("summary", LLMPriority.SUMMARIZATION),
+            ("chat2", LLMPriority.INTERACTIVE),
+        ]
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    assert order == ["first", "chat", "chat2", "agent", "summary", "title"]
+    stats = scheduler.get_stats()["openai"]
+    assert stats["interactive"]["requests"] == 2
+    assert stats["title"]["max_wait_ms"] >= stats["interactive"]["max_wait_ms"]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_calls():
+    """A call waits until the tokens-per-minute bucket refills enough for its estimate."""
+    scheduler = LLMScheduler(default_concurrency=4, tokens_per_minute_limits={"openai": 6000})
+
+    start = time.monotonic()
+    async with scheduler.slot("openai", tokens=6000):
+        pass
+    async with scheduler.slot("openai", tokens=10):  # 10 tokens refill in 0.1s
+        pass
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_scheduled_model_limits_concurrency():
+    """Models with a scheduler attached never exceed the provider's concurrency."""
+    scheduler = LLMScheduler(default_concurrency=2)
+    model = ScheduledMockChatModel().attach_scheduler(scheduler, "mock")
+    peak = 0
+
+    original = scheduler._queue("mock").acquire
+
+    async def tracking_acquire(priority, tokens):
+        nonlocal peak
+        await original(priority, tokens)
+        peak = max(peak, scheduler._queue("mock").active)
+
+    scheduler._queue("mock").acquire = tracking_acquire
+    results = await asyncio.gather(*[model.ainvoke("hello") for _ in range(6)])
+
+    assert len(results) == 6
+    assert peak <= 2
+    assert scheduler.get_stats()["mock"]["agent"]["requests"] == 6
@@ -0,0 +1,177 @@
+"""Tests for streaming LLM output into report chunks."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import BaseModel
+
+from src.llm.mock import MockChatModel
+from src.llm.streaming import stream_structured, stream_text
+from src.streaming.sse import ResearchStreamingGenerator
+from src.workflow.research.nodes.report import GenerateReportNode
+from src.workflow.search.writer import writer_agent
+
+
+class _Stream:
+    def __init__(self):
+        self.chunks = []
+        self.report_streamed = False
+
+    def emit_report_chunk(self, chunk):
+        self.chunks.append(chunk)
+
+    def emit_status(self, message, step=None):
+        pass
+
+
+class _Section(BaseModel):
+    title: str
+    content: str
+
+
+class _Report(BaseModel):
+    executive_summary: str
+    sections: list[_Section]
+    conclusion: str
+
+
+class _ToolStreamingModel(MockChatModel):
+    """Streams one forced tool call as small JSON argument fragments."""
+
+    def bind_tools(self, tools, tool_choice=None, **kwargs):
+        return self.bind(**kwargs)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        args = json.dumps({
+            "executive_summary": "Batteries are improving.",
+            "sections": [{"title": "Cost", "content": "Prices fell."}, {"title": "Safety", "content": "Fewer fires."}],
+            "conclusion": "Adoption will grow.",
+        })
+        for i in range(0, len(args), 7):
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {"name": "_Report" if i == 0 else None, "args": args[i : i + 7], "id": "call_1", "index": 0}
+                    ],
+                )
+            )
+
+
+@pytest.mark.asyncio
+async def test_stream_text_forwards_tokens():
+    """Text answers are forwarded while generating and returned in full."""
+    stream = _Stream()
+    llm = MockChatModel(token_latency=0.001)
+
+    answer = await stream_text(llm, ["Summarize the following source: a b c d"], stream, flush_interval=0)
+
+    assert "".join(stream.chunks) == answer
+    assert len(stream.chunks) > 1
+    assert stream.report_streamed
+
+
+@pytest.mark.asyncio
+async def test_stream_structured_renders_partial_report():
+    """Partial tool-call arguments are rendered incrementally and validated at the end."""
+    stream = _Stream()
+    node = GenerateReportNode.__new__(GenerateReportNode)
+
+    report = await stream_structured(
+        _ToolStreamingModel(),
+        _Report,
+        ["write the report"],
+        render=lambda args: node._render_partial_report(args, "batteries"),
+        stream=stream,
+        flush_interval=0,
+    )
+
+    assert report.sections[1].title == "Safety"
+    assert len(stream.chunks) > 5
+    assert "".join(stream.chunks) == node._render_partial_report(report.model_dump(), "batteries")
+
+
+class _NoToolsModel(MockChatModel):
+    """Model without tool binding that answers with fenced JSON text."""
+
+    def bind_tools(self, tools, tool_choice=None, **kwargs):
+        raise NotImplementedError
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        report = {"executive_summary": "Short.", "sections": [{"title": "A", "content": "B"}], "conclusion": "End."}
+        message = AIMessage(content=f"Here it is:\n```json\n{json.dumps(report)}\n```")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@pytest.mark.asyncio
+async def test_stream_structured_falls_back_without_tools():
+    """Models without tool binding are asked for JSON in a blocking call, parsed into the schema."""
+    stream = _Stream()
+
+    report = await stream_structured(_NoToolsModel(), _Report, ["x"], render=lambda args: "", stream=stream)
+
+    assert report.sections[0].title == "A" and report.conclusion == "End."
+    assert stream.chunks == [] and not stream.report_streamed
+
+
+class _Session:
+    """Async DB session stand-in: the chat exists, no message does; added rows are collected."""
+
+    def __init__(self, added):
+        self.added = added
+        self.lookups = iter([SimpleNamespace(updated_at=None), None])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        row = next(self.lookups)
+        return SimpleNamespace(scalar_one_or_none=lambda: row)
+
+    def add(self, row):
+        self.added.append(row.content)
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_final_report_is_persisted_instead_of_streamed_chunks():
+    """The cleaned final report is saved, not the raw streamed tokens of earlier attempts."""
+    saved = []
+    stream = ResearchStreamingGenerator(
+        session_id="s1", app_state={"chat_id": "c1", "session_factory": lambda: _Session(saved)}
+    )
+    await stream_text(MockChatModel(), ["Summarize the following source: a b c"], stream, flush_interval=0)
+    assert stream.report_streamed
+
+    stream.emit_final_report("## Answer\n\nCleaned report.")
+    stream.emit_done()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert saved == ["## Answer\n\nCleaned report."]
+
+
+@pytest.mark.asyncio
+async def test_writer_agent_streams_and_returns_the_model_answer():
+    """The writer streams the answer and returns it with Sources, not the failure fallback."""
+    stream = _Stream()
+    research = {
+        "sources": [{"title": "Cells", "url": "https://cells.example", "snippet": "s"}],
+        "scraped_content": [{"title": "Cells", "url": "https://cells.example", "content": "Batteries got cheaper."}],
+        "reasoning": "r",
+    }
+
+    answer = await writer_agent("batteries?", research, MockChatModel(), stream)
+
+    assert stream.report_streamed and "Mock response" in "".join(stream.chunks)
+    assert "Based on the research" not in answer
+    assert "[Cells](https://cells.example)" in answer
@@ -0,0 +1,106 @@
+"""Tests for the simulating mock chat model."""
+
+import time
+
+import openai
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
+
+from src.llm.cache import cache_scope
+from src.llm.mock import MockChatModel
+from src.llm.scheduler import LLMPriority, llm_priority
+from src.workflow.research.models import FinalReport
+
+
+@tool
+def web_search(query: str, max_results: int = 5) -> str:
+    """Search the web."""
+    return ""
+
+
+@pytest.mark.asyncio
+async def test_structured_output_matches_schema():
+    """with_structured_output returns a schema-valid instance, also when streamed."""
+    llm = MockChatModel(seed=1)
+    prompt = "Write the final report.\nResearch topic: solid-state batteries"
+
+    report = await llm.with_structured_output(FinalReport).ainvoke(prompt)
+    streamed = None
+    async for chunk in llm.bind_tools([FinalReport], tool_choice="FinalReport").astream(prompt):
+        streamed = chunk if streamed is None else streamed + chunk
+
+    assert isinstance(report, FinalReport)
+    assert "solid-state batteries" in report.executive_summary
+    assert FinalReport.model_validate(streamed.tool_calls[0]["args"])
+
+
+@pytest.mark.asyncio
+async def test_tool_loop_ends_after_max_rounds():
+    """With auto tool choice the model calls tools for max_tool_rounds, then answers in text."""
+    llm = MockChatModel(tool_call_rate=1.0, max_tool_rounds=1).bind_tools([web_search])
+    messages = [HumanMessage(content="Research topic: heat pumps")]
+
+    first = await llm.ainvoke(messages)
+    call = first.tool_calls[0]
+    messages += [first, ToolMessage(content="results", tool_call_id=call["id"])]
+    second = await llm.ainvoke(messages)
+
+    assert call["name"] == "web_search" and isinstance(call["args"]["query"], str)
+    assert isinstance(second, AIMessage) and not second.tool_calls and second.content
+
+
+@pytest.mark.asyncio
+async def test_failures_are_injected_reproducibly():
+    """Seeded 429 and 500 rates fail a matching share of calls, the same way every run."""
+
+    async def outcomes():
+        llm = MockChatModel(seed=7, rate_limit_rate=0.2, failure_rate=0.2)
+        result = []
+        for _ in range(200):
+            try:
+                await llm.ainvoke("hello")
+                result.append("ok")
+            except openai.RateLimitError as e:
+                assert e.status_code == 429
+                result.append("429")
+            except openai.InternalServerError:
+                result.append("500")
+        return result
+
+    first = await outcomes()
+
+    assert first == await outcomes()
+    assert 20 <= first.count("429") <= 60
+    assert 20 <= first.count("500") <= 60
+
+
+@pytest.mark.asyncio
+async def test_site_latency_overrides_default():
+    """Call-site labels and priority names pick their own first-token delay."""
+    llm = MockChatModel(first_token_latency=0.0, site_latency={"classify_query": 0.05, "title": 0.1})
+
+    async def timed():
+        start = time.perf_counter()
+        await llm.ainvoke("hello")
+        return time.perf_counter() - start
+
+    default = await timed()
+    with cache_scope("classify_query"):
+        site = await timed()
+    with llm_priority(LLMPriority.TITLE):
+        title = await timed()
+
+    assert default < 0.04
+    assert 0.05 <= site < 0.1
+    assert title >= 0.1
+
+
+def test_lognormal_latency_keeps_mean():
+    """Lognormal delays vary per call but average to the configured latency."""
+    llm = MockChatModel(first_token_latency=1.0, latency_distribution="lognormal", seed=3)
+
+    delays = [llm._first_token_delay() for _ in range(5000)]
+
+    assert len(set(delays)) > 1
+    assert 0.95 < sum(delays) / len(delays) < 1.05
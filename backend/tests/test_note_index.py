@@ -0,0 +1,39 @@
+"""Tests for the per-session agent note index."""
+
+import pytest
+
+from src.memory.note_index import SessionNoteIndex
+
+
+@pytest.mark.asyncio
+async def test_note_index_ranks_relevant_notes_first():
+    """BM25 ranking picks notes about the task topic over recent unrelated ones."""
+    index = SessionNoteIndex()
+    await index.add("Luftwaffe fleet: Eurofighter Typhoon and Tornado jets in service", source="item")
+    await index.add("Battery chemistry: solid-state cells improve energy density", source="item")
+    await index.add("Weather in Berlin was rainy last week", source="shared")
+
+    notes = await index.select_for_prompt("German air force jets Luftwaffe", top_k=1)
+
+    assert notes == ["Luftwaffe fleet: Eurofighter Typhoon and Tornado jets in service"]
+
+
+@pytest.mark.asyncio
+async def test_note_index_is_incremental_and_respects_budget():
+    """Re-adding a note is a no-op, other agents' personal notes stay private, budget is enforced."""
+    index = SessionNoteIndex()
+    assert await index.add("alpha finding about pricing", source="agent_note", agent_id="agent_1")
+    assert not await index.add("alpha finding about pricing", source="agent_note", agent_id="agent_1")
+    await index.add("alpha finding from another agent", source="agent_note", agent_id="agent_2")
+    await index.add("alpha " * 400, source="item")
+
+    notes = await index.select_for_prompt("alpha", agent_id="agent_1", token_budget=50)
+
+    assert "alpha finding about pricing" in notes
+    assert "alpha finding from another agent" not in notes
+    assert all(len(note) < 1000 for note in notes)
+
+    index.record_selection(baseline_tokens=400, selected_tokens=100)
+    stats = index.get_stats()
+    assert stats["indexed_notes"] == 3
+    assert stats["saved_tokens"] == 300
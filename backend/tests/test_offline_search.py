@@ -0,0 +1,85 @@
+"""Tests for the offline search stand-in."""
+
+import pytest
+
+from src.search.offline import BM25Index, OfflineSearchBackend, generate_corpus
+from src.search.scraper import WebScraper
+from src.search.searxng_provider import SearXNGSearchProvider, result_diversity, should_fallback
+from src.utils.host_limits import HostLimiter
+from src.utils.http import HTTPClientRegistry
+
+
+def test_corpus_is_deterministic_and_bm25_ranks_topical_pages():
+    """The same seed gives the same corpus, and topical queries rank pages of that topic first."""
+    corpus = generate_corpus(300, seed=7)
+    assert [d.title for d in corpus] == [d.title for d in generate_corpus(300, seed=7)]
+
+    index = BM25Index([d.text for d in corpus])
+    ranked, total = index.search("solar battery turbine", limit=10)
+
+    assert total > 10
+    assert [score for _, score in ranked] == sorted((score for _, score in ranked), reverse=True)
+    assert sum(corpus[idx].topic == "energy" for idx, _ in ranked) >= 8
+
+
+@pytest.mark.asyncio
+async def test_searxng_provider_and_scraper_run_against_stand_in():
+    """SearXNGSearchProvider searches and WebScraper fetches pages from the stand-in."""
+    backend = OfflineSearchBackend(corpus_size=200, latency_ms=1, page_latency_ms=1, duplicate_rate=1.0)
+    base_url = await backend.start()
+    http_clients = HTTPClientRegistry(hosts=HostLimiter(rate=0, failure_threshold=0))
+    try:
+        provider = SearXNGSearchProvider(instance_url=base_url, http_clients=http_clients)
+        response = await provider.search("vaccine clinical trial", max_results=6)
+        scraped = await WebScraper(http_clients=http_clients).scrape(response.results[0].url)
+    finally:
+        await http_clients.close()
+        await backend.stop()
+
+    assert len(response.results) == 6
+    assert response.results[1].url.startswith(response.results[0].url)
+    assert scraped.title.startswith(response.results[0].title)
+    assert "We use cookies" not in scraped.content
+    assert backend.stats["searches"] == 1 and backend.stats["pages"] == 1
+
+
+@pytest.mark.asyncio
+async def test_each_site_is_its_own_host():
+    """Results span the corpus sites, so they pass the diversity check and host limits apply per site."""
+    backend = OfflineSearchBackend(corpus_size=200, latency_ms=1, page_latency_ms=1)
+    base_url = await backend.start()
+    http_clients = HTTPClientRegistry(hosts=HostLimiter(rate=0, failure_threshold=0))
+    try:
+        provider = SearXNGSearchProvider(instance_url=base_url, http_clients=http_clients)
+        response = await provider.search("solar battery turbine", max_results=10)
+        scraper = WebScraper(http_clients=http_clients)
+        pages = [await scraper.scrape(result.url) for result in response.results[:4]]
+    finally:
+        await http_clients.close()
+        await backend.stop()
+
+    unique_domains, total = result_diversity(response.results)
+    assert total == 10 and unique_domains >= 5
+    assert not should_fallback(response.results, max_results=10)
+    assert all(page.content for page in pages) and backend.stats["not_found"] == 0
+    site_hosts = {url.split("/")[2].split(":")[0] for url in (r.url for r in response.results[:4])}
+    host_stats = http_clients.hosts.get_stats()
+    assert all(host.endswith(".example.localhost") for host in site_hosts)
+    assert sum(host_stats[host]["requests"] for host in site_hosts) == 4
+    assert host_stats["127.0.0.1"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_error_rate_fails_requests():
+    """With error_rate=1 every search is answered with 503, which the provider turns into no results."""
+    backend = OfflineSearchBackend(corpus_size=50, latency_ms=0, latency_sigma=0, error_rate=1.0)
+    base_url = await backend.start()
+    provider = SearXNGSearchProvider(instance_url=base_url)
+    try:
+        response = await provider.search("solar")
+    finally:
+        await provider.close()
+        await backend.stop()
+
+    assert response.results == []
+    assert backend.stats["errors"] == 1
@@ -0,0 +1,89 @@
+"""Tests for batched, retrying Ollama embeddings against a stub server."""
+
+import pytest
+from aiohttp import web
+
+from src.embeddings.ollama_provider import OllamaEmbeddingProvider
+
+
+async def _start_server(routes: dict) -> tuple[web.AppRunner, str]:
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_post(path, handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+def _provider(base_url: str, **kwargs) -> OllamaEmbeddingProvider:
+    return OllamaEmbeddingProvider(base_url=base_url, model="stub", retry_backoff=0.001, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_sent_to_api_embed_and_retried_on_429_and_5xx():
+    """Texts are split into batch_size requests; 429/503 are retried and output keeps input order."""
+    batches = []
+    failures = [503, 429]
+
+    async def embed(request: web.Request) -> web.Response:
+        if failures:
+            return web.Response(status=failures.pop(0))
+        payload = await request.json()
+        batches.append(payload["input"])
+        return web.json_response({"embeddings": [[float(len(text))] for text in payload["input"]]})
+
+    runner, base_url = await _start_server({"/api/embed": embed})
+    provider = _provider(base_url, batch_size=2, max_concurrency=1)
+    try:
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+        embeddings = await provider.embed_batch(texts)
+    finally:
+        await provider.close()
+        await runner.cleanup()
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert provider.get_dimension() == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_batch_endpoint_falls_back_to_api_embeddings():
+    """Servers without /api/embed (plain 404) are served one text at a time by /api/embeddings."""
+    prompts = []
+
+    async def legacy(request: web.Request) -> web.Response:
+        payload = await request.json()
+        prompts.append(payload["prompt"])
+        return web.json_response({"embedding": [float(len(payload["prompt"]))]})
+
+    runner, base_url = await _start_server({"/api/embeddings": legacy})
+    provider = _provider(base_url)
+    try:
+        assert await provider.embed_batch(["x", "yy"]) == [[1.0], [2.0]]
+        assert await provider.embed_text("zzz") == [3.0]
+    finally:
+        await provider.close()
+        await runner.cleanup()
+
+    assert not provider._batch_endpoint
+    assert prompts == ["x", "yy", "zzz"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_model_404_raises_without_disabling_batching():
+    """A 404 about the model is reported as such and does not switch to the legacy endpoint."""
+    async def embed(request: web.Request) -> web.Response:
+        return web.json_response({"error": 'model "stub" not found, try pulling it first'}, status=404)
+
+    runner, base_url = await _start_server({"/api/embed": embed})
+    provider = _provider(base_url)
+    try:
+        with pytest.raises(RuntimeError, match="try pulling it first"):
+            await provider.embed_text("x")
+    finally:
+        await provider.close()
+        await runner.cleanup()
+
+    assert provider._batch_endpoint
@@ -0,0 +1,43 @@
+"""Tests for token-packed, rate-limit aware OpenAI embeddings."""
+
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from src.embeddings.openai_provider import OpenAIEmbeddingProvider
+from src.utils.text import estimate_tokens
+
+
+class _FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, input, model, **kwargs):
+        self.calls.append(list(input))
+        if len(self.calls) == 1:
+            request = httpx.Request("POST", "http://stub/v1/embeddings")
+            response = httpx.Response(429, headers={"retry-after-ms": "10"}, request=request)
+            raise openai.RateLimitError("rate limited", response=response, body=None)
+        # Out of order on purpose: the provider must sort by index
+        data = [SimpleNamespace(index=i, embedding=[float(text.split()[1])]) for i, text in enumerate(input)]
+        return SimpleNamespace(data=list(reversed(data)))
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_packs_by_tokens_and_retries_429():
+    """Batches respect the token budget, 429s are retried and output keeps input order."""
+    provider = OpenAIEmbeddingProvider(api_key="test", max_batch_tokens=50, max_concurrency=2)
+    fake = _FakeEmbeddings()
+    provider.client = SimpleNamespace(embeddings=fake)
+    texts = [f"text {i} " + "x" * 60 for i in range(10)]
+
+    embeddings = await provider.embed_batch(texts)
+
+    assert embeddings == [[float(i)] for i in range(10)]
+    assert provider.rate_limiter.rate_limited_count == 1
+    batches = provider._pack_batches(texts)
+    assert len(batches) > 1
+    assert len(fake.calls) == len(batches) + 1
+    assert all(sum(estimate_tokens(text) for text in batch) <= 50 for batch in batches)
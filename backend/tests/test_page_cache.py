@@ -0,0 +1,112 @@
+"""Tests for the HTTP-aware scraped page cache."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.llm.accounting import usage_scope
+from src.search.models import ScrapedContent
+from src.search.page_cache import PageCache, freshness_lifetime
+from src.search.scraper import WebScraper
+from src.utils.host_limits import HostCircuitOpenError, HostLimiter
+from src.utils.http import HTTPClientRegistry
+
+PAGE = "<html><head><title>Cached</title></head><body><article>" + "<p>Stable content.</p>" * 20 + "</article></body></html>"
+
+
+async def _start_site(state: dict) -> tuple[web.AppRunner, str]:
+    async def page(request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        if request.headers.get("If-None-Match") == '"v1"':
+            state["not_modified"] += 1
+            return web.Response(status=304, headers={"Cache-Control": "max-age=0"})
+        state["full"] += 1
+        cache_control = {"fresh": "max-age=600", "stale": "max-age=0", "private": "no-store"}[name]
+        return web.Response(text=PAGE, content_type="text/html", headers={"ETag": '"v1"', "Cache-Control": cache_control})
+
+    app = web.Application()
+    app.router.add_get("/{name}", page)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+def test_freshness_lifetime_honours_cache_control():
+    """max-age wins, no-store forbids storing, no-cache forces revalidation, and lifetimes are capped."""
+    assert freshness_lifetime({"Cache-Control": "public, max-age=120"}, 3600, 86400) == 120
+    assert freshness_lifetime({"Cache-Control": "max-age=999999"}, 3600, 86400) == 86400
+    assert freshness_lifetime({"Cache-Control": "no-store"}, 3600, 86400) is None
+    assert freshness_lifetime({"Cache-Control": "no-cache"}, 3600, 86400) == 0
+    assert freshness_lifetime({}, 3600, 86400) == 3600
+
+
+@pytest.mark.asyncio
+async def test_scraper_serves_fresh_pages_and_revalidates_stale_ones():
+    """Fresh pages skip the network; stale ones are revalidated with If-None-Match; no-store is never cached."""
+    state = {"full": 0, "not_modified": 0}
+    runner, base_url = await _start_site(state)
+    cache = PageCache()
+    http_clients = HTTPClientRegistry(hosts=HostLimiter(rate=0))
+    scraper = WebScraper(http_clients=http_clients, page_cache=cache)
+    try:
+        with usage_scope(session_id="pc1"):
+            for name in ("fresh", "stale", "private"):
+                first = await scraper.scrape(f"{base_url}/{name}")
+                second = await scraper.scrape(f"{base_url}/{name}#top")
+                assert second.content == first.content
+    finally:
+        await http_clients.close()
+        await runner.cleanup()
+
+    assert state == {"full": 4, "not_modified": 1}
+    stats = cache.get_stats("pc1")
+    assert stats["hits"] == 1 and stats["revalidated"] == 1 and stats["misses"] == 4
+    assert stats["bytes_saved"] == 2 * len(PAGE)
+
+
+def test_size_based_eviction_drops_least_recently_used(tmp_path):
+    """The store stays under max_bytes by evicting the least recently used pages, also after reopening."""
+    path = str(tmp_path / "pages.db")
+    page = ScrapedContent(url="https://example.com", title="t", content="x" * 400)
+    entry_size = len(page.model_dump_json(exclude={"html"}))
+    cache = PageCache(path=path, max_bytes=entry_size * 2)
+
+    cache.put("a", page, {}, 1000)
+    cache.put("b", page, {}, 1000)
+    assert cache.get("a") is not None
+    cache.put("c", page, {}, 1000)
+    cache.close()
+
+    reopened = PageCache(path=path, max_bytes=entry_size * 2)
+    assert reopened.get("b") is None
+    assert reopened.get("a") is not None and reopened.get("c") is not None
+    assert reopened.size == entry_size * 2
+
+
+@pytest.mark.asyncio
+async def test_fresh_hits_bypass_host_limits_but_revalidation_does_not():
+    """Fresh pages are served with the host's circuit open and spend no tokens; revalidation needs the host."""
+    state = {"full": 0, "not_modified": 0}
+    runner, base_url = await _start_site(state)
+    limiter = HostLimiter(rate=0, failure_threshold=1, reset_timeout=60)
+    http_clients = HTTPClientRegistry(hosts=limiter)
+    scraper = WebScraper(http_clients=http_clients, page_cache=PageCache())
+    try:
+        for name in ("fresh", "stale"):
+            await scraper.scrape(f"{base_url}/{name}")
+        with pytest.raises(asyncio.TimeoutError):
+            async with limiter.request(base_url):
+                raise asyncio.TimeoutError()
+
+        for _ in range(3):
+            assert (await scraper.scrape(f"{base_url}/fresh")).title == "Cached"
+        with pytest.raises(HostCircuitOpenError):
+            await scraper.scrape(f"{base_url}/stale")
+    finally:
+        await http_clients.close()
+        await runner.cleanup()
+
+    assert state == {"full": 2, "not_modified": 0}
@@ -0,0 +1,75 @@
+"""Tests for the search result cache."""
+
+import asyncio
+
+import pytest
+
+from src.llm.accounting import usage_scope
+from src.search.cache import CachingSearchProvider, SearchResultCache
+from src.search.mock_provider import MockSearchProvider
+from src.search.models import SearchResponse
+
+
+class _CountingSearch(MockSearchProvider):
+    def __init__(self, empty: bool = False):
+        self.calls = 0
+        self.empty = empty
+
+    async def search(self, query, max_results=10):
+        self.calls += 1
+        if self.empty:
+            return SearchResponse(query=query, results=[], total_results=0)
+        return await super().search(query, max_results=max_results)
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_hit_cache_per_session():
+    """Normalized repeats are served from the cache and counted for the session."""
+    provider = _CountingSearch()
+    store = SearchResultCache()
+    cached = CachingSearchProvider(provider, store, name="tavily")
+
+    with usage_scope(session_id="s1"):
+        first = await cached.search("Heat pumps  in Norway?", max_results=5)
+        second = await cached.search("heat pumps in norway", max_results=5)
+        await cached.search("heat pumps in norway", max_results=8)
+
+    assert provider.calls == 2
+    assert second.query == "heat pumps in norway"
+    assert [r.url for r in second.results] == [r.url for r in first.results]
+    assert store.get_stats("s1") == {"hits": 1, "stale_hits": 0, "misses": 2, "revalidations": 0, "hit_rate": 0.333}
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_and_revalidated_once():
+    """Past the TTL, the cached response is returned at once and refreshed by one background search."""
+    provider = _CountingSearch()
+    store = SearchResultCache(ttl_seconds=0, stale_seconds=60)
+    cached = CachingSearchProvider(provider, store, name="tavily")
+
+    await cached.search("solar")
+    responses = await asyncio.gather(*[cached.search("solar") for _ in range(3)])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert all(r.results for r in responses)
+    assert provider.calls == 2
+    assert store.get_stats()["stale_hits"] == 3 and store.get_stats()["revalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_entries_persist_and_failures_are_not_cached(tmp_path):
+    """Responses survive a restart via SQLite; empty (failed) responses are never stored."""
+    path = str(tmp_path / "search_cache.db")
+    store = SearchResultCache(path=path)
+    await CachingSearchProvider(_CountingSearch(), store, name="searxng", language="en").search("wind")
+    empty = _CountingSearch(empty=True)
+    await CachingSearchProvider(empty, store, name="searxng", language="en").search("tide")
+    store.close()
+
+    provider = _CountingSearch()
+    reopened = CachingSearchProvider(provider, SearchResultCache(path=path), name="searxng", language="en")
+    await reopened.search("wind")
+    await reopened.search("tide")
+
+    assert provider.calls == 1
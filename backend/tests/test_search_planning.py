@@ -0,0 +1,89 @@
+"""Tests for the fused classification and search planning call."""
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+
+from src.llm.mock import MockChatModel
+from src.search.mock_provider import MockSearchProvider
+from src.workflow.search.classifier import SearchPlan, plan_search
+from src.workflow.search.researcher import research_agent
+
+
+class _RecordingSearch(MockSearchProvider):
+    def __init__(self, events):
+        self.events = events
+
+    async def search(self, query, max_results=10):
+        self.events.append(("search", query))
+        return await super().search(query, max_results=max_results)
+
+
+_events = []
+_prompts = []
+
+
+class _DoneModel(MockChatModel):
+    """Calls 'done' on its first turn and records what it was shown."""
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        _events.append(("llm", None))
+        _prompts.append(messages)
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **{**kwargs, "tool_choice": "done"})
+
+
+class _FailingModel(MockChatModel):
+    def with_structured_output(self, schema, **kwargs):
+        raise RuntimeError("provider down")
+
+
+@pytest.mark.asyncio
+async def test_plan_search_returns_classification_and_queries():
+    """One call yields a schema-valid plan with at most max_queries non-empty queries."""
+    plan = await plan_search("latest heat pump efficiency", [], MockChatModel(seed=3), max_queries=2)
+
+    assert isinstance(plan, SearchPlan)
+    assert plan.standalone_query
+    assert 0 < len(plan.search_queries) <= 2 and all(q.strip() for q in plan.search_queries)
+
+
+@pytest.mark.asyncio
+async def test_plan_search_falls_back_to_the_query():
+    """A failed planning call still routes to web search with the raw query."""
+    plan = await plan_search("heat pumps", [], _FailingModel())
+
+    assert plan.suggested_mode == "web"
+    assert plan.search_queries == ["heat pumps"]
+
+
+@pytest.mark.asyncio
+async def test_research_agent_is_seeded_with_planned_search():
+    """Planned queries are searched before the agent's first LLM call and shown to it as a web_search result."""
+    _events.clear()
+    _prompts.clear()
+    plan = SearchPlan(
+        reasoning="r",
+        query_type="factual",
+        standalone_query="heat pump efficiency",
+        suggested_mode="web",
+        requires_sources=True,
+        time_sensitive=False,
+        search_queries=["heat pump COP"],
+    )
+
+    result = await research_agent(
+        query="heat pump efficiency",
+        classification=plan,
+        mode="speed",
+        llm=_DoneModel(),
+        search_provider=_RecordingSearch(_events),
+        scraper=None,
+        stream=None,
+        initial_queries=plan.search_queries,
+    )
+
+    assert _events[0][0] == "search" and _events[-1] == ("llm", None)
+    assert {q for kind, q in _events if kind == "search"} == {"heat pump efficiency", "heat pump COP"}
+    assert len(result["sources"]) == 10
+    first_prompt = _prompts[0]
+    assert any(isinstance(m, AIMessage) and m.tool_calls and m.tool_calls[0]["id"] == "call_plan_0" for m in first_prompt)
+    assert any(isinstance(m, ToolMessage) and m.tool_call_id == "call_plan_0" for m in first_prompt)
@@ -0,0 +1,47 @@
+"""Tests for agent session archival and lazy restore."""
+
+import pytest
+
+from src.memory.agent_session import create_agent_session_services
+from src.memory.session_archive import SessionArchive, archive_finished_sessions
+
+
+class _FakeSessionManager:
+    def __init__(self, finished):
+        self.finished = finished
+        self.expired_calls = 0
+
+    async def cleanup_expired_sessions(self, hours=24):
+        self.expired_calls += 1
+        return 0
+
+    async def list_archivable_sessions(self, older_than_hours=24):
+        return self.finished
+
+
+@pytest.mark.asyncio
+async def test_archive_and_transparent_restore(tmp_path):
+    """Finished sessions are packed and removed, then restored when accessed again."""
+    memory_service, file_service, session_dir = create_agent_session_services(tmp_path, "session-1")
+    await memory_service.read_main_file()
+    await file_service.write_agent_file("agent_1", notes=["remember this"])
+    create_agent_session_services(tmp_path, "session-running")
+
+    archive = SessionArchive(tmp_path)
+    manager = _FakeSessionManager([("session-1", "completed"), ("session-running", "completed")])
+    archived = await archive_finished_sessions(manager, archive, active_session_ids=["session-running"])
+
+    assert archived == 1
+    assert manager.expired_calls == 1
+    assert not session_dir.exists()
+    assert archive.is_archived("session-1")
+    assert archive.read_index()["sessions"]["session-1"]["status"] == "completed"
+    assert (tmp_path / "agent_sessions" / "session-running").exists()
+
+    _, file_service, session_dir = create_agent_session_services(tmp_path, "session-1")
+
+    assert not archive.is_archived("session-1")
+    assert "session-1" not in archive.read_index()["sessions"]
+    assert (session_dir / "main.md").exists()
+    agent_file = await file_service.read_agent_file("agent_1")
+    assert agent_file["notes"] == ["remember this"]
@@ -0,0 +1,17 @@
+"""Tests for the shared per-session statistics."""
+
+from collections import defaultdict
+
+from src.utils.session_stats import SessionStats
+
+
+def test_updates_reach_totals_and_session_and_old_sessions_are_dropped():
+    """Updates go to the process-wide stats and their session; the least recently updated session goes first."""
+    stats = SessionStats(lambda: defaultdict(int), max_sessions=2)
+    for session_id in ("a", "b", None, "a", "c"):
+        for counts in stats.targets(session_id):
+            counts["hits"] += 1
+
+    assert stats.get()["hits"] == 5
+    assert stats.get("a")["hits"] == 2 and stats.get("c")["hits"] == 1
+    assert stats.get("b") is None
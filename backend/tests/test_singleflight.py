@@ -0,0 +1,99 @@
+"""Tests for single-flight deduplication of searches and scrapes."""
+
+import asyncio
+
+import pytest
+
+from src.llm.accounting import usage_scope
+from src.search.mock_provider import MockSearchProvider
+from src.search.models import ScrapedContent
+from src.search.scraper import WebScraper
+from src.search.singleflight import SingleFlight, SingleFlightSearchProvider, canonical_url, get_single_flight_stats
+
+
+class _SlowSearch(MockSearchProvider):
+    def __init__(self):
+        self.calls = 0
+
+    async def search(self, query, max_results=10):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return await super().search(query, max_results=max_results)
+
+
+class _SlowScraper(WebScraper):
+    fetches = 0
+
+    async def _scrape_with_http(self, url, extract_markdown=True):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        return ScrapedContent(url=url, title="t", content="body")
+
+
+def test_canonical_url():
+    """Scheme/host case, default ports and fragments do not distinguish URLs."""
+    assert canonical_url("HTTPS://Example.COM:443/a?x=1#top") == "https://example.com/a?x=1"
+    assert canonical_url("http://example.com") == "http://example.com/"
+    assert canonical_url("http://example.com:8080/a") == "http://example.com:8080/a"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_call():
+    """Concurrent searches with the same normalized query hit the provider once; savings are counted per session."""
+    provider = _SlowSearch()
+    deduped = SingleFlightSearchProvider(provider)
+
+    with usage_scope(session_id="sf1"):
+        responses = await asyncio.gather(
+            deduped.search("Heat pumps", max_results=5),
+            deduped.search("heat  pumps?", max_results=5),
+            deduped.search("heat pumps", max_results=5),
+            deduped.search("heat pumps", max_results=8),
+        )
+        await deduped.search("heat pumps", max_results=5)
+
+    assert provider.calls == 3
+    assert responses[0] is responses[1] is responses[2]
+    assert get_single_flight_stats("sf1") == {"search": {"calls": 3, "shared": 2}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scrapes_share_one_fetch():
+    """WebScraper fetches a canonical URL once for concurrent callers."""
+    scraper = _SlowScraper()
+
+    with usage_scope(session_id="sf2"):
+        results = await asyncio.gather(
+            scraper.scrape("https://example.com/page#intro"),
+            scraper.scrape("https://EXAMPLE.com:443/page"),
+            scraper.scrape("https://example.com/other"),
+        )
+
+    assert scraper.fetches == 2
+    assert results[0] is results[1]
+    assert get_single_flight_stats("sf2") == {"scrape": {"calls": 2, "shared": 1}}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_cancellation_is_isolated():
+    """A failure reaches every waiter; cancelling one waiter leaves the call running for the rest."""
+    flight = SingleFlight("test")
+    started = asyncio.Event()
+
+    async def fail():
+        started.set()
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "ok"
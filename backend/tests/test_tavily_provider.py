@@ -0,0 +1,73 @@
+"""Tests for the non-blocking Tavily provider against a local stub API."""
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from src.search.tavily_provider import TavilySearchProvider
+
+
+async def _start_stub(delay: float, state: dict) -> tuple[web.AppRunner, str]:
+    async def search(request: web.Request) -> web.Response:
+        body = await request.json()
+        state["auth"] = request.headers.get("Authorization")
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(delay)
+        state["active"] -= 1
+        return web.json_response(
+            {"results": [{"title": body["query"], "url": "https://example.com", "content": "snippet", "score": 0.9}]}
+        )
+
+    app = web.Application()
+    app.router.add_post("/search", search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_parallel_searches_do_not_block_event_loop():
+    """Parallel searches keep event-loop lag low and respect max_concurrency."""
+    state = {"active": 0, "peak": 0}
+    runner, base_url = await _start_stub(0.2, state)
+    provider = TavilySearchProvider(api_key="tvly-test", base_url=base_url, max_concurrency=3)
+    lags = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - start - 0.01)
+
+    try:
+        tick = asyncio.create_task(ticker())
+        responses = await asyncio.gather(*[provider.search(f"query {i}") for i in range(6)])
+        stop.set()
+        await tick
+    finally:
+        await provider.close()
+        await runner.cleanup()
+
+    assert [r.results[0].title for r in responses] == [f"query {i}" for i in range(6)]
+    assert state["auth"] == "Bearer tvly-test"
+    assert state["peak"] == 3
+    assert max(lags) < 0.05
+
+
+@pytest.mark.asyncio
+async def test_search_errors_return_empty_response():
+    """HTTP errors from the API yield an empty response instead of raising."""
+    provider = TavilySearchProvider(api_key="tvly-test", base_url="http://127.0.0.1:9", timeout=1.0)
+    try:
+        response = await provider.search("anything")
+    finally:
+        await provider.close()
+
+    assert response.results == [] and response.total_results == 0